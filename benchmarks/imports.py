@@ -0,0 +1,108 @@
+"""
+Import-time benchmark, checked against a budget.
+
+Each module is imported in a fresh interpreter with ``-X importtime`` and the
+median cumulative import time of several runs is compared with its budget.
+Modules listed in ``FORBIDDEN`` must not be loaded as a side effect, e.g.
+signing a URL must not import requests or xml.etree. Exits with status 1 when
+a budget is exceeded or a forbidden module is loaded.
+
+Usage:
+    python -m benchmarks.imports [--runs 7]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+# Cumulative import time budget of each module, in milliseconds. Generous
+# enough for slow CI machines, tight enough to catch an eager heavy import.
+BUDGETS_MS = {
+    "sage_bbb": 5.0,
+    "sage_bbb.utils": 15.0,
+    "sage_bbb.services.client": 60.0,
+    "sage_bbb.services.aio.client": 60.0,
+}
+
+# Modules that must not be loaded by importing each module.
+FORBIDDEN = {
+    "sage_bbb": ("hashlib", "requests", "xml.etree.ElementTree"),
+    "sage_bbb.utils": ("requests", "xml.etree.ElementTree", "asyncio", "logging"),
+    "sage_bbb.services.client": (
+        "requests",
+        "asyncio",
+        "xml.etree.ElementTree",
+        "sage_bbb.services.meetings",
+    ),
+    "sage_bbb.services.aio.client": (
+        "httpx",
+        "requests",
+        "xml.etree.ElementTree",
+        "sage_bbb.services.meetings",
+    ),
+}
+
+_PROBE = """
+import sys
+before = set(sys.modules)
+import {module}
+print(",".join(name for name in {forbidden!r} if name in sys.modules
+               and name not in before))
+"""
+
+
+def measure(module: str, runs: int) -> Tuple[float, List[str]]:
+    """
+    Returns the median import time of a module in milliseconds, and the
+    forbidden modules it loaded.
+    """
+    samples = []
+    loaded: List[str] = []
+    for _ in range(runs):
+        process = subprocess.run(
+            [
+                sys.executable,
+                "-X",
+                "importtime",
+                "-c",
+                _PROBE.format(module=module, forbidden=FORBIDDEN.get(module, ())),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        # The last line is the requested module; its second column is the
+        # cumulative time in microseconds, dependencies included.
+        line = process.stderr.strip().splitlines()[-1]
+        samples.append(int(line.split("|")[1]) / 1000)
+        loaded = [name for name in process.stdout.strip().split(",") if name]
+    return statistics.median(samples), loaded
+
+
+def bench_imports(runs: int) -> Dict[str, float]:
+    """
+    Returns the median import time of every budgeted module, in milliseconds.
+    """
+    return {f"{module}_ms": measure(module, runs)[0] for module in BUDGETS_MS}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module, budget in BUDGETS_MS.items():
+        elapsed, loaded = measure(module, args.runs)
+        status = "ok" if elapsed <= budget else "OVER BUDGET"
+        print(f"{module:<30}{elapsed:8.2f} ms  (budget {budget:.0f} ms)  {status}")
+        if loaded:
+            print(f"{'':<30}loads forbidden modules: {', '.join(loaded)}")
+        failed = failed or elapsed > budget or bool(loaded)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+Memory and throughput benchmark for the meeting model layer.
+
+Compares the dataclass path (convert the ``<meeting>`` element into nested
+dicts, then build ``@dataclass`` instances through a chain of ``dict.get``
+lookups) with the slotted ``Meeting`` named tuple built straight from the
+element by the precompiled field tables in ``sage_bbb.services.factory``.
+
+Usage:
+    python -m benchmarks.models [--count 50000]
+"""
+
+import argparse
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from sage_bbb.parsers import element_to_dict
+from sage_bbb.services.factory import MeetingFactory
+
+MEETING_XML = """
+<meeting>
+  <meetingName>Algebra 101</meetingName>
+  <meetingID>random-9887584</meetingID>
+  <internalMeetingID>183f0bf3a0982a127bdb8161e0c44eb696b3e75c-1531240585189</internalMeetingID>
+  <createTime>1531240585189</createTime>
+  <createDate>Tue Jul 10 16:36:25 UTC 2018</createDate>
+  <voiceBridge>70066</voiceBridge>
+  <dialNumber>613-555-1234</dialNumber>
+  <attendeePW>ap</attendeePW>
+  <moderatorPW>mp</moderatorPW>
+  <running>true</running>
+  <duration>0</duration>
+  <hasUserJoined>true</hasUserJoined>
+  <recording>false</recording>
+  <hasBeenForciblyEnded>false</hasBeenForciblyEnded>
+  <startTime>1531240585239</startTime>
+  <endTime>0</endTime>
+  <participantCount>2</participantCount>
+  <listenerCount>1</listenerCount>
+  <voiceParticipantCount>0</voiceParticipantCount>
+  <videoCount>0</videoCount>
+  <maxUsers>0</maxUsers>
+  <moderatorCount>1</moderatorCount>
+  <attendees>
+    <attendee>
+      <userID>w_ysgy8ahiq0yq</userID>
+      <fullName>stu</fullName>
+      <role>VIEWER</role>
+      <isPresenter>false</isPresenter>
+      <isListeningOnly>true</isListeningOnly>
+      <hasJoinedVoice>false</hasJoinedVoice>
+      <hasVideo>false</hasVideo>
+      <clientType>HTML5</clientType>
+    </attendee>
+    <attendee>
+      <userID>w_yurhgz8xlrsd</userID>
+      <fullName>mod</fullName>
+      <role>MODERATOR</role>
+      <isPresenter>true</isPresenter>
+      <isListeningOnly>false</isListeningOnly>
+      <hasJoinedVoice>true</hasJoinedVoice>
+      <hasVideo>false</hasVideo>
+      <clientType>HTML5</clientType>
+    </attendee>
+  </attendees>
+  <metadata>
+    <course>algebra-101</course>
+  </metadata>
+  <isBreakout>false</isBreakout>
+</meeting>
+"""
+
+
+@dataclass
+class LegacyAttendee:
+    user_id: str
+    full_name: str
+    role: str
+    is_presenter: bool
+    is_listening_only: bool
+    has_joined_voice: bool
+    has_video: bool
+    client_type: str
+
+
+@dataclass
+class LegacyMeeting:
+    meeting_id: str
+    internal_meeting_id: str
+    parent_meeting_id: str
+    attendee_pw: str
+    moderator_pw: str
+    create_time: str
+    voice_bridge: str
+    dial_number: str
+    create_date: str
+    has_user_joined: bool
+    duration: int
+    has_been_forcibly_ended: bool
+    message_key: str
+    message: str
+    meeting_name: str = ""
+    running: bool = False
+    recording: bool = False
+    start_time: int = 0
+    end_time: int = 0
+    participant_count: int = 0
+    listener_count: int = 0
+    voice_participant_count: int = 0
+    video_count: int = 0
+    moderator_count: int = 0
+    max_users: int = 0
+    is_breakout: bool = False
+    attendees: List[LegacyAttendee] = field(default_factory=list)
+    metadata: Dict[str, str] = field(default_factory=dict)
+
+
+def _to_int(value: Optional[str]) -> int:
+    return int(value) if value else 0
+
+
+def _to_bool(value: Optional[str]) -> bool:
+    return value == "true"
+
+
+def legacy_create_meeting(element: ET.Element) -> LegacyMeeting:
+    response_dict = element_to_dict(element)
+    return LegacyMeeting(
+        meeting_id=response_dict.get("meetingID", ""),
+        internal_meeting_id=response_dict.get("internalMeetingID", ""),
+        parent_meeting_id=response_dict.get("parentMeetingID", ""),
+        attendee_pw=response_dict.get("attendeePW", ""),
+        moderator_pw=response_dict.get("moderatorPW", ""),
+        create_time=response_dict.get("createTime", ""),
+        voice_bridge=response_dict.get("voiceBridge", ""),
+        dial_number=response_dict.get("dialNumber", ""),
+        create_date=response_dict.get("createDate", ""),
+        has_user_joined=_to_bool(response_dict.get("hasUserJoined")),
+        duration=_to_int(response_dict.get("duration")),
+        has_been_forcibly_ended=_to_bool(response_dict.get("hasBeenForciblyEnded")),
+        message_key=response_dict.get("messageKey", ""),
+        message=response_dict.get("message", ""),
+        meeting_name=response_dict.get("meetingName") or "",
+        running=_to_bool(response_dict.get("running")),
+        recording=_to_bool(response_dict.get("recording")),
+        start_time=_to_int(response_dict.get("startTime")),
+        end_time=_to_int(response_dict.get("endTime")),
+        participant_count=_to_int(response_dict.get("participantCount")),
+        listener_count=_to_int(response_dict.get("listenerCount")),
+        voice_participant_count=_to_int(response_dict.get("voiceParticipantCount")),
+        video_count=_to_int(response_dict.get("videoCount")),
+        moderator_count=_to_int(response_dict.get("moderatorCount")),
+        max_users=_to_int(response_dict.get("maxUsers")),
+        is_breakout=_to_bool(response_dict.get("isBreakout")),
+        attendees=[
+            LegacyAttendee(
+                user_id=attendee.get("userID") or "",
+                full_name=attendee.get("fullName") or "",
+                role=attendee.get("role") or "",
+                is_presenter=_to_bool(attendee.get("isPresenter")),
+                is_listening_only=_to_bool(attendee.get("isListeningOnly")),
+                has_joined_voice=_to_bool(attendee.get("hasJoinedVoice")),
+                has_video=_to_bool(attendee.get("hasVideo")),
+                client_type=attendee.get("clientType") or "",
+            )
+            for attendee in response_dict.get("attendees") or []
+        ],
+        metadata=dict(response_dict.get("metadata") or {}),
+    )
+
+
+def measure(
+    name: str, build: Callable[[ET.Element], Any], element: ET.Element, count: int
+) -> Dict[str, Any]:
+    start = time.perf_counter()
+    for _ in range(count):
+        build(element)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    instances: List[Any] = [build(element) for _ in range(count)]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+
+    return {
+        "name": name,
+        "per_second": count / elapsed,
+        "bytes_per_instance": retained / count,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=50000)
+    args = parser.parse_args()
+
+    element = ET.fromstring(MEETING_XML)
+    results = [
+        measure("dataclass via dict", legacy_create_meeting, element, args.count),
+        measure("slotted via field table", MeetingFactory.from_element, element, args.count),
+    ]
+    print(f"{'path':<26}{'meetings/s':>14}{'bytes/meeting':>16}")
+    for result in results:
+        print(
+            f"{result['name']:<26}{result['per_second']:>14,.0f}"
+            f"{result['bytes_per_instance']:>16,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Throughput benchmark for API call signing.
+
+Compares the original URL building path (convert and quote every parameter,
+rebuild the query string inside the checksum strategy, hash the
+concatenated string) with ``BigBlueButtonUrlBuilder``'s fast path, which
+builds the query string once, reuses memoized quoting and copies a cached
+per-API-call hash state.
+
+Usage:
+    python -m benchmarks.signing [--count 200000]
+"""
+
+import argparse
+import time
+from hashlib import sha1
+from typing import Any, Callable, Dict
+from urllib.parse import quote_plus
+
+from sage_bbb.utils import BigBlueButtonUrlBuilder
+
+BASE_URL = "https://bbb.example.com/bigbluebutton/api/"
+SALT = "8cd8ef52e8e101574e400365b55e11a6"
+JOIN_PARAMS = {
+    "meetingID": "random-9887584",
+    "fullName": "Jane Doe",
+    "password": "mp",
+    "redirect": True,
+    "userID": "user-42",
+}
+
+
+def _convert_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _create_query_string(params: Dict[str, Any]) -> str:
+    return "&".join(
+        f"{key}={quote_plus(_convert_value(value))}"
+        for key, value in sorted(params.items())
+    )
+
+
+def legacy_build_url(api_call: str, params: Dict[str, Any]) -> str:
+    params = {key: _convert_value(value) for key, value in params.items()}
+    query_string = _create_query_string(params)
+    signed = _create_query_string(params)
+    checksum = sha1(f"{api_call}{signed}{SALT}".encode("utf-8")).hexdigest()
+    return f"{BASE_URL}{api_call}?{query_string}&checksum={checksum}"
+
+
+def measure(
+    name: str, build: Callable[[str, Dict[str, Any]], str], count: int
+) -> Dict[str, Any]:
+    assert build("join", JOIN_PARAMS) == legacy_build_url("join", JOIN_PARAMS)
+    start = time.perf_counter()
+    for _ in range(count):
+        build("join", JOIN_PARAMS)
+    elapsed = time.perf_counter() - start
+    return {
+        "name": name,
+        "per_second": count / elapsed,
+        "us_per_url": elapsed / count * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=200000)
+    args = parser.parse_args()
+
+    builder = BigBlueButtonUrlBuilder(BASE_URL, SALT)
+    results = [
+        measure("original", legacy_build_url, args.count),
+        measure("fast path", builder.build_url, args.count),
+    ]
+    print(f"{'path':<12}{'urls/s':>14}{'us/url':>10}")
+    for result in results:
+        print(
+            f"{result['name']:<12}{result['per_second']:>14,.0f}"
+            f"{result['us_per_url']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
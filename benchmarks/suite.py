@@ -0,0 +1,237 @@
+"""
+End-to-end benchmark suite run against the bundled fake BigBlueButton server.
+
+Measures import times, URL signing, response parsing, single-call latency
+and concurrent throughput of the sync client and, when httpx is installed, of
+the async client. Results are saved as JSON so runs of different releases can be
+compared; ``--compare`` reports the metrics that got worse by more than
+``--threshold`` and exits with status 1 if any did.
+
+Usage:
+    python -m benchmarks.suite [--quick] [--output results.json]
+    python -m benchmarks.suite --compare benchmarks/results/0.1.1.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from benchmarks.imports import bench_imports
+from sage_bbb.parsers import StreamingParser
+from sage_bbb.services.batch import run_batch
+from sage_bbb.services.client import BigBlueButtonClient
+from sage_bbb.services.factory import MeetingFactory
+from sage_bbb.testing import FakeBigBlueButtonServer
+
+SALT = "8cd8ef52e8e101574e400365b55e11a6"
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# Metrics where a larger value is better; all others are durations.
+HIGHER_IS_BETTER = ("per_second",)
+
+
+def _version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("python-sage-bbb")
+    except Exception:
+        return "unknown"
+
+
+def _latencies(samples: List[float]) -> Dict[str, float]:
+    samples = sorted(samples)
+    return {
+        "p50_ms": samples[len(samples) // 2] * 1000,
+        "p95_ms": samples[int(len(samples) * 0.95)] * 1000,
+        "p99_ms": samples[int(len(samples) * 0.99)] * 1000,
+        "mean_ms": statistics.fmean(samples) * 1000,
+    }
+
+
+def bench_signing(client: BigBlueButtonClient, count: int) -> Dict[str, float]:
+    params = {"meetingID": "meeting-1", "fullName": "Jane Doe", "password": "ap"}
+    build = client.url_builder.build_url
+    started = time.perf_counter()
+    for _ in range(count):
+        build("join", params)
+    elapsed = time.perf_counter() - started
+    return {"per_second": count / elapsed, "us_per_call": elapsed / count * 1e6}
+
+
+def bench_parsing(client: BigBlueButtonClient, count: int) -> Dict[str, float]:
+    content = client.send_request("getMeetings", {}).content
+    started = time.perf_counter()
+    for _ in range(count):
+        client.parse_response(content)
+    tree = (time.perf_counter() - started) / count
+    started = time.perf_counter()
+    for _ in range(count):
+        parser = StreamingParser("meetings", "meeting", MeetingFactory.from_element)
+        list(parser.feed(content))
+        list(parser.close())
+    streamed = (time.perf_counter() - started) / count
+    return {
+        "response_kib": len(content) / 1024,
+        "tree_ms": tree * 1000,
+        "streaming_ms": streamed * 1000,
+    }
+
+
+def bench_latency(client: BigBlueButtonClient, count: int) -> Dict[str, float]:
+    samples = []
+    for number in range(count):
+        started = time.perf_counter()
+        client.send_request("isMeetingRunning", {"meetingID": f"meeting-{number % 10}"})
+        samples.append(time.perf_counter() - started)
+    return _latencies(samples)
+
+
+def bench_throughput(
+    client: BigBlueButtonClient, count: int, workers: int
+) -> Dict[str, float]:
+    items = [f"meeting-{number % 10}" for number in range(count)]
+    started = time.perf_counter()
+    results = run_batch(
+        lambda meeting_id: client.send_request(
+            "isMeetingRunning", {"meetingID": meeting_id}
+        ),
+        items,
+        workers,
+    )
+    elapsed = time.perf_counter() - started
+    return {
+        "per_second": count / elapsed,
+        "errors": sum(not result.ok for result in results),
+    }
+
+
+async def _async_benchmarks(url: str, count: int) -> Dict[str, Dict[str, float]]:
+    from sage_bbb.services.aio.client import AsyncBigBlueButtonClient
+
+    client = AsyncBigBlueButtonClient(url, SALT)
+    samples = []
+    for number in range(count):
+        started = time.perf_counter()
+        await client.send_request(
+            "isMeetingRunning", {"meetingID": f"meeting-{number % 10}"}
+        )
+        samples.append(time.perf_counter() - started)
+    started = time.perf_counter()
+    outcomes = await asyncio.gather(
+        *(
+            client.send_request(
+                "isMeetingRunning", {"meetingID": f"meeting-{number % 10}"}
+            )
+            for number in range(count)
+        ),
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - started
+    await client.aclose()
+    return {
+        "async_latency": _latencies(samples),
+        "async_throughput": {
+            "per_second": count / elapsed,
+            "errors": sum(isinstance(outcome, Exception) for outcome in outcomes),
+        },
+    }
+
+
+def run(quick: bool, latency: float) -> Dict[str, Any]:
+    scale = 10 if quick else 1
+    results: Dict[str, Any] = {"imports": bench_imports(3 if quick else 7)}
+    with FakeBigBlueButtonServer(
+        SALT, meetings=200, attendees=25, recordings=2000, latency=latency
+    ) as server:
+        client = BigBlueButtonClient(server.url, SALT)
+        results["signing"] = bench_signing(client, 100000 // scale)
+        results["parsing"] = bench_parsing(client, 50 // scale or 1)
+        results["latency"] = bench_latency(client, 1000 // scale)
+        results["throughput"] = bench_throughput(client, 4000 // scale, 10)
+        try:
+            import httpx  # noqa: F401
+        except ImportError:
+            print("httpx is not installed; skipping the async benchmarks.")
+        else:
+            results.update(asyncio.run(_async_benchmarks(server.url, 1000 // scale)))
+        if server.checksum_errors:
+            raise RuntimeError(f"{server.checksum_errors} requests had bad checksums.")
+    return results
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[str]:
+    """
+    Returns a line per metric that regressed by more than ``threshold``.
+    """
+    regressions = []
+    for name, metrics in current["results"].items():
+        for metric, value in metrics.items():
+            before = baseline["results"].get(name, {}).get(metric)
+            if not before or metric in ("errors", "response_kib"):
+                continue
+            change = (value - before) / before
+            if metric in HIGHER_IS_BETTER:
+                change = -change
+            if change > threshold:
+                regressions.append(
+                    f"{name}.{metric}: {before:,.3f} -> {value:,.3f} "
+                    f"({change:+.0%} worse)"
+                )
+    return regressions
+
+
+def _print(results: Dict[str, Any]) -> None:
+    for name, metrics in results.items():
+        values = ", ".join(f"{key}={value:,.3f}" for key, value in metrics.items())
+        print(f"{name:<18}{values}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--quick", action="store_true", help="Run 10x fewer calls.")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Server delay per request (s)."
+    )
+    parser.add_argument("--output", help="Where to save the results as JSON.")
+    parser.add_argument("--compare", help="A saved result file to compare with.")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    report = {
+        "version": _version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": datetime.now(timezone.utc).isoformat(),
+        "quick": args.quick,
+        "latency": args.latency,
+        "results": run(args.quick, args.latency),
+    }
+    _print(report["results"])
+    output = args.output or os.path.join(RESULTS_DIR, f"{report['version']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results saved to {output}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(baseline, report, args.threshold)
+        for line in regressions:
+            print("REGRESSION", line)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
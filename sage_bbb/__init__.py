@@ -0,0 +1,28 @@
+from typing import TYPE_CHECKING
+
+from sage_bbb.lazy import lazy_exports
+
+# Public names and the module each one is imported from on first access;
+# ``from sage_bbb import BigBlueButtonUrlBuilder`` only loads the standard
+# library modules URL signing needs.
+_EXPORTS = {
+    "BigBlueButtonUrlBuilder": "sage_bbb.utils",
+    "ChecksumStrategy": "sage_bbb.utils",
+    "DefaultChecksumStrategy": "sage_bbb.utils",
+    "BigBlueButtonError": "sage_bbb.exceptions",
+    "BigBlueButtonClient": "sage_bbb.services.client",
+    "AsyncBigBlueButtonClient": "sage_bbb.services.aio.client",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from sage_bbb.exceptions import BigBlueButtonError
+    from sage_bbb.services.aio.client import AsyncBigBlueButtonClient
+    from sage_bbb.services.client import BigBlueButtonClient
+    from sage_bbb.utils import (
+        BigBlueButtonUrlBuilder,
+        ChecksumStrategy,
+        DefaultChecksumStrategy,
+    )
@@ -0,0 +1,129 @@
+from typing import Any, Dict, Optional
+
+
+class BigBlueButtonError(Exception):
+    """
+    Base class for every error raised by sage_bbb while calling the API.
+
+    Example:
+        try:
+            bbb_client.meetings.get_meetings()
+        except BigBlueButtonError as e:
+            print("BigBlueButton call failed:", e)
+    """
+
+
+class TransportError(BigBlueButtonError):
+    """
+    The request failed before a response was received.
+
+    Args:
+        message (str): A description of the failure.
+        request_sent (bool): False when the failure happened while connecting,
+        so the server cannot have processed the request. Such calls are always
+        safe to retry, even when they are not idempotent.
+    """
+
+    def __init__(self, message: str, request_sent: bool = True) -> None:
+        super().__init__(message)
+        self.request_sent = request_sent
+
+
+class HTTPStatusError(BigBlueButtonError):
+    """
+    The server answered an API call with an HTTP error status.
+
+    Args:
+        api_call (str): The API call that failed.
+        status_code (int): The HTTP status code of the response.
+        response (optional): The response itself.
+    """
+
+    def __init__(self, api_call: str, status_code: int, response: Any = None) -> None:
+        super().__init__(f"{api_call or 'API'} call failed with HTTP {status_code}")
+        self.api_call = api_call
+        self.status_code = status_code
+        self.response = response
+
+
+class CircuitOpenError(BigBlueButtonError):
+    """
+    The call was rejected without being sent because the circuit breaker of
+    its host is open after repeated failures.
+
+    Args:
+        host (str): The failing host.
+        retry_after (float): Seconds until a probe request is allowed again.
+    """
+
+    def __init__(self, host: str, retry_after: float) -> None:
+        super().__init__(
+            f"Circuit open for {host}; retrying in {retry_after:.1f}s"
+        )
+        self.host = host
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(BigBlueButtonError):
+    """
+    The deadline of the current operation expired before the call could
+    complete.
+
+    Args:
+        api_call (str): The API call that could not complete in time.
+        cause (Exception, optional): The error of the last attempt, if any.
+    """
+
+    def __init__(
+        self, api_call: str, cause: Optional[BaseException] = None
+    ) -> None:
+        super().__init__(f"Deadline exceeded for {api_call or 'API'} call")
+        self.api_call = api_call
+        self.cause = cause
+
+
+class InvalidSignatureError(BigBlueButtonError):
+    """
+    A callback received from a BigBlueButton server is unsigned, or its
+    checksum or JWT signature does not match the shared secret.
+    """
+
+
+class FailedResponseError(BigBlueButtonError):
+    """
+    The server answered an API call with ``returncode`` FAILED, e.g. a
+    ``notFound`` meeting or a ``checksumError``.
+
+    Only raised by clients created with ``raise_on_failure=True``; otherwise
+    the failed response is returned as is.
+
+    Args:
+        message_key (str): The ``messageKey`` of the response.
+        message (str): The ``message`` of the response.
+        response (dict, optional): The parsed response.
+    """
+
+    def __init__(
+        self, message_key: str, message: str = "", response: Any = None
+    ) -> None:
+        super().__init__(f"{message_key}: {message}" if message else message_key)
+        self.message_key = message_key
+        self.message = message
+        self.response = response
+
+
+def raise_for_returncode(response: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Raises FailedResponseError if a parsed response has ``returncode``
+    FAILED, and returns it unchanged otherwise.
+
+    Example:
+        info = raise_for_returncode(bbb_client.meetings.get_meeting_info(meeting))
+    """
+    if response.get("returncode") == "FAILED":
+        raise FailedResponseError(
+            response.get("messageKey") or "failed",
+            response.get("message") or "",
+            response,
+        )
+    return response
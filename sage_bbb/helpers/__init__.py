@@ -1 +1,4 @@
+from .attendee import Attendee
+from .hook import Hook
 from .meeting import Meeting
+from .recording import PlaybackFormat, Recording, TextTrack
@@ -0,0 +1,17 @@
+from typing import NamedTuple
+
+
+class Attendee(NamedTuple):
+    """
+    An immutable attendee of a running meeting, as reported by getMeetings
+    and getMeetingInfo.
+    """
+
+    user_id: str = ""
+    full_name: str = ""
+    role: str = ""
+    is_presenter: bool = False
+    is_listening_only: bool = False
+    has_joined_voice: bool = False
+    has_video: bool = False
+    client_type: str = ""
@@ -0,0 +1,14 @@
+from typing import NamedTuple
+
+
+class Hook(NamedTuple):
+    """
+    An immutable webhook registered on a server through ``hooks/create``.
+    ``meeting_id`` is empty for hooks receiving the events of every meeting.
+    """
+
+    hook_id: str = ""
+    callback_url: str = ""
+    meeting_id: str = ""
+    permanent_hook: bool = False
+    raw_data: bool = False
@@ -1,19 +1,45 @@
-from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, NamedTuple, Optional, Tuple
 
+from .attendee import Attendee
 
-@dataclass
-class Meeting:
-    meeting_id: str
-    internal_meeting_id: str
-    parent_meeting_id: str
-    attendee_pw: str
-    moderator_pw: str
-    create_time: str
-    voice_bridge: str
-    dial_number: str
-    create_date: str
-    has_user_joined: bool
-    duration: int
-    has_been_forcibly_ended: bool
-    message_key: str
-    message: str
+
+class Meeting(NamedTuple):
+    """
+    An immutable BigBlueButton meeting.
+
+    Being a named tuple, a Meeting has no per-instance ``__dict__`` and
+    cannot be modified once built; use ``meeting._replace(...)`` to derive a
+    changed copy. ``create_time`` is the server's epoch timestamp in
+    milliseconds, while ``start_time`` and ``end_time`` are timezone-aware
+    datetimes (None until the meeting has started or ended).
+    """
+
+    meeting_id: str = ""
+    internal_meeting_id: str = ""
+    parent_meeting_id: str = ""
+    attendee_pw: str = ""
+    moderator_pw: str = ""
+    create_time: int = 0
+    voice_bridge: str = ""
+    dial_number: str = ""
+    create_date: str = ""
+    has_user_joined: bool = False
+    duration: int = 0
+    has_been_forcibly_ended: bool = False
+    message_key: str = ""
+    message: str = ""
+    meeting_name: str = ""
+    running: bool = False
+    recording: bool = False
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    participant_count: int = 0
+    listener_count: int = 0
+    voice_participant_count: int = 0
+    video_count: int = 0
+    moderator_count: int = 0
+    max_users: int = 0
+    is_breakout: bool = False
+    attendees: Tuple[Attendee, ...] = ()
+    metadata: Dict[str, str] = {}
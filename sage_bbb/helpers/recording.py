@@ -0,0 +1,49 @@
+from datetime import datetime
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+class PlaybackFormat(NamedTuple):
+    """
+    An immutable playback format of a recording. ``length`` is in minutes
+    and ``processing_time`` in milliseconds, as reported by the server.
+    """
+
+    type: str = ""
+    url: str = ""
+    processing_time: int = 0
+    length: int = 0
+    size: int = 0
+
+
+class TextTrack(NamedTuple):
+    """
+    An immutable caption or subtitle track attached to a recording.
+    """
+
+    href: str = ""
+    kind: str = ""
+    label: str = ""
+    lang: str = ""
+    source: str = ""
+
+
+class Recording(NamedTuple):
+    """
+    An immutable BigBlueButton recording with its metadata and playback
+    formats. ``start_time`` and ``end_time`` are timezone-aware datetimes.
+    """
+
+    record_id: str = ""
+    meeting_id: str = ""
+    internal_meeting_id: str = ""
+    name: str = ""
+    is_breakout: bool = False
+    published: bool = False
+    state: str = ""
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    participants: int = 0
+    raw_size: int = 0
+    size: int = 0
+    metadata: Dict[str, str] = {}
+    playback: Tuple[PlaybackFormat, ...] = ()
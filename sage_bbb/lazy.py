@@ -0,0 +1,38 @@
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Builds the module ``__getattr__`` and ``__dir__`` of a package whose
+    public names are imported from their submodule on first access only, so
+    importing the package does not import its dependencies.
+
+    Args:
+        package (str): The ``__name__`` of the package.
+        exports (dict): Maps each public name to the module defining it,
+        relative to the package (e.g. ``".meetings"``).
+
+    Returns:
+        tuple: The ``__getattr__`` and ``__dir__`` functions of the package.
+
+    Example:
+        __getattr__, __dir__ = lazy_exports(__name__, {"Meetings": ".meetings"})
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        # Later lookups find the name directly, without calling __getattr__.
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
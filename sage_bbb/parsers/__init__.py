@@ -0,0 +1,18 @@
+from typing import TYPE_CHECKING
+
+from sage_bbb.lazy import lazy_exports
+
+# Parsers load xml.etree, so they are imported on first access.
+_EXPORTS = {
+    "StreamingParser": ".stream",
+    "iterparse": ".stream",
+    "element_to_dict": ".tree",
+    "parse_response": ".tree",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .stream import StreamingParser, iterparse
+    from .tree import element_to_dict, parse_response
@@ -0,0 +1,147 @@
+import xml.etree.ElementTree as ET
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+ElementPredicate = Callable[[ET.Element], bool]
+
+
+class StreamingParser(Generic[T]):
+    """
+    Incrementally parses a BigBlueButton response and emits its items.
+
+    Chunks of the response body are fed as they arrive from the network. Each
+    item element (e.g. ``<meeting>`` inside ``<meetings>``) is handed to
+    ``builder`` as soon as its closing tag is parsed and is then dropped from
+    the tree, so memory use does not grow with the number of items in the
+    response. Top-level scalar fields such as ``returncode`` and
+    ``messageKey`` are collected into ``header``.
+
+    With a ``predicate``, items whose element does not match are dropped
+    without being built. ``count`` is the number of items parsed so far,
+    matching or not.
+
+    Args:
+        container_tag (str): The tag wrapping the items, e.g. "recordings".
+        item_tag (str): The tag of each item, e.g. "recording".
+        builder (callable): Converts a completed item element into the
+        object to emit.
+        predicate (callable, optional): Tells whether an item element is
+        emitted.
+
+    Example:
+        parser = StreamingParser("meetings", "meeting", element_to_dict)
+        for chunk in response.iter_content(65536):
+            for meeting in parser.feed(chunk):
+                print(meeting)
+        parser.close()
+    """
+
+    def __init__(
+        self,
+        container_tag: str,
+        item_tag: str,
+        builder: Callable[[ET.Element], T],
+        predicate: Optional[ElementPredicate] = None,
+    ) -> None:
+        self.container_tag = container_tag
+        self.item_tag = item_tag
+        self.builder = builder
+        self.predicate = predicate
+        self.count = 0
+        self.header: Dict[str, Any] = {}
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._stack: List[ET.Element] = []
+
+    def feed(self, chunk: bytes) -> List[T]:
+        """
+        Feeds a chunk of the response body to the parser.
+
+        Args:
+            chunk (bytes): The next chunk of the response body.
+
+        Returns:
+            list: The items completed by this chunk, in document order.
+        """
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> List[T]:
+        """
+        Signals the end of the response body.
+
+        Returns:
+            list: Any items completed by the final chunk.
+
+        Raises:
+            xml.etree.ElementTree.ParseError: If the response is not
+            well-formed XML.
+        """
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> List[T]:
+        items: List[T] = []
+        stack = self._stack
+        for event, element in self._parser.read_events():
+            if event == "start":
+                stack.append(element)
+                continue
+            stack.pop()
+            if not stack:
+                continue
+            parent = stack[-1]
+            if element.tag == self.item_tag and parent.tag == self.container_tag:
+                self.count += 1
+                if self.predicate is None or self.predicate(element):
+                    items.append(self.builder(element))
+                parent.remove(element)
+            elif len(stack) == 1 and element.tag != self.container_tag:
+                self.header[element.tag] = element.text
+                parent.remove(element)
+        return items
+
+
+def iterparse(
+    chunks: Iterable[bytes],
+    container_tag: str,
+    item_tag: str,
+    builder: Callable[[ET.Element], T],
+    predicate: Optional[ElementPredicate] = None,
+) -> Iterator[T]:
+    """
+    Lazily yields the items of a streamed BigBlueButton response.
+
+    Args:
+        chunks (iterable of bytes): The response body chunks, e.g.
+        ``response.iter_content(65536)``.
+        container_tag (str): The tag wrapping the items, e.g. "recordings".
+        item_tag (str): The tag of each item, e.g. "recording".
+        builder (callable): Converts a completed item element into the
+        object to yield.
+        predicate (callable, optional): Tells whether an item element is
+        yielded; other items are never built.
+
+    Returns:
+        Iterator: The built items, one at a time.
+
+    Example:
+        for recording in iterparse(
+        response.iter_content(65536), "recordings", "recording", element_to_dict
+        ):
+            print(recording["recordID"])
+    """
+    parser = StreamingParser(container_tag, item_tag, builder, predicate)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
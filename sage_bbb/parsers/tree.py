@@ -0,0 +1,85 @@
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, Iterable, Union
+
+# Elements whose children are always returned as a list, even when the server
+# sends a single child (or none at all).
+LIST_CONTAINERS = frozenset(
+    {
+        "meetings",
+        "attendees",
+        "recordings",
+        "playback",
+        "images",
+        "breakoutRooms",
+        "tracks",
+        "hooks",
+    }
+)
+
+# Elements whose children are always returned as a mapping, even when empty.
+DICT_CONTAINERS = frozenset({"metadata"})
+
+
+def element_to_dict(element: ET.Element) -> Any:
+    """
+    Converts an XML element into nested Python structures.
+
+    Leaf elements become their text, list containers (``<meetings>``,
+    ``<attendees>``, ``<playback>``...) become lists and every other element
+    becomes a dictionary keyed by child tag. Tags repeated under the same
+    parent are collected into a list.
+
+    Args:
+        element (ET.Element): The element to convert.
+
+    Returns:
+        The text, list or dictionary representation of the element.
+
+    Example:
+        element = ET.fromstring("<meeting><meetingID>1234</meetingID></meeting>")
+        print(element_to_dict(element))  # Output: {"meetingID": "1234"}
+    """
+    tag = element.tag
+    if tag in LIST_CONTAINERS:
+        return [element_to_dict(child) for child in element]
+    if len(element) == 0:
+        return {} if tag in DICT_CONTAINERS else element.text
+    result: Dict[str, Any] = {}
+    for child in element:
+        value = element_to_dict(child)
+        if child.tag in result:
+            existing = result[child.tag]
+            if isinstance(existing, list) and child.tag not in LIST_CONTAINERS:
+                existing.append(value)
+            else:
+                result[child.tag] = [existing, value]
+        else:
+            result[child.tag] = value
+    return result
+
+
+def parse_response(source: Union[str, bytes, Iterable[bytes]]) -> Dict[str, Any]:
+    """
+    Parses a complete BigBlueButton XML response into nested structures.
+
+    Args:
+        source (str, bytes or iterable of bytes): The response body, either
+        whole or as the chunks it was received in.
+
+    Returns:
+        dict: The response, with nested elements converted by
+        ``element_to_dict``.
+
+    Example:
+        response_dict = parse_response(response.content)
+        print(response_dict["returncode"])
+    """
+    if isinstance(source, (str, bytes)):
+        root = ET.fromstring(source)
+    else:
+        parser = ET.XMLParser()
+        for chunk in source:
+            parser.feed(chunk)
+        root = parser.close()
+    result = element_to_dict(root)
+    return result if isinstance(result, dict) else {}
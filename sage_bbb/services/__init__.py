@@ -1,3 +1,21 @@
-from .configurations import Configurations
-from .meetings import Meetings
-from .recordings import Recordings
+from typing import TYPE_CHECKING
+
+from sage_bbb.lazy import lazy_exports
+
+# Services are imported on first access, so importing a single module of this
+# package (e.g. ``sage_bbb.services.client``) does not load all of them.
+_EXPORTS = {
+    "Configurations": ".configurations",
+    "Hooks": ".hooks",
+    "Meetings": ".meetings",
+    "Recordings": ".recordings",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .configurations import Configurations
+    from .hooks import Hooks
+    from .meetings import Meetings
+    from .recordings import Recordings
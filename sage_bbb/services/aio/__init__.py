@@ -0,0 +1,20 @@
+from typing import TYPE_CHECKING
+
+from sage_bbb.lazy import lazy_exports
+
+# Services are imported on first access, like those of sage_bbb.services.
+_EXPORTS = {
+    "AsyncConfigurations": ".configurations",
+    "AsyncHooks": ".hooks",
+    "AsyncMeetings": ".meetings",
+    "AsyncRecordings": ".recordings",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .configurations import AsyncConfigurations
+    from .hooks import AsyncHooks
+    from .meetings import AsyncMeetings
+    from .recordings import AsyncRecordings
@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Optional,
+    TypeVar,
+)
+from urllib.parse import urlsplit
+
+from sage_bbb import parsers
+from sage_bbb.exceptions import HTTPStatusError, raise_for_returncode
+from sage_bbb.services import aio
+from sage_bbb.services.cache import ResponseCache
+from sage_bbb.services.instrumentation import (
+    CallMetrics,
+    Instrumentation,
+    response_size,
+)
+from sage_bbb.services.policy import RequestPolicy
+from sage_bbb.utils import BigBlueButtonUrlBuilder, ChecksumStrategy
+
+if TYPE_CHECKING:
+    import xml.etree.ElementTree as ET
+
+    from sage_bbb.services.aio.transport import AsyncTransport
+    from sage_bbb.services.transport import Timeout
+
+T = TypeVar("T")
+
+
+class AsyncBigBlueButtonClient:
+    """
+    This class provides an asyncio client to interact with a BigBlueButton server.
+
+    It mirrors BigBlueButtonClient, but every API call is a coroutine, so a
+    single event loop can drive many concurrent calls without worker threads.
+
+    Args:
+        bbb_server_base_url (str): The base URL of the BigBlueButton server.
+        security_salt (str): The security salt used for generating checksums.
+        transport (AsyncTransport, optional): The transport used to send
+        requests. A pooled ``HttpxAsyncTransport`` is created when omitted.
+        cache (ResponseCache, optional): Caches read-only API calls. Responses
+        are always fetched from the server when omitted.
+        checksum_strategy (ChecksumStrategy, optional): Signs the API calls.
+        Defaults to SHA-1 ``DefaultChecksumStrategy``.
+        policy (RequestPolicy, optional): Retries, circuit breaking and
+        deadlines applied to every call. Defaults to ``RequestPolicy()``.
+        instrumentation (Instrumentation, optional): Hooks called around every
+        API call, e.g. a ``MetricsCollector``. Calls are not timed when omitted.
+        raise_on_failure (bool): Raises FailedResponseError for responses with
+        ``returncode`` FAILED instead of returning them.
+
+    Attributes:
+        meetings: An instance of the AsyncMeetings class for meeting operations.
+        recordings: An instance of the AsyncRecordings class for recording
+        operations.
+        configurations: An instance of the AsyncConfigurations class
+        for configuration operations.
+        hooks: An instance of the AsyncHooks class for webhook operations.
+        transport: The transport all API calls are routed through.
+        cache: The response cache, or None when caching is disabled.
+        policy: The request policy.
+        instrumentation: The instrumentation hooks, or None.
+
+    Example:
+        async with AsyncBigBlueButtonClient(
+        "http://example.com/bigbluebutton/api/", "secret"
+        ) as bbb_client:
+            connection_status = await bbb_client.check_connection()
+            print(connection_status)
+    """
+
+    def __init__(
+        self,
+        bbb_server_base_url: str,
+        security_salt: str,
+        transport: Optional[AsyncTransport] = None,
+        cache: Optional[ResponseCache] = None,
+        checksum_strategy: Optional[ChecksumStrategy] = None,
+        policy: Optional[RequestPolicy] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        raise_on_failure: bool = False,
+    ) -> None:
+        self.url_builder = BigBlueButtonUrlBuilder(
+            bbb_server_base_url, security_salt, checksum_strategy
+        )
+        self.host = urlsplit(self.url_builder.bbb_server_base_url).netloc
+        self.policy = policy or RequestPolicy()
+        self.instrumentation = instrumentation
+        self.raise_on_failure = raise_on_failure
+        self._owns_transport = transport is None
+        if transport is None:
+            # Imported here, so importing this module does not load httpx.
+            from sage_bbb.services.aio.transport import HttpxAsyncTransport
+
+            transport = HttpxAsyncTransport()
+        self.transport = transport
+        self.cache = cache
+        self.meetings = aio.AsyncMeetings(self)
+        self.recordings = aio.AsyncRecordings(self)
+        self.configurations = aio.AsyncConfigurations(self)
+        self.hooks = aio.AsyncHooks(self)
+
+    async def aclose(self) -> None:
+        """
+        Closes the underlying transport and its pooled connections.
+
+        A transport passed in by the caller is left open, since it may be
+        shared with other clients.
+
+        Example:
+            await bbb_client.aclose()
+        """
+        if self._owns_transport:
+            await self.transport.aclose()
+
+    async def __aenter__(self) -> "AsyncBigBlueButtonClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def send_request(
+        self,
+        api_call: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Any = None,
+        headers: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Timeout] = None,
+        files: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+    ) -> Any:
+        """
+        Sends an HTTP request to the BigBlueButton server.
+
+        Args:
+            api_call (str): The API call to be made (e.g., "create", "join").
+            params (dict, optional): The parameters to be included in the request.
+            data (str, optional): The data to be included in the request body (
+            for POST requests
+            ). A MultipartStream is streamed rather than loaded in memory.
+            headers (dict, optional): The headers to be included in the request.
+            timeout (float or tuple, optional): A single timeout or a
+            ``(connect, read)`` tuple overriding the transport defaults.
+            files (dict, optional): Files to upload as a multipart body.
+            stream (bool): Whether to defer downloading the response body.
+
+        Returns:
+            httpx.Response: The response from the server.
+
+        Raises:
+            TransportError: If no response was received.
+            HTTPStatusError: If the server answered with an HTTP error status.
+            CircuitOpenError: If the server's circuit breaker is open.
+            DeadlineExceededError: If the current deadline expired.
+
+        Example:
+            response = await self.send_request("getMeetings", params={})
+            print(response.content)
+        """
+        cache = self.cache
+        if cache is None or stream:
+            return await self._send(
+                api_call, params, data, headers, timeout, files, stream
+            )
+        server = self.url_builder.bbb_server_base_url
+        if data is None and files is None and cache.is_cacheable(api_call):
+            return await cache.aget_or_fetch(
+                api_call,
+                params,
+                lambda: self._send(
+                    api_call, params, data, headers, timeout, None, False
+                ),
+                server,
+            )
+        try:
+            return await self._send(
+                api_call, params, data, headers, timeout, files, False
+            )
+        finally:
+            cache.invalidate(api_call, params, server)
+
+    async def _send(
+        self,
+        api_call: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[str],
+        headers: Optional[Dict[str, Any]],
+        timeout: Optional[Timeout],
+        files: Optional[Dict[str, Any]],
+        stream: bool,
+    ) -> Any:
+        """
+        Signs and sends a request through the transport and the request
+        policy, bypassing the cache.
+        """
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            return await self._send_instrumented(
+                instrumentation, api_call, params, data, headers, timeout, files, stream
+            )
+        url = self.url_builder.build_url(api_call, params)
+        return await self.policy.aexecute(
+            api_call,
+            self.host,
+            self._attempt(api_call, url, data, headers, files, stream),
+            timeout,
+        )
+
+    def _attempt(
+        self,
+        api_call: str,
+        url: str,
+        data: Optional[str],
+        headers: Optional[Dict[str, Any]],
+        files: Optional[Dict[str, Any]],
+        stream: bool,
+    ) -> Callable[[Optional[Timeout]], Any]:
+        """
+        Returns a function sending one attempt of a signed call.
+        """
+
+        async def attempt(attempt_timeout: Optional[Timeout]) -> Any:
+            if data or files:
+                response = await self.transport.request(
+                    "POST",
+                    url,
+                    data=data,
+                    headers=headers,
+                    timeout=attempt_timeout,
+                    files=files,
+                )
+            else:
+                response = await self.transport.request(
+                    "GET", url, timeout=attempt_timeout, stream=stream
+                )
+            if response.status_code >= 400:
+                await response.aclose()
+                raise HTTPStatusError(api_call, response.status_code, response)
+            return response
+
+        return attempt
+
+    async def _send_instrumented(
+        self,
+        instrumentation: Instrumentation,
+        api_call: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[str],
+        headers: Optional[Dict[str, Any]],
+        timeout: Optional[Timeout],
+        files: Optional[Dict[str, Any]],
+        stream: bool,
+    ) -> Any:
+        """
+        Same as ``_send``, timing the signing and network phases for the
+        instrumentation hooks.
+        """
+        instrumentation.before_request(api_call, self.host)
+        started = signed = time.perf_counter()
+        response = None
+        error: Optional[BaseException] = None
+        try:
+            url = self.url_builder.build_url(api_call, params)
+            signed = time.perf_counter()
+            response = await self.policy.aexecute(
+                api_call,
+                self.host,
+                self._attempt(api_call, url, data, headers, files, stream),
+                timeout,
+            )
+            return response
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            instrumentation.after_request(
+                CallMetrics(
+                    api_call,
+                    self.host,
+                    sign_seconds=signed - started,
+                    network_seconds=time.perf_counter() - signed,
+                    response_bytes=response_size(response, stream),
+                    status_code=(
+                        response.status_code
+                        if response is not None
+                        else getattr(error, "status_code", None)
+                    ),
+                    error=error,
+                )
+            )
+
+    async def stream_items(
+        self,
+        api_call: str,
+        params: Dict[str, Any],
+        container_tag: str,
+        item_tag: str,
+        builder: Callable[[ET.Element], T],
+        chunk_size: int = 65536,
+        predicate: Optional[Callable[[ET.Element], bool]] = None,
+    ) -> AsyncIterator[T]:
+        """
+        Sends a request and lazily yields the items of its response.
+
+        Args:
+            api_call (str): The API call to be made (e.g., "getRecordings").
+            params (dict): The parameters to be included in the request.
+            container_tag (str): The tag wrapping the items, e.g. "recordings".
+            item_tag (str): The tag of each item, e.g. "recording".
+            builder (callable): Converts an item element into the yielded object.
+            chunk_size (int): The number of bytes read from the network at a time.
+            predicate (callable, optional): Tells whether an item element is
+            yielded; other items are never built.
+
+        Returns:
+            AsyncIterator: The built items, one at a time.
+
+        Example:
+            async for recording in bbb_client.stream_items(
+            "getRecordings", {}, "recordings", "recording",
+            RecordingFactory.from_element
+            ):
+                print(recording.record_id)
+        """
+        response = await self.send_request(api_call, params, stream=True)
+        instrumentation = self.instrumentation
+        parse_seconds = 0.0
+        size = 0
+        try:
+            parser = parsers.StreamingParser(
+                container_tag, item_tag, builder, predicate
+            )
+            async for chunk in response.aiter_bytes(chunk_size):
+                if instrumentation is None:
+                    items = parser.feed(chunk)
+                else:
+                    started = time.perf_counter()
+                    items = parser.feed(chunk)
+                    parse_seconds += time.perf_counter() - started
+                    size += len(chunk)
+                for item in items:
+                    yield item
+            for item in parser.close():
+                yield item
+        finally:
+            await response.aclose()
+            if instrumentation is not None:
+                instrumentation.on_parse(api_call, parse_seconds, size)
+
+    def parse_response(
+        self, response_xml: str, api_call: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Parses the XML response from the server.
+
+        Args:
+            response_xml (str): The XML response content.
+            api_call (str, optional): The API call the response answers, which
+            parse time is attributed to by the instrumentation hooks.
+
+        Returns:
+            dict: A dictionary representation of the XML response. Nested
+            elements such as ``<meetings>`` or ``<recordings>`` are kept as
+            nested lists and dictionaries.
+
+        Raises:
+            FailedResponseError: If ``raise_on_failure`` is set and the
+            response has ``returncode`` FAILED.
+
+        Example:
+            response_dict = self.parse_response(response.content, "getMeetings")
+            print(response_dict)
+        """
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            result = parsers.parse_response(response_xml)
+        else:
+            started = time.perf_counter()
+            result = parsers.parse_response(response_xml)
+            instrumentation.on_parse(
+                api_call, time.perf_counter() - started, len(response_xml)
+            )
+        if self.raise_on_failure:
+            raise_for_returncode(result)
+        return result
+
+    async def check_connection(self) -> Dict[str, Any]:
+        """
+        Checks the connection to the BigBlueButton server.
+
+        Returns:
+            dict: A dictionary containing the response from the server.
+
+        Example:
+            connection_status = await bbb_client.check_connection()
+            print(connection_status)
+        """
+        response = await self.send_request("", {})
+        return self.parse_response(response.content, "")
@@ -0,0 +1,98 @@
+from typing import Any, Dict, Iterable, List, Optional
+import logging
+
+from sage_bbb.helpers import Hook
+from sage_bbb.services.factory import HookFactory
+from sage_bbb.services.hooks import _create_params, _created_hook
+from sage_bbb.services.logs import ServiceLogger
+
+logger = logging.getLogger(__name__)
+log = ServiceLogger(logger)
+
+
+class AsyncHooks:
+    """
+    Async counterpart of Hooks, for AsyncBigBlueButtonClient.
+
+    Args:
+        client: The async client used to interact with the BigBlueButton server.
+
+    Example:
+        hook = await async_client.hooks.create_hook("https://example.com/bbb/events")
+    """
+
+    def __init__(self, client: "AsyncBigBlueButtonClient") -> None:
+        self.client = client
+
+    async def create_hook(
+        self,
+        callback_url: str,
+        meeting_id: Optional[str] = None,
+        event_ids: Optional[Iterable[str]] = None,
+        raw_data: bool = False,
+    ) -> Hook:
+        """
+        Registers a webhook.
+
+        Args:
+            callback_url (str): The URL events are sent to.
+            meeting_id (str, optional): Only sends the events of this meeting.
+            event_ids (iterable of str, optional): Only sends these event types.
+            raw_data (bool): Whether to send the raw server messages too.
+
+        Returns:
+            Hook: The registered hook. ``hook_id`` is empty if the server
+            refused it.
+
+        Example:
+            hook = await hooks.create_hook("https://example.com/bbb/events")
+        """
+        params = _create_params(callback_url, meeting_id, event_ids, raw_data)
+        log.request("hooks/create", "Registering webhook for %s", callback_url)
+        response = await self.client.send_request("hooks/create", params)
+        hook = _created_hook(
+            self.client.parse_response(response.content, "hooks/create"), params
+        )
+        log.response("hooks/create", "Webhook registered with ID: %s", hook.hook_id)
+        return hook
+
+    async def list_hooks(self, meeting_id: Optional[str] = None) -> List[Hook]:
+        """
+        Lists the registered webhooks.
+
+        Args:
+            meeting_id (str, optional): Only lists the hooks of this meeting
+            and the global hooks.
+
+        Returns:
+            list: The registered Hook objects.
+
+        Example:
+            hooks = await async_client.hooks.list_hooks()
+        """
+        params = {"meetingID": meeting_id} if meeting_id else {}
+        log.request("hooks/list", "Listing webhooks with params: %s", params)
+        response = await self.client.send_request("hooks/list", params)
+        response_dict = self.client.parse_response(response.content, "hooks/list")
+        log.response("hooks/list", "Webhooks listed successfully.")
+        return [
+            HookFactory.create_hook(hook) for hook in response_dict.get("hooks") or []
+        ]
+
+    async def destroy_hook(self, hook_id: str) -> Dict[str, Any]:
+        """
+        Removes a webhook.
+
+        Args:
+            hook_id (str): The ID returned by ``create_hook``.
+
+        Returns:
+            dict: The response from the API call.
+
+        Example:
+            await async_client.hooks.destroy_hook(hook.hook_id)
+        """
+        log.request("hooks/destroy", "Removing webhook ID: %s", hook_id)
+        response = await self.client.send_request("hooks/destroy", {"hookID": hook_id})
+        log.response("hooks/destroy", "Webhook ID %s removed.", hook_id)
+        return self.client.parse_response(response.content, "hooks/destroy")
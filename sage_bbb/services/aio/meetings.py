@@ -0,0 +1,376 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+import asyncio
+import logging
+
+from sage_bbb.helpers import Meeting
+from sage_bbb.services.batch import BatchResult, gather_batch
+from sage_bbb.services.factory import MeetingFactory
+from sage_bbb.services.logs import ServiceLogger
+from sage_bbb.services.meetings import (
+    JOIN_URL_CHUNK_SIZE,
+    Roster,
+    _answer_from_listing,
+    _info_response,
+    _running_response,
+    build_join_urls,
+)
+from sage_bbb.services.presentations import (
+    PresentationBody,
+    PresentationSource,
+    shared_cache,
+)
+from sage_bbb.services.query import Query
+
+logger = logging.getLogger(__name__)
+log = ServiceLogger(logger)
+
+
+class AsyncMeetings:
+    """
+    This class handles asynchronous operations related to meetings in BigBlueButton.
+
+    Args:
+        client: The client used to interact with the BigBlueButton server.
+
+    Example:
+        bbb_client = AsyncBigBlueButtonClient(
+        "http://example.com/bigbluebutton/api/", "secret"
+        )
+        meetings = AsyncMeetings(bbb_client)
+    """
+
+    def __init__(self, client: "AsyncBigBlueButtonClient") -> None:
+        self.client = client
+        self.presentation_cache = shared_cache
+
+    async def get_meetings(
+        self, metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieves a list of all current meetings, optionally filtered by metadata.
+
+        Args:
+            metadata (dict, optional): A dictionary of metadata to filter the meetings.
+
+        Returns:
+            dict: A dictionary containing information about the current meetings.
+
+        Example:
+            meetings = AsyncMeetings(bbb_client)
+            current_meetings = await meetings.get_meetings()
+            print(current_meetings)
+
+            filtered_meetings = await meetings.get_meetings({"title": "Test Meeting"})
+            print(filtered_meetings)
+        """
+        params = metadata if metadata else {}
+        log.request("getMeetings", "Retrieving meetings with params: %s", params)
+        response = await self.client.send_request("getMeetings", params)
+        log.response("getMeetings", "Meetings retrieved successfully.")
+        return self.client.parse_response(response.content, "getMeetings")
+
+    def iter_meetings(
+        self,
+        metadata: Optional[Dict[str, Any]] = None,
+        query: Optional[Query] = None,
+    ) -> AsyncIterator[Meeting]:
+        """
+        Lazily yields every current meeting, including its attendees and metadata.
+
+        Args:
+            metadata (dict, optional): A dictionary of metadata to filter the meetings.
+            query (Query, optional): Only yields the matching meetings; the
+            others are skipped while parsing, without being built.
+
+        Returns:
+            AsyncIterator[Meeting]: The current meetings, one at a time.
+
+        Example:
+            meetings = AsyncMeetings(bbb_client)
+            async for meeting in meetings.iter_meetings():
+                print(meeting.meeting_name, meeting.participant_count)
+        """
+        params = metadata if metadata else {}
+        log.request("getMeetings", "Streaming meetings with params: %s", params)
+        return self.client.stream_items(
+            "getMeetings",
+            params,
+            "meetings",
+            "meeting",
+            MeetingFactory.from_element,
+            predicate=query.element_predicate("meeting") if query else None,
+        )
+
+    async def create_meeting(
+        self,
+        name: str,
+        meeting_id: str,
+        attendee_pw: str,
+        moderator_pw: str,
+        presentations: Optional[Iterable[PresentationSource]] = None,
+        **kwargs: Any,
+    ) -> Meeting:
+        """
+        Creates a new meeting.
+
+        Presentations are sent as the XML body of the request. Embedded
+        documents are base64-encoded once per content by
+        ``presentation_cache`` and streamed in chunks, so creating many
+        meetings with the same deck only encodes it once.
+
+        Args:
+            name (str): The name of the meeting.
+            meeting_id (str): The unique identifier for the meeting.
+            attendee_pw (str): The password for attendees.
+            moderator_pw (str): The password for moderators.
+            presentations (iterable, optional): Documents to preload:
+            Presentation objects, URLs, paths, binary file objects or
+            contents wrapped in a Presentation with a filename.
+            **kwargs: Additional optional parameters for the meeting.
+
+        Returns:
+            Meeting: An immutable Meeting instance
+            containing details about the created meeting.
+
+        Example:
+            meetings = AsyncMeetings(bbb_client)
+            new_meeting = await meetings.create_meeting(
+                name="Test Meeting",
+                meeting_id="1234",
+                attendee_pw="ap",
+                moderator_pw="mp",
+                presentations=["decks/week-1.pdf"],
+            )
+            print(new_meeting)
+        """
+        params = {
+            "name": name,
+            "meetingID": meeting_id,
+            "attendeePW": attendee_pw,
+            "moderatorPW": moderator_pw,
+            **kwargs,
+        }
+        log.request("create", "Creating meeting with params: %s", params)
+        if presentations is None:
+            response = await self.client.send_request("create", params)
+        else:
+            # Encoding a new deck reads the file, so it runs off the event loop.
+            body = await asyncio.get_running_loop().run_in_executor(
+                None, PresentationBody, presentations, self.presentation_cache
+            )
+            response = await self.client.send_request(
+                "create", params, data=body, headers=body.headers
+            )
+        response_dict = self.client.parse_response(response.content, "create")
+        log.response("create", "Meeting created successfully with ID: %s", meeting_id)
+        return MeetingFactory.create_meeting(response_dict)
+
+    def join_meeting(
+        self, meeting: Meeting, full_name: str, password: str, **kwargs: Any
+    ) -> str:
+        """
+        Constructs the URL for joining a meeting.
+
+        Args:
+            meeting (Meeting): The Meeting instance.
+            full_name (str): The full name of the user joining the meeting.
+            password (str): The password for the meeting (attendee or moderator).
+            **kwargs: Additional optional parameters for the join URL.
+
+        Returns:
+            str: The URL for joining the meeting.
+
+        Example:
+            join_url = meetings.join_meeting(
+                meeting=new_meeting,
+                full_name="John Doe",
+                password="ap"
+            )
+            print(join_url)
+        """
+        params = {
+            "fullName": full_name,
+            "meetingID": meeting.meeting_id,
+            "password": password,
+            **kwargs,
+        }
+        log.request("join", "Joining meeting ID: %s with full name: %s", meeting.meeting_id, full_name)
+        join_url = self.client.url_builder.build_url("join", params)
+        log.response("join", "Join URL generated: %s", join_url)
+        return join_url
+
+    def build_join_urls(
+        self,
+        meeting: Meeting,
+        roster: Roster,
+        processes: Optional[int] = None,
+        chunk_size: int = JOIN_URL_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """
+        Lazily builds the join URLs of a whole roster. Signing is local, so
+        this is a regular method; see Meetings.build_join_urls.
+
+        Example:
+            join_urls = list(
+                meetings.build_join_urls(
+                    new_meeting, [{"fullName": "Jane Doe"}], role="VIEWER"
+                )
+            )
+        """
+        return build_join_urls(
+            self.client.url_builder, meeting, roster, processes, chunk_size, **kwargs
+        )
+
+    async def end_meeting(self, meeting: Meeting) -> Dict[str, Any]:
+        """
+        Ends a meeting.
+
+        Args:
+            meeting (Meeting): The Meeting instance.
+
+        Returns:
+            dict: The response from the API call.
+
+        Example:
+            end_meeting_response = await meetings.end_meeting(new_meeting)
+            print(end_meeting_response)
+        """
+        params = {
+            "meetingID": meeting.meeting_id,
+            "password": meeting.moderator_pw,
+        }
+        log.request("end", "Ending meeting ID: %s", meeting.meeting_id)
+        response = await self.client.send_request("end", params)
+        log.response("end", "Meeting ID %s ended successfully.", meeting.meeting_id)
+        return self.client.parse_response(response.content, "end")
+
+    async def is_meeting_running(self, meeting: Meeting) -> Dict[str, Any]:
+        """
+        Checks if a meeting is currently running.
+
+        Args:
+            meeting (Meeting): The Meeting instance.
+
+        Returns:
+            dict: The response from the API call.
+
+        Example:
+            is_running_response = await meetings.is_meeting_running(new_meeting)
+            print(is_running_response)
+        """
+        params = {
+            "meetingID": meeting.meeting_id,
+        }
+        log.request("isMeetingRunning", "Checking if meeting ID: %s is running.", meeting.meeting_id)
+        response = await self.client.send_request("isMeetingRunning", params)
+        log.response("isMeetingRunning", "Meeting running status retrieved for meeting ID: %s", meeting.meeting_id)
+        return self.client.parse_response(response.content, "isMeetingRunning")
+
+    async def get_meeting_info(self, meeting: Meeting) -> Dict[str, Any]:
+        """
+        Retrieves detailed information about a meeting.
+
+        Args:
+            meeting (Meeting): The Meeting instance.
+
+        Returns:
+            dict: The response from the API call.
+
+        Example:
+            meeting_info = await meetings.get_meeting_info(new_meeting)
+            print(meeting_info)
+        """
+        params = {
+            "meetingID": meeting.meeting_id,
+        }
+        log.request("getMeetingInfo", "Retrieving information for meeting ID: %s", meeting.meeting_id)
+        response = await self.client.send_request("getMeetingInfo", params)
+        log.response("getMeetingInfo", "Meeting information retrieved for meeting ID: %s", meeting.meeting_id)
+        return self.client.parse_response(response.content, "getMeetingInfo")
+
+    async def is_meeting_running_many(
+        self,
+        meetings: Iterable[Meeting],
+        max_concurrency: Optional[int] = None,
+        single_request: bool = False,
+    ) -> List[BatchResult]:
+        """
+        Checks whether each of several meetings is currently running.
+
+        The isMeetingRunning calls run as concurrent tasks. With
+        ``single_request`` the answers are instead derived from one
+        getMeetings call.
+
+        Args:
+            meetings (iterable of Meeting): The meetings to check.
+            max_concurrency (int, optional): The maximum number of requests in
+            flight, on top of the transport's own limit.
+            single_request (bool): Whether to answer from a single getMeetings call.
+
+        Returns:
+            list: One BatchResult per meeting, in input order.
+
+        Example:
+            results = await meetings.is_meeting_running_many([meeting_a, meeting_b])
+        """
+        meetings = list(meetings)
+        log.request("isMeetingRunning", "Checking running status of %s meetings.", len(meetings))
+        if single_request:
+            return await self._answer_from_get_meetings(meetings, _running_response)
+        return await gather_batch(self.is_meeting_running, meetings, max_concurrency)
+
+    async def get_meeting_info_many(
+        self,
+        meetings: Iterable[Meeting],
+        max_concurrency: Optional[int] = None,
+        single_request: bool = False,
+    ) -> List[BatchResult]:
+        """
+        Retrieves detailed information about several meetings.
+
+        The getMeetingInfo calls run as concurrent tasks. With
+        ``single_request`` the answers are instead taken from one getMeetings
+        call.
+
+        Args:
+            meetings (iterable of Meeting): The meetings to look up.
+            max_concurrency (int, optional): The maximum number of requests in
+            flight, on top of the transport's own limit.
+            single_request (bool): Whether to answer from a single getMeetings call.
+
+        Returns:
+            list: One BatchResult per meeting, in input order.
+
+        Example:
+            results = await meetings.get_meeting_info_many(todays_meetings)
+        """
+        meetings = list(meetings)
+        log.request("getMeetingInfo", "Retrieving information for %s meetings.", len(meetings))
+        if single_request:
+            return await self._answer_from_get_meetings(meetings, _info_response)
+        return await gather_batch(self.get_meeting_info, meetings, max_concurrency)
+
+    async def _answer_from_get_meetings(
+        self,
+        meetings: List[Meeting],
+        build: Callable[[Optional[Dict[str, Any]]], Dict[str, Any]],
+    ) -> List[BatchResult]:
+        """
+        Answers a batch of per-meeting calls from a single getMeetings call,
+        reporting a failure of that call against every meeting.
+        """
+        try:
+            listing = await self.get_meetings()
+        except Exception as e:
+            return [BatchResult(meeting, error=e) for meeting in meetings]
+        return _answer_from_listing(meetings, listing, build)
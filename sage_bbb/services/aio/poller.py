@@ -0,0 +1,151 @@
+import asyncio
+import inspect
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set
+
+from sage_bbb.services.poller import EventCallback, MeetingEvent, MeetingIndex
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMeetingPoller:
+    """
+    Polls a server's meetings on the event loop and streams changes only.
+
+    Changes are delivered to callbacks (plain functions or coroutine
+    functions) and to every ``events()`` async iterator. See MeetingPoller
+    for the polling and diffing rules.
+
+    Args:
+        client (AsyncBigBlueButtonClient): The client of the server to watch.
+        active_interval (float): Seconds between polls while meetings run.
+        idle_interval (float): Seconds between polls while the server is idle.
+        metadata (dict, optional): Only watch meetings matching this metadata.
+        max_queued (int): The maximum number of events buffered per
+        ``events()`` iterator; the oldest events are dropped beyond it.
+
+    Example:
+        async with AsyncMeetingPoller(bbb_client) as poller:
+            async for event in poller.events():
+                print(event.type, event.meeting.meeting_id)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        active_interval: float = 2.0,
+        idle_interval: float = 30.0,
+        metadata: Optional[Dict[str, Any]] = None,
+        max_queued: int = 10000,
+    ) -> None:
+        self.client = client
+        self.active_interval = active_interval
+        self.idle_interval = idle_interval
+        self.metadata = metadata
+        self.max_queued = max_queued
+        self.index = MeetingIndex()
+        self._subscribers: List[EventCallback] = []
+        self._queues: Set["asyncio.Queue[MeetingEvent]"] = set()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def subscribe(self, callback: EventCallback) -> Callable[[], None]:
+        """
+        Registers a callback called with every MeetingEvent.
+
+        Returns:
+            callable: Unregisters the callback.
+        """
+        self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    @property
+    def interval(self) -> float:
+        """
+        Seconds until the next poll, given the current state.
+        """
+        return self.active_interval if self.index.active else self.idle_interval
+
+    async def poll(self) -> List[MeetingEvent]:
+        """
+        Polls the server once and notifies subscribers of the changes.
+
+        Returns:
+            list: The change events of this poll.
+        """
+        stream = self.client.meetings.iter_meetings(self.metadata)
+        meetings = [meeting async for meeting in stream]
+        events = self.index.update(meetings)
+        await self._publish(events)
+        return events
+
+    async def _publish(self, events: List[MeetingEvent]) -> None:
+        for event in events:
+            for queue in list(self._queues):
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(event)
+            for callback in list(self._subscribers):
+                try:
+                    result = callback(event)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    logger.exception(
+                        "Meeting event subscriber failed on %s.", event.type
+                    )
+
+    async def events(self) -> AsyncIterator[MeetingEvent]:
+        """
+        Yields every change event from now on, starting the poller if needed.
+
+        Example:
+            async for event in poller.events():
+                print(event)
+        """
+        queue: "asyncio.Queue[MeetingEvent]" = asyncio.Queue(self.max_queued)
+        self._queues.add(queue)
+        self.start()
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._queues.discard(queue)
+
+    def start(self) -> None:
+        """
+        Starts polling in a background task of the running event loop.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._poll_forever())
+
+    async def stop(self) -> None:
+        """
+        Stops the background polling task.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def __aenter__(self) -> "AsyncMeetingPoller":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    async def _poll_forever(self) -> None:
+        while True:
+            try:
+                await self.poll()
+            except Exception as e:
+                logger.warning("Polling meetings failed: %s", e)
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,533 @@
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+import asyncio
+import logging
+
+from sage_bbb.helpers import Recording, TextTrack
+from sage_bbb.parsers import StreamingParser
+from sage_bbb.parsers.stream import ElementPredicate
+from sage_bbb.services.batch import BatchResult, gather_batch
+from sage_bbb.services.factory import RecordingFactory
+from sage_bbb.services.logs import ServiceLogger
+from sage_bbb.services.query import Query
+from sage_bbb.services.recordings import (
+    MAX_URL_LENGTH,
+    PAGE_CHUNK_SIZE,
+    page_looks_full,
+    per_record_results,
+    record_id_chunks,
+)
+from sage_bbb.services.upload import (
+    MAX_CONCURRENT_UPLOADS,
+    UPLOAD_CHUNK_SIZE,
+    FilePart,
+    FileSource,
+    MultipartStream,
+    ProgressCallback,
+)
+
+logger = logging.getLogger(__name__)
+log = ServiceLogger(logger)
+
+
+class AsyncRecordings:
+    """
+    This class handles asynchronous operations related to recordings in BigBlueButton.
+
+    Args:
+        client: The client used to interact with the BigBlueButton server.
+
+    Example:
+        bbb_client = AsyncBigBlueButtonClient(
+        "http://example.com/bigbluebutton/api/", "secret"
+        )
+        recordings = AsyncRecordings(bbb_client)
+    """
+
+    def __init__(self, client: "AsyncBigBlueButtonClient") -> None:
+        self.client = client
+        # Created on first use, inside the event loop that runs the uploads.
+        self._upload_slots: Optional[asyncio.Semaphore] = None
+
+    async def get_recordings(
+        self, meeting_id: str, metadata: Optional[Dict[str, Any]] = None
+    ) -> dict:
+        """
+        Retrieves the recordings for a specific meeting, optionally filtered by metadata.
+
+        Args:
+            meeting_id (str): The unique identifier for the meeting.
+            metadata (dict, optional): A dictionary of metadata to filter the recordings.
+
+        Returns:
+            dict: A dictionary containing information about the recordings
+            for the specified meeting.
+
+        Example:
+            recordings = AsyncRecordings(bbb_client)
+            recordings_response = await recordings.get_recordings("random-9887584")
+            print(recordings_response)
+
+            filtered_recordings = await recordings.get_recordings(
+            "random-9887584", {"state": "published"}
+            )
+            print(filtered_recordings)
+        """
+        params = {"meetingID": meeting_id}
+        if metadata:
+            params.update(metadata)
+        log.request("getRecordings", "Retrieving recordings for meeting ID: %s with params: %s", meeting_id, params)
+        response = await self.client.send_request("getRecordings", params)
+        log.response("getRecordings", "Recordings retrieved successfully for meeting ID: %s", meeting_id)
+        return self.client.parse_response(response.content, "getRecordings")
+
+    def iter_recordings(
+        self,
+        meeting_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = 100,
+        prefetch: bool = True,
+        query: Optional[Query] = None,
+    ) -> AsyncIterator[Recording]:
+        """
+        Lazily yields recordings, including their metadata and playback formats.
+
+        Recordings are fetched a page at a time using BigBlueButton's
+        ``offset``/``limit`` pagination, with the next page downloaded in a
+        background task while the current one is consumed.
+
+        Args:
+            meeting_id (str, optional): Restricts the recordings to a meeting.
+            metadata (dict, optional): A dictionary of metadata to filter the recordings.
+            page_size (int, optional): The number of recordings per request. Pass
+            None to fetch every recording in one streamed request.
+            prefetch (bool): Whether to download the next page in the
+            background while the current one is consumed.
+            query (Query, optional): Only yields the matching recordings; the
+            others are skipped while parsing, without being built. Its
+            metadata equalities are also sent as ``meta_`` filters.
+
+        Returns:
+            AsyncIterator[Recording]: The matching recordings, one at a time.
+
+        Example:
+            recordings = AsyncRecordings(bbb_client)
+            async for recording in recordings.iter_recordings(page_size=500):
+                print(recording.record_id, recording.state)
+        """
+        params: Dict[str, Any] = {}
+        if meeting_id:
+            params["meetingID"] = meeting_id
+        if metadata:
+            params.update(metadata)
+        predicate = None
+        if query is not None:
+            params.update(query.server_params())
+            predicate = query.element_predicate("recording")
+        log.request("getRecordings", "Streaming recordings with params: %s", params)
+        if not page_size:
+            return self.client.stream_items(
+                "getRecordings",
+                params,
+                "recordings",
+                "recording",
+                RecordingFactory.from_element,
+                predicate=predicate,
+            )
+        return self._iter_recording_pages(params, page_size, prefetch, predicate)
+
+    async def _fetch_recording_page(
+        self, params: Dict[str, Any], offset: int, limit: int
+    ) -> bytes:
+        """
+        Downloads one page of a paginated getRecordings listing.
+        """
+        page_params = {**params, "offset": offset, "limit": limit}
+        logger.debug("Fetching recordings page at offset %s", offset)
+        response = await self.client.send_request("getRecordings", page_params)
+        return response.content
+
+    async def _iter_recording_pages(
+        self,
+        params: Dict[str, Any],
+        page_size: int,
+        prefetch: bool,
+        predicate: Optional[ElementPredicate] = None,
+    ) -> AsyncIterator[Recording]:
+        """
+        Yields recordings page by page, prefetching the next page in a
+        background task while the current one is consumed. Only full pages
+        are followed by a prefetch: a short page is the last one.
+
+        Whether a page is full is first guessed from its raw bytes (see
+        ``page_looks_full``); when the guess was wrong, the parsed item count
+        decides.
+        """
+        offset = 0
+        pending: Optional["asyncio.Future[bytes]"] = None
+        try:
+            content = await self._fetch_recording_page(params, offset, page_size)
+            while True:
+                next_offset = offset + page_size
+                if prefetch and page_looks_full(content, page_size):
+                    pending = asyncio.ensure_future(
+                        self._fetch_recording_page(params, next_offset, page_size)
+                    )
+                parser = StreamingParser(
+                    "recordings",
+                    "recording",
+                    RecordingFactory.from_element,
+                    predicate,
+                )
+                for start in range(0, len(content), PAGE_CHUNK_SIZE):
+                    chunk = content[start : start + PAGE_CHUNK_SIZE]
+                    items = parser.feed(chunk)
+                    if prefetch and pending is None and parser.count >= page_size:
+                        pending = asyncio.ensure_future(
+                            self._fetch_recording_page(params, next_offset, page_size)
+                        )
+                    for recording in items:
+                        yield recording
+                for recording in parser.close():
+                    yield recording
+                del content
+                total = parser.header.get("totalElements")
+                if (
+                    parser.count != page_size
+                    or not total
+                    or next_offset >= int(total)
+                ):
+                    break
+                offset = next_offset
+                if pending is not None:
+                    content = await pending
+                    pending = None
+                else:
+                    content = await self._fetch_recording_page(
+                        params, offset, page_size
+                    )
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def publish_recording(self, recording_id: str, publish: bool) -> Dict[str, Any]:
+        """
+        Publishes or unpublishes a specific recording.
+
+        Args:
+            recording_id (str): The unique identifier for the recording.
+            publish (bool): True to publish the recording, False to unpublish.
+
+        Returns:
+            dict: The response from the API call.
+
+        Example:
+            recordings = AsyncRecordings(bbb_client)
+            publish_response = await recordings.publish_recording("recording-id-1234", True)
+            print(publish_response)
+        """
+        params = {
+            "recordID": recording_id,
+            "publish": "true" if publish else "false",
+        }
+        log.request("publishRecordings", "Setting publish status for recording ID: %s to %s", recording_id, publish)
+        response = await self.client.send_request("publishRecordings", params)
+        log.response("publishRecordings", "Publish status set successfully for recording ID: %s", recording_id)
+        return self.client.parse_response(response.content, "publishRecordings")
+
+    async def delete_recording(self, recording_id: str) -> Dict[str, Any]:
+        """
+        Deletes a specific recording.
+
+        Args:
+            recording_id (str): The unique identifier for the recording.
+
+        Returns:
+            dict: The response from the API call.
+
+        Example:
+            recordings = AsyncRecordings(bbb_client)
+            delete_response = await recordings.delete_recording("recording-id-1234")
+            print(delete_response)
+        """
+        params = {
+            "recordID": recording_id,
+        }
+        log.request("deleteRecordings", "Deleting recording ID: %s", recording_id)
+        response = await self.client.send_request("deleteRecordings", params)
+        log.response("deleteRecordings", "Recording ID: %s deleted successfully.", recording_id)
+        return self.client.parse_response(response.content, "deleteRecordings")
+
+    async def update_recordings(
+        self, meeting_id: str, metadata: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Updates the metadata for a specific recording.
+
+        Args:
+            meeting_id (str): The unique identifier for the meeting.
+            metadata (dict): A dictionary containing the metadata to update.
+
+        Returns:
+            dict: The response from the API call.
+
+        Example:
+            recordings = AsyncRecordings(bbb_client)
+            update_response = await recordings.update_recordings(
+            "recording-id-1234", {"title": "New Title"}
+            )
+            print(update_response)
+        """
+        params = {"meetingID": meeting_id}
+        if metadata:
+            params.update(metadata)
+        log.request("updateRecordings", "Updating recordings for meeting ID: %s with metadata: %s", meeting_id, metadata)
+        response = await self.client.send_request("updateRecordings", params)
+        log.response("updateRecordings", "Recordings updated successfully for meeting ID: %s", meeting_id)
+        return self.client.parse_response(response.content, "updateRecordings")
+
+    async def _bulk(
+        self,
+        api_call: str,
+        record_ids: Iterable[str],
+        params: Dict[str, Any],
+        max_concurrency: Optional[int],
+        max_url_length: int,
+    ) -> List[BatchResult]:
+        chunks = record_id_chunks(
+            self.client.url_builder, api_call, record_ids, params, max_url_length
+        )
+        log.request(api_call, "Sending %s for %s recordings in %s requests.", api_call, sum(map(len, chunks)), len(chunks))
+
+        async def send(chunk: List[str]) -> Dict[str, Any]:
+            response = await self.client.send_request(
+                api_call, {**params, "recordID": ",".join(chunk)}
+            )
+            return self.client.parse_response(response.content, api_call)
+
+        results = per_record_results(
+            await gather_batch(send, chunks, max_concurrency)
+        )
+        log.response(api_call, "%s completed for %s recordings.", api_call, len(results))
+        return results
+
+    async def publish_many(
+        self,
+        record_ids: Iterable[str],
+        max_concurrency: Optional[int] = None,
+        max_url_length: int = MAX_URL_LENGTH,
+    ) -> List[BatchResult]:
+        """
+        Publishes several recordings.
+
+        The IDs are sent as comma-separated lists, as few requests as the
+        URL length allows, and the requests run as concurrent tasks.
+
+        Args:
+            record_ids (iterable of str): The recordings to publish.
+            max_concurrency (int, optional): The maximum number of requests in
+            flight, on top of the transport's own limit.
+            max_url_length (int): The maximum length of a request URL.
+
+        Returns:
+            list: One BatchResult per record ID, in input order. Each value
+            is the response of the request that carried the ID.
+
+        Example:
+            results = await recordings.publish_many(record_ids)
+        """
+        params = {"publish": "true"}
+        return await self._bulk(
+            "publishRecordings", record_ids, params, max_concurrency, max_url_length
+        )
+
+    async def unpublish_many(
+        self,
+        record_ids: Iterable[str],
+        max_concurrency: Optional[int] = None,
+        max_url_length: int = MAX_URL_LENGTH,
+    ) -> List[BatchResult]:
+        """
+        Unpublishes several recordings, in as few requests as possible.
+
+        Args:
+            record_ids (iterable of str): The recordings to unpublish.
+            max_concurrency (int, optional): The maximum number of requests in
+            flight, on top of the transport's own limit.
+            max_url_length (int): The maximum length of a request URL.
+
+        Returns:
+            list: One BatchResult per record ID, in input order.
+
+        Example:
+            results = await recordings.unpublish_many(record_ids)
+        """
+        params = {"publish": "false"}
+        return await self._bulk(
+            "publishRecordings", record_ids, params, max_concurrency, max_url_length
+        )
+
+    async def delete_many(
+        self,
+        record_ids: Iterable[str],
+        max_concurrency: Optional[int] = None,
+        max_url_length: int = MAX_URL_LENGTH,
+    ) -> List[BatchResult]:
+        """
+        Deletes several recordings, in as few requests as possible.
+
+        Args:
+            record_ids (iterable of str): The recordings to delete.
+            max_concurrency (int, optional): The maximum number of requests in
+            flight, on top of the transport's own limit.
+            max_url_length (int): The maximum length of a request URL.
+
+        Returns:
+            list: One BatchResult per record ID, in input order.
+
+        Example:
+            results = await recordings.delete_many(expired_ids)
+        """
+        return await self._bulk(
+            "deleteRecordings", record_ids, {}, max_concurrency, max_url_length
+        )
+
+    async def update_many(
+        self,
+        record_ids: Iterable[str],
+        metadata: Dict[str, Any],
+        max_concurrency: Optional[int] = None,
+        max_url_length: int = MAX_URL_LENGTH,
+    ) -> List[BatchResult]:
+        """
+        Sets the same metadata on several recordings, in as few requests as
+        possible.
+
+        Args:
+            record_ids (iterable of str): The recordings to update.
+            metadata (dict): The parameters to set, e.g.
+            ``{"meta_course": "CS101"}``.
+            max_concurrency (int, optional): The maximum number of requests in
+            flight, on top of the transport's own limit.
+            max_url_length (int): The maximum length of a request URL.
+
+        Returns:
+            list: One BatchResult per record ID, in input order.
+
+        Example:
+            results = await recordings.update_many(record_ids, {"meta_term": "2024"})
+        """
+        return await self._bulk(
+            "updateRecordings",
+            record_ids,
+            dict(metadata),
+            max_concurrency,
+            max_url_length,
+        )
+
+    async def get_recording_text_tracks(self, record_id: str) -> Dict[str, Any]:
+        """
+        Retrieves the text tracks for a specific recording.
+
+        Args:
+            record_id (str): The unique identifier for the recording.
+
+        Returns:
+            dict: The response from the API call.
+
+        Example:
+            recordings = AsyncRecordings(bbb_client)
+            text_tracks_response = await recordings.get_recording_text_tracks(
+            "recording-id-1234"
+            )
+            print(text_tracks_response)
+        """
+        params = {
+            "recordID": record_id,
+        }
+        log.request("getRecordingTextTracks", "Retrieving text tracks for recording ID: %s", record_id)
+        response = await self.client.send_request("getRecordingTextTracks", params)
+        log.response("getRecordingTextTracks", "Text tracks retrieved successfully for recording ID: %s", record_id)
+        # Unlike the rest of the API, getRecordingTextTracks answers in JSON.
+        return response.json().get("response", {})
+
+    async def get_text_tracks(self, record_id: str) -> List[TextTrack]:
+        """
+        Retrieves the text tracks for a specific recording as TextTrack objects.
+
+        Args:
+            record_id (str): The unique identifier for the recording.
+
+        Returns:
+            list: The caption and subtitle tracks of the recording.
+
+        Example:
+            recordings = AsyncRecordings(bbb_client)
+            for track in await recordings.get_text_tracks("recording-id-1234"):
+                print(track.lang, track.href)
+        """
+        response = await self.get_recording_text_tracks(record_id)
+        return [
+            RecordingFactory.create_text_track(track)
+            for track in response.get("tracks") or []
+        ]
+
+    async def put_recording_text_track(
+        self,
+        record_id: str,
+        track_file: FileSource,
+        kind: str = "subtitles",
+        lang: str = "en-US",
+        label: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Uploads a text track for a specific recording.
+
+        The file is streamed in ``chunk_size`` pieces read off the event loop,
+        and at most ``MAX_CONCURRENT_UPLOADS`` uploads of this service run at
+        the same time.
+
+        Args:
+            record_id (str): The unique identifier for the recording.
+            track_file: The text track: a path (read through a memory map),
+            a binary file object or the file content.
+            kind (str): "subtitles" or "captions".
+            lang (str): The language of the track, e.g. "en-US".
+            label (str, optional): The label shown in the player.
+            progress (callable, optional): Called with ``(sent, total)`` bytes
+            as the upload progresses, from an executor thread.
+            chunk_size (int): The number of bytes sent at a time.
+
+        Returns:
+            dict: The response from the API call.
+
+        Example:
+            recordings = AsyncRecordings(bbb_client)
+            put_track_response = await recordings.put_recording_text_track(
+            "recording-id-1234", "track.vtt", lang="fr-FR"
+            )
+            print(put_track_response)
+        """
+        params = {
+            "recordID": record_id,
+            "kind": kind,
+            "lang": lang,
+        }
+        if label:
+            params["label"] = label
+        body = MultipartStream(
+            files=[FilePart("file", track_file)],
+            chunk_size=chunk_size,
+            progress=progress,
+        )
+        if self._upload_slots is None:
+            self._upload_slots = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+        log.request("putRecordingTextTrack", "Uploading text track for recording ID: %s", record_id)
+        async with self._upload_slots:
+            response = await self.client.send_request(
+                "putRecordingTextTrack", params, data=body, headers=body.headers
+            )
+        log.response("putRecordingTextTrack", "Text track uploaded successfully for recording ID: %s", record_id)
+        # Like getRecordingTextTracks, putRecordingTextTrack answers in JSON.
+        return response.json().get("response", {})
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from sage_bbb.exceptions import TransportError
+
+if TYPE_CHECKING:
+    from sage_bbb.services.transport import Timeout
+
+
+class _ReleasingStream(httpx.AsyncByteStream if httpx is not None else object):
+    """
+    Wraps the body of a streamed response to release its concurrency slot
+    once the response is closed, rather than when its headers arrive.
+    """
+
+    def __init__(self, stream: Any, semaphore: asyncio.Semaphore) -> None:
+        self._stream = stream
+        self._semaphore: Optional[asyncio.Semaphore] = semaphore
+
+    async def __aiter__(self) -> Any:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+                self._semaphore = None
+
+
+class AsyncTransport:
+    """
+    Abstract base class for the HTTP transports used by AsyncBigBlueButtonClient.
+
+    Example:
+        class CustomAsyncTransport(AsyncTransport):
+            async def request(self, method, url, data=None, headers=None, timeout=None):
+                ...
+    """
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        data: Any = None,
+        headers: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Timeout] = None,
+        files: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+    ) -> Any:
+        """
+        Sends an HTTP request and returns the response.
+
+        Args:
+            method (str): The HTTP method ("GET" or "POST").
+            url (str): The fully signed URL of the API call.
+            data (optional): The request body, for POST requests.
+            headers (dict, optional): Extra headers to send with the request.
+            timeout (float or tuple, optional): Either a single timeout in
+            seconds or a ``(connect, read)`` tuple.
+            files (dict, optional): Files to send as a multipart body.
+            stream (bool): Whether to defer downloading the response body.
+
+        Returns:
+            The response from the server.
+
+        Raises:
+            TransportError: If no response was received.
+        """
+        raise NotImplementedError(
+            "AsyncTransport.request() must be overridden in subclasses"
+        )
+
+    async def aclose(self) -> None:
+        """
+        Releases the resources held by the transport.
+        """
+
+    async def __aenter__(self) -> "AsyncTransport":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+class HttpxAsyncTransport(AsyncTransport):
+    """
+    Default async transport backed by a pooled ``httpx.AsyncClient``.
+
+    The number of requests in flight is bounded by a semaphore, so a single
+    event loop can schedule thousands of API calls without opening thousands
+    of sockets at once. A streamed response holds its slot until it is
+    closed.
+
+    Args:
+        max_connections (int): The maximum number of open connections.
+        max_keepalive_connections (int): The maximum number of idle
+        connections kept alive for reuse.
+        keepalive_expiry (float): Seconds an idle connection is kept open.
+        max_concurrency (int): The maximum number of requests in flight.
+        connect_timeout (float): Default seconds to wait for a connection.
+        read_timeout (float): Default seconds to wait for the server to respond.
+
+    Example:
+        transport = HttpxAsyncTransport(max_connections=200, max_concurrency=500)
+        bbb_client = AsyncBigBlueButtonClient(
+        "http://example.com/bigbluebutton/api/", "secret", transport=transport
+        )
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        max_concurrency: int = 100,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+    ) -> None:
+        if httpx is None:
+            raise ImportError(
+                "The async client requires httpx. "
+                "Install it with: pip install python-sage-bbb[async]"
+            )
+        self.max_concurrency = max_concurrency
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=self._build_timeout(None),
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _build_timeout(self, timeout: Optional[Timeout]) -> "httpx.Timeout":
+        if timeout is None:
+            connect, read = self.connect_timeout, self.read_timeout
+        elif isinstance(timeout, tuple):
+            connect, read = timeout
+        else:
+            connect = read = timeout
+        return httpx.Timeout(read, connect=connect)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        data: Any = None,
+        headers: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Timeout] = None,
+        files: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+    ) -> "httpx.Response":
+        """
+        Sends an HTTP request through the pooled async client.
+
+        Args:
+            method (str): The HTTP method ("GET" or "POST").
+            url (str): The fully signed URL of the API call.
+            data (optional): The request body, for POST requests: a dict of
+            form fields, bytes or an async iterable of bytes.
+            headers (dict, optional): Extra headers to send with the request.
+            timeout (float or tuple, optional): Overrides the default
+            ``(connect, read)`` timeouts for this call.
+            files (dict, optional): Files to send as a multipart body.
+            stream (bool): Whether to defer downloading the response body. The
+            caller must then close the response with ``await response.aclose()``.
+
+        Returns:
+            httpx.Response: The response from the server.
+
+        Example:
+            response = await transport.request("GET", url, timeout=(2, 5))
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Dicts are form-encoded. Async-iterable bodies (such as
+        # MultipartStream) are handed over as an async iterator, since httpx
+        # would read any object that is also iterable synchronously.
+        if hasattr(data, "__aiter__"):
+            content = data.__aiter__()
+        else:
+            content = data if isinstance(data, (str, bytes)) else None
+        request = self.client.build_request(
+            method,
+            url,
+            content=content,
+            data=None if content is not None else data,
+            files=files,
+            headers=headers,
+            timeout=self._build_timeout(timeout),
+        )
+        await self._semaphore.acquire()
+        try:
+            response = await self.client.send(request, stream=stream)
+        except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+            self._semaphore.release()
+            raise TransportError(str(e), request_sent=False) from e
+        except httpx.TransportError as e:
+            self._semaphore.release()
+            raise TransportError(str(e)) from e
+        except BaseException:
+            self._semaphore.release()
+            raise
+        if not stream:
+            self._semaphore.release()
+            return response
+        # The body is still being read from the connection: keep the slot
+        # until the caller closes the response.
+        response.stream = _ReleasingStream(response.stream, self._semaphore)
+        return response
+
+    async def aclose(self) -> None:
+        """
+        Closes every pooled connection held by the async client.
+
+        Example:
+            await transport.aclose()
+        """
+        await self.client.aclose()
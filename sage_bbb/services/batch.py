@@ -0,0 +1,114 @@
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterable, List, NamedTuple, Optional
+
+# Matches the default per-host pool size of RequestsTransport, so a batch
+# never opens connections that the pool would have to discard.
+DEFAULT_MAX_WORKERS = 10
+
+
+class BatchResult(NamedTuple):
+    """
+    The outcome of one item of a batch call.
+
+    Exactly one of ``value`` and ``error`` is set: a failing item never
+    affects the others, and its exception is kept here instead of being
+    raised.
+
+    Example:
+        for result in bbb_client.meetings.get_meeting_info_many(meetings):
+            if result.ok:
+                print(result.item.meeting_id, result.value["participantCount"])
+            else:
+                print(result.item.meeting_id, "failed:", result.error)
+    """
+
+    item: Any
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def run_batch(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List[BatchResult]:
+    """
+    Calls ``func`` for every item on a bounded thread pool.
+
+    Args:
+        func (callable): The function to call with each item.
+        items (iterable): The items to process.
+        max_workers (int): The maximum number of concurrent calls.
+
+    Returns:
+        list: One BatchResult per item, in input order.
+
+    Example:
+        results = run_batch(bbb_client.meetings.is_meeting_running, meetings)
+    """
+    items = list(items)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        # Each call runs in a copy of the caller's context, so deadlines set
+        # around the batch apply to every item.
+        futures = [
+            executor.submit(contextvars.copy_context().run, func, item)
+            for item in items
+        ]
+        results = []
+        for item, future in zip(items, futures):
+            try:
+                results.append(BatchResult(item, value=future.result()))
+            except Exception as e:
+                results.append(BatchResult(item, error=e))
+        return results
+
+
+async def gather_batch(
+    func: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any],
+    max_concurrency: Optional[int] = None,
+) -> List[BatchResult]:
+    """
+    Awaits ``func`` for every item concurrently.
+
+    Args:
+        func (callable): The coroutine function to call with each item.
+        items (iterable): The items to process.
+        max_concurrency (int, optional): The maximum number of calls in
+        flight. The async transport already bounds concurrency, so this is
+        only needed to apply a tighter limit.
+
+    Returns:
+        list: One BatchResult per item, in input order.
+
+    Example:
+        results = await gather_batch(bbb_client.meetings.is_meeting_running, meetings)
+    """
+    items = list(items)
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def call(item: Any) -> Any:
+        if semaphore is None:
+            return await func(item)
+        async with semaphore:
+            return await func(item)
+
+    outcomes = await asyncio.gather(
+        *(call(item) for item in items), return_exceptions=True
+    )
+    return [
+        (
+            BatchResult(item, error=outcome)
+            if isinstance(outcome, BaseException)
+            else BatchResult(item, value=outcome)
+        )
+        for item, outcome in zip(items, outcomes)
+    ]
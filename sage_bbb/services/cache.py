@@ -0,0 +1,340 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from sage_bbb.utils import DefaultChecksumStrategy
+
+if TYPE_CHECKING:
+    import asyncio
+
+# (server, API call, canonicalized parameters).
+CacheKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+# Read-only API calls that may be cached, with their default time to live in
+# seconds. Live meeting state goes stale quickly; recordings and the default
+# configuration change rarely.
+DEFAULT_TTLS: Dict[str, float] = {
+    "getMeetings": 2.0,
+    "getMeetingInfo": 2.0,
+    "isMeetingRunning": 2.0,
+    "getRecordings": 30.0,
+    "getDefaultConfigXML": 300.0,
+}
+
+# Cached API calls made stale by each mutating call. Calls listed in
+# MEETING_SCOPED are only invalidated for the meetingID the mutation targets.
+INVALIDATES: Dict[str, Tuple[str, ...]] = {
+    "create": ("getMeetings", "getMeetingInfo", "isMeetingRunning"),
+    "end": ("getMeetings", "getMeetingInfo", "isMeetingRunning"),
+    "publishRecordings": ("getRecordings",),
+    "deleteRecordings": ("getRecordings",),
+    "updateRecordings": ("getRecordings",),
+    "setConfigXML": ("getDefaultConfigXML",),
+}
+MEETING_SCOPED = frozenset({"getMeetingInfo", "isMeetingRunning"})
+
+
+class _Pending:
+    """
+    A fetch in flight, shared by every thread asking for the same key.
+    """
+
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class ResponseCache:
+    """
+    An opt-in, in-memory cache for read-only BigBlueButton API calls.
+
+    Responses are keyed by the server, the API call and its canonicalized
+    parameters, so one cache can be shared by the clients of several servers.
+    They expire after a per-endpoint time to live and are evicted least recently
+    used first once ``max_entries`` is reached. Concurrent identical calls
+    are coalesced: only the first one reaches the server and the others wait
+    for its response. Mutating calls sent through the client invalidate the
+    entries they make stale (see ``INVALIDATES``).
+
+    Args:
+        ttls (dict, optional): Time to live in seconds per API call. Calls
+        missing from the mapping are never cached. Defaults to
+        ``DEFAULT_TTLS``.
+        max_entries (int): The maximum number of cached responses.
+        clock (callable): Returns the current time in seconds.
+
+    Example:
+        cache = ResponseCache(ttls={**DEFAULT_TTLS, "getMeetings": 5})
+        bbb_client = BigBlueButtonClient(
+        "http://example.com/bigbluebutton/api/", "secret", cache=cache
+        )
+        bbb_client.meetings.get_meetings()
+        print(cache.stats())
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._pending: Dict[CacheKey, _Pending] = {}
+        self._async_pending: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+    def is_cacheable(self, api_call: str) -> bool:
+        """
+        Returns whether responses of ``api_call`` are cached.
+        """
+        return api_call in self.ttls
+
+    @staticmethod
+    def make_key(
+        api_call: str, params: Optional[Mapping[str, Any]], server: str = ""
+    ) -> CacheKey:
+        """
+        Builds the canonical cache key of an API call.
+
+        Parameters are converted the same way as when the URL is signed and
+        sorted, so ``{"a": True, "b": 1}`` and ``{"b": "1", "a": "true"}``
+        share an entry. ``server`` (the clients pass their API base URL)
+        keeps the responses of different servers apart.
+        """
+        convert = DefaultChecksumStrategy._convert_value
+        return server, api_call, tuple(
+            sorted((key, convert(value)) for key, value in (params or {}).items())
+        )
+
+    def get_or_fetch(
+        self,
+        api_call: str,
+        params: Optional[Mapping[str, Any]],
+        fetch: Callable[[], Any],
+        server: str = "",
+    ) -> Any:
+        """
+        Returns the cached response of an API call, fetching it on a miss.
+
+        Args:
+            api_call (str): The API call being made.
+            params (dict, optional): The parameters of the API call.
+            fetch (callable): Sends the request and returns its response.
+            server (str): The server the call is sent to.
+
+        Returns:
+            The cached or freshly fetched response.
+
+        Example:
+            response = cache.get_or_fetch("getMeetings", {}, send)
+        """
+        key = self.make_key(api_call, params, server)
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None:
+                return value
+            pending = self._pending.get(key)
+            if pending is not None:
+                self._counters["coalesced"] += 1
+                leader = False
+            else:
+                pending = self._pending[key] = _Pending()
+                self._counters["misses"] += 1
+                leader = True
+            generation = self._generation
+        if not leader:
+            pending.event.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.value
+        try:
+            pending.value = fetch()
+        except BaseException as e:
+            pending.error = e
+            raise
+        else:
+            self._store(key, pending.value, generation)
+            return pending.value
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+            pending.event.set()
+
+    async def aget_or_fetch(
+        self,
+        api_call: str,
+        params: Optional[Mapping[str, Any]],
+        fetch: Callable[[], Awaitable[Any]],
+        server: str = "",
+    ) -> Any:
+        """
+        Async counterpart of ``get_or_fetch``: concurrent identical calls on
+        the same event loop share a single in-flight request.
+
+        Args:
+            api_call (str): The API call being made.
+            params (dict, optional): The parameters of the API call.
+            fetch (callable): Coroutine function sending the request.
+            server (str): The server the call is sent to.
+
+        Returns:
+            The cached or freshly fetched response.
+
+        Example:
+            response = await cache.aget_or_fetch("getMeetings", {}, send)
+        """
+        # Imported here, so the sync client does not load asyncio.
+        import asyncio
+
+        key = self.make_key(api_call, params, server)
+        loop = asyncio.get_running_loop()
+        pending_key = (id(loop), key)
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None:
+                return value
+            future = self._async_pending.get(pending_key)
+            if future is not None:
+                self._counters["coalesced"] += 1
+                leader = False
+            else:
+                future = self._async_pending[pending_key] = loop.create_future()
+                self._counters["misses"] += 1
+                leader = True
+            generation = self._generation
+        if not leader:
+            return await asyncio.shield(future)
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case nobody else was waiting.
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            self._store(key, value, generation)
+            return value
+        finally:
+            with self._lock:
+                self._async_pending.pop(pending_key, None)
+
+    def _lookup(self, key: CacheKey) -> Any:
+        """
+        Returns a fresh cached value, or None. Must be called with the lock held.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        self._counters["hits"] += 1
+        return value
+
+    def _store(self, key: CacheKey, value: Any, generation: int) -> None:
+        """
+        Stores a fetched value unless an invalidation happened while it was
+        being fetched.
+        """
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (self.clock() + self.ttls[key[1]], value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def invalidate(
+        self,
+        api_call: str,
+        params: Optional[Mapping[str, Any]] = None,
+        server: str = "",
+    ) -> int:
+        """
+        Drops the entries made stale by a mutating API call.
+
+        Args:
+            api_call (str): The mutating API call, e.g. "end".
+            params (dict, optional): Its parameters; ``meetingID`` narrows
+            which getMeetingInfo/isMeetingRunning entries are dropped.
+            server (str): The server the call was sent to; entries of other
+            servers are kept.
+
+        Returns:
+            int: The number of entries dropped.
+
+        Example:
+            cache.invalidate("end", {"meetingID": "1234"})
+        """
+        affected = INVALIDATES.get(api_call)
+        if not affected:
+            return 0
+        meeting_id = (params or {}).get("meetingID")
+        meeting_param = ("meetingID", str(meeting_id))
+
+        def is_stale(key: CacheKey) -> bool:
+            key_server, call, canonical = key
+            if key_server != server or call not in affected:
+                return False
+            if call in MEETING_SCOPED and meeting_id is not None:
+                return meeting_param in canonical
+            return True
+
+        with self._lock:
+            self._generation += 1
+            stale = [key for key in self._entries if is_stale(key)]
+            for key in stale:
+                del self._entries[key]
+            self._counters["invalidations"] += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """
+        Drops every cached response.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the hit, miss, coalesced, eviction and invalidation counters
+        along with the current number of entries.
+
+        Example:
+            print(cache.stats())  # {"hits": 12, "misses": 3, ...}
+        """
+        with self._lock:
+            return {**self._counters, "size": len(self._entries)}
@@ -0,0 +1,484 @@
+import base64
+import hashlib
+import hmac
+import inspect
+import json
+import logging
+import threading
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+from sage_bbb.exceptions import InvalidSignatureError
+
+logger = logging.getLogger(__name__)
+
+MEETING_ENDED = "meeting-ended"
+RECORDING_READY = "recording-ready"
+ALL_EVENTS = "*"
+
+# Largest callback body accepted by the WSGI and ASGI apps.
+MAX_CALLBACK_BODY = 4 * 1024 * 1024
+
+# Webhook checksums are hex digests; their length tells the algorithm.
+CHECKSUM_ALGORITHMS = {40: "sha1", 64: "sha256", 96: "sha384", 128: "sha512"}
+
+EventHandler = Callable[["CallbackEvent"], Any]
+
+
+class CallbackEvent(NamedTuple):
+    """
+    An event pushed by a BigBlueButton server.
+
+    ``type`` is the webhook event ID (e.g. ``"meeting-ended"``,
+    ``"user-joined"``), or RECORDING_READY for recording ready callbacks.
+    ``data`` holds the decoded event as it was sent.
+
+    Example:
+        def on_event(event):
+            print(event.type, event.meeting_id, event.timestamp)
+    """
+
+    type: str
+    meeting_id: str = ""
+    internal_meeting_id: str = ""
+    record_id: str = ""
+    timestamp: float = 0.0
+    data: Optional[Dict[str, Any]] = None
+
+
+def _b64url_decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def verify_jwt(token: str, secret: str) -> Dict[str, Any]:
+    """
+    Verifies an HS256 JSON Web Token signed with the shared secret, as sent
+    by the recording ready callback, and returns its payload.
+
+    Args:
+        token (str): The compact JWT.
+        secret (str): The security salt of the server.
+
+    Returns:
+        dict: The decoded payload.
+
+    Raises:
+        InvalidSignatureError: If the token is malformed, not HS256 or its
+        signature does not match.
+
+    Example:
+        payload = verify_jwt(form["signed_parameters"], "secret")
+        print(payload["record_id"])
+    """
+    try:
+        header, payload, signature = token.split(".")
+        algorithm = json.loads(_b64url_decode(header)).get("alg")
+        expected = hmac.new(
+            secret.encode("utf-8"),
+            f"{header}.{payload}".encode("ascii"),
+            hashlib.sha256,
+        ).digest()
+        valid = algorithm == "HS256" and hmac.compare_digest(
+            expected, _b64url_decode(signature)
+        )
+        if valid:
+            return json.loads(_b64url_decode(payload))
+    except (ValueError, AttributeError, UnicodeError):
+        pass
+    raise InvalidSignatureError("Invalid JWT signature")
+
+
+def webhook_checksum(callback_url: str, fields: Dict[str, str], secret: str) -> str:
+    """
+    Returns the SHA-1 checksum bbb-webhooks appends to its callback URL:
+    the hash of the URL, the JSON encoding of the posted form fields and the
+    shared secret.
+
+    Args:
+        callback_url (str): The URL the hook was registered with.
+        fields (dict): The posted form fields, in their original order.
+        secret (str): The security salt of the server.
+
+    Returns:
+        str: The checksum, as a hex digest.
+    """
+    return _checksum("sha1", callback_url, fields, secret)
+
+
+def _checksum(
+    algorithm: str, callback_url: str, fields: Dict[str, str], secret: str
+) -> str:
+    body = json.dumps(fields, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.new(
+        algorithm, (callback_url + body + secret).encode("utf-8")
+    ).hexdigest()
+
+
+def decode_events(payload: str) -> List[CallbackEvent]:
+    """
+    Decodes the ``event`` field of a webhook callback, a JSON array holding
+    one or more events, in a single pass.
+
+    Args:
+        payload (str): The JSON array.
+
+    Returns:
+        list: The CallbackEvent objects, in the order they were sent.
+
+    Raises:
+        ValueError: If the payload is not a JSON array of events.
+
+    Example:
+        events = decode_events(form["event"])
+    """
+    messages = json.loads(payload)
+    if isinstance(messages, dict):
+        messages = [messages]
+    if not isinstance(messages, list):
+        raise ValueError("Webhook events must be a JSON array")
+    events = []
+    for message in messages:
+        data = message.get("data") if isinstance(message, dict) else None
+        if not isinstance(data, dict):
+            raise ValueError("Webhook event without data")
+        attributes = data.get("attributes") or {}
+        meeting = attributes.get("meeting") or {}
+        timestamp = (data.get("event") or {}).get("ts") or 0
+        events.append(
+            CallbackEvent(
+                type=str(data.get("id", "")),
+                meeting_id=str(meeting.get("external-meeting-id", "")),
+                internal_meeting_id=str(meeting.get("internal-meeting-id", "")),
+                record_id=str(attributes.get("record-id", "")),
+                timestamp=float(timestamp) / 1000,
+                data=data,
+            )
+        )
+    return events
+
+
+class CallbackReceiver:
+    """
+    Receives the events a BigBlueButton server pushes, verifies they were
+    signed with the shared secret and dispatches them to handlers.
+
+    Three kinds of callbacks are understood:
+
+    * bbb-webhooks events (hooks registered with ``bbb_client.hooks``): a
+      form POST whose ``event`` field is a JSON array of events, signed by a
+      ``checksum`` appended to the callback URL.
+    * recording ready callbacks (``meta_bbb-recording-ready-url``): a
+      ``signed_parameters`` HS256 JWT, dispatched as RECORDING_READY.
+    * meeting end callbacks (``meta_endCallbackUrl``): a GET request with a
+      ``meetingID``, dispatched as MEETING_ENDED. BigBlueButton does not sign
+      them, so they are refused unless ``allow_unsigned`` is set; put a
+      secret of your own in that URL if you accept them.
+
+    The receiver is a WSGI application, and ``asgi`` is the same receiver as
+    an ASGI application. Both answer 200 once the handlers ran, 401 for a
+    bad signature and 400 for a malformed payload. A failing handler is
+    logged and does not prevent the other handlers from running.
+
+    Args:
+        secret (str): The security salt of the server.
+        callback_url (str, optional): The public URL the hooks were
+        registered with. Needed to verify webhook checksums when a proxy
+        changes the URL the receiver sees; by default the request URL is
+        used.
+        allow_unsigned (bool): Whether to accept meeting end callbacks.
+
+    Example:
+        receiver = CallbackReceiver("secret")
+
+        @receiver.on("meeting-ended")
+        def ended(event):
+            print(event.meeting_id, "ended")
+
+        # e.g. with wsgiref: make_server("", 8000, receiver).serve_forever()
+    """
+
+    def __init__(
+        self,
+        secret: str,
+        callback_url: Optional[str] = None,
+        allow_unsigned: bool = False,
+    ) -> None:
+        self.secret = secret
+        self.callback_url = callback_url
+        self.allow_unsigned = allow_unsigned
+        self._handlers: Dict[str, List[EventHandler]] = {}
+        self._lock = threading.Lock()
+
+    def on(
+        self, event_type: str, handler: Optional[EventHandler] = None
+    ) -> Any:
+        """
+        Registers a handler for an event type, or ALL_EVENTS. Handlers may be
+        coroutine functions when the receiver is served through ``asgi``.
+        Without ``handler``, returns a decorator.
+
+        Args:
+            event_type (str): The event type, e.g. ``"user-joined"``.
+            handler (callable, optional): Called with each CallbackEvent.
+
+        Example:
+            receiver.on(RECORDING_READY, publish_recording)
+        """
+        if handler is None:
+            return lambda function: self.on(event_type, function)
+        with self._lock:
+            self._handlers.setdefault(event_type, []).append(handler)
+        return handler
+
+    def verify(
+        self, url: str, fields: Dict[str, str], query: Dict[str, str]
+    ) -> List[CallbackEvent]:
+        """
+        Verifies a callback and decodes its events.
+
+        Args:
+            url (str): The URL the callback was sent to, query string included.
+            fields (dict): The posted form fields, in their original order.
+            query (dict): The query string parameters.
+
+        Returns:
+            list: The CallbackEvent objects.
+
+        Raises:
+            InvalidSignatureError: If the callback is not correctly signed.
+            ValueError: If the payload is malformed.
+        """
+        if "event" in fields:
+            self._verify_checksum(url, fields, query.get("checksum", ""))
+            return decode_events(fields["event"])
+        token = fields.get("signed_parameters") or query.get("signed_parameters")
+        if token:
+            payload = verify_jwt(token, self.secret)
+            return [
+                CallbackEvent(
+                    type=RECORDING_READY,
+                    meeting_id=str(payload.get("meeting_id", "")),
+                    record_id=str(payload.get("record_id", "")),
+                    data=payload,
+                )
+            ]
+        if "meetingID" in query:
+            if not self.allow_unsigned:
+                raise InvalidSignatureError("Unsigned meeting end callback")
+            return [
+                CallbackEvent(
+                    type=MEETING_ENDED, meeting_id=query["meetingID"], data=query
+                )
+            ]
+        raise ValueError("Unknown callback payload")
+
+    def _verify_checksum(
+        self, url: str, fields: Dict[str, str], checksum: str
+    ) -> None:
+        algorithm = CHECKSUM_ALGORITHMS.get(len(checksum))
+        if algorithm is not None:
+            expected = _checksum(
+                algorithm, self._signed_url(url), fields, self.secret
+            )
+            if hmac.compare_digest(expected, checksum.lower()):
+                return
+        raise InvalidSignatureError("Invalid webhook checksum")
+
+    def _signed_url(self, url: str) -> str:
+        parts = urlsplit(self.callback_url or url)
+        query = "&".join(
+            item
+            for item in parts.query.split("&")
+            if item and not item.startswith("checksum=")
+        )
+        return urlunsplit(parts._replace(query=query))
+
+    def _handlers_for(self, event: CallbackEvent) -> List[EventHandler]:
+        with self._lock:
+            return self._handlers.get(event.type, []) + self._handlers.get(
+                ALL_EVENTS, []
+            )
+
+    def dispatch(self, events: Iterable[CallbackEvent]) -> None:
+        """
+        Calls the handlers of each event, in order.
+        """
+        for event in events:
+            for handler in self._handlers_for(event):
+                try:
+                    result = handler(event)
+                    if inspect.isawaitable(result):
+                        result.close()
+                        raise TypeError("Async handlers need the ASGI receiver")
+                except Exception:
+                    logger.exception("Callback handler failed on %s.", event.type)
+
+    async def adispatch(self, events: Iterable[CallbackEvent]) -> None:
+        """
+        Calls the handlers of each event, in order, awaiting async handlers.
+        """
+        for event in events:
+            for handler in self._handlers_for(event):
+                try:
+                    result = handler(event)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    logger.exception("Callback handler failed on %s.", event.type)
+
+    def _receive(
+        self, url: str, body: bytes
+    ) -> Tuple[int, List[CallbackEvent]]:
+        query = dict(parse_qsl(urlsplit(url).query, keep_blank_values=True))
+        try:
+            fields = dict(
+                parse_qsl(body.decode("utf-8"), keep_blank_values=True)
+            )
+            return 200, self.verify(url, fields, query)
+        except InvalidSignatureError as error:
+            logger.warning("Rejected callback to %s: %s", url, error)
+            return 401, []
+        except ValueError as error:
+            logger.warning("Malformed callback to %s: %s", url, error)
+            return 400, []
+
+    def handle(self, url: str, body: bytes = b"") -> int:
+        """
+        Verifies, decodes and dispatches one callback request.
+
+        Args:
+            url (str): The URL the callback was sent to, query string included.
+            body (bytes): The form-encoded request body.
+
+        Returns:
+            int: The HTTP status to answer with.
+
+        Example:
+            status = receiver.handle(request.url, request.body)
+        """
+        status, events = self._receive(url, body)
+        self.dispatch(events)
+        return status
+
+    async def ahandle(self, url: str, body: bytes = b"") -> int:
+        """
+        Async counterpart of ``handle``, awaiting async handlers.
+        """
+        status, events = self._receive(url, body)
+        await self.adispatch(events)
+        return status
+
+    def __call__(
+        self, environ: Dict[str, Any], start_response: Callable[..., Any]
+    ) -> List[bytes]:
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        if length > MAX_CALLBACK_BODY:
+            return _wsgi_answer(start_response, 413)
+        body = environ["wsgi.input"].read(length) if length else b""
+        return _wsgi_answer(start_response, self.handle(_wsgi_url(environ), body))
+
+    wsgi = __call__
+
+    async def asgi(
+        self,
+        scope: Dict[str, Any],
+        receive: Callable[[], Awaitable[Dict[str, Any]]],
+        send: Callable[[Dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        """
+        The receiver as an ASGI application.
+
+        Example:
+            # e.g. uvicorn module:receiver.asgi
+            app = receiver.asgi
+        """
+        if scope["type"] != "http":
+            return
+        chunks = []
+        size = 0
+        more = True
+        while more:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_CALLBACK_BODY:
+                await _asgi_answer(send, 413)
+                return
+            chunks.append(chunk)
+            more = message.get("more_body", False)
+        status = await self.ahandle(_asgi_url(scope), b"".join(chunks))
+        await _asgi_answer(send, status)
+
+
+def _wsgi_url(environ: Dict[str, Any]) -> str:
+    host = environ.get("HTTP_HOST") or "{}:{}".format(
+        environ.get("SERVER_NAME", ""), environ.get("SERVER_PORT", "")
+    )
+    url = "{}://{}{}{}".format(
+        environ.get("wsgi.url_scheme", "http"),
+        host,
+        environ.get("SCRIPT_NAME", ""),
+        environ.get("PATH_INFO", ""),
+    )
+    query = environ.get("QUERY_STRING")
+    return f"{url}?{query}" if query else url
+
+
+def _asgi_url(scope: Dict[str, Any]) -> str:
+    headers = dict(scope.get("headers") or [])
+    host = headers.get(b"host", b"").decode("latin-1")
+    if not host and scope.get("server"):
+        host = "{}:{}".format(*scope["server"])
+    url = "{}://{}{}{}".format(
+        scope.get("scheme", "http"),
+        host,
+        scope.get("root_path", ""),
+        scope.get("path", ""),
+    )
+    query = scope.get("query_string", b"").decode("latin-1")
+    return f"{url}?{query}" if query else url
+
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    413: "Payload Too Large",
+}
+
+
+def _wsgi_answer(start_response: Callable[..., Any], status: int) -> List[bytes]:
+    start_response(
+        f"{status} {_REASONS[status]}",
+        [("Content-Type", "text/plain"), ("Content-Length", "0")],
+    )
+    return []
+
+
+async def _asgi_answer(
+    send: Callable[[Dict[str, Any]], Awaitable[None]], status: int
+) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"text/plain"),
+                (b"content-length", b"0"),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": b""})
@@ -1,10 +1,28 @@
-import xml.etree.ElementTree as ET
-from typing import Any, Dict, Optional
+from __future__ import annotations
 
-import requests
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional, TypeVar
+from urllib.parse import urlsplit
 
-from sage_bbb.services import Configurations, Meetings, Recordings
-from sage_bbb.utils import BigBlueButtonUrlBuilder
+from sage_bbb import parsers, services
+from sage_bbb.exceptions import HTTPStatusError, raise_for_returncode
+from sage_bbb.services.cache import ResponseCache
+from sage_bbb.services.instrumentation import (
+    CallMetrics,
+    Instrumentation,
+    response_size,
+)
+from sage_bbb.services.policy import RequestPolicy
+from sage_bbb.utils import BigBlueButtonUrlBuilder, ChecksumStrategy
+
+if TYPE_CHECKING:
+    import xml.etree.ElementTree as ET
+
+    import requests
+
+    from sage_bbb.services.transport import Timeout, Transport
+
+T = TypeVar("T")
 
 
 class BigBlueButtonClient:
@@ -14,33 +32,96 @@ class BigBlueButtonClient:
     Args:
         bbb_server_base_url (str): The base URL of the BigBlueButton server.
         security_salt (str): The security salt used for generating checksums.
+        transport (Transport, optional): The transport used to send requests.
+        A pooled ``RequestsTransport`` is created when omitted.
+        cache (ResponseCache, optional): Caches read-only API calls. Responses
+        are always fetched from the server when omitted.
+        checksum_strategy (ChecksumStrategy, optional): Signs the API calls.
+        Defaults to SHA-1 ``DefaultChecksumStrategy``.
+        policy (RequestPolicy, optional): Retries, circuit breaking and
+        deadlines applied to every call. Defaults to ``RequestPolicy()``.
+        instrumentation (Instrumentation, optional): Hooks called around every
+        API call, e.g. a ``MetricsCollector``. Calls are not timed when omitted.
+        raise_on_failure (bool): Raises FailedResponseError for responses with
+        ``returncode`` FAILED instead of returning them.
 
     Attributes:
         meetings: An instance of the Meetings class for meeting operations.
         recordings: An instance of the Recordings class for recording operations.
         configurations: An instance of the Configurations class
         for configuration operations.
+        hooks: An instance of the Hooks class for webhook operations.
+        transport: The transport all API calls are routed through.
+        cache: The response cache, or None when caching is disabled.
+        policy: The request policy.
+        instrumentation: The instrumentation hooks, or None.
 
     Example:
-        bbb_client = BigBlueButtonClient(
+        with BigBlueButtonClient(
         "http://example.com/bigbluebutton/api/", "secret"
-        )
-        connection_status = bbb_client.check_connection()
-        print(connection_status)
+        ) as bbb_client:
+            connection_status = bbb_client.check_connection()
+            print(connection_status)
     """
 
-    def __init__(self, bbb_server_base_url: str, security_salt: str) -> None:
-        self.url_builder = BigBlueButtonUrlBuilder(bbb_server_base_url, security_salt)
-        self.meetings = Meetings(self)
-        self.recordings = Recordings(self)
-        self.configurations = Configurations(self)
+    def __init__(
+        self,
+        bbb_server_base_url: str,
+        security_salt: str,
+        transport: Optional[Transport] = None,
+        cache: Optional[ResponseCache] = None,
+        checksum_strategy: Optional[ChecksumStrategy] = None,
+        policy: Optional[RequestPolicy] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        raise_on_failure: bool = False,
+    ) -> None:
+        self.url_builder = BigBlueButtonUrlBuilder(
+            bbb_server_base_url, security_salt, checksum_strategy
+        )
+        self.host = urlsplit(self.url_builder.bbb_server_base_url).netloc
+        self.policy = policy or RequestPolicy()
+        self.instrumentation = instrumentation
+        self.raise_on_failure = raise_on_failure
+        self._owns_transport = transport is None
+        if transport is None:
+            # Imported here, so importing this module does not load requests.
+            from sage_bbb.services.transport import RequestsTransport
+
+            transport = RequestsTransport()
+        self.transport = transport
+        self.cache = cache
+        self.meetings = services.Meetings(self)
+        self.recordings = services.Recordings(self)
+        self.configurations = services.Configurations(self)
+        self.hooks = services.Hooks(self)
+
+    def close(self) -> None:
+        """
+        Closes the underlying transport and its pooled connections.
+
+        A transport passed in by the caller is left open, since it may be
+        shared with other clients.
+
+        Example:
+            bbb_client.close()
+        """
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self) -> "BigBlueButtonClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def send_request(
         self,
         api_call: str,
         params: Dict[str, Any] = {},
-        data: Optional[str] = None,
+        data: Any = None,
         headers: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Timeout] = None,
+        stream: bool = False,
     ) -> requests.Response:
         """
         Sends an HTTP request to the BigBlueButton server.
@@ -50,42 +131,243 @@ class BigBlueButtonClient:
             params (dict): The parameters to be included in the request.
             data (str, optional): The data to be included in the request body (
             for POST requests
-            ).
+            ). A MultipartStream is streamed rather than loaded in memory.
             headers (dict, optional): The headers to be included in the request.
+            timeout (float or tuple, optional): A single timeout or a
+            ``(connect, read)`` tuple overriding the transport defaults.
+            stream (bool): Whether to defer downloading the response body,
+            so it can be consumed with ``response.iter_content``.
 
         Returns:
             requests.Response: The response from the server.
 
+        Raises:
+            TransportError: If no response was received.
+            HTTPStatusError: If the server answered with an HTTP error status.
+            CircuitOpenError: If the server's circuit breaker is open.
+            DeadlineExceededError: If the current deadline expired.
+
         Example:
             response = self.send_request("getMeetings", params={})
             print(response.content)
         """
+        cache = self.cache
+        if cache is None or stream:
+            return self._send(api_call, params, data, headers, timeout, stream)
+        server = self.url_builder.bbb_server_base_url
+        if data is None and cache.is_cacheable(api_call):
+            return cache.get_or_fetch(
+                api_call,
+                params,
+                lambda: self._send(api_call, params, data, headers, timeout, False),
+                server,
+            )
+        try:
+            return self._send(api_call, params, data, headers, timeout, False)
+        finally:
+            cache.invalidate(api_call, params, server)
+
+    def _send(
+        self,
+        api_call: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[str],
+        headers: Optional[Dict[str, Any]],
+        timeout: Optional[Timeout],
+        stream: bool,
+    ) -> requests.Response:
+        """
+        Signs and sends a request through the transport and the request
+        policy, bypassing the cache.
+        """
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            return self._send_instrumented(
+                instrumentation, api_call, params, data, headers, timeout, stream
+            )
         url = self.url_builder.build_url(api_call, params)
-        # print(f"Sending request to URL: {url}")
-        if data:
-            response = requests.post(url, data=data, headers=headers)
-        else:
-            response = requests.get(url)
-        response.raise_for_status()
-        return response
+        return self.policy.execute(
+            api_call,
+            self.host,
+            self._attempt(api_call, url, data, headers, stream),
+            timeout,
+        )
 
-    def parse_response(self, response_xml: str) -> Dict[str, Any]:
+    def _attempt(
+        self,
+        api_call: str,
+        url: str,
+        data: Optional[str],
+        headers: Optional[Dict[str, Any]],
+        stream: bool,
+    ) -> Callable[[Optional[Timeout]], Any]:
+        """
+        Returns a function sending one attempt of a signed call.
+        """
+
+        def attempt(attempt_timeout: Optional[Timeout]) -> requests.Response:
+            if data:
+                response = self.transport.request(
+                    "POST", url, data=data, headers=headers, timeout=attempt_timeout
+                )
+            else:
+                response = self.transport.request(
+                    "GET", url, timeout=attempt_timeout, stream=stream
+                )
+            if response.status_code >= 400:
+                response.close()
+                http_error = getattr(self.transport, "http_error", None)
+                if http_error is None:
+                    raise HTTPStatusError(api_call, response.status_code, response)
+                raise http_error(api_call, response.status_code, response)
+            return response
+
+        return attempt
+
+    def _send_instrumented(
+        self,
+        instrumentation: Instrumentation,
+        api_call: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[str],
+        headers: Optional[Dict[str, Any]],
+        timeout: Optional[Timeout],
+        stream: bool,
+    ) -> requests.Response:
+        """
+        Same as ``_send``, timing the signing and network phases for the
+        instrumentation hooks.
+        """
+        instrumentation.before_request(api_call, self.host)
+        started = signed = time.perf_counter()
+        response = None
+        error: Optional[BaseException] = None
+        try:
+            url = self.url_builder.build_url(api_call, params)
+            signed = time.perf_counter()
+            response = self.policy.execute(
+                api_call,
+                self.host,
+                self._attempt(api_call, url, data, headers, stream),
+                timeout,
+            )
+            return response
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            instrumentation.after_request(
+                CallMetrics(
+                    api_call,
+                    self.host,
+                    sign_seconds=signed - started,
+                    network_seconds=time.perf_counter() - signed,
+                    response_bytes=response_size(response, stream),
+                    status_code=(
+                        response.status_code
+                        if response is not None
+                        else getattr(error, "status_code", None)
+                    ),
+                    error=error,
+                )
+            )
+
+    def stream_items(
+        self,
+        api_call: str,
+        params: Dict[str, Any],
+        container_tag: str,
+        item_tag: str,
+        builder: Callable[[ET.Element], T],
+        chunk_size: int = 65536,
+        predicate: Optional[Callable[[ET.Element], bool]] = None,
+    ) -> Iterator[T]:
+        """
+        Sends a request and lazily yields the items of its response.
+
+        The response body is downloaded and parsed incrementally, and each
+        item element is discarded once it has been built, so arbitrarily
+        large listings are processed in constant memory.
+
+        Args:
+            api_call (str): The API call to be made (e.g., "getRecordings").
+            params (dict): The parameters to be included in the request.
+            container_tag (str): The tag wrapping the items, e.g. "recordings".
+            item_tag (str): The tag of each item, e.g. "recording".
+            builder (callable): Converts an item element into the yielded object.
+            chunk_size (int): The number of bytes read from the network at a time.
+            predicate (callable, optional): Tells whether an item element is
+            yielded; other items are never built.
+
+        Returns:
+            Iterator: The built items, one at a time.
+
+        Example:
+            for recording in bbb_client.stream_items(
+            "getRecordings", {}, "recordings", "recording",
+            RecordingFactory.from_element
+            ):
+                print(recording.record_id)
+        """
+        response = self.send_request(api_call, params, stream=True)
+        instrumentation = self.instrumentation
+        parse_seconds = 0.0
+        size = 0
+        try:
+            parser = parsers.StreamingParser(
+                container_tag, item_tag, builder, predicate
+            )
+            for chunk in response.iter_content(chunk_size):
+                if instrumentation is None:
+                    yield from parser.feed(chunk)
+                    continue
+                started = time.perf_counter()
+                items = parser.feed(chunk)
+                parse_seconds += time.perf_counter() - started
+                size += len(chunk)
+                yield from items
+            yield from parser.close()
+        finally:
+            response.close()
+            if instrumentation is not None:
+                instrumentation.on_parse(api_call, parse_seconds, size)
+
+    def parse_response(
+        self, response_xml: str, api_call: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Parses the XML response from the server.
 
         Args:
             response_xml (str): The XML response content.
+            api_call (str, optional): The API call the response answers, which
+            parse time is attributed to by the instrumentation hooks.
 
         Returns:
-            dict: A dictionary representation of the XML response.
+            dict: A dictionary representation of the XML response. Nested
+            elements such as ``<meetings>`` or ``<recordings>`` are kept as
+            nested lists and dictionaries.
+
+        Raises:
+            FailedResponseError: If ``raise_on_failure`` is set and the
+            response has ``returncode`` FAILED.
 
         Example:
-            response_dict = self.parse_response(response.content)
+            response_dict = self.parse_response(response.content, "getMeetings")
             print(response_dict)
         """
-        root = ET.fromstring(response_xml)
-        response = {child.tag: child.text for child in root}
-        return response
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            result = parsers.parse_response(response_xml)
+        else:
+            started = time.perf_counter()
+            result = parsers.parse_response(response_xml)
+            instrumentation.on_parse(
+                api_call, time.perf_counter() - started, len(response_xml)
+            )
+        if self.raise_on_failure:
+            raise_for_returncode(result)
+        return result
 
     def check_connection(self) -> Dict[str, Any]:
         """
@@ -99,4 +381,4 @@ class BigBlueButtonClient:
             print(connection_status)
         """
         response = self.send_request("", {})
-        return self.parse_response(response.content)
+        return self.parse_response(response.content, "")
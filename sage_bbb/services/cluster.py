@@ -0,0 +1,369 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Union
+
+from sage_bbb.helpers import Meeting
+from sage_bbb.services.batch import run_batch
+
+logger = logging.getLogger(__name__)
+
+
+class ServerLoad(NamedTuple):
+    """
+    The last known load of a server in the cluster.
+
+    ``healthy`` is False when the last poll of the server failed, in which
+    case ``error`` holds the exception and no new meetings are placed there.
+    """
+
+    meetings: int = 0
+    participants: int = 0
+    healthy: bool = True
+    checked_at: float = 0.0
+    error: Optional[BaseException] = None
+
+
+class BigBlueButtonCluster:
+    """
+    This class routes meetings across a fleet of BigBlueButton servers.
+
+    A background thread polls every server's getMeetings listing to track its
+    load and which meetings it hosts. New meetings are created on the least
+    loaded healthy server, and follow-up calls for a meeting are sent to the
+    server that owns it.
+
+    Args:
+        clients (dict or iterable): The server clients, either keyed by a
+        server name or as a plain iterable (named by their base URL).
+        poll_interval (float): Seconds between two load polls.
+        meeting_weight (float): The load one meeting adds on top of its
+        participants. Newly created meetings start empty, so this keeps a
+        burst of creations from all landing on the same server.
+        max_workers (int): The maximum number of servers polled concurrently.
+        min_refresh_interval (float): The minimum seconds between two
+        refreshes triggered by lookups of unknown meetings.
+
+    Example:
+        cluster = BigBlueButtonCluster(
+            {
+                "bbb1": BigBlueButtonClient("https://bbb1.example.com/", "salt-1"),
+                "bbb2": BigBlueButtonClient("https://bbb2.example.com/", "salt-2"),
+            }
+        )
+        with cluster:
+            meeting = cluster.create_meeting("Algebra", "algebra-101", "ap", "mp")
+            join_url = cluster.join_meeting(meeting, "John Doe", "ap")
+    """
+
+    def __init__(
+        self,
+        clients: Union[Mapping[str, Any], Iterable[Any]],
+        poll_interval: float = 10.0,
+        meeting_weight: float = 10.0,
+        max_workers: int = 10,
+        min_refresh_interval: float = 1.0,
+    ) -> None:
+        if isinstance(clients, Mapping):
+            self.servers: Dict[str, Any] = dict(clients)
+        else:
+            self.servers = {
+                client.url_builder.bbb_server_base_url: client for client in clients
+            }
+        if not self.servers:
+            raise ValueError("A cluster needs at least one server.")
+        self.poll_interval = poll_interval
+        self.meeting_weight = meeting_weight
+        self.max_workers = max_workers
+        self.min_refresh_interval = min_refresh_interval
+        self.loads: Dict[str, ServerLoad] = {
+            name: ServerLoad() for name in self.servers
+        }
+        self._index: Dict[str, str] = {}
+        self._placed_at: Dict[str, float] = {}
+        # Creates of new meetings in flight, so concurrent creates of the same
+        # meetingID wait for the first placement instead of picking a server.
+        self._placing: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refreshed_at = float("-inf")
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        Polls every server once, then keeps polling in a background thread.
+
+        Example:
+            cluster.start()
+        """
+        self.refresh()
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._poll_forever, name="bbb-cluster-poller", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the background polling thread.
+
+        Example:
+            cluster.stop()
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> None:
+        """
+        Stops polling and closes every server client.
+        """
+        self.stop()
+        for client in self.servers.values():
+            client.close()
+
+    def __enter__(self) -> "BigBlueButtonCluster":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _poll_forever(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Polling the cluster failed.")
+
+    def refresh(self) -> None:
+        """
+        Polls every server concurrently and updates loads and the
+        meeting-to-server index.
+
+        Example:
+            cluster.refresh()
+            print(cluster.loads)
+        """
+        started_at = time.monotonic()
+        self._refreshed_at = started_at
+        results = run_batch(
+            lambda name: list(self.servers[name].meetings.iter_meetings()),
+            list(self.servers),
+            self.max_workers,
+        )
+        with self._lock:
+            for result in results:
+                name = result.item
+                if not result.ok:
+                    if self.loads[name].healthy:
+                        logger.warning(
+                            "Server %s is unhealthy: %s", name, result.error
+                        )
+                    self.loads[name] = self.loads[name]._replace(
+                        healthy=False, checked_at=started_at, error=result.error
+                    )
+                    continue
+                meetings: List[Meeting] = result.value
+                self.loads[name] = ServerLoad(
+                    meetings=len(meetings),
+                    participants=sum(m.participant_count for m in meetings),
+                    healthy=True,
+                    checked_at=started_at,
+                )
+                hosted = {meeting.meeting_id for meeting in meetings}
+                for meeting_id in hosted:
+                    self._index[meeting_id] = name
+                for meeting_id, owner in list(self._index.items()):
+                    if (
+                        owner == name
+                        and meeting_id not in hosted
+                        and meeting_id not in self._placing
+                        and self._placed_at.get(meeting_id, 0.0) < started_at
+                    ):
+                        del self._index[meeting_id]
+                        self._placed_at.pop(meeting_id, None)
+
+    def _score(self, load: ServerLoad) -> float:
+        return load.participants + self.meeting_weight * load.meetings
+
+    def least_loaded(self) -> str:
+        """
+        Returns the name of the least loaded healthy server.
+
+        Raises:
+            RuntimeError: If no server in the cluster is healthy.
+
+        Example:
+            print(cluster.least_loaded())
+        """
+        with self._lock:
+            return self._least_loaded()
+
+    def _least_loaded(self) -> str:
+        healthy = [name for name, load in self.loads.items() if load.healthy]
+        if not healthy:
+            raise RuntimeError("No healthy BigBlueButton server is available.")
+        return min(healthy, key=lambda name: self._score(self.loads[name]))
+
+    def _add_load(self, server: str, meetings: int) -> None:
+        load = self.loads[server]
+        self.loads[server] = load._replace(meetings=max(load.meetings + meetings, 0))
+
+    def server_for(self, meeting_id: str) -> str:
+        """
+        Returns the name of the server hosting a meeting.
+
+        The index is refreshed once if the meeting is unknown, in case it was
+        created outside of this cluster client. Such refreshes are shared by
+        concurrent lookups and happen at most once per
+        ``min_refresh_interval``, so a burst of lookups for unknown IDs does
+        not poll every server for each of them.
+
+        Raises:
+            KeyError: If no server in the cluster hosts the meeting.
+
+        Example:
+            print(cluster.server_for("algebra-101"))
+        """
+        with self._lock:
+            name = self._index.get(meeting_id)
+        if name is None:
+            with self._refresh_lock:
+                # Another lookup may have refreshed while this one waited.
+                if time.monotonic() - self._refreshed_at >= self.min_refresh_interval:
+                    self.refresh()
+            with self._lock:
+                name = self._index.get(meeting_id)
+        if name is None:
+            raise KeyError(f"Meeting {meeting_id!r} is not hosted by any server.")
+        return name
+
+    def client_for(self, meeting_id: str) -> Any:
+        """
+        Returns the client of the server hosting a meeting.
+
+        Example:
+            info = cluster.client_for("algebra-101").meetings.get_meetings()
+        """
+        return self.servers[self.server_for(meeting_id)]
+
+    def create_meeting(
+        self,
+        name: str,
+        meeting_id: str,
+        attendee_pw: str,
+        moderator_pw: str,
+        **kwargs: Any,
+    ) -> Meeting:
+        """
+        Creates a meeting on the least loaded healthy server.
+
+        The server is reserved, and its load counted, before the create is
+        sent, so concurrent creates are spread over the cluster. Creating a
+        meeting that already exists in the cluster is sent to the server that
+        owns it, as BigBlueButton treats a repeated create as a no-op there;
+        concurrent creates of the same new meeting wait for the first one to
+        be placed. The reservation is released if the create fails or is
+        refused.
+
+        Args:
+            name (str): The name of the meeting.
+            meeting_id (str): The unique identifier for the meeting.
+            attendee_pw (str): The password for attendees.
+            moderator_pw (str): The password for moderators.
+            **kwargs: Additional optional parameters for the meeting.
+
+        Returns:
+            Meeting: The created meeting.
+
+        Example:
+            meeting = cluster.create_meeting("Algebra", "algebra-101", "ap", "mp")
+        """
+        while True:
+            with self._lock:
+                placing = self._placing.get(meeting_id)
+                if placing is None:
+                    server = self._index.get(meeting_id)
+                    reserved = server is None
+                    if server is None:
+                        server = self._least_loaded()
+                        self._index[meeting_id] = server
+                        self._add_load(server, 1)
+                        self._placing[meeting_id] = threading.Event()
+                    break
+            placing.wait()
+        placed = False
+        try:
+            meeting = self.servers[server].meetings.create_meeting(
+                name, meeting_id, attendee_pw, moderator_pw, **kwargs
+            )
+            placed = bool(meeting.meeting_id)
+        finally:
+            with self._lock:
+                if placed:
+                    self._placed_at[meeting_id] = time.monotonic()
+                elif reserved and self._index.get(meeting_id) == server:
+                    del self._index[meeting_id]
+                    self._add_load(server, -1)
+                if reserved:
+                    self._placing.pop(meeting_id).set()
+        if not placed:
+            logger.warning(
+                "Server %s refused to create meeting %s: %s",
+                server,
+                meeting_id,
+                meeting.message_key,
+            )
+            return meeting
+        logger.info("Meeting %s placed on server %s.", meeting_id, server)
+        return meeting
+
+    def join_meeting(
+        self, meeting: Meeting, full_name: str, password: str, **kwargs: Any
+    ) -> str:
+        """
+        Builds the join URL of a meeting on the server that owns it.
+
+        Example:
+            join_url = cluster.join_meeting(meeting, "John Doe", "ap")
+        """
+        return self.client_for(meeting.meeting_id).meetings.join_meeting(
+            meeting, full_name, password, **kwargs
+        )
+
+    def end_meeting(self, meeting: Meeting) -> Dict[str, Any]:
+        """
+        Ends a meeting on the server that owns it.
+
+        Example:
+            cluster.end_meeting(meeting)
+        """
+        response = self.client_for(meeting.meeting_id).meetings.end_meeting(meeting)
+        with self._lock:
+            self._index.pop(meeting.meeting_id, None)
+            self._placed_at.pop(meeting.meeting_id, None)
+        return response
+
+    def is_meeting_running(self, meeting: Meeting) -> Dict[str, Any]:
+        """
+        Checks whether a meeting is running on the server that owns it.
+
+        Example:
+            print(cluster.is_meeting_running(meeting))
+        """
+        return self.client_for(meeting.meeting_id).meetings.is_meeting_running(
+            meeting
+        )
+
+    def get_meeting_info(self, meeting: Meeting) -> Dict[str, Any]:
+        """
+        Retrieves information about a meeting from the server that owns it.
+
+        Example:
+            print(cluster.get_meeting_info(meeting))
+        """
+        return self.client_for(meeting.meeting_id).meetings.get_meeting_info(meeting)
@@ -0,0 +1,163 @@
+import hashlib
+import json
+import threading
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+# Rendered configs kept by a ConfigTemplate, and configuration tokens kept
+# per Configurations service.
+MAX_CACHED_CONFIGS = 256
+MAX_CACHED_TOKENS = 4096
+
+# Attribute patches by element path, e.g.
+# {"layout": {"defaultLayout": "bbb.layout.name.webcamsfocus"}}. A None value
+# removes the attribute.
+ConfigOverride = Mapping[str, Mapping[str, Any]]
+
+
+def module_path(name: str) -> str:
+    """
+    Returns the element path of a client module, for use as an override key.
+
+    Example:
+        override = {module_path("ChatModule"): {"privateEnabled": False}}
+    """
+    return f"modules/module[@name='{name}']"
+
+
+def _attribute_value(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _normalize(override: ConfigOverride) -> Dict[str, Dict[str, Optional[str]]]:
+    return {
+        path: {name: _attribute_value(value) for name, value in attributes.items()}
+        for path, attributes in override.items()
+    }
+
+
+class ConfigTemplate:
+    """
+    A client configuration (the ``getDefaultConfigXML`` document) rendered
+    with per-meeting overrides.
+
+    The document is parsed once. An override patches attributes of the
+    elements it selects, the patched document is serialized and the patch
+    is undone, so the tree is never copied. Rendered documents are cached by
+    fingerprint, the SHA-256 of the template and the normalized override:
+    meetings sharing a layout share the same bytes, built once.
+
+    Args:
+        default_xml (bytes or str): The default configuration document.
+        max_entries (int): The maximum number of rendered documents kept.
+
+    Example:
+        template = bbb_client.configurations.default_template()
+        config_xml = template.render({"layout": {"showToolbar": False}})
+    """
+
+    def __init__(
+        self, default_xml: Any, max_entries: int = MAX_CACHED_CONFIGS
+    ) -> None:
+        if isinstance(default_xml, str):
+            default_xml = default_xml.encode("utf-8")
+        self.root = ET.fromstring(default_xml)
+        self.digest = hashlib.sha256(default_xml).hexdigest()
+        self.max_entries = max_entries
+        self._paths: Dict[str, List[ET.Element]] = {}
+        self._rendered: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rendered)
+
+    def fingerprint(self, override: Optional[ConfigOverride] = None) -> str:
+        """
+        Returns the fingerprint of the document an override renders.
+        """
+        normalized = json.dumps(
+            _normalize(override or {}), sort_keys=True, separators=(",", ":")
+        )
+        return hashlib.sha256(
+            f"{self.digest}:{normalized}".encode("utf-8")
+        ).hexdigest()
+
+    def _elements(self, path: str) -> List[ET.Element]:
+        elements = self._paths.get(path)
+        if elements is None:
+            elements = [self.root] if path in ("", ".") else self.root.findall(path)
+            if not elements:
+                raise ValueError(f"No element of the config matches {path!r}")
+            self._paths[path] = elements
+        return elements
+
+    def render(self, override: Optional[ConfigOverride] = None) -> bytes:
+        """
+        Returns the configuration document with an override applied.
+
+        Args:
+            override (dict, optional): Attribute patches by element path,
+            e.g. ``{"layout": {"defaultLayout": "..."}}``. Paths are
+            ElementTree paths relative to ``<config>``; see ``module_path``.
+
+        Returns:
+            bytes: The UTF-8 encoded document.
+
+        Raises:
+            ValueError: If a path matches no element.
+
+        Example:
+            config_xml = template.render(
+                {module_path("ChatModule"): {"privateEnabled": False}}
+            )
+        """
+        return self.render_with_fingerprint(override)[1]
+
+    def render_with_fingerprint(
+        self, override: Optional[ConfigOverride] = None
+    ) -> Tuple[str, bytes]:
+        """
+        Returns the fingerprint and the document of an override.
+        """
+        fingerprint = self.fingerprint(override)
+        with self._lock:
+            document = self._rendered.get(fingerprint)
+            if document is not None:
+                self._rendered.move_to_end(fingerprint)
+                return fingerprint, document
+            document = self._apply(_normalize(override or {}))
+            self._rendered[fingerprint] = document
+            while len(self._rendered) > self.max_entries:
+                self._rendered.popitem(last=False)
+        return fingerprint, document
+
+    def _apply(self, override: Dict[str, Dict[str, Optional[str]]]) -> bytes:
+        undo: List[Tuple[ET.Element, str, Optional[str]]] = []
+        try:
+            for path, attributes in override.items():
+                for element in self._elements(path):
+                    for name, value in attributes.items():
+                        undo.append((element, name, element.get(name)))
+                        if value is None:
+                            element.attrib.pop(name, None)
+                        else:
+                            element.set(name, value)
+            return ET.tostring(self.root, encoding="utf-8")
+        finally:
+            for element, name, old in reversed(undo):
+                if old is None:
+                    element.attrib.pop(name, None)
+                else:
+                    element.set(name, old)
+
+    def clear(self) -> None:
+        """
+        Drops every rendered document.
+        """
+        with self._lock:
+            self._rendered.clear()
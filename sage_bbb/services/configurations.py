@@ -1,8 +1,16 @@
-from typing import Any, Dict
-import requests
+from typing import Any, Dict, Optional, Tuple
 import logging
+import threading
+
+from sage_bbb.services.config import (
+    MAX_CACHED_TOKENS,
+    ConfigOverride,
+    ConfigTemplate,
+)
+from sage_bbb.services.logs import ServiceLogger
 
 logger = logging.getLogger(__name__)
+log = ServiceLogger(logger)
 
 
 class Configurations:
@@ -21,6 +29,9 @@ class Configurations:
 
     def __init__(self, client: "BigBlueButtonClient") -> None:
         self.client = client
+        self._template: Optional[ConfigTemplate] = None
+        self._tokens: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
 
     def get_default_config_xml(self) -> Dict[str, Any]:
         """
@@ -29,54 +40,116 @@ class Configurations:
         Returns:
             dict: A dictionary containing the default configuration XML.
 
+        Raises:
+            BigBlueButtonError: If the call failed, e.g. HTTPStatusError when
+            the endpoint is missing or TransportError when the server is
+            unreachable.
+
         Example:
             configurations = Configurations(bbb_client)
             default_config = configurations.get_default_config_xml()
             print(default_config)
         """
-        try:
-            logger.info("Attempting to retrieve the default configuration XML.")
-            response = self.client.send_request("getDefaultConfigXML")
-            logger.info("Successfully retrieved the default configuration XML.")
-            return self.client.parse_response(response.content)
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                logger.error("Endpoint not found. Please check the API URL and endpoint.")
-            else:
-                logger.error(f"An HTTP error occurred: {e}")
-        except Exception as e:
-            logger.error(f"An error occurred while retrieving the default configuration XML: {e}")
-        return {}
-
-    def set_config_xml(self, config_xml: str) -> Dict[str, Any]:
+        log.request("getDefaultConfigXML", "Attempting to retrieve the default configuration XML.")
+        response = self.client.send_request("getDefaultConfigXML")
+        log.response("getDefaultConfigXML", "Successfully retrieved the default configuration XML.")
+        return self.client.parse_response(response.content, "getDefaultConfigXML")
+
+    def set_config_xml(
+        self, config_xml: Any, meeting_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Sets the configuration XML.
 
         Args:
-            config_xml (str): The configuration XML to be set.
+            config_xml (str or bytes): The configuration XML to be set.
+            meeting_id (str, optional): The meeting the configuration is for.
 
         Returns:
             dict: The response from the API call.
 
+        Raises:
+            BigBlueButtonError: If the call failed.
+
         Example:
             configurations = Configurations(bbb_client)
             set_config_response = configurations.set_config_xml("<config>...</config>")
             print(set_config_response)
         """
-        try:
-            logger.info("Attempting to set the configuration XML.")
-            response = self.client.send_request(
-                "setConfigXML",
-                data=config_xml,
-                headers={"Content-Type": "application/xml"},
+        log.request("setConfigXML", "Attempting to set the configuration XML.")
+        response = self.client.send_request(
+            "setConfigXML",
+            {"meetingID": meeting_id} if meeting_id else {},
+            data=config_xml,
+            headers={"Content-Type": "application/xml"},
+        )
+        log.response("setConfigXML", "Successfully set the configuration XML.")
+        return self.client.parse_response(response.content, "setConfigXML")
+
+    def default_template(self, refresh: bool = False) -> ConfigTemplate:
+        """
+        Returns the default configuration as a ConfigTemplate, fetching it
+        from the server on first use only.
+
+        Args:
+            refresh (bool): Fetches the default configuration again, e.g.
+            after the server was upgraded.
+
+        Returns:
+            ConfigTemplate: The shared template.
+
+        Example:
+            template = bbb_client.configurations.default_template()
+            print(template.render({"layout": {"showLayoutTools": False}}))
+        """
+        if self._template is None or refresh:
+            log.request("getDefaultConfigXML", "Fetching the default configuration template.")
+            response = self.client.send_request("getDefaultConfigXML")
+            self._template = ConfigTemplate(response.content)
+            with self._lock:
+                self._tokens.clear()
+            log.response("getDefaultConfigXML", "Default configuration template cached.")
+        return self._template
+
+    def config_token(
+        self, meeting_id: str, override: Optional[ConfigOverride] = None
+    ) -> str:
+        """
+        Uploads the default configuration with an override for a meeting and
+        returns the token to pass as ``configToken`` when joining it.
+
+        The document comes from the ``default_template`` render cache, and a
+        configuration already uploaded for the meeting is not sent again.
+
+        Args:
+            meeting_id (str): The meeting the configuration is for.
+            override (dict, optional): Attribute patches by element path.
+
+        Returns:
+            str: The configuration token, or an empty string if the server
+            did not return one.
+
+        Example:
+            token = bbb_client.configurations.config_token(
+                "algebra-101", {"layout": {"defaultLayout": "bbb.layout.name.lecture"}}
             )
-            logger.info("Successfully set the configuration XML.")
-            return self.client.parse_response(response.content)
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                logger.error("Endpoint not found. Please check the API URL and endpoint.")
-            else:
-                logger.error(f"An HTTP error occurred: {e}")
-        except Exception as e:
-            logger.error(f"An error occurred while setting the configuration XML: {e}")
-        return {}
+            join_url = bbb_client.meetings.join_meeting(
+                meeting, "John Doe", "ap", configToken=token
+            )
+        """
+        fingerprint, config_xml = self.default_template().render_with_fingerprint(
+            override
+        )
+        key = (meeting_id, fingerprint)
+        with self._lock:
+            token = self._tokens.get(key)
+        if token is not None:
+            logger.debug("Configuration %s already set for %s", fingerprint, meeting_id)
+            return token
+        token = self.set_config_xml(config_xml, meeting_id).get("configToken") or ""
+        if token:
+            with self._lock:
+                if len(self._tokens) >= MAX_CACHED_TOKENS:
+                    del self._tokens[next(iter(self._tokens))]
+                self._tokens[key] = token
+        return token
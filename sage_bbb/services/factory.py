@@ -1,11 +1,306 @@
-from typing import Any, Dict
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-from sage_bbb.helpers import Meeting
+from sage_bbb.helpers import (
+    Attendee,
+    Hook,
+    Meeting,
+    PlaybackFormat,
+    Recording,
+    TextTrack,
+)
+
+T = TypeVar("T", bound=tuple)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# A compiled field table maps a response tag to the position of the model
+# field it fills and the converter applied to the raw value.
+FieldTable = Dict[str, Tuple[int, Callable[[Any], Any]]]
+
+
+class FieldMapping(NamedTuple):
+    """
+    The precompiled tables used to build a model from a response.
+
+    ``scalars`` convert the text of leaf elements, while ``nested`` convert
+    whole elements (metadata, attendee or playback lists). ``defaults`` holds
+    the model's default value for every field, in field order, and
+    ``mutable`` the positions of the mutable ones (the metadata dict), which
+    get a fresh copy per built model instead of sharing the default.
+    """
+
+    scalars: FieldTable
+    nested: FieldTable
+    defaults: List[Any]
+    mutable: Tuple[int, ...] = ()
+
+
+def _to_str(value: Optional[str]) -> str:
+    """
+    Converts a text response field to a str, treating missing values as "".
+    """
+    return value or ""
+
+
+def _to_int(value: Optional[str]) -> int:
+    """
+    Converts a numeric response field to an int, treating missing or blank
+    values as 0.
+    """
+    return int(value) if value else 0
+
+
+def _to_bool(value: Optional[str]) -> bool:
+    """
+    Converts a "true"/"false" response field to a bool.
+    """
+    return value == "true"
+
+
+def _to_datetime(value: Optional[str]) -> Optional[datetime]:
+    """
+    Converts an epoch-milliseconds response field to an aware datetime,
+    treating missing values and 0 as None.
+    """
+    if not value or value == "0":
+        return None
+    return _EPOCH + timedelta(milliseconds=int(value))
+
+
+def _compile(
+    model: Type[T],
+    scalars: Mapping[str, Tuple[str, Callable[[Optional[str]], Any]]],
+    nested: Optional[Mapping[str, Tuple[str, Callable[[Any], Any]]]] = None,
+) -> FieldMapping:
+    """
+    Compiles ``{tag: (field, converter)}`` mappings into tag-to-position
+    tables for ``model``.
+    """
+    positions = {name: index for index, name in enumerate(model._fields)}
+    defaults = [model._field_defaults[name] for name in model._fields]
+    return FieldMapping(
+        scalars={
+            tag: (positions[field], converter)
+            for tag, (field, converter) in scalars.items()
+        },
+        nested={
+            tag: (positions[field], converter)
+            for tag, (field, converter) in (nested or {}).items()
+        },
+        defaults=defaults,
+        mutable=tuple(
+            index
+            for index, default in enumerate(defaults)
+            if isinstance(default, (dict, list, set))
+        ),
+    )
+
+
+def _make(model: Type[T], mapping: FieldMapping, values: List[Any]) -> T:
+    """
+    Builds the model, replacing the mutable defaults left in ``values``.
+    """
+    defaults = mapping.defaults
+    for index in mapping.mutable:
+        if values[index] is defaults[index]:
+            values[index] = type(defaults[index])()
+    return model._make(values)
+
+
+def _build_from_element(
+    model: Type[T], mapping: FieldMapping, element: ET.Element
+) -> T:
+    """
+    Builds a model from the direct children of an element in one pass.
+    """
+    values = mapping.defaults.copy()
+    scalars = mapping.scalars
+    nested = mapping.nested
+    for child in element:
+        tag = child.tag
+        spec = scalars.get(tag)
+        if spec is not None:
+            values[spec[0]] = spec[1](child.text)
+        else:
+            spec = nested.get(tag)
+            if spec is not None:
+                values[spec[0]] = spec[1](child)
+    return _make(model, mapping, values)
+
+
+def _build_from_dict(
+    model: Type[T], mapping: FieldMapping, response_dict: Mapping[str, Any]
+) -> T:
+    """
+    Builds a model from a parsed response dictionary.
+    """
+    values = mapping.defaults.copy()
+    scalars = mapping.scalars
+    nested = mapping.nested
+    for tag, value in response_dict.items():
+        spec = scalars.get(tag) or nested.get(tag)
+        if spec is not None:
+            values[spec[0]] = spec[1](value)
+    return _make(model, mapping, values)
+
+
+def _metadata(element: Any) -> Dict[str, str]:
+    """
+    Converts a ``<metadata>`` element or dictionary into a plain dict.
+    """
+    if isinstance(element, ET.Element):
+        return {child.tag: child.text or "" for child in element}
+    return dict(element or {})
+
+
+def _nested(
+    element_builder: Callable[[ET.Element], Any],
+    dict_builder: Callable[[Mapping[str, Any]], Any],
+) -> Callable[[Any], Tuple[Any, ...]]:
+    """
+    Builds a converter turning a list container (an element, or a list of
+    dictionaries) into a tuple of models.
+    """
+
+    def converter(value: Any) -> Tuple[Any, ...]:
+        if isinstance(value, ET.Element):
+            return tuple([element_builder(child) for child in value])
+        return tuple([dict_builder(item) for item in value or ()])
+
+    return converter
+
+
+ATTENDEE_MAPPING = _compile(
+    Attendee,
+    {
+        "userID": ("user_id", _to_str),
+        "fullName": ("full_name", _to_str),
+        "role": ("role", _to_str),
+        "isPresenter": ("is_presenter", _to_bool),
+        "isListeningOnly": ("is_listening_only", _to_bool),
+        "hasJoinedVoice": ("has_joined_voice", _to_bool),
+        "hasVideo": ("has_video", _to_bool),
+        "clientType": ("client_type", _to_str),
+    },
+)
+
+PLAYBACK_FORMAT_MAPPING = _compile(
+    PlaybackFormat,
+    {
+        "type": ("type", _to_str),
+        "url": ("url", _to_str),
+        "processingTime": ("processing_time", _to_int),
+        "length": ("length", _to_int),
+        "size": ("size", _to_int),
+    },
+)
+
+TEXT_TRACK_MAPPING = _compile(
+    TextTrack,
+    {
+        "href": ("href", _to_str),
+        "kind": ("kind", _to_str),
+        "label": ("label", _to_str),
+        "lang": ("lang", _to_str),
+        "source": ("source", _to_str),
+    },
+)
+
+
+class AttendeeFactory:
+    @staticmethod
+    def create_attendee(attendee_dict: Mapping[str, Any]) -> Attendee:
+        """
+        Creates an Attendee instance from an ``<attendee>`` dictionary.
+
+        Args:
+            attendee_dict (dict): The dictionary containing attendee details.
+
+        Returns:
+            Attendee: An immutable Attendee instance.
+
+        Example:
+            attendee = AttendeeFactory.create_attendee(
+                {"userID": "w_1", "fullName": "John Doe", "role": "VIEWER"}
+            )
+            print(attendee)
+        """
+        return _build_from_dict(Attendee, ATTENDEE_MAPPING, attendee_dict)
+
+    @staticmethod
+    def from_element(element: ET.Element) -> Attendee:
+        """
+        Creates an Attendee instance from an ``<attendee>`` XML element.
+
+        Args:
+            element (ET.Element): The element containing attendee details.
+
+        Returns:
+            Attendee: An immutable Attendee instance.
+
+        Example:
+            attendee = AttendeeFactory.from_element(element)
+            print(attendee.full_name)
+        """
+        return _build_from_element(Attendee, ATTENDEE_MAPPING, element)
+
+
+MEETING_MAPPING = _compile(
+    Meeting,
+    {
+        "meetingID": ("meeting_id", _to_str),
+        "internalMeetingID": ("internal_meeting_id", _to_str),
+        "parentMeetingID": ("parent_meeting_id", _to_str),
+        "attendeePW": ("attendee_pw", _to_str),
+        "moderatorPW": ("moderator_pw", _to_str),
+        "createTime": ("create_time", _to_int),
+        "voiceBridge": ("voice_bridge", _to_str),
+        "dialNumber": ("dial_number", _to_str),
+        "createDate": ("create_date", _to_str),
+        "hasUserJoined": ("has_user_joined", _to_bool),
+        "duration": ("duration", _to_int),
+        "hasBeenForciblyEnded": ("has_been_forcibly_ended", _to_bool),
+        "messageKey": ("message_key", _to_str),
+        "message": ("message", _to_str),
+        "meetingName": ("meeting_name", _to_str),
+        "running": ("running", _to_bool),
+        "recording": ("recording", _to_bool),
+        "startTime": ("start_time", _to_datetime),
+        "endTime": ("end_time", _to_datetime),
+        "participantCount": ("participant_count", _to_int),
+        "listenerCount": ("listener_count", _to_int),
+        "voiceParticipantCount": ("voice_participant_count", _to_int),
+        "videoCount": ("video_count", _to_int),
+        "moderatorCount": ("moderator_count", _to_int),
+        "maxUsers": ("max_users", _to_int),
+        "isBreakout": ("is_breakout", _to_bool),
+    },
+    {
+        "attendees": (
+            "attendees",
+            _nested(AttendeeFactory.from_element, AttendeeFactory.create_attendee),
+        ),
+        "metadata": ("metadata", _metadata),
+    },
+)
 
 
 class MeetingFactory:
     @staticmethod
-    def create_meeting(response_dict: Dict[str, Any]) -> Meeting:
+    def create_meeting(response_dict: Mapping[str, Any]) -> Meeting:
         """
         Creates a Meeting instance from a response dictionary.
 
@@ -13,7 +308,7 @@ class MeetingFactory:
             response_dict (dict): The dictionary containing meeting details.
 
         Returns:
-            Meeting: An instance of the Meeting dataclass populated with the
+            Meeting: An immutable Meeting instance populated with the
             provided details.
 
         Example:
@@ -36,19 +331,186 @@ class MeetingFactory:
             meeting = MeetingFactory.create_meeting(response_dict)
             print(meeting)
         """
-        return Meeting(
-            meeting_id=response_dict.get("meetingID", ""),
-            internal_meeting_id=response_dict.get("internalMeetingID", ""),
-            parent_meeting_id=response_dict.get("parentMeetingID", ""),
-            attendee_pw=response_dict.get("attendeePW", ""),
-            moderator_pw=response_dict.get("moderatorPW", ""),
-            create_time=response_dict.get("createTime", ""),
-            voice_bridge=response_dict.get("voiceBridge", ""),
-            dial_number=response_dict.get("dialNumber", ""),
-            create_date=response_dict.get("createDate", ""),
-            has_user_joined=response_dict.get("hasUserJoined") == "true",
-            duration=int(response_dict.get("duration", 0)),
-            has_been_forcibly_ended=response_dict.get("hasBeenForciblyEnded") == "true",
-            message_key=response_dict.get("messageKey", ""),
-            message=response_dict.get("message", ""),
-        )
+        return _build_from_dict(Meeting, MEETING_MAPPING, response_dict)
+
+    @staticmethod
+    def from_element(element: ET.Element) -> Meeting:
+        """
+        Creates a Meeting instance from a ``<meeting>`` (or ``<response>``)
+        XML element.
+
+        Fields are filled in a single pass over the element's children using
+        the precompiled ``MEETING_MAPPING`` tables, without building an
+        intermediate dictionary.
+
+        Args:
+            element (ET.Element): The element containing meeting details.
+
+        Returns:
+            Meeting: An immutable Meeting instance.
+
+        Example:
+            meeting = MeetingFactory.from_element(element)
+            print(meeting.participant_count)
+        """
+        return _build_from_element(Meeting, MEETING_MAPPING, element)
+
+
+class RecordingFactory:
+    @staticmethod
+    def create_recording(recording_dict: Mapping[str, Any]) -> Recording:
+        """
+        Creates a Recording instance from a ``<recording>`` dictionary.
+
+        Args:
+            recording_dict (dict): The dictionary containing recording details.
+
+        Returns:
+            Recording: An immutable Recording instance, including its metadata
+            and playback formats.
+
+        Example:
+            recording = RecordingFactory.create_recording(
+                {"recordID": "abcd-1234", "meetingID": "1234", "state": "published"}
+            )
+            print(recording)
+        """
+        return _build_from_dict(Recording, RECORDING_MAPPING, recording_dict)
+
+    @staticmethod
+    def from_element(element: ET.Element) -> Recording:
+        """
+        Creates a Recording instance from a ``<recording>`` XML element.
+
+        Fields are filled in a single pass over the element's children using
+        the precompiled ``RECORDING_MAPPING`` tables.
+
+        Args:
+            element (ET.Element): The element containing recording details.
+
+        Returns:
+            Recording: An immutable Recording instance.
+
+        Example:
+            recording = RecordingFactory.from_element(element)
+            print(recording.record_id)
+        """
+        return _build_from_element(Recording, RECORDING_MAPPING, element)
+
+    @staticmethod
+    def create_playback_format(format_dict: Mapping[str, Any]) -> PlaybackFormat:
+        """
+        Creates a PlaybackFormat instance from a ``<format>`` dictionary.
+
+        Args:
+            format_dict (dict): The dictionary containing playback details.
+
+        Returns:
+            PlaybackFormat: An immutable PlaybackFormat instance.
+
+        Example:
+            playback_format = RecordingFactory.create_playback_format(
+                {"type": "presentation", "url": "https://example.com/playback"}
+            )
+            print(playback_format)
+        """
+        return _build_from_dict(PlaybackFormat, PLAYBACK_FORMAT_MAPPING, format_dict)
+
+    @staticmethod
+    def playback_format_from_element(element: ET.Element) -> PlaybackFormat:
+        """
+        Creates a PlaybackFormat instance from a ``<format>`` XML element.
+
+        Args:
+            element (ET.Element): The element containing playback details.
+
+        Returns:
+            PlaybackFormat: An immutable PlaybackFormat instance.
+
+        Example:
+            playback_format = RecordingFactory.playback_format_from_element(element)
+            print(playback_format.url)
+        """
+        return _build_from_element(PlaybackFormat, PLAYBACK_FORMAT_MAPPING, element)
+
+    @staticmethod
+    def create_text_track(track_dict: Mapping[str, Any]) -> TextTrack:
+        """
+        Creates a TextTrack instance from a getRecordingTextTracks entry.
+
+        Args:
+            track_dict (dict): The dictionary containing text track details.
+
+        Returns:
+            TextTrack: An immutable TextTrack instance.
+
+        Example:
+            track = RecordingFactory.create_text_track(
+                {"href": "https://example.com/caption.vtt", "kind": "subtitles"}
+            )
+            print(track)
+        """
+        return _build_from_dict(TextTrack, TEXT_TRACK_MAPPING, track_dict)
+
+
+RECORDING_MAPPING = _compile(
+    Recording,
+    {
+        "recordID": ("record_id", _to_str),
+        "meetingID": ("meeting_id", _to_str),
+        "internalMeetingID": ("internal_meeting_id", _to_str),
+        "name": ("name", _to_str),
+        "isBreakout": ("is_breakout", _to_bool),
+        "published": ("published", _to_bool),
+        "state": ("state", _to_str),
+        "startTime": ("start_time", _to_datetime),
+        "endTime": ("end_time", _to_datetime),
+        "participants": ("participants", _to_int),
+        "rawSize": ("raw_size", _to_int),
+        "size": ("size", _to_int),
+    },
+    {
+        "metadata": ("metadata", _metadata),
+        "playback": (
+            "playback",
+            _nested(
+                RecordingFactory.playback_format_from_element,
+                RecordingFactory.create_playback_format,
+            ),
+        ),
+    },
+)
+
+
+HOOK_MAPPING = _compile(
+    Hook,
+    {
+        "hookID": ("hook_id", _to_str),
+        "callbackURL": ("callback_url", _to_str),
+        "meetingID": ("meeting_id", _to_str),
+        "permanentHook": ("permanent_hook", _to_bool),
+        "rawData": ("raw_data", _to_bool),
+    },
+)
+
+
+class HookFactory:
+    @staticmethod
+    def create_hook(hook_dict: Mapping[str, Any]) -> Hook:
+        """
+        Creates a Hook instance from a ``<hook>`` (or hooks/create response)
+        dictionary.
+
+        Args:
+            hook_dict (dict): The dictionary containing hook details.
+
+        Returns:
+            Hook: An immutable Hook instance.
+
+        Example:
+            hook = HookFactory.create_hook(
+                {"hookID": "1", "callbackURL": "https://example.com/bbb/events"}
+            )
+            print(hook)
+        """
+        return _build_from_dict(Hook, HOOK_MAPPING, hook_dict)
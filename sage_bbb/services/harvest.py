@@ -0,0 +1,302 @@
+import contextvars
+import csv
+import json
+import logging
+import queue
+import threading
+import time
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Union,
+)
+
+from sage_bbb.helpers import Recording
+from sage_bbb.services.query import Query
+
+logger = logging.getLogger(__name__)
+
+# Recordings buffered between the server threads and the consumer. When the
+# consumer falls behind, the server threads wait instead of reading ahead.
+HARVEST_QUEUE_SIZE = 1000
+
+# Columns of ``export_csv``; metadata is written as a JSON object.
+CSV_FIELDS = (
+    "server",
+    "record_id",
+    "meeting_id",
+    "internal_meeting_id",
+    "name",
+    "state",
+    "published",
+    "start_time",
+    "end_time",
+    "participants",
+    "size",
+    "playback_url",
+    "metadata",
+)
+
+# Seconds a blocked server thread waits before checking whether the
+# harvest was abandoned.
+_PUT_TIMEOUT = 0.2
+
+
+class HostReport(NamedTuple):
+    """
+    The outcome of harvesting one server.
+
+    ``recordings`` counts the recordings the server listed, ``duplicates``
+    those already received from another server. ``error`` is set when the
+    listing failed; recordings received before the failure are kept.
+    """
+
+    server: str
+    recordings: int = 0
+    duplicates: int = 0
+    seconds: float = 0.0
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class HarvestedRecording(NamedTuple):
+    """
+    A recording of the merged stream, with the server it was first seen on.
+    """
+
+    server: str
+    recording: Recording
+
+
+def recording_record(item: HarvestedRecording) -> Dict[str, Any]:
+    """
+    Converts a harvested recording into a JSON-serializable dict.
+
+    Example:
+        print(json.dumps(recording_record(item)))
+    """
+    recording = item.recording
+    return {
+        "server": item.server,
+        "record_id": recording.record_id,
+        "meeting_id": recording.meeting_id,
+        "internal_meeting_id": recording.internal_meeting_id,
+        "name": recording.name,
+        "state": recording.state,
+        "published": recording.published,
+        "start_time": _isoformat(recording.start_time),
+        "end_time": _isoformat(recording.end_time),
+        "participants": recording.participants,
+        "size": recording.size,
+        "playback": [playback._asdict() for playback in recording.playback],
+        "metadata": dict(recording.metadata),
+    }
+
+
+def _isoformat(value: Any) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+class _Done(NamedTuple):
+    server: str
+    report: HostReport
+
+
+class RecordingHarvester:
+    """
+    Fetches the recordings of many BigBlueButton servers concurrently and
+    merges them into one stream, deduplicated by recordID.
+
+    Every server is read by its own thread through ``iter_recordings``, page
+    by page with the next page prefetched, so a full export takes about as
+    long as the slowest server rather than the sum of all of them. The
+    threads hand recordings over through a bounded queue: when the consumer
+    (e.g. a file writer) is slower than the servers, they wait rather than
+    buffering whole archives. A failing server is reported in ``reports``
+    without interrupting the others.
+
+    Args:
+        clients (dict or iterable): The server clients, either keyed by a
+        server name or as a plain iterable (named by their base URL).
+        page_size (int): The number of recordings per request.
+        query (Query, optional): Only harvests the matching recordings.
+        queue_size (int): The number of recordings buffered ahead of the
+        consumer.
+
+    Example:
+        harvester = RecordingHarvester([bbb1_client, bbb2_client], page_size=500)
+        with open("recordings.jsonl", "w") as file:
+            reports = harvester.export_jsonl(file)
+        for report in reports.values():
+            if not report.ok:
+                print(report.server, "failed:", report.error)
+    """
+
+    def __init__(
+        self,
+        clients: Union[Mapping[str, Any], Iterable[Any]],
+        page_size: int = 100,
+        query: Optional[Query] = None,
+        queue_size: int = HARVEST_QUEUE_SIZE,
+    ) -> None:
+        if isinstance(clients, Mapping):
+            self.servers: Dict[str, Any] = dict(clients)
+        else:
+            self.servers = {
+                client.url_builder.bbb_server_base_url: client for client in clients
+            }
+        self.page_size = page_size
+        self.query = query
+        self.queue_size = queue_size
+        self.reports: Dict[str, HostReport] = {}
+
+    def _harvest_server(
+        self, name: str, items: "queue.Queue[Any]", stop: threading.Event
+    ) -> None:
+        started = time.monotonic()
+        count = 0
+        error: Optional[BaseException] = None
+        # The report is always queued, even when the thread is interrupted by
+        # a BaseException, as the consumer waits for one per server.
+        try:
+            for recording in self.servers[name].recordings.iter_recordings(
+                page_size=self.page_size, query=self.query
+            ):
+                count += 1
+                if not _put(items, HarvestedRecording(name, recording), stop):
+                    return
+        except Exception as e:
+            error = e
+            logger.warning("Harvesting recordings from %s failed: %s", name, e)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            report = HostReport(
+                name, recordings=count, seconds=time.monotonic() - started, error=error
+            )
+            _put(items, _Done(name, report), stop)
+
+    def iter_recordings(self) -> Iterator[HarvestedRecording]:
+        """
+        Yields the recordings of every server as they arrive, each recordID
+        once. ``reports`` is complete once the iterator is exhausted.
+
+        Returns:
+            Iterator[HarvestedRecording]: The merged recordings.
+
+        Example:
+            for item in harvester.iter_recordings():
+                print(item.server, item.recording.record_id)
+        """
+        self.reports = {}
+        items: "queue.Queue[Any]" = queue.Queue(self.queue_size)
+        stop = threading.Event()
+        # Each thread runs in a copy of the caller's context, so deadlines set
+        # around the harvest apply to every server.
+        threads = [
+            threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(self._harvest_server, name, items, stop),
+                name=f"bbb-harvest-{index}",
+                daemon=True,
+            )
+            for index, name in enumerate(self.servers)
+        ]
+        for thread in threads:
+            thread.start()
+        seen: Set[str] = set()
+        duplicates: Dict[str, int] = dict.fromkeys(self.servers, 0)
+        pending = len(threads)
+        try:
+            while pending:
+                item = items.get()
+                if isinstance(item, _Done):
+                    pending -= 1
+                    self.reports[item.server] = item.report._replace(
+                        duplicates=duplicates[item.server]
+                    )
+                    continue
+                record_id = item.recording.record_id
+                if record_id in seen:
+                    duplicates[item.server] += 1
+                    continue
+                seen.add(record_id)
+                yield item
+        finally:
+            # Stops the server threads when the consumer gives up early.
+            stop.set()
+
+    def export_jsonl(self, file: IO[str]) -> Dict[str, HostReport]:
+        """
+        Writes the merged recordings as JSON Lines, one recording per line.
+
+        Args:
+            file: A text file opened for writing.
+
+        Returns:
+            dict: The HostReport of each server.
+
+        Example:
+            with open("recordings.jsonl", "w") as file:
+                reports = harvester.export_jsonl(file)
+        """
+        for item in self.iter_recordings():
+            file.write(json.dumps(recording_record(item), ensure_ascii=False))
+            file.write("\n")
+        return self.reports
+
+    def export_csv(
+        self, file: IO[str], fields: Iterable[str] = CSV_FIELDS
+    ) -> Dict[str, HostReport]:
+        """
+        Writes the merged recordings as CSV, with a header row.
+
+        Args:
+            file: A text file opened for writing with ``newline=""``.
+            fields (iterable of str): The columns, among CSV_FIELDS.
+
+        Returns:
+            dict: The HostReport of each server.
+
+        Example:
+            with open("recordings.csv", "w", newline="") as file:
+                reports = harvester.export_csv(file)
+        """
+        writer = csv.DictWriter(file, fieldnames=list(fields), extrasaction="ignore")
+        writer.writeheader()
+        for item in self.iter_recordings():
+            record = recording_record(item)
+            playback = record.pop("playback")
+            record["playback_url"] = playback[0]["url"] if playback else ""
+            record["metadata"] = json.dumps(record["metadata"], ensure_ascii=False)
+            writer.writerow(record)
+        return self.reports
+
+    @property
+    def failures(self) -> List[HostReport]:
+        """
+        The reports of the servers whose listing failed in the last harvest.
+        """
+        return [report for report in self.reports.values() if not report.ok]
+
+
+def _put(items: "queue.Queue[Any]", item: Any, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=_PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            continue
+    return False
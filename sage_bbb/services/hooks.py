@@ -0,0 +1,136 @@
+from typing import Any, Dict, Iterable, List, Optional
+import logging
+
+from sage_bbb.helpers import Hook
+from sage_bbb.services.factory import HookFactory
+from sage_bbb.services.logs import ServiceLogger
+
+logger = logging.getLogger(__name__)
+log = ServiceLogger(logger)
+
+
+def _create_params(
+    callback_url: str,
+    meeting_id: Optional[str],
+    event_ids: Optional[Iterable[str]],
+    raw_data: bool,
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"callbackURL": callback_url, "getRaw": raw_data}
+    if meeting_id:
+        params["meetingID"] = meeting_id
+    if event_ids:
+        params["eventID"] = ",".join(event_ids)
+    return params
+
+
+def _created_hook(response_dict: Dict[str, Any], params: Dict[str, Any]) -> Hook:
+    if response_dict.get("returncode") != "SUCCESS":
+        logger.warning(
+            "hooks/create was refused: %s", response_dict.get("messageKey")
+        )
+        return Hook()
+    return HookFactory.create_hook(
+        {
+            "callbackURL": params["callbackURL"],
+            "meetingID": params.get("meetingID", ""),
+            **response_dict,
+        }
+    )
+
+
+class Hooks:
+    """
+    This class handles the webhooks of a BigBlueButton server (the
+    bbb-webhooks ``hooks/create``, ``hooks/list`` and ``hooks/destroy`` calls).
+
+    Args:
+        client: The client used to interact with the BigBlueButton server.
+
+    Example:
+        bbb_client = BigBlueButtonClient(
+        "http://example.com/bigbluebutton/api/", "secret"
+        )
+        hook = bbb_client.hooks.create_hook("https://example.com/bbb/events")
+    """
+
+    def __init__(self, client: "BigBlueButtonClient") -> None:
+        self.client = client
+
+    def create_hook(
+        self,
+        callback_url: str,
+        meeting_id: Optional[str] = None,
+        event_ids: Optional[Iterable[str]] = None,
+        raw_data: bool = False,
+    ) -> Hook:
+        """
+        Registers a webhook. The server then POSTs events to ``callback_url``
+        instead of the application polling for them.
+
+        Args:
+            callback_url (str): The URL events are sent to.
+            meeting_id (str, optional): Only sends the events of this meeting.
+            event_ids (iterable of str, optional): Only sends these event
+            types, e.g. ``["meeting-ended", "user-joined"]``.
+            raw_data (bool): Whether to send the raw server messages too.
+
+        Returns:
+            Hook: The registered hook. ``hook_id`` is empty if the server
+            refused it.
+
+        Example:
+            hook = hooks.create_hook(
+            "https://example.com/bbb/events", event_ids=["meeting-ended"]
+            )
+            print(hook.hook_id)
+        """
+        params = _create_params(callback_url, meeting_id, event_ids, raw_data)
+        log.request("hooks/create", "Registering webhook for %s", callback_url)
+        response = self.client.send_request("hooks/create", params)
+        hook = _created_hook(
+            self.client.parse_response(response.content, "hooks/create"), params
+        )
+        log.response("hooks/create", "Webhook registered with ID: %s", hook.hook_id)
+        return hook
+
+    def list_hooks(self, meeting_id: Optional[str] = None) -> List[Hook]:
+        """
+        Lists the registered webhooks.
+
+        Args:
+            meeting_id (str, optional): Only lists the hooks of this meeting
+            and the global hooks.
+
+        Returns:
+            list: The registered Hook objects.
+
+        Example:
+            for hook in hooks.list_hooks():
+                print(hook.hook_id, hook.callback_url)
+        """
+        params = {"meetingID": meeting_id} if meeting_id else {}
+        log.request("hooks/list", "Listing webhooks with params: %s", params)
+        response = self.client.send_request("hooks/list", params)
+        response_dict = self.client.parse_response(response.content, "hooks/list")
+        log.response("hooks/list", "Webhooks listed successfully.")
+        return [
+            HookFactory.create_hook(hook) for hook in response_dict.get("hooks") or []
+        ]
+
+    def destroy_hook(self, hook_id: str) -> Dict[str, Any]:
+        """
+        Removes a webhook.
+
+        Args:
+            hook_id (str): The ID returned by ``create_hook``.
+
+        Returns:
+            dict: The response from the API call.
+
+        Example:
+            hooks.destroy_hook(hook.hook_id)
+        """
+        log.request("hooks/destroy", "Removing webhook ID: %s", hook_id)
+        response = self.client.send_request("hooks/destroy", {"hookID": hook_id})
+        log.response("hooks/destroy", "Webhook ID %s removed.", hook_id)
+        return self.client.parse_response(response.content, "hooks/destroy")
@@ -0,0 +1,508 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    AsyncIterable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from sage_bbb.helpers import PlaybackFormat, Recording
+
+logger = logging.getLogger(__name__)
+
+# Changed recordings written per transaction while a sync runs.
+SYNC_BATCH_SIZE = 500
+
+# States getRecordings lists when no ``state`` filter is given.
+DEFAULT_STATES = "published,unpublished"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS recordings (
+    record_id TEXT PRIMARY KEY,
+    meeting_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    state TEXT NOT NULL,
+    published INTEGER NOT NULL,
+    start_time REAL,
+    end_time REAL,
+    duration REAL,
+    size INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS recordings_meeting
+    ON recordings (meeting_id, start_time);
+CREATE INDEX IF NOT EXISTS recordings_start ON recordings (start_time);
+CREATE INDEX IF NOT EXISTS recordings_state ON recordings (state, start_time);
+CREATE INDEX IF NOT EXISTS recordings_duration ON recordings (duration);
+CREATE TABLE IF NOT EXISTS recording_metadata (
+    record_id TEXT NOT NULL REFERENCES recordings (record_id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (record_id, key)
+);
+CREATE INDEX IF NOT EXISTS recording_metadata_lookup
+    ON recording_metadata (key, value, record_id);
+CREATE TABLE IF NOT EXISTS sync_checkpoints (
+    scope TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL,
+    recordings INTEGER NOT NULL
+);
+"""
+
+
+class SyncReport(NamedTuple):
+    """
+    The outcome of a RecordingIndex sync.
+
+    ``unchanged`` recordings were listed by the server but not written, as
+    their fingerprint matched the indexed copy.
+    """
+
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    seconds: float = 0.0
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    return value.timestamp() if value is not None else None
+
+
+def _datetime(value: Optional[float]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value, tz=timezone.utc)
+
+
+def _dump(recording: Recording) -> str:
+    data = recording._asdict()
+    data["start_time"] = _timestamp(recording.start_time)
+    data["end_time"] = _timestamp(recording.end_time)
+    data["playback"] = [list(playback) for playback in recording.playback]
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+
+def _load(data: str) -> Recording:
+    fields = json.loads(data)
+    fields["start_time"] = _datetime(fields["start_time"])
+    fields["end_time"] = _datetime(fields["end_time"])
+    fields["playback"] = tuple(
+        PlaybackFormat(*playback) for playback in fields["playback"]
+    )
+    return Recording(**fields)
+
+
+def _row(recording: Recording) -> Tuple[Any, ...]:
+    data = _dump(recording)
+    start, end = _timestamp(recording.start_time), _timestamp(recording.end_time)
+    return (
+        recording.record_id,
+        recording.meeting_id,
+        recording.name,
+        recording.state,
+        int(recording.published),
+        start,
+        end,
+        end - start if start is not None and end is not None else None,
+        recording.size,
+        hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest(),
+        data,
+    )
+
+
+def _scope_metadata(scope: Mapping[str, Any]) -> Dict[str, str]:
+    """
+    Maps getRecordings ``meta_`` filters to the indexed metadata keys.
+    """
+    return {
+        key[len("meta_") :]: str(value)
+        for key, value in scope.items()
+        if key.startswith("meta_")
+    }
+
+
+def _filter_in(column: str, value: Any, clauses: List[str], args: List[Any]) -> None:
+    values = [item for item in str(value).split(",") if item]
+    if values:
+        clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+        args.extend(values)
+
+
+def _filter_scope(
+    meeting_id: Optional[str],
+    filters: Mapping[str, Any],
+    clauses: List[str],
+    args: List[Any],
+) -> None:
+    """
+    Narrows a query to the recordings getRecordings lists for a sync scope,
+    so that only those can be found stale.
+
+    Raises:
+        ValueError: If a filter cannot be evaluated against the index.
+    """
+    if meeting_id:
+        _filter_in("meeting_id", meeting_id, clauses, args)
+    if "state" not in filters:
+        _filter_in("state", DEFAULT_STATES, clauses, args)
+    for key, value in filters.items():
+        if key == "state":
+            if "any" not in str(value).split(","):
+                _filter_in("state", value, clauses, args)
+        elif key == "recordID":
+            _filter_in("record_id", value, clauses, args)
+        elif key == "meetingID":
+            _filter_in("meeting_id", value, clauses, args)
+        elif not key.startswith("meta_"):
+            raise ValueError(
+                f"Cannot sync recordings filtered by {key!r}: only meetingID,"
+                " recordID, state and meta_ filters are supported."
+            )
+    _filter_metadata(_scope_metadata(filters), clauses, args)
+
+
+def _filter_metadata(
+    metadata: Mapping[str, Any], clauses: List[str], args: List[Any]
+) -> None:
+    for key, value in metadata.items():
+        clauses.append(
+            "record_id IN (SELECT record_id FROM recording_metadata"
+            " WHERE key = ? AND value = ?)"
+        )
+        args.extend((key, str(value)))
+
+
+class RecordingIndex:
+    """
+    A local SQLite index of a server's recordings.
+
+    Queries by meeting, metadata, start time, state and duration are
+    answered from indexed columns without contacting the server. ``sync``
+    brings the index up to date: getRecordings has no "modified since"
+    filter, so every sync streams the whole scope page by page, but each
+    recording is compared with the indexed copy by fingerprint and only new
+    or changed recordings are written. Indexed recordings within the scope
+    that are no longer listed are removed once a complete listing has been
+    read; recordings outside the scope are left untouched.
+
+    Args:
+        path (str): The SQLite database file, or ":memory:".
+
+    Example:
+        index = RecordingIndex("recordings.db")
+        index.sync(bbb_client.recordings, metadata={"meta_course": "CS101"})
+        for recording in index.search(metadata={"course": "CS101"}, limit=20):
+            print(recording.record_id, recording.start_time)
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        with self._lock, self._connection as connection:
+            if path != ":memory:":
+                connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "RecordingIndex":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM recordings"
+            ).fetchone()
+        return count
+
+    def get(self, record_id: str) -> Optional[Recording]:
+        """
+        Returns an indexed recording by recordID.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM recordings WHERE record_id = ?", (record_id,)
+            ).fetchone()
+        return _load(row[0]) if row else None
+
+    def search(
+        self,
+        meeting_id: Optional[str] = None,
+        metadata: Optional[Mapping[str, Any]] = None,
+        state: Optional[str] = None,
+        published: Optional[bool] = None,
+        start_after: Optional[datetime] = None,
+        start_before: Optional[datetime] = None,
+        min_duration: Optional[float] = None,
+        max_duration: Optional[float] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        newest_first: bool = True,
+    ) -> List[Recording]:
+        """
+        Returns the indexed recordings matching every given filter.
+
+        Args:
+            meeting_id (str, optional): The meetingID of the recordings.
+            metadata (dict, optional): Metadata values the recordings must
+            have, keyed without the ``meta_`` prefix.
+            state (str, optional): e.g. "published" or "processing".
+            published (bool, optional): The published flag.
+            start_after (datetime, optional): Inclusive lower start time bound.
+            start_before (datetime, optional): Exclusive upper start time bound.
+            min_duration (float, optional): Minimum duration, in seconds.
+            max_duration (float, optional): Maximum duration, in seconds.
+            limit (int, optional): The maximum number of recordings returned.
+            offset (int): The number of matching recordings skipped.
+            newest_first (bool): Whether to sort by descending start time.
+
+        Returns:
+            list: The matching Recording objects.
+
+        Example:
+            last_week = index.search(
+            metadata={"course": "CS101"},
+            start_after=datetime.now(timezone.utc) - timedelta(days=7),
+            min_duration=600,
+            )
+        """
+        clauses: List[str] = []
+        args: List[Any] = []
+        for column, operator, value in (
+            ("meeting_id", "=", meeting_id),
+            ("state", "=", state),
+            ("published", "=", None if published is None else int(published)),
+            ("start_time", ">=", _timestamp(start_after)),
+            ("start_time", "<", _timestamp(start_before)),
+            ("duration", ">=", min_duration),
+            ("duration", "<=", max_duration),
+        ):
+            if value is not None:
+                clauses.append(f"{column} {operator} ?")
+                args.append(value)
+        _filter_metadata(metadata or {}, clauses, args)
+        query = "SELECT data FROM recordings"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        direction = "DESC" if newest_first else "ASC"
+        query += f" ORDER BY start_time {direction}, record_id"
+        if limit is not None or offset:
+            query += " LIMIT ? OFFSET ?"
+            args.extend((-1 if limit is None else limit, offset))
+        with self._lock:
+            rows = self._connection.execute(query, args).fetchall()
+        return [_load(data) for (data,) in rows]
+
+    def last_synced(
+        self,
+        meeting_id: Optional[str] = None,
+        metadata: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[datetime]:
+        """
+        Returns when the given scope was last synced completely, if ever.
+        The checkpoint is informational: it does not narrow later syncs.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT synced_at FROM sync_checkpoints WHERE scope = ?",
+                (self._scope_key(meeting_id, metadata),),
+            ).fetchone()
+        return _datetime(row[0]) if row else None
+
+    @staticmethod
+    def _scope_key(
+        meeting_id: Optional[str], metadata: Optional[Mapping[str, Any]]
+    ) -> str:
+        scope = {key: str(value) for key, value in (metadata or {}).items()}
+        return json.dumps({"meetingID": meeting_id, **scope}, sort_keys=True)
+
+    def _fingerprints(
+        self, meeting_id: Optional[str], metadata: Mapping[str, Any]
+    ) -> Dict[str, str]:
+        query = "SELECT record_id, fingerprint FROM recordings"
+        clauses: List[str] = []
+        args: List[Any] = []
+        _filter_scope(meeting_id, metadata, clauses, args)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        with self._lock:
+            return dict(self._connection.execute(query, args).fetchall())
+
+    def _write(self, rows: Sequence[Tuple[Any, ...]]) -> None:
+        if not rows:
+            return
+        record_ids = [(row[0],) for row in rows]
+        with self._lock, self._connection as connection:
+            connection.executemany(
+                "DELETE FROM recording_metadata WHERE record_id = ?", record_ids
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO recordings"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            connection.executemany(
+                "INSERT INTO recording_metadata VALUES (?, ?, ?)",
+                [
+                    (row[0], key, str(value))
+                    for row in rows
+                    for key, value in json.loads(row[-1])["metadata"].items()
+                ],
+            )
+
+    def _finish(self, scope: str, stale: Iterable[str], listed: int) -> int:
+        removed = [(record_id,) for record_id in stale]
+        with self._lock, self._connection as connection:
+            connection.executemany(
+                "DELETE FROM recordings WHERE record_id = ?", removed
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO sync_checkpoints VALUES (?, ?, ?)",
+                (scope, time.time(), listed),
+            )
+        return len(removed)
+
+    def sync(
+        self,
+        recordings: Any,
+        meeting_id: Optional[str] = None,
+        metadata: Optional[Mapping[str, Any]] = None,
+        page_size: int = 100,
+    ) -> SyncReport:
+        """
+        Brings the index up to date with the server.
+
+        Args:
+            recordings (Recordings): The recordings service of a client.
+            meeting_id (str, optional): Only syncs this meeting's recordings.
+            metadata (dict, optional): Only syncs recordings matching these
+            getRecordings filters, e.g. ``{"meta_course": "CS101"}``. The
+            ``meta_``, ``state`` and ``recordID`` filters are supported.
+            Without ``state``, only published and unpublished recordings
+            are listed, so recordings in other states are left as they are;
+            pass ``{"state": "any"}`` to sync every state.
+            page_size (int): The number of recordings per request.
+
+        Returns:
+            SyncReport: The number of added, updated, removed and unchanged
+            recordings.
+
+        Raises:
+            ValueError: If ``metadata`` holds another getRecordings filter,
+            since the recordings it excludes could not be told apart from
+            deleted ones.
+
+        Example:
+            report = index.sync(bbb_client.recordings)
+            print(report.added, "new recordings")
+        """
+        started = time.perf_counter()
+        state = _SyncState(self, meeting_id, metadata or {})
+        for recording in recordings.iter_recordings(
+            meeting_id, dict(metadata or {}), page_size
+        ):
+            state.feed(recording)
+        return state.finish(started)
+
+    async def async_sync(
+        self,
+        recordings: Any,
+        meeting_id: Optional[str] = None,
+        metadata: Optional[Mapping[str, Any]] = None,
+        page_size: int = 100,
+    ) -> SyncReport:
+        """
+        Brings the index up to date through an AsyncRecordings service.
+
+        Example:
+            report = await index.async_sync(async_client.recordings)
+        """
+        started = time.perf_counter()
+        state = _SyncState(self, meeting_id, metadata or {})
+        pages: AsyncIterable[Recording] = recordings.iter_recordings(
+            meeting_id, dict(metadata or {}), page_size
+        )
+        async for recording in pages:
+            state.feed(recording)
+        return state.finish(started)
+
+
+class _SyncState:
+    """
+    Diffs a streamed listing against the index, writing changes in batches.
+    """
+
+    def __init__(
+        self,
+        index: RecordingIndex,
+        meeting_id: Optional[str],
+        metadata: Mapping[str, Any],
+    ) -> None:
+        self.index = index
+        self.scope = index._scope_key(meeting_id, metadata)
+        self.known = index._fingerprints(meeting_id, metadata)
+        self.seen: Set[str] = set()
+        self.pending: List[Tuple[Any, ...]] = []
+        self.added = self.updated = self.unchanged = 0
+
+    def feed(self, recording: Recording) -> None:
+        row = _row(recording)
+        self.seen.add(recording.record_id)
+        fingerprint = self.known.get(recording.record_id)
+        if fingerprint == row[-2]:
+            self.unchanged += 1
+            return
+        if fingerprint is None:
+            self.added += 1
+        else:
+            self.updated += 1
+        self.pending.append(row)
+        if len(self.pending) >= SYNC_BATCH_SIZE:
+            self.index._write(self.pending)
+            self.pending = []
+
+    def finish(self, started: float) -> SyncReport:
+        self.index._write(self.pending)
+        self.pending = []
+        stale = [record_id for record_id in self.known if record_id not in self.seen]
+        removed = self.index._finish(self.scope, stale, len(self.seen))
+        report = SyncReport(
+            self.added,
+            self.updated,
+            removed,
+            self.unchanged,
+            time.perf_counter() - started,
+        )
+        logger.info(
+            "Recording index synced: %s added, %s updated, %s removed, %s unchanged.",
+            report.added,
+            report.updated,
+            report.removed,
+            report.unchanged,
+        )
+        return report
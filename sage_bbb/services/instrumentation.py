@@ -0,0 +1,343 @@
+import bisect
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Upper bounds, in bytes, of the response size histogram buckets.
+SIZE_BUCKETS: Tuple[float, ...] = (
+    512,
+    2048,
+    8192,
+    32768,
+    131072,
+    524288,
+    2097152,
+    8388608,
+)
+
+PHASES = ("sign", "network", "parse")
+
+
+def response_size(response: Any, stream: bool) -> int:
+    """
+    Returns the body size of a response without reading a streamed body.
+    """
+    if response is None:
+        return 0
+    if stream:
+        return int(response.headers.get("Content-Length") or 0)
+    return len(response.content)
+
+
+class CallMetrics(NamedTuple):
+    """
+    The measurements of one API call, retries included.
+
+    ``network_seconds`` spans every attempt and the backoff in between.
+    ``status_code`` is None when no response was received.
+    """
+
+    api_call: str
+    host: str
+    sign_seconds: float = 0.0
+    network_seconds: float = 0.0
+    response_bytes: int = 0
+    status_code: Optional[int] = None
+    error: Optional[BaseException] = None
+
+
+class Instrumentation:
+    """
+    Base class of the hooks a client calls around every API call.
+
+    Every hook is a no-op, so subclasses only override what they need. Hooks
+    run on the calling thread (or event loop), so they must be quick.
+
+    Example:
+        class SlowCallLogger(Instrumentation):
+            def after_request(self, call):
+                if call.network_seconds > 1:
+                    print("slow call:", call.api_call, call.network_seconds)
+
+        bbb_client = BigBlueButtonClient(
+        "http://example.com/bigbluebutton/api/", "secret",
+        instrumentation=SlowCallLogger(),
+        )
+    """
+
+    def before_request(self, api_call: str, host: str) -> None:
+        """
+        Called before an API call is signed and sent.
+        """
+
+    def after_request(self, call: CallMetrics) -> None:
+        """
+        Called once an API call succeeded or failed.
+        """
+
+    def on_parse(self, api_call: Optional[str], seconds: float, size: int) -> None:
+        """
+        Called after a response body of ``size`` bytes has been parsed.
+        """
+
+
+class Histogram:
+    """
+    A cumulative histogram with fixed bucket bounds.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def buckets(self) -> List[Tuple[str, int]]:
+        """
+        Returns ``(upper bound, cumulative count)`` pairs, ending with "+Inf".
+        """
+        cumulative = 0
+        result = []
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            cumulative += count
+            label = "+Inf" if bound == float("inf") else f"{bound:g}"
+            result.append((label, cumulative))
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"count": self.count, "sum": self.sum, "buckets": self.buckets()}
+
+
+class _EndpointStats:
+    __slots__ = ("requests", "errors", "size", "phases")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors: Dict[str, int] = {}
+        self.size = Histogram(SIZE_BUCKETS)
+        self.phases = {phase: Histogram(LATENCY_BUCKETS) for phase in PHASES}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+class MetricsCollector(Instrumentation):
+    """
+    An in-process aggregator of API call metrics.
+
+    It keeps, per API call, latency histograms of the signing, network and
+    XML parsing phases, a response size histogram and request and error
+    counts, along with the number of requests in flight per host. Metrics can
+    be read as a snapshot or exported in the Prometheus text format.
+
+    Args:
+        transports (iterable, optional): Transports whose connection pool
+        usage is included in snapshots and exports.
+
+    Example:
+        metrics = MetricsCollector(transports=[transport])
+        bbb_client = BigBlueButtonClient(
+        "http://example.com/bigbluebutton/api/", "secret",
+        transport=transport, instrumentation=metrics,
+        )
+        bbb_client.meetings.get_meetings()
+        print(metrics.to_prometheus())
+    """
+
+    def __init__(self, transports: Iterable[Any] = ()) -> None:
+        self.transports = list(transports)
+        self._endpoints: Dict[str, _EndpointStats] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, api_call: str) -> _EndpointStats:
+        stats = self._endpoints.get(api_call)
+        if stats is None:
+            stats = self._endpoints[api_call] = _EndpointStats()
+        return stats
+
+    def before_request(self, api_call: str, host: str) -> None:
+        with self._lock:
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+
+    def after_request(self, call: CallMetrics) -> None:
+        with self._lock:
+            self._in_flight[call.host] = self._in_flight.get(call.host, 1) - 1
+            stats = self._stats(call.api_call)
+            stats.requests += 1
+            stats.phases["sign"].observe(call.sign_seconds)
+            stats.phases["network"].observe(call.network_seconds)
+            if call.error is not None:
+                name = type(call.error).__name__
+                stats.errors[name] = stats.errors.get(name, 0) + 1
+            else:
+                stats.size.observe(call.response_bytes)
+
+    def on_parse(self, api_call: Optional[str], seconds: float, size: int) -> None:
+        with self._lock:
+            self._stats(api_call or "unknown").phases["parse"].observe(seconds)
+
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns the connection pool usage of the watched transports.
+        """
+        pools: Dict[str, Dict[str, int]] = {}
+        for transport in self.transports:
+            stats = getattr(transport, "pool_stats", None)
+            if stats is not None:
+                pools.update(stats())
+        return pools
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns a point-in-time copy of every metric.
+
+        Example:
+            calls = metrics.snapshot()["calls"]
+            print(calls["getMeetings"]["network"]["sum"])
+        """
+        with self._lock:
+            calls = {
+                api_call: {
+                    "requests": stats.requests,
+                    "errors": dict(stats.errors),
+                    "response_bytes": stats.size.snapshot(),
+                    **{
+                        phase: histogram.snapshot()
+                        for phase, histogram in stats.phases.items()
+                    },
+                }
+                for api_call, stats in self._endpoints.items()
+            }
+            in_flight = dict(self._in_flight)
+        return {"calls": calls, "in_flight": in_flight, "pools": self.pool_stats()}
+
+    def reset(self) -> None:
+        """
+        Drops every recorded metric.
+        """
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_prometheus(self, prefix: str = "bbb") -> str:
+        """
+        Exports the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): The prefix of every metric name.
+
+        Returns:
+            str: The exposition text, ready to be served on /metrics.
+
+        Example:
+            print(metrics.to_prometheus())
+        """
+        snapshot = self.snapshot()
+        lines: List[str] = []
+
+        def histogram(
+            name: str, help_text: str, series: List[Tuple[Mapping[str, str], Any]]
+        ) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for labels, data in series:
+                for bound, count in data["buckets"]:
+                    label_text = _labels(**labels, le=bound)
+                    lines.append(f"{prefix}_{name}_bucket{{{label_text}}} {count}")
+                label_text = _labels(**labels)
+                lines.append(f"{prefix}_{name}_sum{{{label_text}}} {data['sum']}")
+                lines.append(f"{prefix}_{name}_count{{{label_text}}} {data['count']}")
+
+        def simple(
+            name: str,
+            kind: str,
+            help_text: str,
+            series: List[Tuple[Mapping[str, str], Any]],
+        ) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for labels, value in series:
+                lines.append(f"{prefix}_{name}{{{_labels(**labels)}}} {value}")
+
+        calls = snapshot["calls"]
+        histogram(
+            "request_phase_seconds",
+            "Time spent signing, on the network and parsing, per API call.",
+            [
+                ({"endpoint": api_call, "phase": phase}, data[phase])
+                for api_call, data in calls.items()
+                for phase in PHASES
+            ],
+        )
+        histogram(
+            "response_size_bytes",
+            "Size of successful API responses.",
+            [
+                ({"endpoint": api_call}, data["response_bytes"])
+                for api_call, data in calls.items()
+            ],
+        )
+        simple(
+            "requests_total",
+            "counter",
+            "API calls sent.",
+            [
+                ({"endpoint": api_call}, data["requests"])
+                for api_call, data in calls.items()
+            ],
+        )
+        simple(
+            "request_errors_total",
+            "counter",
+            "Failed API calls, by error type.",
+            [
+                ({"endpoint": api_call, "error": error}, count)
+                for api_call, data in calls.items()
+                for error, count in data["errors"].items()
+            ],
+        )
+        simple(
+            "requests_in_flight",
+            "gauge",
+            "API calls currently in flight.",
+            [({"host": host}, count) for host, count in snapshot["in_flight"].items()],
+        )
+        simple(
+            "pool_connections",
+            "gauge",
+            "Connections held by the transport pools.",
+            [
+                ({"pool": pool, "state": state}, count)
+                for pool, stats in snapshot["pools"].items()
+                for state, count in stats.items()
+            ],
+        )
+        return "\n".join(lines) + "\n"
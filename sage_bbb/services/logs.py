@@ -0,0 +1,210 @@
+import atexit
+import logging
+import math
+import re
+import threading
+import time
+import weakref
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+
+# Parameters and model fields whose values never appear in logs.
+SENSITIVE_KEYS = frozenset(
+    {
+        "password",
+        "attendeepw",
+        "moderatorpw",
+        "attendee_pw",
+        "moderator_pw",
+        "checksum",
+        "sessiontoken",
+        "configtoken",
+        "security_salt",
+    }
+)
+REDACTED = "***"
+
+_SENSITIVE_QUERY = re.compile(
+    r"(?i)\b(password|attendeePW|moderatorPW|checksum|sessionToken|configToken)"
+    r"=[^&\s\"']*"
+)
+
+
+def redact(value: Any) -> Any:
+    """
+    Masks secrets in a log argument: query string parameters in strings,
+    sensitive keys in dicts and sensitive fields of named tuples such as
+    Meeting. Other values are returned unchanged.
+
+    Example:
+        print(redact("join?fullName=Jane&password=mp&checksum=abc"))
+        # join?fullName=Jane&password=***&checksum=***
+    """
+    if isinstance(value, str):
+        return _SENSITIVE_QUERY.sub(rf"\1={REDACTED}", value)
+    if isinstance(value, Mapping):
+        return {
+            key: REDACTED if str(key).lower() in SENSITIVE_KEYS else redact(item)
+            for key, item in value.items()
+        }
+    fields = getattr(value, "_fields", None)
+    if isinstance(value, tuple) and fields:
+        hidden = {name: REDACTED for name in fields if name in SENSITIVE_KEYS}
+        return value._replace(**hidden) if hidden else value
+    return value
+
+
+class LogSettings(NamedTuple):
+    """
+    The log volume controls shared by every service logger.
+
+    ``sample_rates`` maps API calls to the fraction of their per-call lines
+    that are emitted; calls missing from it use ``default_rate``. When
+    ``summary_interval`` is set, per-call lines are replaced by one summary
+    line per interval with the number of calls per API call.
+    """
+
+    sample_rates: Mapping[str, float] = {}
+    default_rate: float = 1.0
+    summary_interval: Optional[float] = None
+
+
+_settings = LogSettings()
+
+# Every service logger, so pending summaries can be flushed at shutdown.
+_loggers: "weakref.WeakSet[ServiceLogger]" = weakref.WeakSet()
+
+
+def configure_logging(
+    sample_rates: Optional[Mapping[str, float]] = None,
+    default_rate: float = 1.0,
+    summary_interval: Optional[float] = None,
+) -> None:
+    """
+    Sets the log volume controls of the meeting, recording and configuration
+    services.
+
+    Args:
+        sample_rates (dict, optional): The fraction, between 0 and 1, of the
+        per-call lines emitted for each API call.
+        default_rate (float): The fraction used for unlisted API calls.
+        summary_interval (float, optional): Replaces per-call lines with a
+        summary line every ``summary_interval`` seconds.
+
+    Example:
+        configure_logging(sample_rates={"join": 0.01, "getMeetingInfo": 0.1})
+        configure_logging(summary_interval=60)
+    """
+    global _settings
+    flush_summaries()
+    _settings = LogSettings(dict(sample_rates or {}), default_rate, summary_interval)
+
+
+def flush_summaries() -> None:
+    """
+    Emits the pending summary line of every service logger. Called at
+    interpreter exit so the last interval is not lost, and by
+    ``configure_logging`` before the settings change.
+
+    Example:
+        configure_logging(summary_interval=60)
+        ...
+        flush_summaries()
+    """
+    for service_logger in list(_loggers):
+        service_logger.flush_summary()
+
+
+atexit.register(flush_summaries)
+
+
+class ServiceLogger:
+    """
+    Emits the per-call INFO lines of a service module.
+
+    Lines are dropped before any formatting when INFO is disabled, sampled
+    per API call (the first call is always logged, then one in every
+    ``1 / rate``), and their arguments are redacted. In summary mode each
+    call is counted once, on its ``request`` line. Every record carries
+    the API call in its ``bbb_api_call`` attribute for structured handlers.
+
+    Args:
+        logger (logging.Logger): The logger records are sent to.
+
+    Example:
+        log = ServiceLogger(logging.getLogger(__name__))
+        log.request("end", "Ending meeting ID: %s", meeting_id)
+        log.response("end", "Meeting ID %s ended successfully.", meeting_id)
+    """
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self.logger = logger
+        self._seen: Dict[Tuple[str, bool], int] = {}
+        self._summary: Dict[str, int] = {}
+        self._summary_started = time.monotonic()
+        self._lock = threading.Lock()
+        _loggers.add(self)
+
+    def request(self, api_call: str, msg: str, *args: Any) -> None:
+        """
+        Logs that an API call is about to be made.
+        """
+        self._log(api_call, False, msg, args)
+
+    def response(self, api_call: str, msg: str, *args: Any) -> None:
+        """
+        Logs that an API call completed.
+        """
+        self._log(api_call, True, msg, args)
+
+    def _log(
+        self, api_call: str, completed: bool, msg: str, args: Tuple[Any, ...]
+    ) -> None:
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        settings = _settings
+        if settings.summary_interval is not None:
+            if not completed:
+                self._count(api_call, settings.summary_interval)
+            return
+        rate = settings.sample_rates.get(api_call, settings.default_rate)
+        if rate < 1.0:
+            key = (api_call, completed)
+            with self._lock:
+                seen = self._seen.get(key, 0)
+                self._seen[key] = seen + 1
+            if rate <= 0 or math.floor(seen * rate) == math.floor((seen - 1) * rate):
+                return
+        self.logger.info(
+            msg,
+            *[redact(arg) for arg in args],
+            extra={"bbb_api_call": api_call, "bbb_sample_rate": rate},
+        )
+
+    def _count(self, api_call: str, interval: float) -> None:
+        with self._lock:
+            self._summary[api_call] = self._summary.get(api_call, 0) + 1
+            if time.monotonic() - self._summary_started < interval:
+                return
+        self.flush_summary()
+
+    def flush_summary(self) -> None:
+        """
+        Emits the pending summary line, if any calls were counted.
+
+        Example:
+            log.flush_summary()
+        """
+        with self._lock:
+            counts, self._summary = self._summary, {}
+            elapsed = time.monotonic() - self._summary_started
+            self._summary_started = time.monotonic()
+        if counts:
+            totals = ", ".join(
+                f"{call or 'check'}={count}" for call, count in sorted(counts.items())
+            )
+            self.logger.info(
+                "BigBlueButton calls in the last %.0fs: %s",
+                elapsed,
+                totals,
+                extra={"bbb_summary": counts},
+            )
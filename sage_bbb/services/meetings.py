@@ -1,10 +1,146 @@
-from typing import Any, Dict, Optional
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
 import logging
 
 from sage_bbb.helpers import Meeting
+from sage_bbb.services.batch import DEFAULT_MAX_WORKERS, BatchResult, run_batch
 from sage_bbb.services.factory import MeetingFactory
+from sage_bbb.services.logs import ServiceLogger
+from sage_bbb.services.presentations import (
+    PresentationBody,
+    PresentationSource,
+    shared_cache,
+)
+from sage_bbb.services.query import Query
 
 logger = logging.getLogger(__name__)
+log = ServiceLogger(logger)
+
+# Rows signed per task when a roster is split across worker processes.
+JOIN_URL_CHUNK_SIZE = 2000
+
+Roster = Union[Iterable[Mapping[str, Any]], Mapping[str, Sequence[Any]]]
+
+
+def _running_response(meeting_dict: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Builds an isMeetingRunning-style response from a getMeetings entry.
+    """
+    running = meeting_dict is not None and meeting_dict.get("running") == "true"
+    return {"returncode": "SUCCESS", "running": "true" if running else "false"}
+
+
+def _info_response(meeting_dict: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Builds a getMeetingInfo-style response from a getMeetings entry.
+    """
+    if meeting_dict is None:
+        return {
+            "returncode": "FAILED",
+            "messageKey": "notFound",
+            "message": "We could not find a meeting with that meeting ID",
+        }
+    return {"returncode": "SUCCESS", **meeting_dict}
+
+
+def _answer_from_listing(
+    meetings: List[Meeting],
+    listing: Dict[str, Any],
+    build: Callable[[Optional[Dict[str, Any]]], Dict[str, Any]],
+) -> List[BatchResult]:
+    """
+    Answers a batch of per-meeting calls from a single getMeetings response.
+    """
+    current = {
+        entry.get("meetingID"): entry for entry in listing.get("meetings") or []
+    }
+    return [
+        BatchResult(meeting, value=build(current.get(meeting.meeting_id)))
+        for meeting in meetings
+    ]
+
+
+def _roster_rows(roster: Roster) -> Iterable[Mapping[str, Any]]:
+    """
+    Turns a columnar roster (parameter name to column) into rows; row
+    rosters are returned as they are.
+    """
+    if not isinstance(roster, Mapping):
+        return roster
+    lengths = {len(column) for column in roster.values()}
+    if len(lengths) > 1:
+        raise ValueError("All roster columns must have the same length.")
+    names = list(roster)
+    return (dict(zip(names, values)) for values in zip(*roster.values()))
+
+
+def _build_url_chunk(
+    url_builder: Any,
+    api_call: str,
+    rows: List[Mapping[str, Any]],
+    shared_params: Dict[str, Any],
+) -> List[str]:
+    """
+    Signs a chunk of rows; runs in a worker process.
+    """
+    return list(url_builder.build_urls(api_call, rows, shared_params))
+
+
+def _chunks(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def build_join_urls(
+    url_builder: Any,
+    meeting: Meeting,
+    roster: Roster,
+    processes: Optional[int] = None,
+    chunk_size: int = JOIN_URL_CHUNK_SIZE,
+    **kwargs: Any,
+) -> Iterator[str]:
+    """
+    Builds the join URLs of a roster with a URL builder; shared by the sync
+    and async meeting services.
+    """
+    shared_params = {"meetingID": meeting.meeting_id, **kwargs}
+    rows = _roster_rows(roster)
+    log.request("join", "Building join URLs in bulk for meeting ID: %s", meeting.meeting_id)
+    if not processes:
+        yield from url_builder.build_urls("join", rows, shared_params)
+        return
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        # Keep a couple of chunks per worker in flight, so the roster is
+        # consumed lazily and URLs come back in roster order.
+        pending: Deque["Future[List[str]]"] = deque()
+        for chunk in _chunks(rows, chunk_size):
+            pending.append(
+                executor.submit(
+                    _build_url_chunk, url_builder, "join", chunk, shared_params
+                )
+            )
+            if len(pending) >= 2 * processes:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
 
 
 class Meetings:
@@ -23,6 +159,7 @@ class Meetings:
 
     def __init__(self, client: "BigBlueButtonClient") -> None:
         self.client = client
+        self.presentation_cache = shared_cache
 
     def get_meetings(self, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -43,10 +180,45 @@ class Meetings:
             print(filtered_meetings)
         """
         params = metadata if metadata else {}
-        logger.info("Retrieving meetings with params: %s", params)
+        log.request("getMeetings", "Retrieving meetings with params: %s", params)
         response = self.client.send_request("getMeetings", params)
-        logger.info("Meetings retrieved successfully.")
-        return self.client.parse_response(response.content)
+        log.response("getMeetings", "Meetings retrieved successfully.")
+        return self.client.parse_response(response.content, "getMeetings")
+
+    def iter_meetings(
+        self,
+        metadata: Optional[Dict[str, Any]] = None,
+        query: Optional[Query] = None,
+    ) -> Iterator[Meeting]:
+        """
+        Lazily yields every current meeting, including its attendees and metadata.
+
+        The response is parsed while it is downloaded, so memory use stays
+        flat regardless of how many meetings the server reports.
+
+        Args:
+            metadata (dict, optional): A dictionary of metadata to filter the meetings.
+            query (Query, optional): Only yields the matching meetings; the
+            others are skipped while parsing, without being built.
+
+        Returns:
+            Iterator[Meeting]: The current meetings, one at a time.
+
+        Example:
+            meetings = Meetings(bbb_client)
+            for meeting in meetings.iter_meetings():
+                print(meeting.meeting_name, meeting.participant_count)
+        """
+        params = metadata if metadata else {}
+        log.request("getMeetings", "Streaming meetings with params: %s", params)
+        return self.client.stream_items(
+            "getMeetings",
+            params,
+            "meetings",
+            "meeting",
+            MeetingFactory.from_element,
+            predicate=query.element_predicate("meeting") if query else None,
+        )
 
     def create_meeting(
         self,
@@ -54,20 +226,29 @@ class Meetings:
         meeting_id: str,
         attendee_pw: str,
         moderator_pw: str,
+        presentations: Optional[Iterable[PresentationSource]] = None,
         **kwargs: Any,
     ) -> Meeting:
         """
         Creates a new meeting.
 
+        Presentations are sent as the XML body of the request. Embedded
+        documents are base64-encoded once per content by
+        ``presentation_cache`` and streamed in chunks, so creating many
+        meetings with the same deck only encodes it once.
+
         Args:
             name (str): The name of the meeting.
             meeting_id (str): The unique identifier for the meeting.
             attendee_pw (str): The password for attendees.
             moderator_pw (str): The password for moderators.
+            presentations (iterable, optional): Documents to preload:
+            Presentation objects, URLs, paths, binary file objects or
+            contents wrapped in a Presentation with a filename.
             **kwargs: Additional optional parameters for the meeting.
 
         Returns:
-            Meeting: An instance of the Meeting dataclass
+            Meeting: An immutable Meeting instance
             containing details about the created meeting.
 
         Example:
@@ -76,7 +257,8 @@ class Meetings:
                 name="Test Meeting",
                 meeting_id="1234",
                 attendee_pw="ap",
-                moderator_pw="mp"
+                moderator_pw="mp",
+                presentations=["decks/week-1.pdf"],
             )
             print(new_meeting)
         """
@@ -87,10 +269,16 @@ class Meetings:
             "moderatorPW": moderator_pw,
             **kwargs,
         }
-        logger.info("Creating meeting with params: %s", params)
-        response = self.client.send_request("create", params)
-        response_dict = self.client.parse_response(response.content)
-        logger.info("Meeting created successfully with ID: %s", meeting_id)
+        log.request("create", "Creating meeting with params: %s", params)
+        if presentations is None:
+            response = self.client.send_request("create", params)
+        else:
+            body = PresentationBody(presentations, self.presentation_cache)
+            response = self.client.send_request(
+                "create", params, data=body, headers=body.headers
+            )
+        response_dict = self.client.parse_response(response.content, "create")
+        log.response("create", "Meeting created successfully with ID: %s", meeting_id)
         return MeetingFactory.create_meeting(response_dict)
 
     def join_meeting(
@@ -122,11 +310,53 @@ class Meetings:
             "password": password,
             **kwargs,
         }
-        logger.info("Joining meeting ID: %s with full name: %s", meeting.meeting_id, full_name)
+        log.request("join", "Joining meeting ID: %s with full name: %s", meeting.meeting_id, full_name)
         join_url = self.client.url_builder.build_url("join", params)
-        logger.info("Join URL generated: %s", join_url)
+        log.response("join", "Join URL generated: %s", join_url)
         return join_url
 
+    def build_join_urls(
+        self,
+        meeting: Meeting,
+        roster: Roster,
+        processes: Optional[int] = None,
+        chunk_size: int = JOIN_URL_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """
+        Lazily builds the join URLs of a whole roster.
+
+        Parameters common to every attendee (the meeting ID and ``kwargs``)
+        are encoded once, and URLs are not logged one by one. For very large
+        rosters, signing can be split across worker processes.
+
+        Args:
+            meeting (Meeting): The Meeting instance.
+            roster: Either an iterable of rows (dicts of join parameters such as
+            ``fullName``, ``role``, ``password`` or ``userID``), or a columnar
+            dict mapping each join parameter to a sequence of values.
+            processes (int, optional): The number of worker processes. URLs are
+            built in the calling thread when omitted.
+            chunk_size (int): The number of rows sent to a worker at a time.
+            **kwargs: Join parameters shared by every attendee, e.g. ``role``
+            or ``redirect``. Row values take precedence.
+
+        Returns:
+            Iterator[str]: One join URL per roster row, in order.
+
+        Example:
+            join_urls = list(
+                meetings.build_join_urls(
+                    new_meeting,
+                    {"fullName": ["Jane Doe", "John Doe"], "userID": ["u1", "u2"]},
+                    role="VIEWER",
+                )
+            )
+        """
+        return build_join_urls(
+            self.client.url_builder, meeting, roster, processes, chunk_size, **kwargs
+        )
+
     def end_meeting(self, meeting: Meeting) -> Dict[str, Any]:
         """
         Ends a meeting.
@@ -145,10 +375,10 @@ class Meetings:
             "meetingID": meeting.meeting_id,
             "password": meeting.moderator_pw,
         }
-        logger.info("Ending meeting ID: %s", meeting.meeting_id)
+        log.request("end", "Ending meeting ID: %s", meeting.meeting_id)
         response = self.client.send_request("end", params)
-        logger.info("Meeting ID %s ended successfully.", meeting.meeting_id)
-        return self.client.parse_response(response.content)
+        log.response("end", "Meeting ID %s ended successfully.", meeting.meeting_id)
+        return self.client.parse_response(response.content, "end")
 
     def is_meeting_running(self, meeting: Meeting) -> Dict[str, Any]:
         """
@@ -167,10 +397,10 @@ class Meetings:
         params = {
             "meetingID": meeting.meeting_id,
         }
-        logger.info("Checking if meeting ID: %s is running.", meeting.meeting_id)
+        log.request("isMeetingRunning", "Checking if meeting ID: %s is running.", meeting.meeting_id)
         response = self.client.send_request("isMeetingRunning", params)
-        logger.info("Meeting running status retrieved for meeting ID: %s", meeting.meeting_id)
-        return self.client.parse_response(response.content)
+        log.response("isMeetingRunning", "Meeting running status retrieved for meeting ID: %s", meeting.meeting_id)
+        return self.client.parse_response(response.content, "isMeetingRunning")
 
     def get_meeting_info(self, meeting: Meeting) -> Dict[str, Any]:
         """
@@ -189,7 +419,91 @@ class Meetings:
         params = {
             "meetingID": meeting.meeting_id,
         }
-        logger.info("Retrieving information for meeting ID: %s", meeting.meeting_id)
+        log.request("getMeetingInfo", "Retrieving information for meeting ID: %s", meeting.meeting_id)
         response = self.client.send_request("getMeetingInfo", params)
-        logger.info("Meeting information retrieved for meeting ID: %s", meeting.meeting_id)
-        return self.client.parse_response(response.content)
+        log.response("getMeetingInfo", "Meeting information retrieved for meeting ID: %s", meeting.meeting_id)
+        return self.client.parse_response(response.content, "getMeetingInfo")
+
+    def is_meeting_running_many(
+        self,
+        meetings: Iterable[Meeting],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        single_request: bool = False,
+    ) -> List[BatchResult]:
+        """
+        Checks whether each of several meetings is currently running.
+
+        The isMeetingRunning calls are fanned out over a bounded thread pool.
+        With ``single_request`` the answers are instead derived from one
+        getMeetings call, which is cheaper when checking many meetings on the
+        same server.
+
+        Args:
+            meetings (iterable of Meeting): The meetings to check.
+            max_workers (int): The maximum number of concurrent requests.
+            single_request (bool): Whether to answer from a single getMeetings call.
+
+        Returns:
+            list: One BatchResult per meeting, in input order. Each value has
+            the same shape as the ``is_meeting_running`` response, and a
+            failed call is reported in the result's ``error``.
+
+        Example:
+            results = meetings.is_meeting_running_many([meeting_a, meeting_b])
+            for result in results:
+                print(result.item.meeting_id, result.ok and result.value["running"])
+        """
+        meetings = list(meetings)
+        log.request("isMeetingRunning", "Checking running status of %s meetings.", len(meetings))
+        if single_request:
+            return self._answer_from_get_meetings(meetings, _running_response)
+        return run_batch(self.is_meeting_running, meetings, max_workers)
+
+    def get_meeting_info_many(
+        self,
+        meetings: Iterable[Meeting],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        single_request: bool = False,
+    ) -> List[BatchResult]:
+        """
+        Retrieves detailed information about several meetings.
+
+        The getMeetingInfo calls are fanned out over a bounded thread pool.
+        With ``single_request`` the answers are instead taken from one
+        getMeetings call; meetings that are not currently on the server are
+        then reported with a ``notFound`` response, as getMeetingInfo would.
+
+        Args:
+            meetings (iterable of Meeting): The meetings to look up.
+            max_workers (int): The maximum number of concurrent requests.
+            single_request (bool): Whether to answer from a single getMeetings call.
+
+        Returns:
+            list: One BatchResult per meeting, in input order. Each value has
+            the same shape as the ``get_meeting_info`` response, and a failed
+            call is reported in the result's ``error``.
+
+        Example:
+            results = meetings.get_meeting_info_many(todays_meetings, max_workers=32)
+            failed = [result.item for result in results if not result.ok]
+        """
+        meetings = list(meetings)
+        log.request("getMeetingInfo", "Retrieving information for %s meetings.", len(meetings))
+        if single_request:
+            return self._answer_from_get_meetings(meetings, _info_response)
+        return run_batch(self.get_meeting_info, meetings, max_workers)
+
+    def _answer_from_get_meetings(
+        self,
+        meetings: List[Meeting],
+        build: Callable[[Optional[Dict[str, Any]]], Dict[str, Any]],
+    ) -> List[BatchResult]:
+        """
+        Answers a batch of per-meeting calls from a single getMeetings call,
+        reporting a failure of that call against every meeting.
+        """
+        try:
+            listing = self.get_meetings()
+        except Exception as e:
+            return [BatchResult(meeting, error=e) for meeting in meetings]
+        return _answer_from_listing(meetings, listing, build)
@@ -0,0 +1,472 @@
+from __future__ import annotations
+
+import contextvars
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    Optional,
+    TypeVar,
+)
+
+from sage_bbb.exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    HTTPStatusError,
+    TransportError,
+)
+from sage_bbb.services.logs import redact
+
+if TYPE_CHECKING:
+    from sage_bbb.services.transport import Timeout
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# API calls that can be repeated without changing the outcome. Any other call
+# (create, end, deleteRecordings...) is only retried when it failed while
+# connecting, i.e. when the server cannot have seen it.
+IDEMPOTENT_CALLS = frozenset(
+    {
+        "",
+        "getMeetings",
+        "getMeetingInfo",
+        "isMeetingRunning",
+        "getRecordings",
+        "getRecordingTextTracks",
+        "getDefaultConfigXML",
+        "publishRecordings",
+        "updateRecordings",
+    }
+)
+
+# Statuses of overloaded or restarting servers and proxies.
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+_deadline: "contextvars.ContextVar[Optional[float]]" = contextvars.ContextVar(
+    "sage_bbb_deadline", default=None
+)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Bounds the total time of every API call made inside the block, retries
+    and backoff included.
+
+    Deadlines nest: an inner block can only shorten the outer deadline. They
+    follow the context into coroutines and into the worker threads used by
+    batch calls and prefetching.
+
+    Args:
+        seconds (float): The time budget of the block.
+
+    Example:
+        with deadline(2.0):
+            info = bbb_client.meetings.get_meeting_info(meeting)
+    """
+    expires_at = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        expires_at = min(expires_at, outer)
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """
+    Returns the seconds left before the current deadline, or None when no
+    deadline is set.
+    """
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+def _cap_timeout(timeout: Optional[Timeout], remaining: float) -> Timeout:
+    if timeout is None:
+        return remaining
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return min(connect, remaining), min(read, remaining)
+    return min(timeout, remaining)
+
+
+class RetryPolicy:
+    """
+    Decides which failed calls are retried, and how long to wait in between.
+
+    Waits grow exponentially with "full jitter": attempt ``n`` sleeps a random
+    time between 0 and ``min(max_backoff, base_backoff * 2 ** n)``, so many
+    clients hitting the same failing server do not retry in lockstep.
+
+    Args:
+        max_attempts (int): The maximum number of attempts per call, the
+        first one included. 1 disables retries.
+        base_backoff (float): The backoff ceiling of the first retry, in seconds.
+        max_backoff (float): The largest backoff ceiling, in seconds.
+        retry_statuses (collection): HTTP statuses worth retrying.
+        idempotent_calls (collection): API calls that are safe to repeat once
+        the request reached the server.
+
+    Example:
+        policy = RequestPolicy(retry=RetryPolicy(max_attempts=5, base_backoff=0.5))
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_backoff: float = 0.2,
+        max_backoff: float = 5.0,
+        retry_statuses: Collection[int] = RETRY_STATUSES,
+        idempotent_calls: Collection[str] = IDEMPOTENT_CALLS,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_calls = frozenset(idempotent_calls)
+
+    def is_retryable(self, api_call: str, error: BaseException) -> bool:
+        """
+        Returns whether a call that failed with ``error`` may be sent again.
+        """
+        if isinstance(error, TransportError):
+            return not error.request_sent or api_call in self.idempotent_calls
+        if isinstance(error, HTTPStatusError):
+            return (
+                error.status_code in self.retry_statuses
+                and api_call in self.idempotent_calls
+            )
+        return False
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns the seconds to wait before retrying after ``attempt`` failed
+        attempts.
+        """
+        ceiling = min(self.max_backoff, self.base_backoff * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """
+    Tracks the health of one host and fails fast while it is down.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls are rejected with CircuitOpenError. Once ``reset_timeout`` has
+    elapsed a single probe call is let through: its success closes the
+    circuit, its failure opens it again.
+
+    Args:
+        host (str): The host the breaker protects.
+        failure_threshold (int): Consecutive failures that open the circuit.
+        reset_timeout (float): Seconds the circuit stays open before a probe.
+        clock (callable): Returns the current time in seconds.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """
+        Returns "closed", "open" or "half-open".
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            if self.clock() - self.opened_at >= self.reset_timeout:
+                return "half-open"
+            return "open"
+
+    def before_call(self) -> None:
+        """
+        Raises CircuitOpenError if a call to the host must not be sent now.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return
+            retry_after = self.opened_at + self.reset_timeout - self.clock()
+            if retry_after > 0 or self._probing:
+                raise CircuitOpenError(self.host, max(retry_after, 0.0))
+            self._probing = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.opened_at is not None:
+                logger.info("Circuit for %s closed.", self.host)
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def cancel_probe(self) -> None:
+        """
+        Lets another probe through after one ended without a verdict, e.g.
+        when it was interrupted.
+        """
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._probing or (
+                self.opened_at is None and self.failures >= self.failure_threshold
+            ):
+                if self.opened_at is None:
+                    logger.warning(
+                        "Circuit for %s opened after %d consecutive failures.",
+                        self.host,
+                        self.failures,
+                    )
+                self.opened_at = self.clock()
+                self._probing = False
+
+
+def _is_server_failure(error: BaseException) -> bool:
+    """
+    Returns whether an error says the host is unhealthy. Client errors (4xx)
+    come from a healthy server and do not trip the breaker.
+    """
+    if isinstance(error, TransportError):
+        return True
+    return isinstance(error, HTTPStatusError) and (
+        error.status_code >= 500 or error.status_code == 429
+    )
+
+
+class RequestPolicy:
+    """
+    Retries, per-host circuit breaking and deadlines applied to every call
+    sent by a client.
+
+    A policy may be shared by several clients, in which case they also
+    share the circuit breaker of each host.
+
+    Args:
+        retry (RetryPolicy, optional): The retry policy. Defaults to
+        ``RetryPolicy()``; pass ``RetryPolicy(max_attempts=1)`` to disable
+        retries.
+        failure_threshold (int): Consecutive failures that open the circuit
+        of a host. 0 disables circuit breaking.
+        reset_timeout (float): Seconds a circuit stays open before a probe.
+        sleep (callable): Blocks for the given seconds between sync retries.
+        clock (callable): Returns the current time in seconds.
+
+    Example:
+        policy = RequestPolicy(
+            retry=RetryPolicy(max_attempts=4), failure_threshold=3, reset_timeout=10
+        )
+        bbb_client = BigBlueButtonClient(
+        "http://example.com/bigbluebutton/api/", "secret", policy=policy
+        )
+    """
+
+    def __init__(
+        self,
+        retry: Optional[RetryPolicy] = None,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.retry = retry or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.sleep = sleep
+        self.clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, host: str) -> Optional[CircuitBreaker]:
+        """
+        Returns the circuit breaker of a host, or None when circuit breaking
+        is disabled.
+        """
+        if not self.failure_threshold:
+            return None
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(
+                    host, self.failure_threshold, self.reset_timeout, self.clock
+                )
+            return breaker
+
+    def _before_attempt(
+        self,
+        api_call: str,
+        breaker: Optional[CircuitBreaker],
+        timeout: Optional[Timeout],
+        last_error: Optional[BaseException],
+    ) -> Optional[Timeout]:
+        """
+        Checks the deadline and the breaker, and returns the timeout of the
+        next attempt.
+        """
+        remaining = remaining_time()
+        if remaining is not None:
+            if remaining <= 0:
+                raise DeadlineExceededError(api_call, last_error) from last_error
+            timeout = _cap_timeout(timeout, remaining)
+        if breaker is not None:
+            breaker.before_call()
+        return timeout
+
+    def _after_failure(
+        self,
+        api_call: str,
+        host: str,
+        breaker: Optional[CircuitBreaker],
+        error: BaseException,
+        attempt: int,
+    ) -> Optional[float]:
+        """
+        Records a failed attempt and returns the backoff before the next one,
+        or None if the error must be raised. Raises DeadlineExceededError if
+        the deadline expired, or leaves no time for a retry.
+        """
+        remaining = remaining_time()
+        if remaining is not None and remaining <= 0:
+            # The attempt was cut short by the deadline, which says nothing
+            # about the health of the host.
+            if breaker is not None:
+                breaker.cancel_probe()
+            raise DeadlineExceededError(api_call, error) from error
+        if breaker is not None:
+            if _is_server_failure(error):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        if attempt >= self.retry.max_attempts or not self.retry.is_retryable(
+            api_call, error
+        ):
+            return None
+        delay = self.retry.backoff(attempt)
+        if remaining is not None and delay >= remaining:
+            raise DeadlineExceededError(api_call, error) from error
+        logger.warning(
+            "Retrying %s on %s in %.2fs after attempt %d failed: %s",
+            api_call or "API call",
+            host,
+            delay,
+            attempt,
+            redact(str(error)),
+        )
+        return delay
+
+    def execute(
+        self,
+        api_call: str,
+        host: str,
+        send: Callable[[Optional[Timeout]], T],
+        timeout: Optional[Timeout] = None,
+    ) -> T:
+        """
+        Sends a call through the policy.
+
+        Args:
+            api_call (str): The API call being made.
+            host (str): The host the call is sent to.
+            send (callable): Sends one attempt with the given timeout.
+            timeout (float or tuple, optional): The caller's timeout, capped
+            by the remaining deadline.
+
+        Returns:
+            The result of the first successful attempt.
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open.
+            DeadlineExceededError: If the deadline expired between attempts.
+            TransportError, HTTPStatusError: The error of the last attempt.
+        """
+        breaker = self.breaker(host)
+        attempt = 0
+        last_error: Optional[BaseException] = None
+        while True:
+            attempt += 1
+            attempt_timeout = self._before_attempt(
+                api_call, breaker, timeout, last_error
+            )
+            try:
+                result = send(attempt_timeout)
+            except (TransportError, HTTPStatusError) as e:
+                delay = self._after_failure(api_call, host, breaker, e, attempt)
+                if delay is None:
+                    raise
+                last_error = e
+                self.sleep(delay)
+                continue
+            except BaseException:
+                if breaker is not None:
+                    breaker.cancel_probe()
+                raise
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+    async def aexecute(
+        self,
+        api_call: str,
+        host: str,
+        send: Callable[[Optional[Timeout]], Awaitable[T]],
+        timeout: Optional[Timeout] = None,
+    ) -> T:
+        """
+        Async counterpart of ``execute``; backoff waits do not block the
+        event loop.
+        """
+        # Imported here, so the sync client does not load asyncio.
+        import asyncio
+
+        breaker = self.breaker(host)
+        attempt = 0
+        last_error: Optional[BaseException] = None
+        while True:
+            attempt += 1
+            attempt_timeout = self._before_attempt(
+                api_call, breaker, timeout, last_error
+            )
+            try:
+                result = await send(attempt_timeout)
+            except (TransportError, HTTPStatusError) as e:
+                delay = self._after_failure(api_call, host, breaker, e, attempt)
+                if delay is None:
+                    raise
+                last_error = e
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                if breaker is not None:
+                    breaker.cancel_probe()
+                raise
+            if breaker is not None:
+                breaker.record_success()
+            return result
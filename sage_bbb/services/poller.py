@@ -0,0 +1,261 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from sage_bbb.helpers import Attendee, Meeting
+
+logger = logging.getLogger(__name__)
+
+MEETING_STARTED = "meeting_started"
+MEETING_ENDED = "meeting_ended"
+ATTENDEE_JOINED = "attendee_joined"
+ATTENDEE_LEFT = "attendee_left"
+RECORDING_STARTED = "recording_started"
+
+EventCallback = Callable[["MeetingEvent"], Any]
+
+
+class MeetingEvent(NamedTuple):
+    """
+    A change detected between two polls of the meetings of a server.
+
+    ``meeting`` is the latest known state of the meeting; ``attendee`` is only
+    set for ATTENDEE_JOINED and ATTENDEE_LEFT events.
+
+    Example:
+        def on_event(event):
+            if event.type == ATTENDEE_JOINED:
+                print(event.attendee.full_name, "joined", event.meeting.meeting_name)
+    """
+
+    type: str
+    meeting: Meeting
+    attendee: Optional[Attendee] = None
+    at: float = 0.0
+
+
+class MeetingIndex:
+    """
+    The in-memory state of a server's meetings, updated from full listings
+    into a list of incremental change events.
+
+    Meetings are keyed by their internalMeetingID, which is unique per
+    session even when a meetingID is reused, and attendees by userID. A
+    meeting has ended once it is no longer listed. Meetings whose state is
+    unchanged since the last update are skipped without looking at their
+    attendees.
+
+    Example:
+        index = MeetingIndex()
+        for event in index.update(bbb_client.meetings.iter_meetings()):
+            print(event.type, event.meeting.meeting_id)
+    """
+
+    def __init__(self) -> None:
+        self.meetings: Dict[str, Meeting] = {}
+        self.by_meeting_id: Dict[str, str] = {}
+
+    def get(self, meeting_id: str) -> Optional[Meeting]:
+        """
+        Returns the latest known state of a meeting, by meetingID or
+        internalMeetingID.
+        """
+        internal_id = self.by_meeting_id.get(meeting_id, meeting_id)
+        return self.meetings.get(internal_id)
+
+    @property
+    def active(self) -> bool:
+        """
+        Whether any known meeting is running.
+        """
+        return any(meeting.running for meeting in self.meetings.values())
+
+    def update(self, meetings: Iterable[Meeting]) -> List[MeetingEvent]:
+        """
+        Replaces the indexed state with a new listing and returns the changes.
+
+        Args:
+            meetings (iterable): Every current meeting of the server.
+
+        Returns:
+            list: The change events, in detection order.
+        """
+        now = time.time()
+        events: List[MeetingEvent] = []
+        previous = self.meetings
+        current: Dict[str, Meeting] = {}
+        for meeting in meetings:
+            key = meeting.internal_meeting_id or meeting.meeting_id
+            current[key] = meeting
+            before = previous.get(key)
+            if before == meeting:
+                continue
+            if before is None:
+                before = Meeting()
+            if meeting.running and not before.running:
+                events.append(MeetingEvent(MEETING_STARTED, meeting, at=now))
+            if meeting.recording and not before.recording:
+                events.append(MeetingEvent(RECORDING_STARTED, meeting, at=now))
+            if before.attendees != meeting.attendees:
+                events.extend(_attendee_events(before, meeting, now))
+        for key, meeting in previous.items():
+            if key not in current:
+                for attendee in meeting.attendees:
+                    events.append(MeetingEvent(ATTENDEE_LEFT, meeting, attendee, now))
+                events.append(MeetingEvent(MEETING_ENDED, meeting, at=now))
+        self.meetings = current
+        self.by_meeting_id = {
+            meeting.meeting_id: key for key, meeting in current.items()
+        }
+        return events
+
+
+def _attendee_events(
+    before: Meeting, after: Meeting, now: float
+) -> List[MeetingEvent]:
+    previous = {attendee.user_id: attendee for attendee in before.attendees}
+    current = {attendee.user_id: attendee for attendee in after.attendees}
+    events = [
+        MeetingEvent(ATTENDEE_JOINED, after, attendee, now)
+        for user_id, attendee in current.items()
+        if user_id not in previous
+    ]
+    events.extend(
+        MeetingEvent(ATTENDEE_LEFT, after, attendee, now)
+        for user_id, attendee in previous.items()
+        if user_id not in current
+    )
+    return events
+
+
+class MeetingPoller:
+    """
+    Polls a server's meetings in the background and notifies subscribers of
+    changes only.
+
+    The server is polled every ``active_interval`` seconds while a meeting is
+    running, and every ``idle_interval`` seconds otherwise. A failed poll
+    keeps the previous state, so an unreachable server never produces
+    spurious "ended" events.
+
+    Args:
+        client (BigBlueButtonClient): The client of the server to watch.
+        active_interval (float): Seconds between polls while meetings run.
+        idle_interval (float): Seconds between polls while the server is idle.
+        metadata (dict, optional): Only watch meetings matching this metadata.
+
+    Example:
+        poller = MeetingPoller(bbb_client)
+        poller.subscribe(lambda event: print(event.type, event.meeting.meeting_id))
+        with poller:
+            time.sleep(3600)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        active_interval: float = 2.0,
+        idle_interval: float = 30.0,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.client = client
+        self.active_interval = active_interval
+        self.idle_interval = idle_interval
+        self.metadata = metadata
+        self.index = MeetingIndex()
+        self._subscribers: List[EventCallback] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, callback: EventCallback) -> Callable[[], None]:
+        """
+        Registers a callback called with every MeetingEvent.
+
+        Returns:
+            callable: Unregisters the callback.
+
+        Example:
+            unsubscribe = poller.subscribe(print)
+            unsubscribe()
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    @property
+    def interval(self) -> float:
+        """
+        Seconds until the next poll, given the current state.
+        """
+        return self.active_interval if self.index.active else self.idle_interval
+
+    def poll(self) -> List[MeetingEvent]:
+        """
+        Polls the server once and notifies subscribers of the changes.
+
+        Returns:
+            list: The change events of this poll.
+
+        Example:
+            for event in poller.poll():
+                print(event)
+        """
+        meetings = list(self.client.meetings.iter_meetings(self.metadata))
+        events = self.index.update(meetings)
+        self._publish(events)
+        return events
+
+    def _publish(self, events: List[MeetingEvent]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for event in events:
+            for callback in subscribers:
+                try:
+                    callback(event)
+                except Exception:
+                    logger.exception(
+                        "Meeting event subscriber failed on %s.", event.type
+                    )
+
+    def start(self) -> None:
+        """
+        Starts polling in a background thread.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._poll_forever, name="bbb-meeting-poller", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the background polling thread.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "MeetingPoller":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _poll_forever(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                logger.warning("Polling meetings failed: %s", e)
+            self._stop.wait(self.interval)
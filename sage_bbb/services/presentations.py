@@ -0,0 +1,295 @@
+import base64
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+from xml.sax.saxutils import quoteattr
+
+from sage_bbb.services.upload import (
+    UPLOAD_CHUNK_SIZE,
+    FileSource,
+    StreamingBody,
+    iter_source,
+)
+
+# Raw bytes encoded at a time; a multiple of 3, so the base64 of every chunk
+# concatenates into the base64 of the whole file.
+ENCODE_CHUNK_SIZE = 3 * 16384
+
+# Encoded decks kept by a PresentationCache, and the size above which an
+# encoded deck is moved from memory to a temporary file.
+MAX_CACHED_PRESENTATIONS = 32
+SPOOL_MAX_MEMORY = 1024 * 1024
+
+
+class Presentation(NamedTuple):
+    """
+    A document preloaded in a meeting created with ``create_meeting``.
+
+    ``source`` is either a URL the BigBlueButton server downloads the
+    document from, or the document itself: a path, a binary file object or
+    its content, which is embedded in the request as base64.
+
+    Example:
+        slides = Presentation("decks/week-1.pdf", downloadable=True)
+        remote = Presentation("https://example.com/week-1.pdf", filename="week-1.pdf")
+    """
+
+    source: Union[FileSource, str]
+    filename: Optional[str] = None
+    downloadable: Optional[bool] = None
+    removable: Optional[bool] = None
+    current: Optional[bool] = None
+
+    @property
+    def is_url(self) -> bool:
+        source = self.source
+        return isinstance(source, str) and source.startswith(("http://", "https://"))
+
+
+PresentationSource = Union[Presentation, FileSource]
+
+
+class EncodedDocument:
+    """
+    The base64 encoding of a document, held in a spooled temporary file.
+
+    Reads are serialized, so several requests can stream the same document
+    from different threads.
+    """
+
+    def __init__(self, digest: str, file: IO[bytes], size: int) -> None:
+        self.digest = digest
+        self.size = size
+        self._file = file
+        self._lock = threading.Lock()
+
+    def chunks(self, chunk_size: int) -> Iterator[bytes]:
+        for offset in range(0, self.size, chunk_size):
+            with self._lock:
+                self._file.seek(offset)
+                chunk = self._file.read(chunk_size)
+            yield chunk
+
+
+def _base64_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    rest = b""
+    for chunk in chunks:
+        if rest:
+            chunk = rest + chunk
+        cut = len(chunk) - len(chunk) % 3
+        rest = chunk[cut:]
+        if cut:
+            yield base64.b64encode(chunk[:cut])
+    if rest:
+        yield base64.b64encode(rest)
+
+
+class PresentationCache:
+    """
+    Encodes embedded presentations once per content.
+
+    Documents are identified by the SHA-256 of their content, so a deck
+    shared by many meetings is read and base64-encoded for the first one
+    only; the following ``create`` calls stream the stored encoding. Paths
+    are only hashed again when their size or modification time changes.
+    The least recently used decks are dropped beyond ``max_entries``.
+
+    Args:
+        max_entries (int): The maximum number of encoded decks kept.
+        max_memory (int): The encoded size above which a deck is stored in a
+        temporary file rather than in memory.
+
+    Example:
+        cache = PresentationCache(max_entries=8)
+        bbb_client.meetings.presentation_cache = cache
+    """
+
+    def __init__(
+        self,
+        max_entries: int = MAX_CACHED_PRESENTATIONS,
+        max_memory: int = SPOOL_MAX_MEMORY,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+        self._documents: "OrderedDict[str, EncodedDocument]" = OrderedDict()
+        self._path_digests: Dict[Tuple[str, int, int], str] = {}
+        self._encoding: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def _digest(self, source: FileSource) -> str:
+        if isinstance(source, (str, os.PathLike)):
+            stat = os.stat(source)
+            key = (os.path.realpath(source), stat.st_size, stat.st_mtime_ns)
+            digest = self._path_digests.get(key)
+            if digest is None:
+                if len(self._path_digests) >= 4 * self.max_entries:
+                    self._path_digests.clear()
+                digest = self._path_digests[key] = self._hash(source)
+            return digest
+        return self._hash(source)
+
+    @staticmethod
+    def _hash(source: FileSource) -> str:
+        sha = hashlib.sha256()
+        for chunk in iter_source(source, UPLOAD_CHUNK_SIZE):
+            sha.update(chunk)
+        return sha.hexdigest()
+
+    def encode(self, source: FileSource) -> EncodedDocument:
+        """
+        Returns the base64 encoding of a document, encoding it on first use.
+
+        Args:
+            source: A path, a binary file object or the document content.
+
+        Returns:
+            EncodedDocument: The stored encoding.
+        """
+        digest = self._digest(source)
+        with self._lock:
+            document = self._documents.get(digest)
+            if document is not None:
+                self._documents.move_to_end(digest)
+                return document
+            encoding = self._encoding.setdefault(digest, threading.Lock())
+        with encoding:
+            with self._lock:
+                document = self._documents.get(digest)
+            if document is None:
+                document = self._encode(digest, source)
+            with self._lock:
+                self._documents[digest] = document
+                self._documents.move_to_end(digest)
+                while len(self._documents) > self.max_entries:
+                    self._documents.popitem(last=False)
+                self._encoding.pop(digest, None)
+        return document
+
+    def _encode(self, digest: str, source: FileSource) -> EncodedDocument:
+        file = tempfile.SpooledTemporaryFile(max_size=self.max_memory)
+        size = 0
+        for chunk in _base64_chunks(iter_source(source, ENCODE_CHUNK_SIZE)):
+            file.write(chunk)
+            size += len(chunk)
+        return EncodedDocument(digest, file, size)
+
+    def clear(self) -> None:
+        """
+        Drops every encoded deck.
+        """
+        with self._lock:
+            self._documents.clear()
+            self._path_digests.clear()
+
+
+# Shared by every Meetings service unless replaced, so a deck used on several
+# servers of a cluster is still encoded once.
+shared_cache = PresentationCache()
+
+
+def _attributes(presentation: Presentation, filename: Optional[str]) -> str:
+    attributes: List[Tuple[str, Any]] = [
+        ("url", presentation.source if presentation.is_url else None),
+        ("filename" if presentation.is_url else "name", filename),
+        ("downloadable", presentation.downloadable),
+        ("removable", presentation.removable),
+        ("current", presentation.current),
+    ]
+    return "".join(
+        f" {name}={quoteattr(_attribute_value(value))}"
+        for name, value in attributes
+        if value is not None
+    )
+
+
+def _attribute_value(value: Any) -> str:
+    return str(value).lower() if isinstance(value, bool) else str(value)
+
+
+def _filename(source: Any) -> Optional[str]:
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.basename(os.fspath(source))
+    name = getattr(source, "name", None)
+    return os.path.basename(name) if isinstance(name, str) else None
+
+
+class PresentationBody(StreamingBody):
+    """
+    The ``<modules>`` XML body of a ``create`` call preloading presentations.
+
+    Embedded documents are encoded through a PresentationCache and streamed
+    from it in chunks, so the XML document is never built as one string.
+
+    Args:
+        presentations (iterable): Presentation objects, URLs, paths, binary
+        file objects or document contents.
+        cache (PresentationCache): The cache encoding embedded documents.
+        chunk_size (int): The maximum number of bytes per chunk.
+
+    Example:
+        body = PresentationBody(["https://example.com/deck.pdf"], cache)
+        response = bbb_client.send_request(
+            "create", params, data=body, headers=body.headers
+        )
+    """
+
+    content_type = "application/xml"
+
+    def __init__(
+        self,
+        presentations: Iterable[PresentationSource],
+        cache: PresentationCache,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ) -> None:
+        self.chunk_size = chunk_size
+        self._parts: List[Union[bytes, EncodedDocument]] = [
+            b'<?xml version="1.0" encoding="UTF-8"?>'
+            b'<modules><module name="presentation">'
+        ]
+        for presentation in presentations:
+            if not isinstance(presentation, Presentation):
+                presentation = Presentation(presentation)
+            filename = presentation.filename or _filename(presentation.source)
+            if filename is None and not presentation.is_url:
+                raise ValueError(
+                    "Embedded presentations given as content need a filename."
+                )
+            attributes = _attributes(presentation, filename).encode("utf-8")
+            if presentation.is_url:
+                self._parts.append(b"<document" + attributes + b"/>")
+                continue
+            self._parts.append(b"<document" + attributes + b">")
+            self._parts.append(cache.encode(presentation.source))
+            self._parts.append(b"</document>")
+        self._parts.append(b"</module></modules>")
+        self._length = sum(
+            part.size if isinstance(part, EncodedDocument) else len(part)
+            for part in self._parts
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        for part in self._parts:
+            if isinstance(part, EncodedDocument):
+                yield from part.chunks(self.chunk_size)
+            else:
+                yield part
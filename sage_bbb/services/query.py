@@ -0,0 +1,365 @@
+import threading
+import xml.etree.ElementTree as ET
+from collections import Counter
+from datetime import datetime
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+from sage_bbb.helpers import Meeting, Recording
+from sage_bbb.parsers.stream import ElementPredicate
+
+T = TypeVar("T", Meeting, Recording)
+
+# The response tags a query reads, per item element.
+ITEM_FIELDS = {
+    "meeting": {"participants": "participantCount", "running": "running"},
+    "recording": {"participants": "participants", "running": None},
+}
+
+
+def _epoch_ms(value: datetime) -> int:
+    return int(value.timestamp() * 1000)
+
+
+def _int(text: Optional[str]) -> int:
+    try:
+        return int(text) if text else 0
+    except ValueError:
+        return 0
+
+
+class _QueryFields(NamedTuple):
+    """
+    The fields of a Query, validated by ``Query.__new__``.
+    """
+
+    metadata: Mapping[str, str] = {}
+    metadata_prefix: Mapping[str, str] = {}
+    min_participants: Optional[int] = None
+    max_participants: Optional[int] = None
+    started_after: Optional[datetime] = None
+    started_before: Optional[datetime] = None
+    running: Optional[bool] = None
+
+
+class Query(_QueryFields):
+    """
+    A filter over meetings or recordings, compiled into predicates.
+
+    Conditions are combined with AND. ``element_predicate`` evaluates them on
+    the XML elements of a streamed response, so ``iter_meetings(query=...)``
+    and ``iter_recordings(query=...)`` never build the items that do not
+    match; ``matches`` evaluates them on built Meeting and Recording objects.
+
+    Args:
+        metadata (dict): Metadata values the items must equal.
+        metadata_prefix (dict): Prefixes metadata values must start with.
+        min_participants (int, optional): The minimum participant count.
+        max_participants (int, optional): The maximum participant count.
+        started_after (datetime, optional): The earliest start time, as a
+        timezone-aware datetime.
+        started_before (datetime, optional): The latest start time, as a
+        timezone-aware datetime.
+        running (bool, optional): The running state of meetings.
+
+    Raises:
+        ValueError: If ``started_after`` or ``started_before`` is naive.
+        Item start times are timezone-aware, so naive bounds could not be
+        compared consistently.
+
+    Example:
+        query = Query(
+            metadata={"course": "cs101"},
+            metadata_prefix={"term": "2024-"},
+            min_participants=10,
+            running=True,
+        )
+        for meeting in bbb_client.meetings.iter_meetings(query=query):
+            print(meeting.meeting_name)
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "Query":
+        query = super().__new__(cls, *args, **kwargs)
+        for name in ("started_after", "started_before"):
+            value = getattr(query, name)
+            if value is not None and value.utcoffset() is None:
+                raise ValueError(f"Query {name} must be a timezone-aware datetime")
+        return query
+
+    @classmethod
+    def _make(cls, iterable: Iterable[Any]) -> "Query":
+        # Also validates the queries built by _replace.
+        return cls(*iterable)
+
+    def element_predicate(self, item_tag: str) -> ElementPredicate:
+        """
+        Compiles the query into a predicate over ``<meeting>`` or
+        ``<recording>`` elements.
+
+        Direct children (counts, times, state) are checked before metadata,
+        and the predicate stops at the first failing condition.
+
+        Args:
+            item_tag (str): "meeting" or "recording".
+
+        Returns:
+            callable: Returns whether an element matches.
+
+        Raises:
+            ValueError: If the query filters on a field the items lack, e.g.
+            the running state of recordings.
+        """
+        fields = ITEM_FIELDS[item_tag]
+        checks: List[ElementPredicate] = []
+        if self.running is not None:
+            running_tag = fields["running"]
+            if running_tag is None:
+                raise ValueError(f"{item_tag} items have no running state")
+            expected = "true" if self.running else "false"
+            checks.append(lambda e: e.findtext(running_tag) == expected)
+        participants_tag = fields["participants"]
+        low, high = self.min_participants, self.max_participants
+        if low is not None:
+            checks.append(lambda e: _int(e.findtext(participants_tag)) >= low)
+        if high is not None:
+            checks.append(lambda e: _int(e.findtext(participants_tag)) <= high)
+        if self.started_after is not None:
+            after = _epoch_ms(self.started_after)
+            checks.append(lambda e: _int(e.findtext("startTime")) >= after)
+        if self.started_before is not None:
+            before = _epoch_ms(self.started_before)
+            checks.append(lambda e: 0 < _int(e.findtext("startTime")) <= before)
+        for key, value in self.metadata.items():
+            checks.append(_metadata_equals(f"metadata/{key}", value))
+        for key, prefix in self.metadata_prefix.items():
+            checks.append(_metadata_startswith(f"metadata/{key}", prefix))
+        if not checks:
+            return lambda element: True
+        if len(checks) == 1:
+            return checks[0]
+        return lambda element: all(check(element) for check in checks)
+
+    def matches(self, item: T) -> bool:
+        """
+        Returns whether a Meeting or Recording matches the query.
+        """
+        running = getattr(item, "running", None)
+        if self.running is not None and running != self.running:
+            return False
+        participants = (
+            item.participant_count if isinstance(item, Meeting) else item.participants
+        )
+        low, high = self.min_participants, self.max_participants
+        if (low is not None and participants < low) or (
+            high is not None and participants > high
+        ):
+            return False
+        start = item.start_time
+        if self.started_after is not None and (
+            start is None or start < self.started_after
+        ):
+            return False
+        if self.started_before is not None and (
+            start is None or start > self.started_before
+        ):
+            return False
+        metadata = item.metadata
+        for key, value in self.metadata.items():
+            if metadata.get(key) != value:
+                return False
+        for key, prefix in self.metadata_prefix.items():
+            value = metadata.get(key)
+            if value is None or not value.startswith(prefix):
+                return False
+        return True
+
+    def server_params(self) -> Dict[str, str]:
+        """
+        The ``meta_`` parameters of the metadata equality conditions, which
+        getRecordings filters on server side.
+        """
+        return {f"meta_{key}": value for key, value in self.metadata.items()}
+
+
+def _metadata_equals(path: str, value: str) -> ElementPredicate:
+    return lambda element: element.findtext(path) == value
+
+
+def _metadata_startswith(path: str, prefix: str) -> ElementPredicate:
+    def check(element: ET.Element) -> bool:
+        text = element.findtext(path)
+        return text is not None and text.startswith(prefix)
+
+    return check
+
+
+def _item_key(item: Any) -> Hashable:
+    if isinstance(item, Meeting):
+        return item.internal_meeting_id or item.meeting_id
+    return item.record_id
+
+
+class MetadataIndex(Generic[T]):
+    """
+    An in-memory secondary index of meetings or recordings by metadata.
+
+    Holds a snapshot of items and answers Query objects from it. Equality
+    and prefix conditions on indexed keys are resolved from per-key buckets,
+    smallest first, so only the candidates they leave are checked against
+    the rest of the query. Keys can be indexed upfront, or once they
+    were used by ``auto_index_after`` queries.
+
+    Args:
+        keys (iterable of str): Metadata keys indexed upfront.
+        auto_index_after (int, optional): Indexes a metadata key once this
+        many queries filtered on it. Disabled when omitted.
+
+    Example:
+        index = MetadataIndex(keys=["course"], auto_index_after=3)
+        index.rebuild(bbb_client.meetings.iter_meetings())
+        busy = index.select(Query(metadata={"course": "cs101"}, min_participants=20))
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[str] = (),
+        auto_index_after: Optional[int] = None,
+    ) -> None:
+        self.auto_index_after = auto_index_after
+        self._items: Dict[Hashable, T] = {}
+        # Insertion order of the items, so selections are deterministic.
+        self._positions: Dict[Hashable, int] = {}
+        self._next_position = 0
+        self._buckets: Dict[str, Dict[str, Set[Hashable]]] = {
+            key: {} for key in keys
+        }
+        self._usage: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def indexed_keys(self) -> List[str]:
+        """
+        The metadata keys currently indexed.
+        """
+        return sorted(self._buckets)
+
+    def rebuild(self, items: Iterable[T]) -> None:
+        """
+        Replaces the indexed items, e.g. with a fresh ``iter_meetings`` listing.
+        """
+        with self._lock:
+            self._items = {_item_key(item): item for item in items}
+            self._positions = {
+                item_key: position for position, item_key in enumerate(self._items)
+            }
+            self._next_position = len(self._items)
+            for key in self._buckets:
+                self._buckets[key] = self._bucket(key)
+
+    def add(self, item: T) -> None:
+        """
+        Adds or replaces one item.
+        """
+        item_key = _item_key(item)
+        with self._lock:
+            self._discard(item_key)
+            self._items[item_key] = item
+            self._positions[item_key] = self._next_position
+            self._next_position += 1
+            for key, bucket in self._buckets.items():
+                if key in item.metadata:
+                    bucket.setdefault(item.metadata[key], set()).add(item_key)
+
+    def remove(self, item_key: Hashable) -> None:
+        """
+        Removes an item by internalMeetingID (meetings) or recordID.
+        """
+        with self._lock:
+            self._discard(item_key)
+
+    def _discard(self, item_key: Hashable) -> None:
+        old = self._items.pop(item_key, None)
+        if old is None:
+            return
+        del self._positions[item_key]
+        for key, bucket in self._buckets.items():
+            value = old.metadata.get(key)
+            if value is not None and value in bucket:
+                bucket[value].discard(item_key)
+                if not bucket[value]:
+                    del bucket[value]
+
+    def _bucket(self, key: str) -> Dict[str, Set[Hashable]]:
+        bucket: Dict[str, Set[Hashable]] = {}
+        for item_key, item in self._items.items():
+            value = item.metadata.get(key)
+            if value is not None:
+                bucket.setdefault(value, set()).add(item_key)
+        return bucket
+
+    def select(self, query: Query) -> List[T]:
+        """
+        Returns the indexed items matching a query, in the order they were
+        added to the index.
+
+        Args:
+            query (Query): The filter.
+
+        Returns:
+            list: The matching items.
+        """
+        with self._lock:
+            self._track(query)
+            matches = [
+                self._buckets[key].get(value, set())
+                for key, value in query.metadata.items()
+                if key in self._buckets
+            ]
+            for key, prefix in query.metadata_prefix.items():
+                if key in self._buckets:
+                    matches.append(
+                        set().union(
+                            *(
+                                item_keys
+                                for value, item_keys in self._buckets[key].items()
+                                if value.startswith(prefix)
+                            )
+                        )
+                    )
+            if matches:
+                matches.sort(key=len)
+                candidates = set(matches[0]).intersection(*matches[1:])
+                items = [
+                    self._items[item_key]
+                    for item_key in sorted(candidates, key=self._positions.__getitem__)
+                ]
+            else:
+                items = list(self._items.values())
+        return [item for item in items if query.matches(item)]
+
+    def _track(self, query: Query) -> None:
+        if self.auto_index_after is None:
+            return
+        for key in set(query.metadata) | set(query.metadata_prefix):
+            if key in self._buckets:
+                continue
+            self._usage[key] += 1
+            if self._usage[key] >= self.auto_index_after:
+                self._buckets[key] = self._bucket(key)
+                del self._usage[key]
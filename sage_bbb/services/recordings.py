@@ -1,7 +1,102 @@
-from typing import Any, Dict, Optional
+import contextvars
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import quote_plus
 import logging
 
+from sage_bbb.helpers import Recording, TextTrack
+from sage_bbb.parsers import StreamingParser
+from sage_bbb.parsers.stream import ElementPredicate
+from sage_bbb.services.batch import DEFAULT_MAX_WORKERS, BatchResult, run_batch
+from sage_bbb.services.factory import RecordingFactory
+from sage_bbb.services.logs import ServiceLogger
+from sage_bbb.services.query import Query
+from sage_bbb.services.upload import (
+    MAX_CONCURRENT_UPLOADS,
+    UPLOAD_CHUNK_SIZE,
+    FilePart,
+    FileSource,
+    MultipartStream,
+    ProgressCallback,
+)
+
 logger = logging.getLogger(__name__)
+log = ServiceLogger(logger)
+
+PAGE_CHUNK_SIZE = 65536
+
+# Start tags of the recordings of a page, with or without attributes.
+_RECORDING_TAG = re.compile(rb"<recording[\s/>]")
+
+# Longest URL sent by the bulk recording calls. Well under the 8 KiB request
+# line that nginx and Tomcat accept by default.
+MAX_URL_LENGTH = 4096
+
+
+def page_looks_full(content: bytes, page_size: int) -> bool:
+    """
+    Guesses whether a getRecordings page holds ``page_size`` recordings by
+    counting their start tags in the raw bytes, so the next page can be
+    prefetched before this one is parsed.
+
+    This is a heuristic: the tags are not parsed, e.g. a ``<recording>``
+    inside a CDATA section is counted too. Callers fall back to the parsed
+    item count when it guesses wrong.
+    """
+    count = 0
+    for _ in _RECORDING_TAG.finditer(content):
+        count += 1
+        if count >= page_size:
+            return True
+    return False
+
+
+def record_id_chunks(
+    url_builder: Any,
+    api_call: str,
+    record_ids: Iterable[str],
+    params: Dict[str, Any],
+    max_url_length: int = MAX_URL_LENGTH,
+) -> List[List[str]]:
+    """
+    Splits record IDs into comma-separated lists whose signed URL fits in
+    ``max_url_length``. Duplicate IDs are dropped and the order is kept.
+
+    Example:
+        chunks = record_id_chunks(
+        bbb_client.url_builder, "deleteRecordings", record_ids, {}
+        )
+    """
+    base = len(url_builder.build_url(api_call, {**params, "recordID": ""}))
+    chunks: List[List[str]] = []
+    chunk: List[str] = []
+    length = base
+    for record_id in dict.fromkeys(record_ids):
+        size = len(quote_plus(record_id))
+        # Every ID after the first adds an encoded comma ("%2C").
+        if chunk and length + 3 + size > max_url_length:
+            chunks.append(chunk)
+            chunk, length = [], base
+        length += size + 3 if chunk else size
+        chunk.append(record_id)
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def per_record_results(chunk_results: List[BatchResult]) -> List[BatchResult]:
+    """
+    Expands the result of each chunk of a bulk call into one result per
+    record ID. BigBlueButton answers a list with a single status, which
+    applies to every ID of the chunk.
+    """
+    return [
+        BatchResult(record_id, result.value, result.error)
+        for result in chunk_results
+        for record_id in result.item
+    ]
 
 
 class Recordings:
@@ -20,6 +115,7 @@ class Recordings:
 
     def __init__(self, client: "BigBlueButtonClient") -> None:
         self.client = client
+        self._upload_slots = threading.BoundedSemaphore(MAX_CONCURRENT_UPLOADS)
 
     def get_recordings(
         self, meeting_id: str, metadata: Optional[Dict[str, Any]] = None
@@ -48,10 +144,150 @@ class Recordings:
         params = {"meetingID": meeting_id}
         if metadata:
             params.update(metadata)
-        logger.info("Retrieving recordings for meeting ID: %s with params: %s", meeting_id, params)
+        log.request("getRecordings", "Retrieving recordings for meeting ID: %s with params: %s", meeting_id, params)
         response = self.client.send_request("getRecordings", params)
-        logger.info("Recordings retrieved successfully for meeting ID: %s", meeting_id)
-        return self.client.parse_response(response.content)
+        log.response("getRecordings", "Recordings retrieved successfully for meeting ID: %s", meeting_id)
+        return self.client.parse_response(response.content, "getRecordings")
+
+    def iter_recordings(
+        self,
+        meeting_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = 100,
+        prefetch: bool = True,
+        query: Optional[Query] = None,
+    ) -> Iterator[Recording]:
+        """
+        Lazily yields recordings, including their metadata and playback formats.
+
+        Recordings are fetched a page at a time using BigBlueButton's
+        ``offset``/``limit`` pagination. While the caller consumes one page,
+        the next one is downloaded in the background, and only the current and
+        next pages are ever held in memory, so an entire archive can be
+        streamed in constant memory. Servers that do not support pagination
+        (no ``totalElements`` in the response) are read in a single request.
+
+        Args:
+            meeting_id (str, optional): Restricts the recordings to a meeting.
+            metadata (dict, optional): A dictionary of metadata to filter the recordings.
+            page_size (int, optional): The number of recordings per request. Pass
+            None to fetch every recording in one streamed request.
+            prefetch (bool): Whether to download the next page in the
+            background while the current one is consumed.
+            query (Query, optional): Only yields the matching recordings; the
+            others are skipped while parsing, without being built. Its
+            metadata equalities are also sent as ``meta_`` filters.
+
+        Returns:
+            Iterator[Recording]: The matching recordings, one at a time.
+
+        Example:
+            recordings = Recordings(bbb_client)
+            for recording in recordings.iter_recordings(page_size=500):
+                print(recording.record_id, recording.state)
+        """
+        params: Dict[str, Any] = {}
+        if meeting_id:
+            params["meetingID"] = meeting_id
+        if metadata:
+            params.update(metadata)
+        predicate = None
+        if query is not None:
+            params.update(query.server_params())
+            predicate = query.element_predicate("recording")
+        log.request("getRecordings", "Streaming recordings with params: %s", params)
+        if not page_size:
+            return self.client.stream_items(
+                "getRecordings",
+                params,
+                "recordings",
+                "recording",
+                RecordingFactory.from_element,
+                predicate=predicate,
+            )
+        return self._iter_recording_pages(params, page_size, prefetch, predicate)
+
+    def _fetch_recording_page(
+        self, params: Dict[str, Any], offset: int, limit: int
+    ) -> bytes:
+        """
+        Downloads one page of a paginated getRecordings listing.
+        """
+        page_params = {**params, "offset": offset, "limit": limit}
+        logger.debug("Fetching recordings page at offset %s", offset)
+        return self.client.send_request("getRecordings", page_params).content
+
+    def _iter_recording_pages(
+        self,
+        params: Dict[str, Any],
+        page_size: int,
+        prefetch: bool,
+        predicate: Optional[ElementPredicate] = None,
+    ) -> Iterator[Recording]:
+        """
+        Yields recordings page by page, prefetching the next page in a
+        background thread while the current one is consumed. Only full pages
+        are followed by a prefetch: a short page is the last one.
+
+        Whether a page is full is first guessed from its raw bytes (see
+        ``page_looks_full``), so the prefetch overlaps the parsing of the
+        page. When the guess was wrong, the parsed item count decides.
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        offset = 0
+        pending: Optional["Future[bytes]"] = None
+
+        def prefetch_next(next_offset: int) -> Optional["Future[bytes]"]:
+            if executor is None:
+                return None
+            return executor.submit(
+                contextvars.copy_context().run,
+                self._fetch_recording_page,
+                params,
+                next_offset,
+                page_size,
+            )
+
+        try:
+            content = self._fetch_recording_page(params, offset, page_size)
+            while True:
+                next_offset = offset + page_size
+                if page_looks_full(content, page_size):
+                    pending = prefetch_next(next_offset)
+                parser = StreamingParser(
+                    "recordings",
+                    "recording",
+                    RecordingFactory.from_element,
+                    predicate,
+                )
+                for start in range(0, len(content), PAGE_CHUNK_SIZE):
+                    chunk = content[start : start + PAGE_CHUNK_SIZE]
+                    items = parser.feed(chunk)
+                    if pending is None and parser.count >= page_size:
+                        pending = prefetch_next(next_offset)
+                    for recording in items:
+                        yield recording
+                for recording in parser.close():
+                    yield recording
+                del content
+                total = parser.header.get("totalElements")
+                if (
+                    parser.count != page_size
+                    or not total
+                    or next_offset >= int(total)
+                ):
+                    break
+                offset = next_offset
+                if pending is not None:
+                    content = pending.result()
+                    pending = None
+                else:
+                    content = self._fetch_recording_page(params, offset, page_size)
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
 
     def publish_recording(self, recording_id: str, publish: bool) -> Dict[str, Any]:
         """
@@ -73,10 +309,10 @@ class Recordings:
             "recordID": recording_id,
             "publish": "true" if publish else "false",
         }
-        logger.info("Setting publish status for recording ID: %s to %s", recording_id, publish)
+        log.request("publishRecordings", "Setting publish status for recording ID: %s to %s", recording_id, publish)
         response = self.client.send_request("publishRecordings", params)
-        logger.info("Publish status set successfully for recording ID: %s", recording_id)
-        return self.client.parse_response(response.content)
+        log.response("publishRecordings", "Publish status set successfully for recording ID: %s", recording_id)
+        return self.client.parse_response(response.content, "publishRecordings")
 
     def delete_recording(self, recording_id: str) -> Dict[str, Any]:
         """
@@ -96,10 +332,10 @@ class Recordings:
         params = {
             "recordID": recording_id,
         }
-        logger.info("Deleting recording ID: %s", recording_id)
+        log.request("deleteRecordings", "Deleting recording ID: %s", recording_id)
         response = self.client.send_request("deleteRecordings", params)
-        logger.info("Recording ID: %s deleted successfully.", recording_id)
-        return self.client.parse_response(response.content)
+        log.response("deleteRecordings", "Recording ID: %s deleted successfully.", recording_id)
+        return self.client.parse_response(response.content, "deleteRecordings")
 
     def update_recordings(
         self, meeting_id: str, metadata: Dict[str, Any] = None
@@ -124,10 +360,141 @@ class Recordings:
         params = {"meetingID": meeting_id}
         if metadata:
             params.update(metadata)
-        logger.info("Updating recordings for meeting ID: %s with metadata: %s", meeting_id, metadata)
+        log.request("updateRecordings", "Updating recordings for meeting ID: %s with metadata: %s", meeting_id, metadata)
         response = self.client.send_request("updateRecordings", params)
-        logger.info("Recordings updated successfully for meeting ID: %s", meeting_id)
-        return self.client.parse_response(response.content)
+        log.response("updateRecordings", "Recordings updated successfully for meeting ID: %s", meeting_id)
+        return self.client.parse_response(response.content, "updateRecordings")
+
+    def _bulk(
+        self,
+        api_call: str,
+        record_ids: Iterable[str],
+        params: Dict[str, Any],
+        max_workers: int,
+        max_url_length: int,
+    ) -> List[BatchResult]:
+        chunks = record_id_chunks(
+            self.client.url_builder, api_call, record_ids, params, max_url_length
+        )
+        log.request(api_call, "Sending %s for %s recordings in %s requests.", api_call, sum(map(len, chunks)), len(chunks))
+
+        def send(chunk: List[str]) -> Dict[str, Any]:
+            response = self.client.send_request(
+                api_call, {**params, "recordID": ",".join(chunk)}
+            )
+            return self.client.parse_response(response.content, api_call)
+
+        results = per_record_results(run_batch(send, chunks, max_workers))
+        log.response(api_call, "%s completed for %s recordings.", api_call, len(results))
+        return results
+
+    def publish_many(
+        self,
+        record_ids: Iterable[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_url_length: int = MAX_URL_LENGTH,
+    ) -> List[BatchResult]:
+        """
+        Publishes several recordings.
+
+        The IDs are sent as comma-separated lists, as few requests as the
+        URL length allows, and the requests run on a bounded thread pool.
+
+        Args:
+            record_ids (iterable of str): The recordings to publish.
+            max_workers (int): The maximum number of concurrent requests.
+            max_url_length (int): The maximum length of a request URL.
+
+        Returns:
+            list: One BatchResult per record ID, in input order. Each value
+            is the response of the request that carried the ID.
+
+        Example:
+            results = recordings.publish_many(record_ids)
+            failed = [result.item for result in results if not result.ok]
+        """
+        params = {"publish": "true"}
+        return self._bulk(
+            "publishRecordings", record_ids, params, max_workers, max_url_length
+        )
+
+    def unpublish_many(
+        self,
+        record_ids: Iterable[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_url_length: int = MAX_URL_LENGTH,
+    ) -> List[BatchResult]:
+        """
+        Unpublishes several recordings, in as few requests as possible.
+
+        Args:
+            record_ids (iterable of str): The recordings to unpublish.
+            max_workers (int): The maximum number of concurrent requests.
+            max_url_length (int): The maximum length of a request URL.
+
+        Returns:
+            list: One BatchResult per record ID, in input order.
+
+        Example:
+            results = recordings.unpublish_many(record_ids)
+        """
+        params = {"publish": "false"}
+        return self._bulk(
+            "publishRecordings", record_ids, params, max_workers, max_url_length
+        )
+
+    def delete_many(
+        self,
+        record_ids: Iterable[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_url_length: int = MAX_URL_LENGTH,
+    ) -> List[BatchResult]:
+        """
+        Deletes several recordings, in as few requests as possible.
+
+        Args:
+            record_ids (iterable of str): The recordings to delete.
+            max_workers (int): The maximum number of concurrent requests.
+            max_url_length (int): The maximum length of a request URL.
+
+        Returns:
+            list: One BatchResult per record ID, in input order.
+
+        Example:
+            results = recordings.delete_many(expired_ids)
+            print(sum(result.ok for result in results), "deleted")
+        """
+        return self._bulk(
+            "deleteRecordings", record_ids, {}, max_workers, max_url_length
+        )
+
+    def update_many(
+        self,
+        record_ids: Iterable[str],
+        metadata: Dict[str, Any],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_url_length: int = MAX_URL_LENGTH,
+    ) -> List[BatchResult]:
+        """
+        Sets the same metadata on several recordings, in as few requests as
+        possible.
+
+        Args:
+            record_ids (iterable of str): The recordings to update.
+            metadata (dict): The parameters to set, e.g.
+            ``{"meta_course": "CS101"}``.
+            max_workers (int): The maximum number of concurrent requests.
+            max_url_length (int): The maximum length of a request URL.
+
+        Returns:
+            list: One BatchResult per record ID, in input order.
+
+        Example:
+            results = recordings.update_many(record_ids, {"meta_term": "2024"})
+        """
+        return self._bulk(
+            "updateRecordings", record_ids, dict(metadata), max_workers, max_url_length
+        )
 
     def get_recording_text_tracks(self, record_id: str) -> Dict[str, Any]:
         """
@@ -149,20 +516,60 @@ class Recordings:
         params = {
             "recordID": record_id,
         }
-        logger.info("Retrieving text tracks for recording ID: %s", record_id)
+        log.request("getRecordingTextTracks", "Retrieving text tracks for recording ID: %s", record_id)
         response = self.client.send_request("getRecordingTextTracks", params)
-        logger.info("Text tracks retrieved successfully for recording ID: %s", record_id)
-        return self.client.parse_response(response.content)
+        log.response("getRecordingTextTracks", "Text tracks retrieved successfully for recording ID: %s", record_id)
+        # Unlike the rest of the API, getRecordingTextTracks answers in JSON.
+        return response.json().get("response", {})
+
+    def get_text_tracks(self, record_id: str) -> List[TextTrack]:
+        """
+        Retrieves the text tracks for a specific recording as TextTrack objects.
+
+        Args:
+            record_id (str): The unique identifier for the recording.
+
+        Returns:
+            list: The caption and subtitle tracks of the recording.
+
+        Example:
+            recordings = Recordings(bbb_client)
+            for track in recordings.get_text_tracks("recording-id-1234"):
+                print(track.lang, track.href)
+        """
+        response = self.get_recording_text_tracks(record_id)
+        return [
+            RecordingFactory.create_text_track(track)
+            for track in response.get("tracks") or []
+        ]
 
     def put_recording_text_track(
-        self, record_id: str, track_file: Any
+        self,
+        record_id: str,
+        track_file: FileSource,
+        kind: str = "subtitles",
+        lang: str = "en-US",
+        label: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
     ) -> Dict[str, Any]:
         """
         Uploads a text track for a specific recording.
 
+        The file is streamed in ``chunk_size`` pieces, so its size does not
+        affect memory use, and at most ``MAX_CONCURRENT_UPLOADS`` uploads of
+        this service run at the same time; others wait for a free slot.
+
         Args:
             record_id (str): The unique identifier for the recording.
-            track_file: The text track file to upload.
+            track_file: The text track: a path (read through a memory map),
+            a binary file object or the file content.
+            kind (str): "subtitles" or "captions".
+            lang (str): The language of the track, e.g. "en-US".
+            label (str, optional): The label shown in the player.
+            progress (callable, optional): Called with ``(sent, total)`` bytes
+            as the upload progresses.
+            chunk_size (int): The number of bytes sent at a time.
 
         Returns:
             dict: The response from the API call.
@@ -170,17 +577,27 @@ class Recordings:
         Example:
             recordings = Recordings(bbb_client)
             put_track_response = recordings.put_recording_text_track(
-            "recording-id-1234", open("track.vtt", "rb")
+            "recording-id-1234", "track.vtt", lang="fr-FR"
             )
             print(put_track_response)
         """
         params = {
             "recordID": record_id,
+            "kind": kind,
+            "lang": lang,
         }
-        files = {"file": track_file}
-        logger.info("Uploading text track for recording ID: %s", record_id)
-        response = self.client.send_request(
-            "putRecordingTextTrack", params, files=files
+        if label:
+            params["label"] = label
+        body = MultipartStream(
+            files=[FilePart("file", track_file)],
+            chunk_size=chunk_size,
+            progress=progress,
         )
-        logger.info("Text track uploaded successfully for recording ID: %s", record_id)
-        return self.client.parse_response(response.content)
+        log.request("putRecordingTextTrack", "Uploading text track for recording ID: %s", record_id)
+        with self._upload_slots:
+            response = self.client.send_request(
+                "putRecordingTextTrack", params, data=body, headers=body.headers
+            )
+        log.response("putRecordingTextTrack", "Text track uploaded successfully for recording ID: %s", record_id)
+        # Like getRecordingTextTracks, putRecordingTextTrack answers in JSON.
+        return response.json().get("response", {})
@@ -0,0 +1,646 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from sage_bbb.exceptions import BigBlueButtonError, FailedResponseError
+from sage_bbb.helpers import Meeting
+from sage_bbb.services.batch import DEFAULT_MAX_WORKERS, BatchResult, run_batch
+
+logger = logging.getLogger(__name__)
+
+# Lifecycle states of a scheduled meeting.
+PENDING = "pending"
+CREATING = "creating"
+CREATED = "created"
+ENDING = "ending"
+ENDED = "ended"
+CREATE_FAILED = "create_failed"
+END_FAILED = "end_failed"
+MISSED = "missed"
+
+# States a meeting does not leave on its own; failed ones can be retried.
+TERMINAL_STATES = frozenset({ENDED, CREATE_FAILED, END_FAILED, MISSED})
+
+# Version of the state file layout written by ``save``.
+STATE_FILE_VERSION = 1
+
+# Permissions of the state file, which holds the meeting passwords.
+STATE_FILE_MODE = 0o600
+
+# Meetings ended per batch. The state file is saved after every batch.
+END_BATCH_SIZE = 100
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket limiting the rate of calls to one server.
+
+    Tokens are added continuously at ``rate`` per second, up to ``burst``.
+    Each call takes a token, waiting for one when the bucket is empty.
+
+    Args:
+        rate (float): The sustained number of calls per second.
+        burst (int): The number of calls allowed at once after a pause.
+
+    Example:
+        bucket = TokenBucket(rate=5.0, burst=10)
+        bucket.acquire()
+        bbb_client.meetings.create_meeting("Algebra", "algebra-101", "ap", "mp")
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("A token bucket needs a positive rate and burst.")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, stop: Optional[threading.Event] = None) -> bool:
+        """
+        Takes a token, waiting until one is available.
+
+        Args:
+            stop (threading.Event, optional): Gives up waiting once set.
+
+        Returns:
+            bool: False if the wait was given up, True otherwise.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if stop is None:
+                time.sleep(wait)
+            elif stop.wait(wait):
+                return False
+
+
+class MeetingSpec(NamedTuple):
+    """
+    A meeting of the schedule.
+
+    ``start`` and ``end`` are timezone-aware datetimes. ``params`` are extra
+    create parameters (e.g. ``record`` or ``meta_course``) and must be JSON
+    serializable for the state file. The passwords are saved in the state
+    file as well, since ending a resumed meeting needs the moderator
+    password.
+    """
+
+    meeting_id: str
+    name: str
+    start: datetime
+    end: datetime
+    attendee_pw: str = "ap"
+    moderator_pw: str = "mp"
+    server: Optional[str] = None
+    params: Mapping[str, Any] = {}
+
+
+class MeetingStatus(NamedTuple):
+    """
+    The lifecycle state of a scheduled meeting.
+
+    ``server`` is the server the meeting is assigned to. ``error`` describes
+    the last failure when ``state`` is CREATE_FAILED or END_FAILED.
+    """
+
+    spec: MeetingSpec
+    state: str = PENDING
+    server: str = ""
+    error: Optional[str] = None
+    updated_at: Optional[datetime] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.state not in (CREATE_FAILED, END_FAILED)
+
+
+class _Stopped(Exception):
+    """
+    Raised by a worker when the scheduler stopped while it was throttled.
+    """
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _status_record(status: MeetingStatus) -> Dict[str, Any]:
+    spec = status.spec
+    return {
+        "meeting_id": spec.meeting_id,
+        "name": spec.name,
+        "start": spec.start.isoformat(),
+        "end": spec.end.isoformat(),
+        "attendee_pw": spec.attendee_pw,
+        "moderator_pw": spec.moderator_pw,
+        "server": spec.server,
+        "params": dict(spec.params),
+        "state": status.state,
+        "assigned_server": status.server,
+        "error": status.error,
+        "updated_at": status.updated_at.isoformat() if status.updated_at else None,
+    }
+
+
+def _status_from_record(record: Dict[str, Any]) -> MeetingStatus:
+    spec = MeetingSpec(
+        meeting_id=record["meeting_id"],
+        name=record["name"],
+        start=datetime.fromisoformat(record["start"]),
+        end=datetime.fromisoformat(record["end"]),
+        attendee_pw=record["attendee_pw"],
+        moderator_pw=record["moderator_pw"],
+        server=record["server"],
+        params=record["params"],
+    )
+    state = record["state"]
+    # Calls in flight when the state was saved may or may not have reached
+    # the server. Both are safe to repeat: create returns the existing
+    # meeting, and ending a meeting that is gone counts as ended.
+    if state == CREATING:
+        state = PENDING
+    elif state == ENDING:
+        state = CREATED
+    updated_at = record.get("updated_at")
+    return MeetingStatus(
+        spec,
+        state=state,
+        server=record["assigned_server"],
+        error=record.get("error"),
+        updated_at=datetime.fromisoformat(updated_at) if updated_at else None,
+    )
+
+
+class MeetingScheduler:
+    """
+    Creates and ends the meetings of a timetable on a set of servers.
+
+    Meetings are created ``lead_time`` seconds ahead of their start, so the
+    burst at the top of the hour is spread over the preceding minutes, and
+    ended in batches once their end time has passed. Calls go through a
+    bounded thread pool, and each server has its own token bucket, so a
+    large batch never sends more than ``rate`` calls per second (after an
+    initial ``burst``) to a single server.
+
+    The lifecycle state of every meeting is tracked in memory. A failing
+    create or end is recorded on that meeting only, and can be retried with
+    ``retry_failed``. With a ``state_file``, the state is saved after every
+    batch, and ``resume`` picks up where a stopped or crashed scheduler left
+    off.
+
+    Args:
+        clients (dict or iterable): The server clients, either keyed by a
+        server name or as a plain iterable (named by their base URL).
+        schedule (iterable of MeetingSpec): The meetings to schedule.
+        lead_time (float): Seconds before its start a meeting is created.
+        rate (float): The maximum calls per second to each server.
+        burst (int): The number of calls a server may receive at once.
+        max_workers (int): The maximum number of concurrent calls.
+        end_batch_size (int): The number of meetings ended per batch.
+        state_file (str, optional): The JSON file the state is saved to.
+
+    Example:
+        scheduler = MeetingScheduler(
+            {"bbb1": bbb1_client, "bbb2": bbb2_client},
+            [
+                MeetingSpec("algebra-101", "Algebra", start, start + hour),
+                MeetingSpec("physics-201", "Physics", start, start + hour),
+            ],
+            lead_time=600,
+            rate=5.0,
+            state_file="schedule.json",
+        )
+        scheduler.run()
+        for status in scheduler.failures:
+            print(status.spec.meeting_id, status.state, status.error)
+    """
+
+    def __init__(
+        self,
+        clients: Union[Mapping[str, Any], Iterable[Any]],
+        schedule: Iterable[MeetingSpec] = (),
+        lead_time: float = 300.0,
+        rate: float = 5.0,
+        burst: int = 10,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        end_batch_size: int = END_BATCH_SIZE,
+        state_file: Optional[str] = None,
+    ) -> None:
+        if isinstance(clients, Mapping):
+            self.servers: Dict[str, Any] = dict(clients)
+        else:
+            self.servers = {
+                client.url_builder.bbb_server_base_url: client for client in clients
+            }
+        if not self.servers:
+            raise ValueError("A scheduler needs at least one server.")
+        self.lead_time = lead_time
+        self.max_workers = max_workers
+        self.end_batch_size = end_batch_size
+        self.state_file = state_file
+        self.buckets: Dict[str, TokenBucket] = {
+            name: TokenBucket(rate, burst) for name in self.servers
+        }
+        self._statuses: Dict[str, MeetingStatus] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self.add(schedule)
+
+    @classmethod
+    def resume(
+        cls,
+        clients: Union[Mapping[str, Any], Iterable[Any]],
+        state_file: str,
+        **kwargs: Any,
+    ) -> "MeetingScheduler":
+        """
+        Restores a scheduler from its state file, or starts an empty one if
+        the file does not exist yet.
+
+        Meetings that were being created or ended when the state was saved
+        are created or ended again.
+
+        Args:
+            clients (dict or iterable): The server clients, with the same
+            names as when the state was saved.
+            state_file (str): The JSON file written by ``save``.
+            **kwargs: Other MeetingScheduler arguments.
+
+        Returns:
+            MeetingScheduler: The restored scheduler.
+
+        Raises:
+            ValueError: If the file has an unknown layout or assigns meetings
+            to a server that is not in ``clients``.
+
+        Example:
+            scheduler = MeetingScheduler.resume(clients, "schedule.json")
+            scheduler.add(todays_timetable)
+            scheduler.run()
+        """
+        scheduler = cls(clients, state_file=state_file, **kwargs)
+        if not os.path.exists(state_file):
+            return scheduler
+        with open(state_file, encoding="utf-8") as file:
+            document = json.load(file)
+        if document.get("version") != STATE_FILE_VERSION:
+            raise ValueError(f"Unsupported state file version in {state_file}")
+        for record in document["meetings"]:
+            status = _status_from_record(record)
+            if status.server not in scheduler.servers:
+                raise ValueError(
+                    f"Meeting {status.spec.meeting_id} is assigned to unknown "
+                    f"server {status.server!r}"
+                )
+            scheduler._statuses[status.spec.meeting_id] = status
+        logger.info(
+            "Resumed %d scheduled meetings from %s",
+            len(scheduler._statuses),
+            state_file,
+        )
+        return scheduler
+
+    def add(self, schedule: Iterable[MeetingSpec]) -> None:
+        """
+        Adds meetings to the schedule. Meetings already scheduled, e.g. after
+        ``resume``, are left as they are.
+
+        Meetings without a ``server`` are assigned to the server with the
+        fewest meetings that have not ended yet.
+
+        Raises:
+            ValueError: If a meeting has a naive start or end time, ends
+            before it starts or names an unknown server.
+        """
+        with self._lock:
+            active = Counter(
+                status.server
+                for status in self._statuses.values()
+                if status.state not in TERMINAL_STATES
+            )
+            for spec in schedule:
+                if spec.meeting_id in self._statuses:
+                    continue
+                if spec.start.utcoffset() is None or spec.end.utcoffset() is None:
+                    raise ValueError(
+                        f"Meeting {spec.meeting_id} needs timezone-aware start "
+                        "and end times"
+                    )
+                if spec.end <= spec.start:
+                    raise ValueError(
+                        f"Meeting {spec.meeting_id} ends before it starts"
+                    )
+                if spec.server is not None and spec.server not in self.servers:
+                    raise ValueError(
+                        f"Meeting {spec.meeting_id} names unknown server "
+                        f"{spec.server!r}"
+                    )
+                server = spec.server or min(self.servers, key=active.__getitem__)
+                active[server] += 1
+                self._statuses[spec.meeting_id] = MeetingStatus(spec, server=server)
+
+    @property
+    def statuses(self) -> Dict[str, MeetingStatus]:
+        """
+        The status of every scheduled meeting, by meeting ID.
+        """
+        with self._lock:
+            return dict(self._statuses)
+
+    @property
+    def failures(self) -> List[MeetingStatus]:
+        """
+        The meetings whose last create or end failed.
+        """
+        return [status for status in self.statuses.values() if not status.ok]
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Returns the number of meetings in each lifecycle state.
+
+        Example:
+            print(scheduler.counts())  # {"created": 180, "pending": 20}
+        """
+        return dict(Counter(status.state for status in self.statuses.values()))
+
+    def _set(self, meeting_id: str, state: str, error: Optional[str] = None) -> None:
+        with self._lock:
+            self._statuses[meeting_id] = self._statuses[meeting_id]._replace(
+                state=state, error=error, updated_at=_now()
+            )
+
+    def _take(
+        self, ready: Callable[[MeetingStatus], bool], state: str
+    ) -> List[MeetingStatus]:
+        # Selects the ready meetings and marks them in flight, interleaved by
+        # server so that one throttled server does not hold every worker.
+        with self._lock:
+            by_server: Dict[str, List[MeetingStatus]] = {}
+            for status in self._statuses.values():
+                if ready(status):
+                    by_server.setdefault(status.server, []).append(status)
+            taken: List[MeetingStatus] = []
+            queues = [
+                sorted(statuses, key=lambda status: status.spec.start)
+                for statuses in by_server.values()
+            ]
+            for index in range(max(map(len, queues), default=0)):
+                taken.extend(queue[index] for queue in queues if index < len(queue))
+            now = _now()
+            for status in taken:
+                self._statuses[status.spec.meeting_id] = status._replace(
+                    state=state, updated_at=now
+                )
+        return taken
+
+    def _create(self, status: MeetingStatus) -> Meeting:
+        if not self.buckets[status.server].acquire(self._stop):
+            raise _Stopped()
+        spec = status.spec
+        meeting = self.servers[status.server].meetings.create_meeting(
+            spec.name,
+            spec.meeting_id,
+            spec.attendee_pw,
+            spec.moderator_pw,
+            **spec.params,
+        )
+        if not meeting.meeting_id:
+            raise BigBlueButtonError(
+                f"create was refused: {meeting.message_key} {meeting.message}".strip()
+            )
+        return meeting
+
+    def _end(self, status: MeetingStatus) -> Dict[str, Any]:
+        if not self.buckets[status.server].acquire(self._stop):
+            raise _Stopped()
+        spec = status.spec
+        # A meeting that is already gone, e.g. ended by its moderator, counts
+        # as ended.
+        try:
+            response = self.servers[status.server].meetings.end_meeting(
+                Meeting(meeting_id=spec.meeting_id, moderator_pw=spec.moderator_pw)
+            )
+        except FailedResponseError as e:
+            if e.message_key != "notFound":
+                raise
+            return e.response
+        if response.get("returncode") != "SUCCESS" and (
+            response.get("messageKey") != "notFound"
+        ):
+            raise BigBlueButtonError(
+                f"end was refused: {response.get('messageKey')} "
+                f"{response.get('message', '')}".strip()
+            )
+        return response
+
+    def _record(
+        self, results: List[BatchResult], done: str, failed: str, undo: str
+    ) -> List[BatchResult]:
+        reported = []
+        for result in results:
+            meeting_id = result.item.spec.meeting_id
+            if isinstance(result.error, _Stopped):
+                self._set(meeting_id, undo)
+                continue
+            if result.ok:
+                self._set(meeting_id, done)
+            else:
+                logger.warning(
+                    "Scheduled meeting %s failed: %s", meeting_id, result.error
+                )
+                self._set(meeting_id, failed, str(result.error))
+            reported.append(result)
+        return reported
+
+    def create_due(self, now: Optional[datetime] = None) -> List[BatchResult]:
+        """
+        Creates the pending meetings starting within ``lead_time``.
+
+        Meetings whose end time has already passed are marked MISSED instead.
+
+        Args:
+            now (datetime, optional): The current time, for dry runs.
+
+        Returns:
+            list: One BatchResult per meeting, holding the created Meeting or
+            the error.
+        """
+        now = now or _now()
+        horizon = now.timestamp() + self.lead_time
+        with self._lock:
+            for meeting_id, status in self._statuses.items():
+                if status.state == PENDING and status.spec.end <= now:
+                    self._statuses[meeting_id] = status._replace(
+                        state=MISSED, updated_at=now
+                    )
+        due = self._take(
+            lambda status: status.state == PENDING
+            and status.spec.start.timestamp() <= horizon,
+            CREATING,
+        )
+        if not due:
+            return []
+        logger.info("Creating %d scheduled meetings", len(due))
+        results = self._record(
+            run_batch(self._create, due, self.max_workers),
+            CREATED,
+            CREATE_FAILED,
+            PENDING,
+        )
+        self._autosave()
+        return results
+
+    def end_due(self, now: Optional[datetime] = None) -> List[BatchResult]:
+        """
+        Ends the created meetings whose end time has passed, in batches of
+        ``end_batch_size``.
+
+        Args:
+            now (datetime, optional): The current time, for dry runs.
+
+        Returns:
+            list: One BatchResult per meeting, holding the end response or the
+            error.
+        """
+        now = now or _now()
+        due = self._take(
+            lambda status: status.state == CREATED and status.spec.end <= now,
+            ENDING,
+        )
+        results: List[BatchResult] = []
+        for start in range(0, len(due), self.end_batch_size):
+            batch = due[start : start + self.end_batch_size]
+            if self._stop.is_set():
+                for status in batch:
+                    self._set(status.spec.meeting_id, CREATED)
+                continue
+            logger.info("Ending %d scheduled meetings", len(batch))
+            results.extend(
+                self._record(
+                    run_batch(self._end, batch, self.max_workers),
+                    ENDED,
+                    END_FAILED,
+                    CREATED,
+                )
+            )
+            self._autosave()
+        return results
+
+    def retry_failed(self) -> int:
+        """
+        Schedules the failed meetings again: failed creates become pending,
+        failed ends are ended again.
+
+        Returns:
+            int: The number of meetings rescheduled.
+        """
+        retried = 0
+        with self._lock:
+            for meeting_id, status in self._statuses.items():
+                if status.state in (CREATE_FAILED, END_FAILED):
+                    state = PENDING if status.state == CREATE_FAILED else CREATED
+                    self._statuses[meeting_id] = status._replace(state=state)
+                    retried += 1
+        return retried
+
+    def next_event(self, now: Optional[datetime] = None) -> Optional[float]:
+        """
+        Returns the seconds until a meeting is due to be created or ended,
+        0 if one is already due, or None when every meeting is done.
+        """
+        now_ts = (now or _now()).timestamp()
+        times = []
+        for status in self.statuses.values():
+            if status.state == PENDING:
+                times.append(status.spec.start.timestamp() - self.lead_time)
+            elif status.state == CREATED:
+                times.append(status.spec.end.timestamp())
+        if not times:
+            return None
+        return max(0.0, min(times) - now_ts)
+
+    def run(self, poll_interval: float = 30.0) -> Dict[str, int]:
+        """
+        Creates and ends meetings as they come due, until every meeting is
+        done or ``stop`` is called.
+
+        Sleeps until the next meeting is due, but at most ``poll_interval``
+        seconds, so meetings added from another thread are picked up.
+
+        Args:
+            poll_interval (float): The maximum seconds between two checks.
+
+        Returns:
+            dict: The number of meetings in each lifecycle state.
+        """
+        self._stop.clear()
+        while not self._stop.is_set():
+            self.create_due()
+            self.end_due()
+            wait = self.next_event()
+            if wait is None:
+                break
+            self._stop.wait(min(wait, poll_interval))
+        self._autosave()
+        return self.counts()
+
+    def stop(self) -> None:
+        """
+        Stops ``run``. Throttled calls are abandoned and left to the next run.
+        """
+        self._stop.set()
+
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Writes the state of every meeting to a JSON file, atomically.
+
+        The file holds the attendee and moderator passwords in plain text,
+        so it is created readable by its owner only (``STATE_FILE_MODE``).
+
+        Args:
+            path (str, optional): The file to write, ``state_file`` by
+            default.
+        """
+        path = path or self.state_file
+        if path is None:
+            raise ValueError("No state file to save to.")
+        document = {
+            "version": STATE_FILE_VERSION,
+            "meetings": [_status_record(status) for status in self.statuses.values()],
+        }
+        temporary = f"{path}.tmp"
+        descriptor = os.open(
+            temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, STATE_FILE_MODE
+        )
+        with open(descriptor, "w", encoding="utf-8") as file:
+            json.dump(document, file, ensure_ascii=False)
+        os.replace(temporary, path)
+
+    def _autosave(self) -> None:
+        if self.state_file is not None:
+            self.save()
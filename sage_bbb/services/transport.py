@@ -0,0 +1,240 @@
+from typing import Any, Dict, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+from sage_bbb.exceptions import HTTPStatusError, TransportError
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class RequestsTransportError(TransportError, requests.RequestException):
+    """
+    A TransportError raised by RequestsTransport. It is also a
+    ``requests.RequestException``, so handlers written against requests
+    keep catching it.
+    """
+
+
+class RequestsHTTPStatusError(HTTPStatusError, requests.HTTPError):
+    """
+    An HTTPStatusError for a response received through RequestsTransport.
+    It is also a ``requests.HTTPError``, the error ``raise_for_status``
+    raises.
+    """
+
+
+class Transport:
+    """
+    Abstract base class for the HTTP transports used by BigBlueButtonClient.
+
+    A transport owns the network resources (connection pools, sessions) used
+    to talk to a BigBlueButton server and is responsible for releasing them
+    when closed.
+
+    Example:
+        class CustomTransport(Transport):
+            def request(self, method, url, data=None, headers=None, timeout=None):
+                ...
+    """
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: Any = None,
+        headers: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Timeout] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Sends an HTTP request and returns the response.
+
+        Args:
+            method (str): The HTTP method ("GET" or "POST").
+            url (str): The fully signed URL of the API call.
+            data (optional): The request body, for POST requests.
+            headers (dict, optional): Extra headers to send with the request.
+            timeout (float or tuple, optional): Either a single timeout in
+            seconds or a ``(connect, read)`` tuple. Falls back to the transport
+            defaults when omitted.
+            stream (bool): Whether to defer downloading the response body.
+
+        Returns:
+            requests.Response: The response from the server.
+        """
+        raise NotImplementedError("Transport.request() must be overridden in subclasses")
+
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns the connection pool usage per pool, if the transport pools
+        connections.
+        """
+        return {}
+
+    def http_error(
+        self, api_call: str, status_code: int, response: Any
+    ) -> HTTPStatusError:
+        """
+        Builds the error raised for a response with an HTTP error status.
+        """
+        return HTTPStatusError(api_call, status_code, response)
+
+    def close(self) -> None:
+        """
+        Releases the resources held by the transport.
+        """
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _was_sent(error: requests.exceptions.RequestException) -> bool:
+    """
+    Returns whether a failed request may have reached the server. Only
+    failures to establish the connection guarantee that it did not.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return False
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        reason = getattr(error.args[0], "reason", error.args[0])
+        return not isinstance(reason, NewConnectionError)
+    return True
+
+
+class RequestsTransport(Transport):
+    """
+    Default transport backed by a pooled, keep-alive ``requests.Session``.
+
+    Connections are kept open between calls, so repeated polling of the same
+    BigBlueButton host reuses its TCP and TLS connections instead of opening
+    new ones for every request.
+
+    Args:
+        pool_connections (int): The number of per-host connection pools to cache.
+        pool_maxsize (int): The maximum number of connections kept per host.
+        connect_timeout (float): Default seconds to wait for a connection.
+        read_timeout (float): Default seconds to wait for the server to respond.
+        keep_alive (bool): Whether connections are reused between requests.
+        pool_block (bool): Whether to block when the pool has no free
+        connection instead of opening a throwaway one.
+
+    Example:
+        transport = RequestsTransport(pool_maxsize=50, read_timeout=10)
+        bbb_client = BigBlueButtonClient(
+        "http://example.com/bigbluebutton/api/", "secret", transport=transport
+        )
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        keep_alive: bool = True,
+        pool_block: bool = False,
+    ) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = (connect_timeout, read_timeout)
+        self.keep_alive = keep_alive
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+        self._closed = False
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: Any = None,
+        headers: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Timeout] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Sends an HTTP request through the pooled session.
+
+        Args:
+            method (str): The HTTP method ("GET" or "POST").
+            url (str): The fully signed URL of the API call.
+            data (optional): The request body, for POST requests.
+            headers (dict, optional): Extra headers to send with the request.
+            timeout (float or tuple, optional): Overrides the default
+            ``(connect, read)`` timeouts for this call.
+            stream (bool): Whether to defer downloading the response body.
+
+        Returns:
+            requests.Response: The response from the server.
+
+        Example:
+            response = transport.request("GET", url, timeout=(2, 5))
+        """
+        if self._closed:
+            raise RuntimeError("Cannot send a request through a closed transport.")
+        try:
+            return self.session.request(
+                method,
+                url,
+                data=data,
+                headers=headers,
+                timeout=timeout if timeout is not None else self.timeout,
+                stream=stream,
+            )
+        except requests.exceptions.RequestException as e:
+            raise RequestsTransportError(str(e), request_sent=_was_sent(e)) from e
+
+    def http_error(
+        self, api_call: str, status_code: int, response: Any
+    ) -> HTTPStatusError:
+        """
+        Builds the error raised for a response with an HTTP error status, a
+        ``requests.HTTPError`` as well.
+        """
+        return RequestsHTTPStatusError(api_call, status_code, response)
+
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns, per host, the number of connections opened by its pool and
+        the number currently idle.
+
+        Example:
+            print(transport.pool_stats())  # {"bbb.example.com:443": {...}}
+        """
+        stats: Dict[str, Dict[str, int]] = {}
+        for adapter in {id(a): a for a in self.session.adapters.values()}.values():
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                # The pool queue is pre-filled with None placeholders.
+                idle = list(pool.pool.queue) if pool.pool is not None else []
+                stats[f"{pool.host}:{pool.port}"] = {
+                    "opened": pool.num_connections,
+                    "idle": sum(1 for conn in idle if conn is not None),
+                }
+        return stats
+
+    def close(self) -> None:
+        """
+        Closes every pooled connection held by the session.
+
+        Example:
+            transport.close()
+        """
+        if not self._closed:
+            self._closed = True
+            self.session.close()
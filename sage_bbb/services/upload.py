@@ -0,0 +1,222 @@
+import asyncio
+import mimetypes
+import mmap
+import os
+import uuid
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+# Bytes read from a file and handed to the transport at a time.
+UPLOAD_CHUNK_SIZE = 65536
+
+# Uploads running at the same time per Recordings service.
+MAX_CONCURRENT_UPLOADS = 4
+
+ProgressCallback = Callable[[int, int], Any]
+FileSource = Union[bytes, bytearray, memoryview, str, "os.PathLike[str]", IO[bytes]]
+
+
+class FilePart(NamedTuple):
+    """
+    A file field of a multipart body.
+
+    ``source`` is either the file content, a path (read through a
+    memory map) or a binary file object (read from its current position).
+    """
+
+    name: str
+    source: FileSource
+    filename: Optional[str] = None
+    content_type: Optional[str] = None
+
+
+def source_size(source: FileSource) -> int:
+    """
+    Returns the number of bytes a source holds from its current position.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return len(source)
+    if isinstance(source, memoryview):
+        return source.nbytes
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    position = source.tell()
+    try:
+        return os.fstat(source.fileno()).st_size - position
+    except (AttributeError, OSError, ValueError):
+        end = source.seek(0, os.SEEK_END)
+        source.seek(position)
+        return end - position
+
+
+def iter_source(source: FileSource, chunk_size: int) -> Iterator[bytes]:
+    """
+    Reads a source in chunks of at most ``chunk_size`` bytes. File objects
+    are rewound to their starting position afterwards.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source).cast("B")
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start : start + chunk_size])
+        return
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for start in range(0, len(mapped), chunk_size):
+                    yield mapped[start : start + chunk_size]
+        return
+    position = source.tell()
+    try:
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        # Rewind, so the body can be sent again if the request is retried.
+        source.seek(position)
+
+
+class StreamingBody:
+    """
+    Base class of request bodies produced in chunks.
+
+    Subclasses implement ``__iter__`` and ``__len__``. The length is sent as
+    the Content-Length, and ``__aiter__`` runs the chunk production in the
+    default executor, so a slow disk never blocks the event loop.
+    """
+
+    content_type = "application/octet-stream"
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """
+        The Content-Type and Content-Length headers of the body.
+        """
+        return {"Content-Type": self.content_type, "Content-Length": str(len(self))}
+
+    def __len__(self) -> int:
+        raise NotImplementedError("StreamingBody.__len__() must be overridden")
+
+    def __iter__(self) -> Iterator[bytes]:
+        raise NotImplementedError("StreamingBody.__iter__() must be overridden")
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+        chunks = iter(self)
+        while True:
+            chunk = await loop.run_in_executor(None, next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+
+class MultipartStream(StreamingBody):
+    """
+    A multipart/form-data request body produced in fixed-size chunks.
+
+    File contents are never loaded in memory as a whole: they are read, or
+    sliced from a memory map, one chunk at a time while the request is sent.
+    The body length is computed upfront, so requests are sent with a
+    Content-Length instead of chunked encoding, and the stream can be
+    iterated again when a request is retried.
+
+    Args:
+        fields (dict, optional): Plain text fields.
+        files (list): The FilePart fields.
+        chunk_size (int): The maximum number of bytes per chunk.
+        progress (callable, optional): Called with ``(sent, total)`` bytes
+        after each chunk.
+
+    Example:
+        body = MultipartStream(files=[FilePart("file", "captions.vtt")])
+        response = bbb_client.send_request(
+            "putRecordingTextTrack", params, data=body, headers=body.headers
+        )
+    """
+
+    def __init__(
+        self,
+        fields: Optional[Dict[str, str]] = None,
+        files: Optional[List[FilePart]] = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+    ) -> None:
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self._parts: List[Union[bytes, FilePart]] = []
+        for name, value in (fields or {}).items():
+            self._parts.append(self._header(name) + str(value).encode() + b"\r\n")
+        for part in files or []:
+            filename = part.filename or _default_filename(part.source)
+            content_type = (
+                part.content_type
+                or mimetypes.guess_type(filename)[0]
+                or "application/octet-stream"
+            )
+            self._parts.append(self._header(part.name, filename, content_type))
+            self._parts.append(part)
+            self._parts.append(b"\r\n")
+        self._parts.append(f"--{self.boundary}--\r\n".encode("ascii"))
+        self._length = sum(
+            source_size(part.source) if isinstance(part, FilePart) else len(part)
+            for part in self._parts
+        )
+
+    def _header(
+        self,
+        name: str,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> bytes:
+        disposition = f'form-data; name="{_quote(name)}"'
+        if filename is not None:
+            disposition += f'; filename="{_quote(filename)}"'
+        header = f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+        if content_type is not None:
+            header += f"Content-Type: {content_type}\r\n"
+        return (header + "\r\n").encode("utf-8")
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        sent = 0
+        for part in self._parts:
+            chunks = (
+                iter_source(part.source, self.chunk_size)
+                if isinstance(part, FilePart)
+                else (part,)
+            )
+            for chunk in chunks:
+                sent += len(chunk)
+                yield chunk
+                if self.progress is not None:
+                    self.progress(sent, self._length)
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\r\n", " ")
+
+
+def _default_filename(source: FileSource) -> str:
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.basename(os.fspath(source))
+    name = getattr(source, "name", None)
+    if isinstance(name, str):
+        return os.path.basename(name)
+    return "file"
@@ -0,0 +1,523 @@
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+from xml.sax.saxutils import escape
+
+from sage_bbb.utils import ChecksumStrategy, DefaultChecksumStrategy
+
+API_PATH = "/bigbluebutton/api/"
+
+# A fixed epoch (milliseconds) for generated timestamps, so generated
+# listings are identical between runs.
+BASE_TIME_MS = 1700000000000
+
+_XML_HEADER = b'<?xml version="1.0" encoding="UTF-8"?>'
+_CHECKSUM = "checksum="
+_SKIP = len(_CHECKSUM)
+_NOT_FOUND = "We could not find a meeting with that meeting ID"
+
+# Recording states getRecordings lists when no ``state`` filter is given.
+DEFAULT_RECORDING_STATES = frozenset({"published", "unpublished"})
+
+# The getDefaultConfigXML document, a raw <config> like the real server's.
+DEFAULT_CONFIG_XML = (
+    b'<?xml version="1.0" ?>'
+    b"<config>"
+    b'<layout showLogButton="false" showVideoLayout="false" '
+    b'showToolbar="true" defaultLayout="bbb.layout.name.defaultlayout"/>'
+    b"<modules>"
+    b'<module name="ChatModule" url="ChatModule.swf" privateEnabled="true"/>'
+    b'<module name="PresentModule" url="PresentModule.swf"/>'
+    b"</modules>"
+    b"</config>"
+)
+
+
+def _element(tag: str, value: Any) -> str:
+    if isinstance(value, bool):
+        value = "true" if value else "false"
+    return f"<{tag}>{escape(str(value))}</{tag}>"
+
+
+def _response(body: str, returncode: str = "SUCCESS") -> bytes:
+    return (
+        _XML_HEADER
+        + f"<response><returncode>{returncode}</returncode>{body}</response>".encode()
+    )
+
+
+def _failure(message_key: str, message: str) -> bytes:
+    return _response(
+        _element("messageKey", message_key) + _element("message", message),
+        "FAILED",
+    )
+
+
+class FakeBigBlueButtonServer:
+    """
+    A local BigBlueButton API server for benchmarks and tests.
+
+    It validates every checksum with a ChecksumStrategy, serves generated
+    ``getMeetings`` and ``getRecordings`` listings of configurable sizes, keeps
+    meetings created and ended through the API, and can delay or fail
+    requests. Listings are rendered once, so the server is rarely the
+    bottleneck of a benchmark. Like BigBlueButton, getRecordings filters by
+    ``state`` and lists published and unpublished recordings by default.
+
+    Args:
+        salt (str): The shared secret clients sign requests with.
+        meetings (int): The number of generated running meetings.
+        attendees (int): The number of attendees per generated meeting.
+        recordings (int): The number of generated recordings.
+        latency (float): Seconds every request is delayed by.
+        error_rate (float): The fraction of requests answered with
+        ``error_status``.
+        error_status (int): The HTTP status of injected errors.
+        checksum_strategy (ChecksumStrategy, optional): Validates checksums;
+        defaults to SHA-1.
+        seed (int): Seeds the error injection, for reproducible runs.
+
+    Example:
+        with FakeBigBlueButtonServer("secret", meetings=200, attendees=25) as server:
+            bbb_client = BigBlueButtonClient(server.url, "secret")
+            print(len(bbb_client.meetings.get_meetings()["meetings"]))
+    """
+
+    def __init__(
+        self,
+        salt: str,
+        meetings: int = 10,
+        attendees: int = 5,
+        recordings: int = 100,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        checksum_strategy: Optional[ChecksumStrategy] = None,
+        seed: int = 0,
+    ) -> None:
+        self.salt = salt
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.checksum_strategy = checksum_strategy or DefaultChecksumStrategy()
+        self.calls: Counter = Counter()
+        self.checksum_errors = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._meetings: Dict[str, bytes] = {}
+        self._running: Dict[str, bool] = {}
+        self._recordings: List[Tuple[str, str, Dict[str, str], bytes]] = []
+        self._recording_states: Dict[str, str] = {}
+        self._hooks: Dict[str, Tuple[str, str, bool]] = {}
+        self._config_tokens = 0
+        for number in range(meetings):
+            self._add_meeting(f"meeting-{number}", f"Meeting {number}", attendees)
+        for number in range(recordings):
+            self._add_recording(number)
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._handlers: Dict[str, Callable[[Dict[str, str]], bytes]] = {
+            "": self._check,
+            "create": self._create,
+            "end": self._end,
+            "getMeetings": self._get_meetings,
+            "getMeetingInfo": self._get_meeting_info,
+            "isMeetingRunning": self._is_meeting_running,
+            "getRecordings": self._get_recordings,
+            "publishRecordings": self._recording_update("published"),
+            "deleteRecordings": self._recording_update("deleted"),
+            "updateRecordings": self._recording_update("updated"),
+            "hooks/create": self._create_hook,
+            "hooks/list": self._list_hooks,
+            "hooks/destroy": self._destroy_hook,
+            "getDefaultConfigXML": self._get_default_config_xml,
+            "setConfigXML": self._set_config_xml,
+        }
+
+    @property
+    def url(self) -> str:
+        """
+        The API base URL clients connect to, once the server is started.
+        """
+        if self._httpd is None:
+            raise RuntimeError("The fake server is not started.")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{API_PATH}"
+
+    def start(self) -> "FakeBigBlueButtonServer":
+        """
+        Starts serving on a free localhost port in a background thread.
+        """
+        if self._httpd is None:
+            self._httpd = _HTTPServer(("127.0.0.1", 0), _Handler)
+            self._httpd.fake = self
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="fake-bbb", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops the server and closes its socket.
+        """
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+            self._thread = None
+
+    def __enter__(self) -> "FakeBigBlueButtonServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _add_meeting(self, meeting_id: str, name: str, attendees: int) -> None:
+        number = len(self._meetings)
+        attendee_xml = "".join(
+            "<attendee>"
+            + _element("userID", f"w_{meeting_id}_{index}")
+            + _element("fullName", f"User {index}")
+            + _element("role", "MODERATOR" if index == 0 else "VIEWER")
+            + _element("isPresenter", index == 0)
+            + _element("isListeningOnly", index % 3 == 0)
+            + _element("hasJoinedVoice", index % 3 != 0)
+            + _element("hasVideo", index % 5 == 0)
+            + _element("clientType", "HTML5")
+            + "</attendee>"
+            for index in range(attendees)
+        )
+        create_time = BASE_TIME_MS + number * 1000
+        self._meetings[meeting_id] = (
+            "<meeting>"
+            + _element("meetingName", name)
+            + _element("meetingID", meeting_id)
+            + _element("internalMeetingID", f"{meeting_id}-{create_time}")
+            + _element("createTime", create_time)
+            + _element("voiceBridge", 70000 + number % 10000)
+            + _element("attendeePW", "ap")
+            + _element("moderatorPW", "mp")
+            + _element("running", attendees > 0)
+            + _element("duration", 0)
+            + _element("hasUserJoined", attendees > 0)
+            + _element("recording", False)
+            + _element("hasBeenForciblyEnded", False)
+            + _element("startTime", create_time + 50)
+            + _element("endTime", 0)
+            + _element("participantCount", attendees)
+            + _element("listenerCount", (attendees + 2) // 3)
+            + _element("voiceParticipantCount", attendees - (attendees + 2) // 3)
+            + _element("videoCount", (attendees + 4) // 5)
+            + _element("maxUsers", 0)
+            + _element("moderatorCount", min(attendees, 1))
+            + f"<attendees>{attendee_xml}</attendees>"
+            + "<metadata>"
+            + _element("course", f"C{number % 50}")
+            + "</metadata>"
+            + "</meeting>"
+        ).encode()
+        self._running[meeting_id] = attendees > 0
+
+    def _add_recording(self, number: int) -> None:
+        meeting_id = f"meeting-{number % max(len(self._meetings), 1)}"
+        record_id = f"{number:040x}-{BASE_TIME_MS + number}"
+        start = BASE_TIME_MS + number * 3600000
+        metadata = {"course": f"C{number % 50}", "term": "fall"}
+        self._recording_states[record_id] = "published"
+        self._recordings.append(
+            (
+                record_id,
+                meeting_id,
+                metadata,
+                (
+                    "<recording>"
+                    + _element("recordID", record_id)
+                    + _element("meetingID", meeting_id)
+                    + _element("internalMeetingID", record_id)
+                    + _element("name", f"Recording {number}")
+                    + _element("isBreakout", False)
+                    + _element("published", True)
+                    + _element("state", "published")
+                    + _element("startTime", start)
+                    + _element("endTime", start + (number % 120 + 1) * 60000)
+                    + _element("participants", number % 40 + 1)
+                    + _element("rawSize", 10000000 + number)
+                    + _element("size", 2000000 + number)
+                    + "<metadata>"
+                    + "".join(_element(key, value) for key, value in metadata.items())
+                    + "</metadata>"
+                    + "<playback><format>"
+                    + _element("type", "presentation")
+                    + _element("url", f"https://bbb.example.com/playback/{record_id}")
+                    + _element("processingTime", 7177)
+                    + _element("length", number % 120 + 1)
+                    + _element("size", 2000000 + number)
+                    + "</format></playback>"
+                    + "</recording>"
+                ).encode(),
+            )
+        )
+
+    def set_recording_state(self, record_id: str, state: str) -> None:
+        """
+        Changes the state of a generated recording, e.g. to "processing" or
+        "deleted", as listed by getRecordings.
+        """
+        with self._lock:
+            old = self._recording_states[record_id]
+            self._recording_states[record_id] = state
+            self._recordings = [
+                (
+                    recording[0],
+                    recording[1],
+                    recording[2],
+                    recording[3]
+                    .replace(
+                        _element("state", old).encode(),
+                        _element("state", state).encode(),
+                    )
+                    .replace(
+                        _element("published", old == "published").encode(),
+                        _element("published", state == "published").encode(),
+                    ),
+                )
+                if recording[0] == record_id
+                else recording
+                for recording in self._recordings
+            ]
+
+    def remove_recording(self, record_id: str) -> None:
+        """
+        Removes a generated recording, as if it was purged from the server.
+        """
+        with self._lock:
+            self._recordings = [
+                recording for recording in self._recordings if recording[0] != record_id
+            ]
+            self._recording_states.pop(record_id, None)
+
+    def handle(self, path: str) -> Tuple[int, bytes]:
+        """
+        Answers one API request, returning the HTTP status and body.
+        """
+        split = urlsplit(path)
+        api_call = None
+        if split.path.startswith(API_PATH):
+            api_call = split.path[len(API_PATH) :]
+        with self._lock:
+            self.calls[api_call] += 1
+            failed = self.error_rate and self._random.random() < self.error_rate
+        if self.latency:
+            time.sleep(self.latency)
+        if failed:
+            return self.error_status, b""
+        handler = self._handlers.get(api_call) if api_call is not None else None
+        if handler is None:
+            return 200, _failure("unsupportedRequest", "This request is not supported")
+        pairs = split.query.split("&") if split.query else []
+        checksums = [pair[_SKIP:] for pair in pairs if pair.startswith(_CHECKSUM)]
+        signed = "&".join(pair for pair in pairs if not pair.startswith(_CHECKSUM))
+        if api_call and not self._valid_checksum(api_call, signed, checksums):
+            with self._lock:
+                self.checksum_errors += 1
+            return 200, _failure("checksumError", "Checksums do not match")
+        return 200, handler(dict(parse_qsl(signed)))
+
+    def _valid_checksum(
+        self, api_call: str, signed: str, checksums: List[str]
+    ) -> bool:
+        if len(checksums) != 1:
+            return False
+        sign = getattr(self.checksum_strategy, "sign", None)
+        if sign is not None:
+            expected = sign(api_call, signed, self.salt)
+        else:
+            expected = self.checksum_strategy.generate(
+                api_call, dict(parse_qsl(signed)), self.salt
+            )
+        return checksums[0] == expected
+
+    def _check(self, params: Dict[str, str]) -> bytes:
+        return _response(_element("version", "2.0"))
+
+    def _create(self, params: Dict[str, str]) -> bytes:
+        meeting_id = params.get("meetingID", "")
+        with self._lock:
+            if meeting_id not in self._meetings:
+                self._add_meeting(meeting_id, params.get("name", meeting_id), 0)
+        return _response(
+            _element("meetingID", meeting_id)
+            + _element("internalMeetingID", f"{meeting_id}-{BASE_TIME_MS}")
+            + _element("attendeePW", params.get("attendeePW", "ap"))
+            + _element("moderatorPW", params.get("moderatorPW", "mp"))
+            + _element("createTime", BASE_TIME_MS)
+            + _element("hasBeenForciblyEnded", False)
+        )
+
+    def _end(self, params: Dict[str, str]) -> bytes:
+        with self._lock:
+            removed = self._meetings.pop(params.get("meetingID", ""), None)
+            self._running.pop(params.get("meetingID", ""), None)
+        if removed is None:
+            return _failure("notFound", _NOT_FOUND)
+        return _response(_element("messageKey", "sentEndMeetingRequest"))
+
+    def _get_meetings(self, params: Dict[str, str]) -> bytes:
+        with self._lock:
+            meetings = b"".join(self._meetings.values())
+        return (
+            _XML_HEADER
+            + b"<response><returncode>SUCCESS</returncode><meetings>"
+            + meetings
+            + b"</meetings></response>"
+        )
+
+    def _get_meeting_info(self, params: Dict[str, str]) -> bytes:
+        with self._lock:
+            meeting = self._meetings.get(params.get("meetingID", ""))
+        if meeting is None:
+            return _failure("notFound", _NOT_FOUND)
+        fields = meeting[len(b"<meeting>") : -len(b"</meeting>")]
+        return (
+            _XML_HEADER
+            + b"<response><returncode>SUCCESS</returncode>"
+            + fields
+            + b"</response>"
+        )
+
+    def _is_meeting_running(self, params: Dict[str, str]) -> bytes:
+        with self._lock:
+            running = self._running.get(params.get("meetingID", ""), False)
+        return _response(_element("running", running))
+
+    def _get_recordings(self, params: Dict[str, str]) -> bytes:
+        meeting_ids = set(filter(None, params.get("meetingID", "").split(",")))
+        record_ids = set(filter(None, params.get("recordID", "").split(",")))
+        states = set(filter(None, params.get("state", "").split(",")))
+        states = states or set(DEFAULT_RECORDING_STATES)
+        metadata = {
+            key[len("meta_") :]: value
+            for key, value in params.items()
+            if key.startswith("meta_")
+        }
+        with self._lock:
+            recordings, recording_states = self._recordings, self._recording_states
+            matches = [
+                xml
+                for record_id, meeting_id, meta, xml in recordings
+                if (not meeting_ids or meeting_id in meeting_ids)
+                and (not record_ids or record_id in record_ids)
+                and ("any" in states or recording_states[record_id] in states)
+                and all(meta.get(key) == value for key, value in metadata.items())
+            ]
+        total = len(matches)
+        if "limit" in params:
+            offset = int(params.get("offset", 0))
+            matches = matches[offset : offset + int(params["limit"])]
+        return (
+            _XML_HEADER
+            + b"<response><returncode>SUCCESS</returncode><recordings>"
+            + b"".join(matches)
+            + b"</recordings>"
+            + _element("totalElements", total).encode()
+            + b"</response>"
+        )
+
+    def _recording_update(self, flag: str) -> Callable[[Dict[str, str]], bytes]:
+        def update(params: Dict[str, str]) -> bytes:
+            if not params.get("recordID"):
+                return _failure("missingParamRecordID", "You must specify a recordID")
+            return _response(_element(flag, True))
+
+        return update
+
+    def _create_hook(self, params: Dict[str, str]) -> bytes:
+        callback_url = params.get("callbackURL")
+        if not callback_url:
+            return _failure("missingParamCallbackURL", "You must specify a callbackURL")
+        meeting_id = params.get("meetingID", "")
+        raw_data = params.get("getRaw") == "true"
+        with self._lock:
+            for hook_id, hook in self._hooks.items():
+                if hook[:2] == (callback_url, meeting_id):
+                    return _failure("duplicateWarning", f"Hook {hook_id} exists")
+            hook_id = str(len(self._hooks) + 1)
+            while hook_id in self._hooks:
+                hook_id = str(int(hook_id) + 1)
+            self._hooks[hook_id] = (callback_url, meeting_id, raw_data)
+        return _response(
+            _element("hookID", hook_id)
+            + _element("permanentHook", False)
+            + _element("rawData", raw_data)
+        )
+
+    def _list_hooks(self, params: Dict[str, str]) -> bytes:
+        meeting_id = params.get("meetingID")
+        with self._lock:
+            hooks = list(self._hooks.items())
+        return _response(
+            "<hooks>"
+            + "".join(
+                "<hook>"
+                + _element("hookID", hook_id)
+                + _element("callbackURL", callback_url)
+                + (_element("meetingID", hook_meeting) if hook_meeting else "")
+                + _element("permanentHook", False)
+                + _element("rawData", raw_data)
+                + "</hook>"
+                for hook_id, (callback_url, hook_meeting, raw_data) in hooks
+                if not meeting_id or hook_meeting in ("", meeting_id)
+            )
+            + "</hooks>"
+        )
+
+    def _destroy_hook(self, params: Dict[str, str]) -> bytes:
+        with self._lock:
+            removed = self._hooks.pop(params.get("hookID", ""), None)
+        if removed is None:
+            return _failure("destroyMissingHook", "The hook informed was not found")
+        return _response(_element("removed", True))
+
+    def _get_default_config_xml(self, params: Dict[str, str]) -> bytes:
+        return DEFAULT_CONFIG_XML
+
+    def _set_config_xml(self, params: Dict[str, str]) -> bytes:
+        with self._lock:
+            self._config_tokens += 1
+            token = f"{params.get('meetingID', '')}-config-{self._config_tokens}"
+        return _response(_element("configToken", token))
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+    fake: FakeBigBlueButtonServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY every
+    # response would wait for a delayed ACK.
+    disable_nagle_algorithm = True
+    server: _HTTPServer
+
+    def _respond(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        status, body = self.server.fake.handle(self.path)
+        self.send_response(status)
+        self.send_header("Content-Type", "text/xml;charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _respond
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
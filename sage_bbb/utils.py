@@ -1,8 +1,16 @@
+import hashlib
 import re
-from hashlib import sha1
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple
 from urllib.parse import quote_plus
 
+# Hash algorithms BigBlueButton accepts for API checksums.
+SUPPORTED_CHECKSUM_ALGORITHMS = frozenset({"sha1", "sha256", "sha384", "sha512"})
+
+# Parameter values repeat heavily across calls (meeting IDs, passwords, role
+# names...), so their URL quoting is memoized.
+_quote = lru_cache(maxsize=4096)(quote_plus)
+
 
 class UrlValidator:
     """
@@ -83,7 +91,15 @@ class ChecksumStrategy:
 
 class DefaultChecksumStrategy(ChecksumStrategy):
     """
-    Default implementation of ChecksumStrategy using SHA-1.
+    Default implementation of ChecksumStrategy, using SHA-1 unless another
+    algorithm supported by BigBlueButton is requested.
+
+    The hash state of ``api_call`` is computed once per API call and copied
+    for each checksum, so signing only hashes the query string and the salt.
+
+    Args:
+        algorithm (str): One of "sha1", "sha256", "sha384" or "sha512". It must
+        be enabled on the server (``supportedChecksumAlgorithms``).
 
     Example:
         checksum_strategy = DefaultChecksumStrategy()
@@ -91,11 +107,26 @@ class DefaultChecksumStrategy(ChecksumStrategy):
         print(checksum)
     """
 
+    def __init__(self, algorithm: str = "sha1") -> None:
+        if algorithm not in SUPPORTED_CHECKSUM_ALGORITHMS:
+            raise ValueError(
+                f"Unsupported checksum algorithm {algorithm!r}; expected one of "
+                f"{sorted(SUPPORTED_CHECKSUM_ALGORITHMS)}."
+            )
+        self.algorithm = algorithm
+        self._prefix_states: Dict[str, Any] = {}
+        self._salts: Dict[str, bytes] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Hash states cannot be pickled; they are rebuilt on first use, which
+        # lets builders be shipped to worker processes.
+        return {**self.__dict__, "_prefix_states": {}}
+
     def generate(
         self, api_call: str, params: dict[str, Any], security_salt: str
     ) -> str:
         """
-        Generates a SHA-1 checksum for the given API call and parameters.
+        Generates a checksum for the given API call and parameters.
 
         Args:
             api_call (str): The API call being made.
@@ -103,15 +134,42 @@ class DefaultChecksumStrategy(ChecksumStrategy):
             security_salt (str): The security salt used for generating the checksum.
 
         Returns:
-            str: The generated SHA-1 checksum.
+            str: The generated checksum, as a hex digest.
 
         Example:
             checksum_strategy = DefaultChecksumStrategy()
             checksum = checksum_strategy.generate("create",{"meetingID": "123"}, "secret")
             print(checksum)
         """
-        secret_str = api_call + self._create_query_string(params) + security_salt
-        return sha1(secret_str.encode("utf-8")).hexdigest()
+        return self.sign(api_call, self._create_query_string(params), security_salt)
+
+    def sign(self, api_call: str, query_string: str, security_salt: str) -> str:
+        """
+        Generates the checksum of an already built query string.
+
+        Args:
+            api_call (str): The API call being made.
+            query_string (str): The canonical (sorted, URL-encoded) query string.
+            security_salt (str): The security salt used for generating the checksum.
+
+        Returns:
+            str: The generated checksum, as a hex digest.
+
+        Example:
+            checksum = checksum_strategy.sign("create", "meetingID=123", "secret")
+            print(checksum)
+        """
+        prefix = self._prefix_states.get(api_call)
+        if prefix is None:
+            prefix = hashlib.new(self.algorithm, api_call.encode("utf-8"))
+            self._prefix_states[api_call] = prefix
+        salt = self._salts.get(security_salt)
+        if salt is None:
+            salt = self._salts[security_salt] = security_salt.encode("utf-8")
+        state = prefix.copy()
+        state.update(query_string.encode("utf-8"))
+        state.update(salt)
+        return state.hexdigest()
 
     @staticmethod
     def _convert_value(value: Any) -> str:
@@ -146,12 +204,10 @@ class DefaultChecksumStrategy(ChecksumStrategy):
             query_string = checksum_strategy._create_query_string({"meetingID": "123"})
             print(query_string)  # Output: "meetingID=123"
         """
-        sorted_params = sorted(params.items())
-        query_string = "&".join(
-            f"{key}={quote_plus(self._convert_value(value))}"
-            for key, value in sorted_params
+        convert = self._convert_value
+        return "&".join(
+            [f"{key}={_quote(convert(value))}" for key, value in sorted(params.items())]
         )
-        return query_string
 
 
 class BigBlueButtonUrlBuilder:
@@ -181,6 +237,13 @@ class BigBlueButtonUrlBuilder:
         self.bbb_server_base_url = UrlValidator.validate(bbb_server_base_url)
         self.security_salt = security_salt
         self.checksum_strategy = checksum_strategy or DefaultChecksumStrategy()
+        # Strategies that override generate() keep their own signing; the
+        # default one signs the query string built for the URL directly.
+        self._fast_signing = (
+            isinstance(self.checksum_strategy, DefaultChecksumStrategy)
+            and type(self.checksum_strategy).generate
+            is DefaultChecksumStrategy.generate
+        )
 
     def build_url(self, api_call: str, params: Optional[dict[str, Any]] = None) -> str:
         """
@@ -200,12 +263,73 @@ class BigBlueButtonUrlBuilder:
             url = url_builder.build_url("create", {"meetingID": "123"})
             print(url)
         """
-        if params is None:
-            params = {}
-        params = {
-            k: self.checksum_strategy._convert_value(v) for k, v in params.items()
-        }
-        query_string = self.checksum_strategy._create_query_string(params)
-        checksum = self.checksum_strategy.generate(api_call, params, self.security_salt)
+        strategy = self.checksum_strategy
+        if self._fast_signing:
+            query_string = strategy._create_query_string(params or {})
+            checksum = strategy.sign(api_call, query_string, self.security_salt)
+        else:
+            # Custom strategies receive the parameters converted to strings,
+            # as they always have.
+            params = {
+                key: strategy._convert_value(value)
+                for key, value in (params or {}).items()
+            }
+            query_string = strategy._create_query_string(params)
+            checksum = strategy.generate(api_call, params, self.security_salt)
         url = f"{self.bbb_server_base_url}{api_call}?{query_string}&checksum={checksum}"
         return url
+
+    def build_urls(
+        self,
+        api_call: str,
+        rows: Iterable[Mapping[str, Any]],
+        shared_params: Optional[Mapping[str, Any]] = None,
+    ) -> Iterator[str]:
+        """
+        Lazily builds one URL per row of parameters for the same API call.
+
+        ``shared_params`` are converted and URL-encoded once and merged into
+        every row, which only pays for encoding its own values. Row values
+        override shared ones.
+
+        Args:
+            api_call (str): The API call being made (e.g., "join").
+            rows (iterable): The per-URL parameters.
+            shared_params (dict, optional): Parameters common to every URL.
+
+        Returns:
+            Iterator[str]: One complete URL per row, in order.
+
+        Example:
+            urls = url_builder.build_urls(
+                "join",
+                [{"fullName": "Jane"}, {"fullName": "John"}],
+                {"meetingID": "123", "role": "VIEWER"},
+            )
+            print(list(urls))
+        """
+        if not self._fast_signing:
+            for row in rows:
+                yield self.build_url(api_call, {**(shared_params or {}), **row})
+            return
+        strategy = self.checksum_strategy
+        convert = strategy._convert_value
+        shared = {
+            key: f"{key}={_quote(convert(value))}"
+            for key, value in (shared_params or {}).items()
+        }
+        prefix = f"{self.bbb_server_base_url}{api_call}?"
+        orders: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        for row in rows:
+            pieces = dict(shared)
+            for key, value in row.items():
+                pieces[key] = f"{key}={_quote(convert(value))}"
+            # Rows of a roster share their keys, so the canonical key order
+            # is sorted once per distinct key set.
+            keys = tuple(pieces)
+            order = orders.get(keys)
+            if order is None:
+                order = orders[keys] = tuple(sorted(keys))
+            query_string = "&".join([pieces[key] for key in order])
+            checksum = strategy.sign(api_call, query_string, self.security_salt)
+            yield f"{prefix}{query_string}&checksum={checksum}"
@@ -0,0 +1,26 @@
+from typing import Iterator
+
+import pytest
+
+from sage_bbb.services.client import BigBlueButtonClient
+from sage_bbb.services.policy import RequestPolicy, RetryPolicy
+from sage_bbb.testing import FakeBigBlueButtonServer
+
+SALT = "test-salt"
+
+
+@pytest.fixture
+def server() -> Iterator[FakeBigBlueButtonServer]:
+    with FakeBigBlueButtonServer(SALT, meetings=10, recordings=250) as fake:
+        yield fake
+
+
+@pytest.fixture
+def client(server: FakeBigBlueButtonServer) -> Iterator[BigBlueButtonClient]:
+    bbb_client = BigBlueButtonClient(
+        server.url,
+        SALT,
+        policy=RequestPolicy(RetryPolicy(max_attempts=1)),
+    )
+    yield bbb_client
+    bbb_client.close()
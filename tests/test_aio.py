@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+import pytest
+
+from sage_bbb.exceptions import HTTPStatusError
+from sage_bbb.helpers import Meeting
+from sage_bbb.services.aio.client import AsyncBigBlueButtonClient
+from sage_bbb.services.aio.transport import HttpxAsyncTransport
+from sage_bbb.services.policy import RequestPolicy, RetryPolicy
+
+from .conftest import SALT
+
+
+def run(server, scenario):
+    """Runs ``scenario(async_client)`` on a fresh event loop."""
+
+    async def main():
+        async with AsyncBigBlueButtonClient(
+            server.url,
+            SALT,
+            policy=RequestPolicy(RetryPolicy(max_attempts=1)),
+        ) as async_client:
+            return await scenario(async_client)
+
+    return asyncio.run(main())
+
+
+def test_mirrors_the_sync_services(server, client):
+    meeting = Meeting(meeting_id="meeting-2")
+
+    async def scenario(async_client):
+        return (
+            await async_client.meetings.get_meetings(),
+            await async_client.meetings.get_meeting_info(meeting),
+            await async_client.meetings.is_meeting_running(meeting),
+            await async_client.recordings.get_recordings("meeting-2"),
+            [meeting async for meeting in async_client.meetings.iter_meetings()],
+            [
+                recording
+                async for recording in async_client.recordings.iter_recordings(
+                    page_size=100
+                )
+            ],
+        )
+
+    results = run(server, scenario)
+
+    assert results == (
+        client.meetings.get_meetings(),
+        client.meetings.get_meeting_info(meeting),
+        client.meetings.is_meeting_running(meeting),
+        client.recordings.get_recordings("meeting-2"),
+        list(client.meetings.iter_meetings()),
+        list(client.recordings.iter_recordings(page_size=100)),
+    )
+    assert len(results[-1]) == 250
+
+
+def test_create_and_end_a_meeting(server):
+    async def scenario(async_client):
+        meeting = await async_client.meetings.create_meeting(
+            "Algebra", "algebra-101", "ap", "mp"
+        )
+        running = await async_client.meetings.get_meeting_info(meeting)
+        ended = await async_client.meetings.end_meeting(meeting)
+        return meeting, running, ended
+
+    meeting, running, ended = run(server, scenario)
+
+    assert meeting.meeting_id == "algebra-101"
+    assert running["meetingName"] == "Algebra"
+    assert ended["returncode"] == "SUCCESS"
+    assert server.calls["create"] == server.calls["end"] == 1
+
+
+def test_runs_calls_concurrently_on_one_loop(server):
+    server.latency = 0.2
+
+    async def scenario(async_client):
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(async_client.meetings.get_meetings() for _ in range(10))
+        )
+        return results, time.perf_counter() - started
+
+    results, elapsed = run(server, scenario)
+
+    assert all(result["returncode"] == "SUCCESS" for result in results)
+    assert elapsed < 1.0
+    assert server.calls["getMeetings"] == 10
+
+
+def test_http_errors_are_raised(server):
+    server.error_rate = 1.0
+
+    async def scenario(async_client):
+        await async_client.meetings.get_meetings()
+
+    with pytest.raises(HTTPStatusError) as info:
+        run(server, scenario)
+
+    assert info.value.status_code == 503
+
+
+def test_leaves_a_shared_transport_open(server):
+    transport = HttpxAsyncTransport()
+
+    async def main():
+        for _ in range(2):
+            async with AsyncBigBlueButtonClient(
+                server.url, SALT, transport=transport
+            ) as async_client:
+                await async_client.meetings.get_meetings()
+        await transport.aclose()
+
+    asyncio.run(main())
+
+    assert server.calls["getMeetings"] == 2
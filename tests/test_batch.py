@@ -0,0 +1,118 @@
+import asyncio
+import threading
+
+import pytest
+
+from sage_bbb.exceptions import HTTPStatusError
+from sage_bbb.helpers import Meeting
+from sage_bbb.services.batch import gather_batch, run_batch
+from sage_bbb.services.policy import deadline, remaining_time
+
+MEETINGS = [Meeting(meeting_id=f"meeting-{number}") for number in (3, 1, 7)]
+MISSING = Meeting(meeting_id="no-such-meeting")
+
+
+def test_run_batch_keeps_input_order_and_isolates_failures():
+    def func(number):
+        if number == 2:
+            raise ValueError("two")
+        return number * 10
+
+    results = run_batch(func, range(5), max_workers=3)
+
+    assert [result.item for result in results] == [0, 1, 2, 3, 4]
+    assert [result.value for result in results] == [0, 10, None, 30, 40]
+    assert [result.ok for result in results] == [True, True, False, True, True]
+    assert isinstance(results[2].error, ValueError)
+    assert run_batch(func, []) == []
+
+
+def test_run_batch_bounds_concurrency():
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def func(item):
+        with lock:
+            running.append(item)
+            peak.append(len(running))
+        threading.Event().wait(0.01)
+        with lock:
+            running.remove(item)
+
+    run_batch(func, range(20), max_workers=4)
+
+    assert max(peak) <= 4
+
+
+def test_run_batch_carries_the_callers_deadline():
+    with deadline(30):
+        results = run_batch(lambda item: remaining_time(), range(3))
+
+    assert all(0 < result.value <= 30 for result in results)
+
+
+def test_gather_batch_limits_calls_in_flight():
+    in_flight = []
+    peak = []
+
+    async def func(item):
+        in_flight.append(item)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(item)
+        if item == 3:
+            raise ValueError("three")
+        return item
+
+    results = asyncio.run(gather_batch(func, range(8), max_concurrency=2))
+
+    assert max(peak) == 2
+    assert [result.value for result in results] == [0, 1, 2, None, 4, 5, 6, 7]
+    assert isinstance(results[3].error, ValueError)
+
+
+@pytest.mark.parametrize("single_request", [False, True])
+def test_is_meeting_running_many(client, server, single_request):
+    results = client.meetings.is_meeting_running_many(
+        MEETINGS + [MISSING], single_request=single_request
+    )
+
+    assert [result.item for result in results] == MEETINGS + [MISSING]
+    assert [result.value["running"] for result in results] == [
+        "true",
+        "true",
+        "true",
+        "false",
+    ]
+    if single_request:
+        assert server.calls["getMeetings"] == 1
+        assert server.calls["isMeetingRunning"] == 0
+    else:
+        assert server.calls["isMeetingRunning"] == 4
+
+
+def test_get_meeting_info_many_answers_like_get_meeting_info(client, server):
+    one_by_one = [
+        client.meetings.get_meeting_info(meeting) for meeting in MEETINGS + [MISSING]
+    ]
+
+    pooled = client.meetings.get_meeting_info_many(MEETINGS + [MISSING])
+    listed = client.meetings.get_meeting_info_many(
+        MEETINGS + [MISSING], single_request=True
+    )
+
+    assert [result.value for result in pooled] == one_by_one
+    assert [result.value for result in listed] == one_by_one
+    assert listed[-1].value["messageKey"] == "notFound"
+    assert server.calls["getMeetings"] == 1
+
+
+def test_failed_listing_is_reported_against_every_meeting(client, server):
+    server.error_rate = 1.0
+
+    results = client.meetings.get_meeting_info_many(MEETINGS, single_request=True)
+
+    assert not any(result.ok for result in results)
+    assert all(isinstance(result.error, HTTPStatusError) for result in results)
+    assert server.calls["getMeetings"] == 1
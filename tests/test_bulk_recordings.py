@@ -0,0 +1,88 @@
+import pytest
+
+from sage_bbb.exceptions import HTTPStatusError
+from sage_bbb.services.recordings import record_id_chunks
+
+RECORD_IDS = [f"{number:040x}-{1700000000000 + number}" for number in range(40)]
+
+
+@pytest.fixture
+def received(server):
+    """Records the recordID list and parameters of every bulk request."""
+    received = []
+    for api_call in ("publishRecordings", "deleteRecordings", "updateRecordings"):
+        handler = server._handlers[api_call]
+
+        def record(params, api_call=api_call, handler=handler):
+            received.append((api_call, params["recordID"].split(","), params))
+            return handler(params)
+
+        server._handlers[api_call] = record
+    return received
+
+
+def test_chunks_fit_the_url_length(client):
+    chunks = record_id_chunks(
+        client.url_builder, "deleteRecordings", RECORD_IDS * 2, {}, 500
+    )
+
+    assert [record_id for chunk in chunks for record_id in chunk] == RECORD_IDS
+    assert len(chunks) > 1
+    for chunk in chunks:
+        url = client.url_builder.build_url(
+            "deleteRecordings", {"recordID": ",".join(chunk)}
+        )
+        assert len(url) <= 500
+
+
+def test_oversized_id_gets_a_chunk_of_its_own(client):
+    long_id = "x" * 600
+
+    chunks = record_id_chunks(
+        client.url_builder, "deleteRecordings", ["a", long_id, "b"], {}, 500
+    )
+
+    assert chunks == [["a"], [long_id], ["b"]]
+
+
+def test_publish_many_sends_few_requests(client, received):
+    results = client.recordings.publish_many(RECORD_IDS, max_url_length=600)
+
+    assert [result.item for result in results] == RECORD_IDS
+    assert all(result.ok and result.value["published"] == "true" for result in results)
+    chunks = record_id_chunks(
+        client.url_builder, "publishRecordings", RECORD_IDS, {"publish": "true"}, 600
+    )
+    assert 1 < len(received) == len(chunks)
+    sent = sorted(record_id for _, ids, _ in received for record_id in ids)
+    assert sent == sorted(RECORD_IDS)
+    assert {params["publish"] for _, _, params in received} == {"true"}
+
+
+def test_default_url_length_fits_in_one_request(client, received):
+    client.recordings.unpublish_many(RECORD_IDS)
+    client.recordings.delete_many(RECORD_IDS[:3])
+
+    assert [(api_call, len(ids)) for api_call, ids, _ in received] == [
+        ("publishRecordings", 40),
+        ("deleteRecordings", 3),
+    ]
+    assert received[0][2]["publish"] == "false"
+
+
+def test_update_many_sets_the_metadata(client, received):
+    results = client.recordings.update_many(
+        RECORD_IDS, {"meta_term": "spring"}, max_url_length=1000
+    )
+
+    assert len(results) == 40
+    assert {params["meta_term"] for _, _, params in received} == {"spring"}
+
+
+def test_failed_request_is_reported_for_each_of_its_ids(client, server):
+    server.error_rate = 1.0
+
+    results = client.recordings.delete_many(RECORD_IDS, max_url_length=1000)
+
+    assert [result.item for result in results] == RECORD_IDS
+    assert all(isinstance(result.error, HTTPStatusError) for result in results)
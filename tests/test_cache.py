@@ -0,0 +1,134 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from sage_bbb.helpers import Meeting
+from sage_bbb.services.cache import ResponseCache
+from sage_bbb.services.client import BigBlueButtonClient
+from sage_bbb.testing import FakeBigBlueButtonServer
+
+from .conftest import SALT
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def cached_client(server, cache):
+    return BigBlueButtonClient(server.url, SALT, cache=cache)
+
+
+def test_serves_repeated_calls_from_cache(server):
+    cache = ResponseCache()
+    bbb_client = cached_client(server, cache)
+
+    first = bbb_client.meetings.get_meetings()
+    second = bbb_client.meetings.get_meetings()
+
+    assert first == second
+    assert server.calls["getMeetings"] == 1
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_equivalent_params_share_an_entry(server):
+    cache = ResponseCache()
+    bbb_client = cached_client(server, cache)
+
+    bbb_client.send_request("getRecordings", {"meetingID": "meeting-1", "limit": 5})
+    bbb_client.send_request("getRecordings", {"limit": "5", "meetingID": "meeting-1"})
+
+    assert server.calls["getRecordings"] == 1
+
+
+def test_entries_expire_after_their_ttl(server):
+    clock = FakeClock()
+    cache = ResponseCache(ttls={"getMeetings": 2.0}, clock=clock)
+    bbb_client = cached_client(server, cache)
+
+    bbb_client.meetings.get_meetings()
+    clock.now = 1.9
+    bbb_client.meetings.get_meetings()
+    clock.now = 2.1
+    bbb_client.meetings.get_meetings()
+
+    assert server.calls["getMeetings"] == 2
+
+
+def test_uncached_calls_reach_the_server(server):
+    cache = ResponseCache(ttls={"getMeetings": 2.0})
+    bbb_client = cached_client(server, cache)
+
+    bbb_client.recordings.get_recordings("meeting-1")
+    bbb_client.recordings.get_recordings("meeting-1")
+
+    assert server.calls["getRecordings"] == 2
+
+
+def test_mutations_invalidate_stale_entries(server):
+    cache = ResponseCache()
+    bbb_client = cached_client(server, cache)
+    meeting = Meeting(meeting_id="meeting-1", moderator_pw="mp")
+    other = Meeting(meeting_id="meeting-2", moderator_pw="mp")
+
+    bbb_client.meetings.get_meetings()
+    bbb_client.meetings.get_meeting_info(meeting)
+    bbb_client.meetings.get_meeting_info(other)
+    bbb_client.meetings.end_meeting(meeting)
+    bbb_client.meetings.get_meetings()
+    bbb_client.meetings.get_meeting_info(meeting)
+    bbb_client.meetings.get_meeting_info(other)
+
+    assert server.calls["getMeetings"] == 2
+    # Only the info of the ended meeting is fetched again.
+    assert server.calls["getMeetingInfo"] == 3
+
+
+def test_shared_cache_keeps_servers_apart(server):
+    cache = ResponseCache()
+    with FakeBigBlueButtonServer(SALT, meetings=3, recordings=0) as other_server:
+        first = cached_client(server, cache)
+        second = cached_client(other_server, cache)
+
+        assert len(first.meetings.get_meetings()["meetings"]) == 10
+        assert len(second.meetings.get_meetings()["meetings"]) == 3
+
+        second.meetings.create_meeting("New", "new-meeting", "ap", "mp")
+        first.meetings.get_meetings()
+        second.meetings.get_meetings()
+
+        assert server.calls["getMeetings"] == 1
+        assert other_server.calls["getMeetings"] == 2
+        second.close()
+    first.close()
+
+
+def test_coalesces_concurrent_identical_calls(server):
+    server.latency = 0.2
+    cache = ResponseCache()
+    bbb_client = cached_client(server, cache)
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(
+            executor.map(lambda _: bbb_client.meetings.get_meetings(), range(8))
+        )
+
+    assert all(result == results[0] for result in results)
+    assert server.calls["getMeetings"] == 1
+    assert cache.stats()["coalesced"] + cache.stats()["hits"] == 7
+
+
+def test_evicts_least_recently_used_entries(server):
+    cache = ResponseCache(max_entries=2)
+    bbb_client = cached_client(server, cache)
+    meetings = [Meeting(meeting_id=f"meeting-{number}") for number in range(3)]
+
+    for meeting in meetings:
+        bbb_client.meetings.get_meeting_info(meeting)
+    bbb_client.meetings.get_meeting_info(meetings[2])
+    bbb_client.meetings.get_meeting_info(meetings[0])
+
+    assert cache.stats()["evictions"] == 2
+    assert cache.stats()["size"] == 2
+    assert server.calls["getMeetingInfo"] == 4
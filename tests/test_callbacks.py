@@ -0,0 +1,257 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import io
+import json
+from urllib.parse import urlencode
+from wsgiref.util import setup_testing_defaults
+
+import pytest
+
+from sage_bbb.exceptions import InvalidSignatureError
+from sage_bbb.services.callbacks import (
+    ALL_EVENTS,
+    MAX_CALLBACK_BODY,
+    MEETING_ENDED,
+    RECORDING_READY,
+    CallbackReceiver,
+    decode_events,
+    verify_jwt,
+    webhook_checksum,
+)
+
+SECRET = "callback-secret"
+CALLBACK_URL = "https://portal.example.com/bbb/callback"
+EVENTS = [
+    {
+        "data": {
+            "type": "event",
+            "id": "meeting-ended",
+            "attributes": {
+                "meeting": {
+                    "internal-meeting-id": "abc-123",
+                    "external-meeting-id": "algebra-101",
+                }
+            },
+            "event": {"ts": 1700000000000},
+        }
+    },
+    {
+        "data": {
+            "type": "event",
+            "id": "rap-publish-ended",
+            "attributes": {
+                "meeting": {"external-meeting-id": "algebra-101"},
+                "record-id": "rec-1",
+            },
+        }
+    },
+]
+
+
+def b64url(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def make_jwt(payload, secret=SECRET, algorithm="HS256"):
+    header = b64url(json.dumps({"alg": algorithm, "typ": "JWT"}).encode())
+    body = b64url(json.dumps(payload).encode())
+    signature = hmac.new(
+        secret.encode(), f"{header}.{body}".encode(), hashlib.sha256
+    ).digest()
+    return f"{header}.{body}.{b64url(signature)}"
+
+
+def webhook(url=CALLBACK_URL, algorithm="sha1", secret=SECRET, events=EVENTS):
+    fields = {"event": json.dumps(events), "timestamp": "1700000000000"}
+    body = json.dumps(fields, separators=(",", ":"))
+    checksum = hashlib.new(algorithm, (url + body + secret).encode()).hexdigest()
+    return f"{url}?checksum={checksum}", urlencode(fields).encode()
+
+
+@pytest.fixture
+def received():
+    return []
+
+
+@pytest.fixture
+def receiver(received):
+    receiver = CallbackReceiver(SECRET)
+    receiver.on(ALL_EVENTS, received.append)
+    return receiver
+
+
+def test_verify_jwt_returns_the_payload():
+    token = make_jwt({"meeting_id": "algebra-101", "record_id": "rec-1"})
+
+    assert verify_jwt(token, SECRET)["record_id"] == "rec-1"
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        make_jwt({"record_id": "rec-1"}, secret="other"),
+        make_jwt({"record_id": "rec-1"}, algorithm="none"),
+        make_jwt({"record_id": "rec-1"})[:-4] + "AAAA",
+        "not-a-jwt",
+        "a.b.c",
+    ],
+)
+def test_verify_jwt_rejects_bad_tokens(token):
+    with pytest.raises(InvalidSignatureError):
+        verify_jwt(token, SECRET)
+
+
+def test_webhook_checksum_matches_bbb_webhooks():
+    fields = {"event": "[]", "timestamp": "1"}
+    expected = hashlib.sha1(
+        (CALLBACK_URL + '{"event":"[]","timestamp":"1"}' + SECRET).encode()
+    ).hexdigest()
+
+    assert webhook_checksum(CALLBACK_URL, fields, SECRET) == expected
+
+
+def test_decode_events():
+    ended, published = decode_events(json.dumps(EVENTS))
+
+    assert ended.type == "meeting-ended"
+    assert ended.meeting_id == "algebra-101"
+    assert ended.internal_meeting_id == "abc-123"
+    assert ended.timestamp == 1700000000.0
+    assert published.record_id == "rec-1"
+    with pytest.raises(ValueError):
+        decode_events('{"data": "nope"}')
+
+
+@pytest.mark.parametrize("algorithm", ["sha1", "sha256", "sha512"])
+def test_accepts_signed_webhooks(receiver, received, algorithm):
+    url, body = webhook(algorithm=algorithm)
+
+    assert receiver.handle(url, body) == 200
+    assert [event.type for event in received] == [
+        "meeting-ended",
+        "rap-publish-ended",
+    ]
+
+
+@pytest.mark.parametrize(
+    "url, body",
+    [
+        webhook(secret="other"),
+        (webhook()[0], webhook(events=EVENTS[:1])[1]),
+        (CALLBACK_URL, webhook()[1]),
+        (webhook()[0].replace("/callback", "/other"), webhook()[1]),
+    ],
+)
+def test_rejects_bad_webhook_checksums(receiver, received, url, body):
+    assert receiver.handle(url, body) == 401
+    assert received == []
+
+
+def test_verifies_against_the_registered_url_behind_a_proxy():
+    receiver = CallbackReceiver(SECRET, callback_url=CALLBACK_URL)
+    url, body = webhook()
+    internal_url = url.replace("https://portal.example.com", "http://10.0.0.5:8000")
+
+    assert receiver.handle(internal_url, body) == 200
+
+
+def test_recording_ready_callbacks(receiver, received):
+    token = make_jwt({"meeting_id": "algebra-101", "record_id": "rec-1"})
+    body = urlencode({"signed_parameters": token}).encode()
+
+    assert receiver.handle(CALLBACK_URL, body) == 200
+    (event,) = received
+    assert (event.type, event.meeting_id, event.record_id) == (
+        RECORDING_READY,
+        "algebra-101",
+        "rec-1",
+    )
+    forged = urlencode({"signed_parameters": make_jwt({}, secret="x")}).encode()
+    assert receiver.handle(CALLBACK_URL, forged) == 401
+
+
+def test_meeting_end_callbacks_need_opting_in(receiver, received):
+    url = f"{CALLBACK_URL}?meetingID=algebra-101"
+
+    assert receiver.handle(url) == 401
+
+    receiver.allow_unsigned = True
+    assert receiver.handle(url) == 200
+    assert received[0].type == MEETING_ENDED
+
+
+def test_malformed_callbacks_are_bad_requests(receiver):
+    assert receiver.handle(CALLBACK_URL, b"foo=bar") == 400
+
+
+def test_failing_handler_does_not_stop_the_others(received):
+    def fail(event):
+        raise RuntimeError("boom")
+
+    failing = CallbackReceiver(SECRET)
+    failing.on("meeting-ended", fail)
+    failing.on(ALL_EVENTS, received.append)
+    url, body = webhook()
+
+    assert failing.handle(url, body) == 200
+    assert len(received) == 2
+
+
+def test_wsgi_application(receiver, received):
+    url, body = webhook()
+    path, query = url[len("https://portal.example.com") :].split("?")
+    environ = {
+        "REQUEST_METHOD": "POST",
+        "PATH_INFO": path,
+        "QUERY_STRING": query,
+        "HTTP_HOST": "portal.example.com",
+        "wsgi.url_scheme": "https",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+    }
+    setup_testing_defaults(environ)
+    statuses = []
+
+    receiver(environ, lambda status, headers: statuses.append(status))
+    environ["CONTENT_LENGTH"] = str(MAX_CALLBACK_BODY + 1)
+    receiver(environ, lambda status, headers: statuses.append(status))
+
+    assert statuses == ["200 OK", "413 Payload Too Large"]
+    assert len(received) == 2
+
+
+def test_asgi_application_awaits_async_handlers():
+    receiver = CallbackReceiver(SECRET)
+    received = []
+
+    async def handler(event):
+        received.append(event.type)
+
+    receiver.on("meeting-ended", handler)
+    url, body = webhook()
+    path, query = url[len("https://portal.example.com") :].split("?")
+    scope = {
+        "type": "http",
+        "scheme": "https",
+        "path": path,
+        "query_string": query.encode(),
+        "headers": [(b"host", b"portal.example.com")],
+    }
+    messages = [
+        {"type": "http.request", "body": body[:10], "more_body": True},
+        {"type": "http.request", "body": body[10:]},
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(receiver.asgi(scope, receive, send))
+
+    assert sent[0]["status"] == 200
+    assert received == ["meeting-ended"]
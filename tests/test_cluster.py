@@ -0,0 +1,113 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sage_bbb.exceptions import HTTPStatusError
+from sage_bbb.services.client import BigBlueButtonClient
+from sage_bbb.services.cluster import BigBlueButtonCluster
+from sage_bbb.services.policy import RequestPolicy, RetryPolicy
+from sage_bbb.testing import FakeBigBlueButtonServer
+
+from .conftest import SALT
+
+
+@pytest.fixture
+def fleet():
+    servers = [
+        FakeBigBlueButtonServer(SALT, meetings=0, recordings=0).start()
+        for _ in range(3)
+    ]
+    clients = {
+        f"bbb{number}": BigBlueButtonClient(
+            server.url, SALT, policy=RequestPolicy(RetryPolicy(max_attempts=1))
+        )
+        for number, server in enumerate(servers)
+    }
+    cluster = BigBlueButtonCluster(clients, meeting_weight=1.0)
+    cluster.refresh()
+    yield cluster, dict(zip(clients, servers))
+    cluster.close()
+    for server in servers:
+        server.stop()
+
+
+def test_concurrent_creates_are_spread(fleet):
+    cluster, servers = fleet
+    for server in servers.values():
+        server.latency = 0.1
+
+    with ThreadPoolExecutor(9) as executor:
+        list(
+            executor.map(
+                lambda number: cluster.create_meeting(
+                    f"Room {number}", f"room-{number}", "ap", "mp"
+                ),
+                range(9),
+            )
+        )
+
+    assert [server.calls["create"] for server in servers.values()] == [3, 3, 3]
+    assert [load.meetings for load in cluster.loads.values()] == [3, 3, 3]
+
+
+def test_concurrent_creates_of_one_meeting_share_a_server(fleet):
+    cluster, servers = fleet
+    for server in servers.values():
+        server.latency = 0.1
+    barrier = threading.Barrier(6)
+
+    def create(_):
+        barrier.wait()
+        return cluster.create_meeting("Algebra", "algebra-101", "ap", "mp")
+
+    with ThreadPoolExecutor(6) as executor:
+        meetings = list(executor.map(create, range(6)))
+
+    assert all(meeting.meeting_id == "algebra-101" for meeting in meetings)
+    hosts = [name for name, server in servers.items() if server.calls["create"]]
+    assert len(hosts) == 1
+    assert cluster.server_for("algebra-101") == hosts[0]
+    assert sum(load.meetings for load in cluster.loads.values()) == 1
+
+
+def test_failed_create_releases_the_reservation(fleet):
+    cluster, servers = fleet
+    for server in servers.values():
+        server.error_rate = 1.0
+
+    with pytest.raises(HTTPStatusError):
+        cluster.create_meeting("Algebra", "algebra-101", "ap", "mp")
+
+    assert sum(load.meetings for load in cluster.loads.values()) == 0
+    with pytest.raises(KeyError):
+        cluster.server_for("algebra-101")
+
+
+def test_refused_create_is_not_recorded(fleet):
+    cluster, servers = fleet
+    for server in servers.values():
+        server._handlers["create"] = lambda params: (
+            b"<response><returncode>FAILED</returncode>"
+            b"<messageKey>idNotUnique</messageKey></response>"
+        )
+
+    meeting = cluster.create_meeting("Algebra", "algebra-101", "ap", "mp")
+
+    assert meeting.meeting_id == ""
+    assert sum(load.meetings for load in cluster.loads.values()) == 0
+    with pytest.raises(KeyError):
+        cluster.server_for("algebra-101")
+
+
+def test_follow_up_calls_go_to_the_owner(fleet):
+    cluster, servers = fleet
+    meeting = cluster.create_meeting("Algebra", "algebra-101", "ap", "mp")
+    owner = servers[cluster.server_for("algebra-101")]
+
+    cluster.get_meeting_info(meeting)
+    cluster.end_meeting(meeting)
+
+    assert owner.calls["getMeetingInfo"] == 1
+    assert owner.calls["end"] == 1
+    assert sum(server.calls["end"] for server in servers.values()) == 1
@@ -0,0 +1,97 @@
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from sage_bbb.services.config import ConfigTemplate, module_path
+from sage_bbb.testing.server import DEFAULT_CONFIG_XML
+
+LECTURE = {"layout": {"defaultLayout": "bbb.layout.name.lecture"}}
+NO_PRIVATE_CHAT = {module_path("ChatModule"): {"privateEnabled": False}}
+
+
+@pytest.fixture
+def template():
+    return ConfigTemplate(DEFAULT_CONFIG_XML)
+
+
+def test_render_patches_attributes_and_leaves_the_template(template):
+    original = template.render()
+
+    config = ET.fromstring(template.render({**LECTURE, **NO_PRIVATE_CHAT}))
+
+    assert config.find("layout").get("defaultLayout") == "bbb.layout.name.lecture"
+    assert config.find("layout").get("showToolbar") == "true"
+    assert config.find(module_path("ChatModule")).get("privateEnabled") == "false"
+    assert template.render() == original
+    assert template.root.find("layout").get("defaultLayout") == (
+        "bbb.layout.name.defaultlayout"
+    )
+
+
+def test_none_removes_an_attribute(template):
+    config = ET.fromstring(template.render({"layout": {"showToolbar": None}}))
+
+    assert "showToolbar" not in config.find("layout").attrib
+    assert "showToolbar" in template.root.find("layout").attrib
+
+
+def test_unknown_path_is_rejected_and_rolled_back(template):
+    with pytest.raises(ValueError, match="NoSuchModule"):
+        template.render({**LECTURE, module_path("NoSuchModule"): {"url": "x"}})
+
+    assert template.root.find("layout").get("defaultLayout") == (
+        "bbb.layout.name.defaultlayout"
+    )
+    assert len(template) == 0
+
+
+def test_fingerprint_ignores_how_an_override_is_spelled(template):
+    spelled = {module_path("ChatModule"): {"privateEnabled": "false"}}
+
+    assert template.fingerprint(NO_PRIVATE_CHAT) == template.fingerprint(spelled)
+    assert template.fingerprint() == template.fingerprint({})
+    assert template.fingerprint(LECTURE) != template.fingerprint(NO_PRIVATE_CHAT)
+    other = ConfigTemplate(DEFAULT_CONFIG_XML.replace(b"true", b"false"))
+    assert other.fingerprint(LECTURE) != template.fingerprint(LECTURE)
+
+
+def test_rendered_documents_are_cached(template):
+    first = template.render(LECTURE)
+
+    assert template.render(dict(LECTURE)) is first
+    assert len(template) == 1
+
+
+def test_cache_keeps_the_most_recently_used_documents():
+    template = ConfigTemplate(DEFAULT_CONFIG_XML, max_entries=2)
+    lecture = template.render(LECTURE)
+    template.render(NO_PRIVATE_CHAT)
+    template.render(LECTURE)
+    template.render()
+
+    assert len(template) == 2
+    assert template.render(LECTURE) is lecture
+
+
+def test_default_template_is_fetched_once(client, server):
+    template = client.configurations.default_template()
+
+    assert client.configurations.default_template() is template
+    assert server.calls["getDefaultConfigXML"] == 1
+    assert client.configurations.default_template(refresh=True) is not template
+    assert server.calls["getDefaultConfigXML"] == 2
+
+
+def test_config_token_uploads_each_configuration_once(client, server):
+    configurations = client.configurations
+
+    first = configurations.config_token("algebra-101", LECTURE)
+    again = configurations.config_token("algebra-101", dict(LECTURE))
+    other_meeting = configurations.config_token("physics-201", LECTURE)
+    other_config = configurations.config_token("algebra-101", NO_PRIVATE_CHAT)
+
+    assert first == again == "algebra-101-config-1"
+    assert other_meeting == "physics-201-config-2"
+    assert other_config == "algebra-101-config-3"
+    assert server.calls["setConfigXML"] == 3
+    assert server.calls["getDefaultConfigXML"] == 1
@@ -0,0 +1,110 @@
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+
+import pytest
+
+from sage_bbb.helpers import Attendee, Meeting, Recording
+from sage_bbb.parsers import parse_response
+from sage_bbb.services.factory import (
+    AttendeeFactory,
+    HookFactory,
+    MeetingFactory,
+    RecordingFactory,
+)
+
+
+@pytest.fixture
+def meetings_xml(server):
+    return server._handlers["getMeetings"]({})
+
+
+@pytest.fixture
+def recordings_xml(server):
+    return server._handlers["getRecordings"]({"meetingID": "meeting-1"})
+
+
+def test_element_and_dict_builders_agree(meetings_xml, recordings_xml):
+    meeting_elements = ET.fromstring(meetings_xml).find("meetings")
+    recording_elements = ET.fromstring(recordings_xml).find("recordings")
+
+    assert [
+        MeetingFactory.from_element(element) for element in meeting_elements
+    ] == [
+        MeetingFactory.create_meeting(meeting)
+        for meeting in parse_response(meetings_xml)["meetings"]
+    ]
+    assert [
+        RecordingFactory.from_element(element) for element in recording_elements
+    ] == [
+        RecordingFactory.create_recording(recording)
+        for recording in parse_response(recordings_xml)["recordings"]
+    ]
+
+
+def test_meeting_fields_are_converted(meetings_xml):
+    meeting = MeetingFactory.from_element(
+        ET.fromstring(meetings_xml).find("meetings")[1]
+    )
+
+    assert meeting.meeting_id == "meeting-1"
+    assert meeting.running is True
+    assert meeting.participant_count == 5
+    assert meeting.start_time == datetime.fromtimestamp(
+        (meeting.create_time + 50) / 1000, timezone.utc
+    )
+    assert meeting.end_time is None
+    assert meeting.metadata == {"course": "C1"}
+    assert len(meeting.attendees) == 5
+    assert meeting.attendees[0] == Attendee(
+        user_id="w_meeting-1_0",
+        full_name="User 0",
+        role="MODERATOR",
+        is_presenter=True,
+        is_listening_only=True,
+        has_joined_voice=False,
+        has_video=True,
+        client_type="HTML5",
+    )
+
+
+def test_recording_fields_are_converted(recordings_xml):
+    recording = RecordingFactory.from_element(
+        ET.fromstring(recordings_xml).find("recordings")[0]
+    )
+
+    assert recording.meeting_id == "meeting-1"
+    assert recording.published is True
+    assert recording.start_time.tzinfo is timezone.utc
+    assert recording.end_time > recording.start_time
+    assert recording.metadata["term"] == "fall"
+    assert recording.playback[0].type == "presentation"
+    assert recording.playback[0].url.startswith("https://")
+
+
+def test_missing_fields_take_the_defaults():
+    meeting = MeetingFactory.create_meeting({"meetingID": "m1", "unknown": "x"})
+    recording = RecordingFactory.from_element(ET.fromstring("<recording/>"))
+
+    assert meeting == Meeting(meeting_id="m1")
+    assert recording == Recording()
+    assert HookFactory.create_hook({"hookID": "1", "rawData": "true"}).raw_data
+    assert AttendeeFactory.create_attendee({}) == Attendee()
+
+
+def test_built_models_do_not_share_metadata():
+    first = MeetingFactory.create_meeting({"meetingID": "m1"})
+    second = MeetingFactory.from_element(ET.fromstring("<meeting/>"))
+    first.metadata["course"] = "C1"
+
+    assert second.metadata == {}
+    assert MeetingFactory.create_meeting({}).metadata == {}
+    assert Meeting().metadata == {}
+
+
+def test_models_are_immutable_and_slotted():
+    meeting = MeetingFactory.create_meeting({"meetingID": "m1"})
+
+    with pytest.raises(AttributeError):
+        meeting.meeting_id = "m2"
+    assert not hasattr(meeting, "__dict__")
+    assert meeting._replace(meeting_id="m2").meeting_id == "m2"
@@ -0,0 +1,110 @@
+import csv
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from sage_bbb.services.client import BigBlueButtonClient
+from sage_bbb.services.harvest import RecordingHarvester
+from sage_bbb.services.policy import RequestPolicy, RetryPolicy
+from sage_bbb.services.query import Query
+from sage_bbb.testing import FakeBigBlueButtonServer
+
+from .conftest import SALT
+
+
+def make_client(server):
+    return BigBlueButtonClient(
+        server.url, SALT, policy=RequestPolicy(RetryPolicy(max_attempts=1))
+    )
+
+
+def test_merges_servers_and_drops_duplicates(server, client):
+    # Servers built with the same seed list the same recordings.
+    with FakeBigBlueButtonServer(SALT, recordings=300) as other_server:
+        harvester = RecordingHarvester(
+            {"bbb1": client, "bbb2": make_client(other_server)}, page_size=100
+        )
+
+        items = list(harvester.iter_recordings())
+
+    assert len(items) == 300
+    assert len({item.recording.record_id for item in items}) == 300
+    reports = harvester.reports
+    assert reports["bbb1"].recordings == 250
+    assert reports["bbb2"].recordings == 300
+    assert reports["bbb1"].duplicates + reports["bbb2"].duplicates == 250
+    assert harvester.failures == []
+
+
+def test_failing_server_does_not_stop_the_others(server, client):
+    with FakeBigBlueButtonServer(SALT, recordings=50, error_rate=1.0) as broken:
+        harvester = RecordingHarvester({"ok": client, "broken": make_client(broken)})
+
+        items = list(harvester.iter_recordings())
+
+    assert len(items) == 250
+    assert {item.server for item in items} == {"ok"}
+    assert [report.server for report in harvester.failures] == ["broken"]
+    assert harvester.reports["ok"].ok
+
+
+def test_query_filters_the_harvest(client):
+    harvester = RecordingHarvester(
+        [client], query=Query(metadata={"course": "C3"}), page_size=50
+    )
+
+    items = list(harvester.iter_recordings())
+
+    assert len(items) == 5
+    assert all(item.recording.metadata["course"] == "C3" for item in items)
+
+
+def test_exports_jsonl_and_csv(client):
+    harvester = RecordingHarvester({"bbb1": client})
+
+    jsonl = io.StringIO()
+    reports = harvester.export_jsonl(jsonl)
+    records = [json.loads(line) for line in jsonl.getvalue().splitlines()]
+    assert reports["bbb1"].recordings == len(records) == 250
+    assert records[0]["server"] == "bbb1"
+    assert records[0]["playback"][0]["type"] == "presentation"
+
+    text = io.StringIO(newline="")
+    harvester.export_csv(text, fields=("record_id", "playback_url", "metadata"))
+    rows = list(csv.DictReader(io.StringIO(text.getvalue())))
+    assert len(rows) == 250
+    assert rows[0]["playback_url"].startswith("https://")
+    assert json.loads(rows[0]["metadata"])["term"] == "fall"
+
+
+def test_abandoned_harvest_stops_server_threads(client):
+    harvester = RecordingHarvester([client], page_size=10, queue_size=5)
+
+    iterator = harvester.iter_recordings()
+    first = next(iterator)
+    iterator.close()
+
+    assert first.recording.record_id
+
+
+# The SystemExit is re-raised and ends the worker thread, as intended.
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_interrupted_server_is_still_reported(client):
+    def iter_recordings(**kwargs):
+        yield from client.recordings.iter_recordings(page_size=10)
+        raise SystemExit("worker interrupted")
+
+    interrupted = SimpleNamespace(
+        recordings=SimpleNamespace(iter_recordings=iter_recordings)
+    )
+    harvester = RecordingHarvester({"ok": client, "interrupted": interrupted})
+
+    items = list(harvester.iter_recordings())
+
+    assert len(items) == 250
+    report = harvester.reports["interrupted"]
+    assert isinstance(report.error, SystemExit)
+    assert report.recordings == 250
+    assert harvester.failures == [report]
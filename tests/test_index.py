@@ -0,0 +1,136 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from sage_bbb.services.index import RecordingIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    with RecordingIndex(str(tmp_path / "recordings.db")) as recording_index:
+        yield recording_index
+
+
+def test_sync_adds_every_listed_recording(index, client, server):
+    report = index.sync(client.recordings, page_size=100)
+
+    assert (report.added, report.updated, report.removed) == (250, 0, 0)
+    assert len(index) == 250
+    assert server.calls["getRecordings"] == 3
+    assert index.last_synced() is not None
+
+
+def test_resync_only_writes_changes(index, client, server):
+    index.sync(client.recordings)
+    record_id, meeting_id, metadata, xml = server._recordings[0]
+    server._recordings[0] = (
+        record_id,
+        meeting_id,
+        metadata,
+        xml.replace(b"Recording 0<", b"Renamed<"),
+    )
+    server.remove_recording(server._recordings[-1][0])
+
+    report = index.sync(client.recordings)
+
+    assert (report.added, report.updated, report.removed) == (0, 1, 1)
+    assert report.unchanged == 248
+    assert index.get(record_id).name == "Renamed"
+
+
+def mark_processing(server, course):
+    record_ids = [
+        record_id
+        for record_id, _, metadata, _ in server._recordings
+        if metadata["course"] == course
+    ]
+    for record_id in record_ids:
+        server.set_recording_state(record_id, "processing")
+    return record_ids
+
+
+def test_scoped_sync_leaves_other_recordings(index, client, server):
+    processing = mark_processing(server, "C1")
+    index.sync(client.recordings, metadata={"state": "any"})
+    assert len(index.search(state="processing")) == 5
+    # The processing recordings are gone from the server, but outside the
+    # scopes synced first.
+    for record_id in processing:
+        server.remove_recording(record_id)
+
+    for scope in (
+        {"state": "published"},
+        {"meta_course": "C2", "state": "published"},
+        {"meta_course": "C2", "state": "processing,published"},
+    ):
+        assert index.sync(client.recordings, metadata=scope).removed == 0
+    assert len(index) == 250
+
+    report = index.sync(client.recordings, metadata={"state": "processing"})
+
+    assert report.removed == 5
+    assert len(index) == 245
+
+
+def test_sync_without_state_keeps_recordings_it_does_not_list(index, client, server):
+    processing = mark_processing(server, "C1")
+    index.sync(client.recordings, metadata={"state": "any"})
+
+    # Without a state filter, getRecordings omits the processing recordings.
+    for scope in ({}, {"meta_course": "C1"}, {"meta_term": "fall"}):
+        report = index.sync(client.recordings, metadata=scope)
+        assert (report.added, report.removed) == (0, 0)
+    assert len(index.search(state="processing")) == 5
+
+    for record_id in processing:
+        server.set_recording_state(record_id, "published")
+    index.sync(client.recordings)
+    server.remove_recording(processing[0])
+
+    assert index.sync(client.recordings).removed == 1
+    assert len(index) == 249
+
+
+def test_sync_rejects_filters_it_cannot_scope(index, client, server):
+    with pytest.raises(ValueError, match="'limit'"):
+        index.sync(client.recordings, metadata={"limit": 10})
+    assert server.calls["getRecordings"] == 0
+
+
+def test_search_uses_the_indexed_columns(index, client):
+    index.sync(client.recordings)
+
+    by_course = index.search(metadata={"course": "C7"})
+    assert len(by_course) == 5
+    assert all(recording.metadata["course"] == "C7" for recording in by_course)
+    starts = [recording.start_time for recording in by_course]
+    assert starts == sorted(starts, reverse=True)
+
+    by_meeting = index.search(meeting_id="meeting-3", limit=4, newest_first=False)
+    assert [recording.meeting_id for recording in by_meeting] == ["meeting-3"] * 4
+    assert by_meeting[0].start_time < by_meeting[-1].start_time
+
+    cutoff = by_course[2].start_time
+    assert index.search(metadata={"course": "C7"}, start_after=cutoff) == (
+        by_course[:3]
+    )
+
+    long_ones = index.search(min_duration=100 * 60)
+    assert long_ones and all(
+        (recording.end_time - recording.start_time).total_seconds() >= 6000
+        for recording in long_ones
+    )
+
+
+def test_index_persists_recordings(tmp_path, client):
+    path = str(tmp_path / "recordings.db")
+    with RecordingIndex(path) as first:
+        first.sync(client.recordings, meeting_id="meeting-1")
+        expected = first.search()
+
+    with RecordingIndex(path) as second:
+        assert second.search() == expected
+        assert second.last_synced(meeting_id="meeting-1") is not None
+        assert second.last_synced() is None
+        before = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        assert second.search(start_before=before) == []
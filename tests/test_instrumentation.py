@@ -0,0 +1,114 @@
+import pytest
+
+from sage_bbb.exceptions import HTTPStatusError
+from sage_bbb.services.client import BigBlueButtonClient
+from sage_bbb.services.instrumentation import (
+    Histogram,
+    Instrumentation,
+    MetricsCollector,
+)
+from sage_bbb.services.policy import RequestPolicy, RetryPolicy
+from sage_bbb.services.transport import RequestsTransport
+
+from .conftest import SALT
+
+
+class Recorder(Instrumentation):
+    def __init__(self):
+        self.events = []
+
+    def before_request(self, api_call, host):
+        self.events.append(("before", api_call))
+
+    def after_request(self, call):
+        self.events.append(("after", call))
+
+    def on_parse(self, api_call, seconds, size):
+        self.events.append(("parse", api_call, size))
+
+
+def instrumented_client(server, instrumentation, **kwargs):
+    return BigBlueButtonClient(
+        server.url,
+        SALT,
+        policy=RequestPolicy(RetryPolicy(max_attempts=1)),
+        instrumentation=instrumentation,
+        **kwargs,
+    )
+
+
+def test_hooks_see_every_phase(server):
+    recorder = Recorder()
+    bbb_client = instrumented_client(server, recorder)
+
+    bbb_client.meetings.get_meetings()
+    list(bbb_client.recordings.iter_recordings(page_size=None))
+
+    kinds = [event[0] for event in recorder.events]
+    assert kinds == ["before", "after", "parse", "before", "after", "parse"]
+    call = recorder.events[1][1]
+    assert (call.api_call, call.host, call.status_code) == (
+        "getMeetings",
+        bbb_client.host,
+        200,
+    )
+    assert call.response_bytes == recorder.events[2][2] > 0
+    assert call.sign_seconds >= 0 and call.network_seconds > 0
+    # A streamed body is sized from its Content-Length, without reading it.
+    size = len(server._handlers["getRecordings"]({}))
+    assert recorder.events[4][1].response_bytes == size
+    assert recorder.events[5][1:] == ("getRecordings", size)
+
+
+def test_failed_calls_are_reported(server):
+    recorder = Recorder()
+    bbb_client = instrumented_client(server, recorder)
+    server.error_rate = 1.0
+
+    with pytest.raises(HTTPStatusError):
+        bbb_client.meetings.get_meetings()
+
+    (_, call) = recorder.events[-1]
+    assert call.status_code == 503
+    assert isinstance(call.error, HTTPStatusError)
+
+
+def test_collector_snapshot_and_prometheus_export(server):
+    transport = RequestsTransport()
+    metrics = MetricsCollector(transports=[transport])
+    bbb_client = instrumented_client(server, metrics, transport=transport)
+
+    for _ in range(3):
+        bbb_client.meetings.get_meetings()
+    server.error_rate = 1.0
+    with pytest.raises(HTTPStatusError):
+        bbb_client.meetings.get_meetings()
+
+    calls = metrics.snapshot()["calls"]["getMeetings"]
+    assert calls["requests"] == 4
+    assert calls["errors"] == {"RequestsHTTPStatusError": 1}
+    assert calls["network"]["count"] == 4
+    assert calls["parse"]["count"] == calls["response_bytes"]["count"] == 3
+    assert metrics.snapshot()["in_flight"] == {bbb_client.host: 0}
+    assert metrics.snapshot()["pools"]
+
+    text = metrics.to_prometheus()
+    assert "# TYPE bbb_request_phase_seconds histogram" in text
+    assert 'bbb_requests_total{endpoint="getMeetings"} 4' in text
+    assert (
+        'bbb_request_errors_total{endpoint="getMeetings",'
+        'error="RequestsHTTPStatusError"} 1'
+    ) in text
+    metrics.reset()
+    assert metrics.snapshot()["calls"] == {}
+    transport.close()
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((1.0, 5.0))
+
+    for value in (0.5, 1.0, 3, 10):
+        histogram.observe(value)
+
+    assert histogram.buckets() == [("1", 2), ("5", 3), ("+Inf", 4)]
+    assert histogram.snapshot()["sum"] == 14.5
@@ -0,0 +1,81 @@
+from itertools import islice
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+from sage_bbb.helpers import Meeting
+from sage_bbb.services.client import BigBlueButtonClient
+
+from .conftest import SALT
+
+MEETING = Meeting(meeting_id="algebra-101")
+ROSTER = [
+    {"fullName": f"Student {number}", "userID": f"u{number}", "password": "ap"}
+    for number in range(25)
+]
+
+
+@pytest.fixture
+def bbb_client():
+    return BigBlueButtonClient("https://bbb.example.com/bigbluebutton/api/", SALT)
+
+
+def one_by_one(bbb_client, roster, **kwargs):
+    return [
+        bbb_client.meetings.join_meeting(
+            MEETING, row["fullName"], row["password"], userID=row["userID"], **kwargs
+        )
+        for row in roster
+    ]
+
+
+def test_matches_join_meeting(bbb_client):
+    urls = list(bbb_client.meetings.build_join_urls(MEETING, ROSTER, redirect=True))
+
+    assert urls == one_by_one(bbb_client, ROSTER, redirect=True)
+
+
+def test_accepts_columnar_rosters(bbb_client):
+    columns = {name: [row[name] for row in ROSTER] for name in ROSTER[0]}
+
+    urls = list(bbb_client.meetings.build_join_urls(MEETING, columns))
+
+    assert urls == one_by_one(bbb_client, ROSTER)
+    with pytest.raises(ValueError, match="same length"):
+        list(
+            bbb_client.meetings.build_join_urls(
+                MEETING, {"fullName": ["Jane", "John"], "password": ["ap"]}
+            )
+        )
+
+
+def test_row_values_override_shared_ones(bbb_client):
+    roster = [{"fullName": "Teacher", "role": "MODERATOR"}, {"fullName": "Student"}]
+
+    urls = bbb_client.meetings.build_join_urls(MEETING, roster, role="VIEWER")
+
+    roles = [dict(parse_qsl(urlsplit(url).query))["role"] for url in urls]
+    assert roles == ["MODERATOR", "VIEWER"]
+
+
+def test_consumes_the_roster_lazily(bbb_client):
+    consumed = []
+
+    def roster():
+        for row in ROSTER:
+            consumed.append(row)
+            yield row
+
+    urls = bbb_client.meetings.build_join_urls(MEETING, roster())
+    first = list(islice(urls, 3))
+
+    assert first == one_by_one(bbb_client, ROSTER[:3])
+    assert len(consumed) == 3
+
+
+def test_worker_processes_keep_roster_order(bbb_client):
+    urls = bbb_client.meetings.build_join_urls(
+        MEETING, ROSTER, processes=2, chunk_size=4
+    )
+
+    assert list(urls) == one_by_one(bbb_client, ROSTER)
@@ -0,0 +1,60 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.imports import FORBIDDEN
+
+LAZY_PACKAGES = (
+    "sage_bbb",
+    "sage_bbb.parsers",
+    "sage_bbb.services",
+    "sage_bbb.services.aio",
+)
+
+
+@pytest.mark.parametrize("module", sorted(FORBIDDEN))
+def test_imports_do_not_load_heavy_modules(module):
+    probe = (
+        "import sys\n"
+        f"import {module}\n"
+        f"print(','.join(name for name in {FORBIDDEN[module]!r} "
+        "if name in sys.modules))"
+    )
+
+    loaded = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+    assert loaded == ""
+
+
+@pytest.mark.parametrize("package", LAZY_PACKAGES)
+def test_every_export_resolves(package):
+    module = importlib.import_module(package)
+
+    for name in module.__all__:
+        value = getattr(module, name)
+        assert value.__name__ == name
+        # The value is stored, so later lookups skip __getattr__.
+        assert module.__dict__[name] is value
+        assert name in dir(module)
+
+
+def test_lazy_names_are_the_submodule_objects():
+    import sage_bbb
+    from sage_bbb.services.client import BigBlueButtonClient
+    from sage_bbb.utils import BigBlueButtonUrlBuilder
+
+    assert sage_bbb.BigBlueButtonClient is BigBlueButtonClient
+    assert sage_bbb.BigBlueButtonUrlBuilder is BigBlueButtonUrlBuilder
+
+
+def test_unknown_names_raise_attribute_error():
+    import sage_bbb
+
+    with pytest.raises(AttributeError, match="'sage_bbb' has no attribute 'Nope'"):
+        sage_bbb.Nope
+    with pytest.raises(ImportError):
+        exec("from sage_bbb.services import Nope", {})
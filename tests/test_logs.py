@@ -0,0 +1,110 @@
+import logging
+
+import pytest
+
+from sage_bbb.helpers import Meeting
+from sage_bbb.services.logs import (
+    REDACTED,
+    ServiceLogger,
+    configure_logging,
+    flush_summaries,
+    redact,
+)
+
+
+@pytest.fixture
+def log(caplog):
+    caplog.set_level(logging.INFO, logger="tests.logs")
+    yield ServiceLogger(logging.getLogger("tests.logs"))
+    configure_logging()
+
+
+def messages(caplog):
+    return [record.getMessage() for record in caplog.records]
+
+
+def test_redacts_secrets():
+    url = "https://bbb/api/join?fullName=Jane&password=mp&checksum=abc"
+
+    assert redact(url) == (
+        f"https://bbb/api/join?fullName=Jane&password={REDACTED}"
+        f"&checksum={REDACTED}"
+    )
+    assert redact({"meetingID": "m1", "moderatorPW": "mp"}) == {
+        "meetingID": "m1",
+        "moderatorPW": REDACTED,
+    }
+    meeting = redact(Meeting(meeting_id="m1", moderator_pw="mp", attendee_pw="ap"))
+    assert (meeting.meeting_id, meeting.moderator_pw, meeting.attendee_pw) == (
+        "m1",
+        REDACTED,
+        REDACTED,
+    )
+    assert redact(42) == 42
+
+
+def test_lines_carry_the_api_call_and_redacted_arguments(log, caplog):
+    log.request("join", "Join URL: %s", "join?password=ap&fullName=Jane")
+
+    (record,) = caplog.records
+    assert record.getMessage() == f"Join URL: join?password={REDACTED}&fullName=Jane"
+    assert record.bbb_api_call == "join"
+    assert record.bbb_sample_rate == 1.0
+
+
+def test_disabled_info_skips_formatting(caplog):
+    class Exploding:
+        def __str__(self):
+            raise AssertionError("formatted")
+
+    caplog.set_level(logging.WARNING, logger="tests.quiet")
+    quiet = ServiceLogger(logging.getLogger("tests.quiet"))
+
+    quiet.request("join", "%s", Exploding())
+
+    assert caplog.records == []
+
+
+def test_samples_per_api_call(log, caplog):
+    configure_logging(sample_rates={"join": 0.1, "end": 0})
+
+    for number in range(30):
+        log.request("join", "join %s", number)
+        log.request("end", "end %s", number)
+        log.request("create", "create %s", number)
+
+    logged = messages(caplog)
+    assert [line for line in logged if line.startswith("join")] == [
+        "join 0",
+        "join 10",
+        "join 20",
+    ]
+    assert not any(line.startswith("end") for line in logged)
+    assert sum(line.startswith("create") for line in logged) == 30
+
+
+def test_summary_mode_counts_calls(log, caplog):
+    configure_logging(summary_interval=3600)
+
+    for _ in range(3):
+        log.request("join", "join")
+        log.response("join", "joined")
+    log.request("", "check")
+    assert caplog.records == []
+
+    flush_summaries()
+
+    (record,) = caplog.records
+    assert record.getMessage().endswith("check=1, join=3")
+    assert record.bbb_summary == {"join": 3, "": 1}
+
+
+def test_reconfiguring_flushes_the_pending_summary(log, caplog):
+    configure_logging(summary_interval=3600)
+    log.request("end", "end")
+
+    configure_logging()
+    log.request("end", "end again")
+
+    assert len(messages(caplog)) == 2
+    assert messages(caplog)[1] == "end again"
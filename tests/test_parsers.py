@@ -0,0 +1,106 @@
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from sage_bbb.parsers import (
+    StreamingParser,
+    element_to_dict,
+    iterparse,
+    parse_response,
+)
+
+MEETINGS = (
+    b"<response><returncode>SUCCESS</returncode><meetings>"
+    b"<meeting><meetingID>m1</meetingID><metadata/>"
+    b"<attendees><attendee><userID>u1</userID></attendee></attendees>"
+    b"</meeting>"
+    b"</meetings></response>"
+)
+
+
+def chunked(content, size):
+    return [content[start : start + size] for start in range(0, len(content), size)]
+
+
+def test_containers_keep_their_shape():
+    response = parse_response(MEETINGS)
+
+    assert response == {
+        "returncode": "SUCCESS",
+        "meetings": [
+            {"meetingID": "m1", "metadata": {}, "attendees": [{"userID": "u1"}]}
+        ],
+    }
+    empty = parse_response(b"<response><meetings/></response>")
+    assert empty == {"meetings": []}
+
+
+def test_repeated_tags_are_collected():
+    element = ET.fromstring("<a><b>1</b><b>2</b><b>3</b><c>4</c></a>")
+
+    assert element_to_dict(element) == {"b": ["1", "2", "3"], "c": "4"}
+
+
+def test_parse_response_accepts_text_bytes_and_chunks(server):
+    content = server._handlers["getRecordings"]({"meetingID": "meeting-1"})
+
+    expected = parse_response(content)
+
+    assert parse_response(content.decode("utf-8")) == expected
+    assert parse_response(chunked(content, 7)) == expected
+    assert len(expected["recordings"]) == 25
+
+
+@pytest.mark.parametrize("size", [1, 13, 65536])
+def test_streaming_matches_the_full_tree(server, size):
+    content = server._handlers["getRecordings"]({})
+    expected = parse_response(content)
+    parser = StreamingParser("recordings", "recording", element_to_dict)
+
+    items = []
+    for chunk in chunked(content, size):
+        items.extend(parser.feed(chunk))
+    items.extend(parser.close())
+
+    assert items == expected["recordings"]
+    assert parser.count == 250
+    assert parser.header == {"returncode": "SUCCESS", "totalElements": "250"}
+
+
+def test_streamed_items_are_dropped_from_the_tree():
+    parser = StreamingParser("meetings", "meeting", element_to_dict)
+
+    items = parser.feed(MEETINGS[: -len(b"</meetings></response>")])
+
+    assert [item["meetingID"] for item in items] == ["m1"]
+    # Only the open <response> and <meetings> elements are left, empty but
+    # for the container itself.
+    response, meetings = parser._stack
+    assert list(response) == [meetings]
+    assert len(meetings) == 0
+
+
+def test_predicate_skips_items_without_building_them(server):
+    built = []
+
+    def builder(element):
+        built.append(element)
+        return element.findtext("recordID")
+
+    def predicate(element):
+        return element.findtext("meetingID") == "meeting-3"
+
+    content = server._handlers["getRecordings"]({})
+    record_ids = list(
+        iterparse(chunked(content, 4096), "recordings", "recording", builder, predicate)
+    )
+
+    assert len(record_ids) == len(built) == 25
+
+
+def test_malformed_responses_raise_on_close():
+    parser = StreamingParser("meetings", "meeting", element_to_dict)
+    parser.feed(b"<response><meetings><meeting>")
+
+    with pytest.raises(ET.ParseError):
+        parser.close()
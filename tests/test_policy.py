@@ -0,0 +1,120 @@
+import time
+
+import pytest
+import requests
+
+from sage_bbb.exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    HTTPStatusError,
+    TransportError,
+)
+from sage_bbb.services.client import BigBlueButtonClient
+from sage_bbb.services.policy import RequestPolicy, RetryPolicy, deadline
+
+from .conftest import SALT
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def client_with(server, **kwargs):
+    kwargs.setdefault("sleep", lambda seconds: None)
+    return BigBlueButtonClient(server.url, SALT, policy=RequestPolicy(**kwargs))
+
+
+def test_retries_idempotent_calls_until_they_succeed(server):
+    server.error_rate = 0.5
+    bbb_client = client_with(
+        server, retry=RetryPolicy(max_attempts=20), failure_threshold=0
+    )
+
+    for _ in range(5):
+        assert bbb_client.meetings.get_meetings()["returncode"] == "SUCCESS"
+    assert server.calls["getMeetings"] > 5
+
+
+def test_gives_up_after_max_attempts(server):
+    server.error_rate = 1.0
+    bbb_client = client_with(
+        server, retry=RetryPolicy(max_attempts=3), failure_threshold=0
+    )
+
+    with pytest.raises(HTTPStatusError) as info:
+        bbb_client.meetings.get_meetings()
+
+    assert info.value.status_code == 503
+    # The sync client's errors stay catchable as requests exceptions.
+    assert isinstance(info.value, requests.HTTPError)
+    assert server.calls["getMeetings"] == 3
+
+
+def test_does_not_repeat_calls_that_are_not_idempotent(server):
+    server.error_rate = 1.0
+    bbb_client = client_with(
+        server, retry=RetryPolicy(max_attempts=3), failure_threshold=0
+    )
+
+    with pytest.raises(HTTPStatusError):
+        bbb_client.meetings.create_meeting("Algebra", "algebra-101", "ap", "mp")
+
+    assert server.calls["create"] == 1
+
+
+def test_retries_connection_errors():
+    attempts = []
+    policy = RequestPolicy(RetryPolicy(max_attempts=3), sleep=attempts.append)
+
+    def send(timeout):
+        raise TransportError("connection refused", request_sent=False)
+
+    with pytest.raises(TransportError):
+        policy.execute("create", "bbb.example.com", send)
+
+    # Two waits between three attempts, even for a non-idempotent call.
+    assert len(attempts) == 2
+
+
+def test_circuit_opens_and_recovers(server):
+    clock = FakeClock()
+    bbb_client = client_with(
+        server,
+        retry=RetryPolicy(max_attempts=1),
+        failure_threshold=3,
+        reset_timeout=10,
+        clock=clock,
+    )
+    server.error_rate = 1.0
+    for _ in range(3):
+        with pytest.raises(HTTPStatusError):
+            bbb_client.meetings.get_meetings()
+
+    with pytest.raises(CircuitOpenError):
+        bbb_client.meetings.get_meetings()
+    assert server.calls["getMeetings"] == 3
+
+    server.error_rate = 0.0
+    clock.now = 10
+    assert bbb_client.meetings.get_meetings()["returncode"] == "SUCCESS"
+    assert bbb_client.policy.breaker(bbb_client.host).state == "closed"
+
+
+def test_deadline_bounds_the_retries(server):
+    server.error_rate = 1.0
+    bbb_client = client_with(
+        server,
+        retry=RetryPolicy(max_attempts=100, base_backoff=0.05, max_backoff=0.05),
+        failure_threshold=0,
+        sleep=time.sleep,
+    )
+
+    with pytest.raises(DeadlineExceededError):
+        with deadline(0.3):
+            bbb_client.meetings.get_meetings()
+
+    assert server.calls["getMeetings"] < 100
@@ -0,0 +1,136 @@
+import threading
+from collections import Counter
+
+import pytest
+
+from sage_bbb.exceptions import HTTPStatusError
+from sage_bbb.helpers import Attendee, Meeting
+from sage_bbb.services.poller import (
+    ATTENDEE_JOINED,
+    ATTENDEE_LEFT,
+    MEETING_ENDED,
+    MEETING_STARTED,
+    RECORDING_STARTED,
+    MeetingIndex,
+    MeetingPoller,
+)
+
+JANE = Attendee(user_id="u1", full_name="Jane")
+JOHN = Attendee(user_id="u2", full_name="John")
+
+
+def session(internal_id="algebra-101-1", attendees=(), **kwargs):
+    return Meeting(
+        meeting_id="algebra-101",
+        internal_meeting_id=internal_id,
+        running=bool(attendees),
+        attendees=tuple(attendees),
+        **kwargs,
+    )
+
+
+def kinds(events):
+    return [(event.type, event.attendee and event.attendee.user_id) for event in events]
+
+
+def test_index_reports_only_changes():
+    index = MeetingIndex()
+
+    assert kinds(index.update([session(attendees=[JANE])])) == [
+        (MEETING_STARTED, None),
+        (ATTENDEE_JOINED, "u1"),
+    ]
+    assert index.update([session(attendees=[JANE])]) == []
+    assert kinds(index.update([session(attendees=[JOHN], recording=True)])) == [
+        (RECORDING_STARTED, None),
+        (ATTENDEE_JOINED, "u2"),
+        (ATTENDEE_LEFT, "u1"),
+    ]
+    assert index.get("algebra-101").attendees == (JOHN,)
+    assert index.get("algebra-101-1") is index.get("algebra-101")
+    assert kinds(index.update([])) == [(ATTENDEE_LEFT, "u2"), (MEETING_ENDED, None)]
+    assert index.get("algebra-101") is None
+    assert not index.active
+
+
+def test_reused_meeting_id_is_a_new_session():
+    index = MeetingIndex()
+    index.update([session("algebra-101-1", [JANE])])
+
+    events = index.update([session("algebra-101-2", [JANE])])
+
+    assert kinds(events) == [
+        (MEETING_STARTED, None),
+        (ATTENDEE_JOINED, "u1"),
+        (ATTENDEE_LEFT, "u1"),
+        (MEETING_ENDED, None),
+    ]
+    assert events[0].meeting.internal_meeting_id == "algebra-101-2"
+    assert events[-1].meeting.internal_meeting_id == "algebra-101-1"
+
+
+def test_poller_publishes_server_changes(client, server):
+    poller = MeetingPoller(client)
+    received = []
+    poller.subscribe(received.append)
+
+    first = poller.poll()
+    assert Counter(event.type for event in first) == {
+        MEETING_STARTED: 10,
+        ATTENDEE_JOINED: 50,
+    }
+    assert poller.poll() == []
+    assert poller.interval == poller.active_interval
+
+    client.meetings.end_meeting(poller.index.get("meeting-4"))
+    ended = poller.poll()
+
+    assert Counter(event.type for event in ended) == {
+        ATTENDEE_LEFT: 5,
+        MEETING_ENDED: 1,
+    }
+    assert {event.meeting.meeting_id for event in ended} == {"meeting-4"}
+    assert received == first + ended
+
+
+def test_failed_poll_keeps_the_previous_state(client, server):
+    poller = MeetingPoller(client)
+    poller.poll()
+    server.error_rate = 1.0
+
+    with pytest.raises(HTTPStatusError):
+        poller.poll()
+
+    assert len(poller.index.meetings) == 10
+    server.error_rate = 0.0
+    assert poller.poll() == []
+
+
+def test_failing_subscriber_does_not_stop_the_others(client):
+    poller = MeetingPoller(client)
+    received = []
+
+    def fail(event):
+        raise RuntimeError("boom")
+
+    poller.subscribe(fail)
+    unsubscribe = poller.subscribe(received.append)
+    poller.poll()
+    unsubscribe()
+    client.meetings.end_meeting(Meeting(meeting_id="meeting-1", moderator_pw="mp"))
+    poller.poll()
+
+    assert len(received) == 60
+
+
+def test_background_polling(client, server):
+    seen = threading.Event()
+    poller = MeetingPoller(client, active_interval=0.01)
+    poller.subscribe(lambda event: event.type == MEETING_ENDED and seen.set())
+    poller.poll()
+
+    with poller:
+        client.meetings.end_meeting(Meeting(meeting_id="meeting-2", moderator_pw="mp"))
+        assert seen.wait(5)
+
+    assert poller._thread is None
@@ -0,0 +1,140 @@
+import base64
+import os
+import threading
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from sage_bbb.services.presentations import (
+    Presentation,
+    PresentationBody,
+    PresentationCache,
+)
+
+# Not a multiple of 3, so base64 padding is exercised.
+DECK = bytes(range(256)) * 400 + b"%%EOF"
+
+
+@pytest.fixture
+def deck_path(tmp_path):
+    path = tmp_path / "week-1.pdf"
+    path.write_bytes(DECK)
+    return str(path)
+
+
+def parse(body):
+    return ET.fromstring(b"".join(body)).find("module")
+
+
+def test_body_lists_urls_and_embeds_documents(deck_path):
+    body = PresentationBody(
+        [
+            Presentation("https://example.com/intro.pdf", filename="intro.pdf"),
+            Presentation(deck_path, downloadable=True, current=True),
+            Presentation(DECK, filename="copy.pdf"),
+        ],
+        PresentationCache(),
+        chunk_size=1000,
+    )
+
+    remote, embedded, copy = parse(body)
+
+    assert remote.attrib == {
+        "url": "https://example.com/intro.pdf",
+        "filename": "intro.pdf",
+    }
+    assert embedded.attrib == {
+        "name": "week-1.pdf",
+        "downloadable": "true",
+        "current": "true",
+    }
+    assert base64.b64decode(embedded.text) == DECK
+    assert copy.get("name") == "copy.pdf"
+    assert copy.text == embedded.text
+    assert body.headers["Content-Length"] == str(len(b"".join(body)))
+    assert max(len(chunk) for chunk in body) <= 1000
+
+
+def test_content_needs_a_filename():
+    with pytest.raises(ValueError, match="filename"):
+        PresentationBody([DECK], PresentationCache())
+
+
+def test_cache_encodes_each_content_once(deck_path):
+    cache = PresentationCache()
+
+    first = cache.encode(deck_path)
+    with open(deck_path, "rb") as file:
+        assert cache.encode(file) is first
+    assert cache.encode(DECK) is first
+    assert len(cache) == 1
+
+    with open(deck_path, "ab") as file:
+        file.write(b"\n")
+    os.utime(deck_path, ns=(0, 0))
+    assert cache.encode(deck_path) is not first
+    assert len(cache) == 2
+
+
+def test_concurrent_encodings_of_a_deck_are_shared(deck_path, monkeypatch):
+    cache = PresentationCache()
+    encoded = []
+    encode = cache._encode
+
+    def counting_encode(digest, source):
+        encoded.append(digest)
+        return encode(digest, source)
+
+    monkeypatch.setattr(cache, "_encode", counting_encode)
+    documents = []
+    threads = [
+        threading.Thread(target=lambda: documents.append(cache.encode(deck_path)))
+        for _ in range(8)
+    ]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(encoded) == 1
+    assert all(document is documents[0] for document in documents)
+
+
+def test_cache_keeps_the_most_recent_decks():
+    cache = PresentationCache(max_entries=2)
+    decks = [DECK + bytes([number]) for number in range(3)]
+
+    first = cache.encode(decks[0])
+    cache.encode(decks[1])
+    cache.encode(decks[0])
+    cache.encode(decks[2])
+
+    assert len(cache) == 2
+    assert cache.encode(decks[0]) is first
+
+
+def test_large_decks_are_spooled_to_disk():
+    cache = PresentationCache(max_memory=1024)
+
+    document = cache.encode(DECK)
+
+    assert document._file._rolled
+    assert base64.b64decode(b"".join(document.chunks(4096))) == DECK
+
+
+def test_create_meeting_with_presentations(client, server, deck_path):
+    client.meetings.presentation_cache = cache = PresentationCache()
+
+    for number in range(3):
+        meeting = client.meetings.create_meeting(
+            "Algebra",
+            f"algebra-{number}",
+            "ap",
+            "mp",
+            presentations=[deck_path, "https://example.com/intro.pdf"],
+        )
+        assert meeting.meeting_id == f"algebra-{number}"
+
+    assert server.calls["create"] == 3
+    assert len(cache) == 1
@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from sage_bbb.services.query import MetadataIndex, Query
+from sage_bbb.testing.server import BASE_TIME_MS
+
+BASE_TIME = datetime.fromtimestamp(BASE_TIME_MS / 1000, tz=timezone.utc)
+
+
+@pytest.mark.parametrize("field", ["started_after", "started_before"])
+def test_rejects_naive_start_bounds(field):
+    with pytest.raises(ValueError, match="timezone-aware"):
+        Query(**{field: datetime(2023, 1, 1)})
+    with pytest.raises(ValueError, match="timezone-aware"):
+        Query()._replace(**{field: datetime(2023, 1, 1)})
+
+
+def test_accepts_aware_bounds_in_any_timezone():
+    tehran = timezone(timedelta(hours=3, minutes=30))
+    query = Query(started_after=datetime(2023, 11, 15, tzinfo=tehran))
+
+    assert query._replace(running=True).started_after == query.started_after
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        Query(metadata={"course": "C3"}),
+        Query(metadata_prefix={"course": "C1"}),
+        Query(min_participants=5, max_participants=5),
+        Query(min_participants=6),
+        Query(started_after=BASE_TIME + timedelta(seconds=5)),
+        Query(started_before=BASE_TIME + timedelta(seconds=5)),
+        Query(
+            started_after=BASE_TIME + timedelta(seconds=2),
+            started_before=BASE_TIME + timedelta(seconds=8),
+            running=True,
+        ),
+    ],
+)
+def test_streamed_and_built_meetings_agree(server, client, query):
+    meetings = list(client.meetings.iter_meetings())
+
+    streamed = list(client.meetings.iter_meetings(query=query))
+
+    assert streamed == [meeting for meeting in meetings if query.matches(meeting)]
+
+
+def test_streamed_and_built_recordings_agree(client):
+    query = Query(
+        metadata={"term": "fall"},
+        metadata_prefix={"course": "C4"},
+        started_before=BASE_TIME + timedelta(days=5),
+    )
+    recordings = list(client.recordings.iter_recordings())
+
+    streamed = list(client.recordings.iter_recordings(query=query))
+
+    assert streamed == [
+        recording for recording in recordings if query.matches(recording)
+    ]
+    assert 0 < len(streamed) < len(recordings)
+
+
+def test_start_bounds_are_inclusive_timestamps(client):
+    sixth = BASE_TIME + timedelta(seconds=5, milliseconds=50)
+
+    after = list(client.meetings.iter_meetings(query=Query(started_after=sixth)))
+    before = list(client.meetings.iter_meetings(query=Query(started_before=sixth)))
+
+    assert [meeting.meeting_id for meeting in after] == [
+        f"meeting-{number}" for number in range(5, 10)
+    ]
+    assert len(before) == 6
+
+
+def test_recordings_have_no_running_state():
+    with pytest.raises(ValueError, match="running"):
+        Query(running=True).element_predicate("recording")
+
+
+def test_server_params_send_metadata_equalities():
+    query = Query(metadata={"course": "C1"}, metadata_prefix={"term": "f"})
+
+    assert query.server_params() == {"meta_course": "C1"}
+
+
+def test_metadata_index_matches_a_full_scan(client):
+    recordings = list(client.recordings.iter_recordings())
+    index = MetadataIndex(keys=["course", "term"])
+    index.rebuild(recordings)
+
+    for query in (
+        Query(metadata={"course": "C7"}),
+        Query(metadata={"course": "C7", "term": "fall"}, min_participants=10),
+        Query(metadata_prefix={"course": "C1"}),
+        Query(metadata={"course": "missing"}),
+        Query(min_participants=39),
+    ):
+        expected = [recording for recording in recordings if query.matches(recording)]
+        assert index.select(query) == expected
+
+
+def test_metadata_index_keeps_insertion_order(client):
+    recordings = list(client.recordings.iter_recordings())
+    index = MetadataIndex(keys=["course"])
+    index.rebuild(recordings)
+    query = Query(metadata={"course": "C1"})
+    first, second = index.select(query)[:2]
+
+    index.add(first)
+    index.remove(second.record_id)
+
+    selected = index.select(query)
+    assert selected[-1] == first
+    assert second not in selected
+    assert len(selected) == 4
+
+
+def test_metadata_index_indexes_keys_after_repeated_queries(client):
+    index = MetadataIndex(auto_index_after=2)
+    index.rebuild(client.recordings.iter_recordings())
+    query = Query(metadata={"course": "C2"})
+
+    index.select(query)
+    assert index.indexed_keys == []
+    index.select(query)
+    assert index.indexed_keys == ["course"]
+    assert len(index.select(query)) == 5
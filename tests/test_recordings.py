@@ -0,0 +1,50 @@
+import itertools
+import time
+
+from sage_bbb.services import recordings as recordings_module
+from sage_bbb.services.recordings import page_looks_full
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_page_looks_full_counts_start_tags():
+    page = b"<recordings><recording>a</recording><recording id='2'>b</recording>"
+
+    assert page_looks_full(page, 2)
+    assert page_looks_full(b"<recording >x</recording>" * 3, 3)
+    assert not page_looks_full(page, 3)
+    assert not page_looks_full(b"<recordings></recordings>", 1)
+
+
+def test_prefetches_only_after_full_pages(client, server):
+    recordings = list(client.recordings.iter_recordings(page_size=100))
+
+    assert len(recordings) == 250
+    assert len({recording.record_id for recording in recordings}) == 250
+    assert server.calls["getRecordings"] == 3
+
+
+def test_prefetch_falls_back_to_the_parsed_count(client, server, monkeypatch):
+    monkeypatch.setattr(recordings_module, "page_looks_full", lambda *args: False)
+
+    iterator = client.recordings.iter_recordings(page_size=100)
+    first_page = list(itertools.islice(iterator, 100))
+
+    assert len(first_page) == 100
+    # The next page is requested once the first one is parsed, before the
+    # caller asks for its first recording.
+    assert wait_for(lambda: server.calls["getRecordings"] == 2)
+    assert len(list(iterator)) == 150
+    assert server.calls["getRecordings"] == 3
+
+
+def test_unpaginated_listing_is_read_in_one_request(client, server):
+    recordings = list(client.recordings.iter_recordings(page_size=None))
+
+    assert len(recordings) == 250
+    assert server.calls["getRecordings"] == 1
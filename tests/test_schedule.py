@@ -0,0 +1,176 @@
+import json
+import os
+import stat
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from sage_bbb.helpers import Meeting
+from sage_bbb.services.client import BigBlueButtonClient
+from sage_bbb.services.schedule import (
+    CREATE_FAILED,
+    CREATED,
+    CREATING,
+    ENDED,
+    MISSED,
+    PENDING,
+    STATE_FILE_MODE,
+    MeetingScheduler,
+    MeetingSpec,
+)
+from sage_bbb.testing import FakeBigBlueButtonServer
+
+START = datetime(2024, 9, 2, 9, 0, tzinfo=timezone.utc)
+HOUR = timedelta(hours=1)
+
+
+def timetable(count, start=START):
+    return [
+        MeetingSpec(f"room-{number}", f"Room {number}", start, start + HOUR)
+        for number in range(count)
+    ]
+
+
+def scheduler_for(client, schedule=(), **kwargs):
+    return MeetingScheduler({"bbb1": client}, schedule, rate=1000, burst=1000, **kwargs)
+
+
+def test_creates_meetings_within_lead_time_and_ends_them(client, server):
+    scheduler = scheduler_for(client, timetable(5), lead_time=600)
+
+    assert scheduler.create_due(START - timedelta(minutes=20)) == []
+    results = scheduler.create_due(START - timedelta(minutes=5))
+
+    assert len(results) == 5 and all(result.ok for result in results)
+    assert server.calls["create"] == 5
+    assert scheduler.counts() == {CREATED: 5}
+
+    assert scheduler.end_due(START + HOUR - timedelta(seconds=1)) == []
+    results = scheduler.end_due(START + HOUR)
+
+    assert all(result.ok for result in results)
+    assert server.calls["end"] == 5
+    assert scheduler.counts() == {ENDED: 5}
+    assert scheduler.next_event() is None
+
+
+def test_marks_meetings_missed_once_they_ended(client, server):
+    scheduler = scheduler_for(client, timetable(2))
+
+    assert scheduler.create_due(START + 2 * HOUR) == []
+    assert scheduler.counts() == {MISSED: 2}
+    assert server.calls["create"] == 0
+
+
+def test_meeting_already_gone_counts_as_ended(client):
+    scheduler = scheduler_for(client, timetable(1))
+    scheduler.create_due(START)
+    client.meetings.end_meeting(Meeting(meeting_id="room-0", moderator_pw="mp"))
+
+    results = scheduler.end_due(START + HOUR)
+
+    assert results[0].ok
+    assert scheduler.statuses["room-0"].state == ENDED
+
+
+def test_failed_creates_are_recorded_and_retried(client, server):
+    scheduler = scheduler_for(client, timetable(3))
+    server.error_rate = 1.0
+
+    results = scheduler.create_due(START)
+
+    assert not any(result.ok for result in results)
+    assert [status.state for status in scheduler.failures] == [CREATE_FAILED] * 3
+    assert all(status.error for status in scheduler.failures)
+
+    server.error_rate = 0.0
+    assert scheduler.retry_failed() == 3
+    scheduler.create_due(START)
+    assert scheduler.counts() == {CREATED: 3}
+
+
+def test_spreads_meetings_over_servers():
+    with FakeBigBlueButtonServer("salt", meetings=0, recordings=0) as first, (
+        FakeBigBlueButtonServer("salt", meetings=0, recordings=0)
+    ) as second:
+        clients = {
+            "first": BigBlueButtonClient(first.url, "salt"),
+            "second": BigBlueButtonClient(second.url, "salt"),
+        }
+        scheduler = MeetingScheduler(clients, timetable(10), rate=1000, burst=1000)
+        scheduler.create_due(START)
+
+        assert first.calls["create"] == second.calls["create"] == 5
+        for bbb_client in clients.values():
+            bbb_client.close()
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        (START.replace(tzinfo=None), START.replace(tzinfo=None) + HOUR),
+        (START, START.replace(tzinfo=None) + HOUR),
+    ],
+)
+def test_rejects_naive_times(client, start, end):
+    scheduler = scheduler_for(client)
+
+    with pytest.raises(ValueError, match="timezone-aware"):
+        scheduler.add([MeetingSpec("room-0", "Room 0", start, end)])
+    assert scheduler.statuses == {}
+
+
+def test_rejects_meetings_ending_before_they_start(client):
+    scheduler = scheduler_for(client)
+
+    with pytest.raises(ValueError, match="ends before it starts"):
+        scheduler.add([MeetingSpec("room-0", "Room 0", START, START)])
+
+
+def test_rejects_unknown_servers(client):
+    with pytest.raises(ValueError, match="unknown server"):
+        scheduler_for(client, [timetable(1)[0]._replace(server="bbb9")])
+
+
+def test_resume_restores_state(client, server, tmp_path):
+    state_file = str(tmp_path / "schedule.json")
+    scheduler = scheduler_for(client, timetable(4), state_file=state_file)
+    scheduler.create_due(START)
+    scheduler.end_due(START + HOUR)
+    scheduler.add(
+        [
+            MeetingSpec("late", "Late", START + 2 * HOUR, START + 3 * HOUR),
+            MeetingSpec("creating", "Creating", START, START + HOUR),
+        ]
+    )
+    scheduler._set("creating", CREATING)
+    scheduler.save()
+
+    resumed = MeetingScheduler.resume(
+        {"bbb1": client}, state_file, rate=1000, burst=1000
+    )
+
+    assert resumed.statuses["room-0"].state == ENDED
+    assert resumed.statuses["late"].state == PENDING
+    # A create in flight when the state was saved is made again.
+    assert resumed.statuses["creating"].state == PENDING
+    assert resumed.statuses["late"].spec == scheduler.statuses["late"].spec
+
+
+def test_state_file_is_private(client, tmp_path):
+    state_file = tmp_path / "schedule.json"
+    scheduler = scheduler_for(client, timetable(1), state_file=str(state_file))
+    scheduler.save()
+
+    with open(state_file, encoding="utf-8") as file:
+        assert json.load(file)["meetings"][0]["moderator_pw"] == "mp"
+    if os.name == "posix":
+        assert stat.S_IMODE(state_file.stat().st_mode) == STATE_FILE_MODE
+
+
+def test_resume_rejects_unknown_servers(client, tmp_path):
+    state_file = str(tmp_path / "schedule.json")
+    scheduler_for(client, timetable(1), state_file=state_file).save()
+
+    with pytest.raises(ValueError, match="unknown server"):
+        MeetingScheduler.resume({"other": client}, state_file)
@@ -0,0 +1,55 @@
+from sage_bbb.testing.server import FakeBigBlueButtonServer
+
+from .conftest import SALT
+
+
+def record_ids(client, **params):
+    response = client.send_request("getRecordings", params)
+    return [
+        recording["recordID"]
+        for recording in client.parse_response(response.content, "getRecordings")[
+            "recordings"
+        ]
+    ]
+
+
+def test_rejects_bad_checksums(server, client):
+    client.url_builder.security_salt = "wrong"
+
+    response = client.parse_response(
+        client.send_request("getMeetings", {}).content, "getMeetings"
+    )
+
+    assert response["messageKey"] == "checksumError"
+    assert server.checksum_errors == 1
+
+
+def test_lists_published_and_unpublished_recordings_by_default(client):
+    with FakeBigBlueButtonServer(SALT, meetings=1, recordings=4) as server:
+        client.url_builder.bbb_server_base_url = server.url
+        first, second, third, fourth = record_ids(client)
+        server.set_recording_state(second, "unpublished")
+        server.set_recording_state(third, "processing")
+        server.set_recording_state(fourth, "deleted")
+
+        assert record_ids(client) == [first, second]
+        assert record_ids(client, state="processing,deleted") == [third, fourth]
+        assert record_ids(client, state="any") == [first, second, third, fourth]
+
+
+def test_changed_state_is_listed(client, server):
+    record_id = record_ids(client, limit=1)[0]
+
+    server.set_recording_state(record_id, "unpublished")
+    content = client.send_request("getRecordings", {"recordID": record_id}).content
+
+    assert b"<state>unpublished</state>" in content
+    assert b"<published>false</published>" in content
+
+
+def test_removed_recordings_are_not_listed(client, server):
+    record_id = record_ids(client, limit=1)[0]
+
+    server.remove_recording(record_id)
+
+    assert record_id not in record_ids(client, state="any")
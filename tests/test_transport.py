@@ -0,0 +1,80 @@
+import socket
+
+import pytest
+import requests
+
+from sage_bbb.exceptions import TransportError
+from sage_bbb.services.client import BigBlueButtonClient
+from sage_bbb.services.transport import RequestsTransport
+
+from .conftest import SALT
+
+
+def unused_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def accepted(server, monkeypatch):
+    """Counts the TCP connections the fake server accepts."""
+    accepted = []
+    httpd = server._httpd
+    get_request = httpd.get_request
+
+    def counting_get_request():
+        connection = get_request()
+        accepted.append(connection[1])
+        return connection
+
+    monkeypatch.setattr(httpd, "get_request", counting_get_request)
+    return accepted
+
+
+def test_reuses_one_connection_per_host(server, accepted):
+    transport = RequestsTransport()
+    bbb_client = BigBlueButtonClient(server.url, SALT, transport=transport)
+
+    for _ in range(20):
+        bbb_client.meetings.get_meetings()
+
+    assert len(accepted) == 1
+    (stats,) = transport.pool_stats().values()
+    assert stats == {"opened": 1, "idle": 1}
+    transport.close()
+
+
+def test_keep_alive_can_be_turned_off(server, accepted):
+    transport = RequestsTransport(keep_alive=False)
+    bbb_client = BigBlueButtonClient(server.url, SALT, transport=transport)
+
+    for _ in range(3):
+        bbb_client.meetings.get_meetings()
+
+    assert len(accepted) == 3
+    transport.close()
+
+
+def test_client_closes_only_the_transport_it_owns(server):
+    shared = RequestsTransport()
+    with BigBlueButtonClient(server.url, SALT, transport=shared) as bbb_client:
+        bbb_client.meetings.get_meetings()
+    with BigBlueButtonClient(server.url, SALT) as owning_client:
+        owning_client.meetings.get_meetings()
+
+    assert shared.request("GET", server.url).status_code == 200
+    with pytest.raises(RuntimeError, match="closed transport"):
+        owning_client.transport.request("GET", server.url)
+    shared.close()
+
+
+def test_refused_connections_were_not_sent():
+    transport = RequestsTransport(connect_timeout=1)
+
+    with pytest.raises(TransportError) as info:
+        transport.request("GET", f"http://127.0.0.1:{unused_port()}/api/")
+
+    assert info.value.request_sent is False
+    assert isinstance(info.value, requests.RequestException)
+    transport.close()
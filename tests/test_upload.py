@@ -0,0 +1,180 @@
+import asyncio
+import io
+import json
+import threading
+import time
+from email.parser import BytesParser
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+import requests
+
+from sage_bbb.services.client import BigBlueButtonClient
+from sage_bbb.services.transport import Transport
+from sage_bbb.services.upload import (
+    MAX_CONCURRENT_UPLOADS,
+    FilePart,
+    MultipartStream,
+    source_size,
+)
+
+CAPTIONS = b"WEBVTT\n\n" + b"".join(
+    f"00:00:{second:02d}.000 --> 00:00:{second:02d}.900\nLine {second}\n\n".encode()
+    for second in range(60)
+)
+
+
+def parse_multipart(body):
+    """Returns the parts of a multipart body as (name, filename, content)."""
+    message = BytesParser().parsebytes(
+        f"Content-Type: {body.content_type}\r\n\r\n".encode() + b"".join(body)
+    )
+    return [
+        (
+            part.get_param("name", header="content-disposition"),
+            part.get_filename(),
+            part.get_payload(decode=True),
+        )
+        for part in message.get_payload()
+    ]
+
+
+@pytest.fixture(params=["bytes", "path", "file"])
+def source(request, tmp_path):
+    path = tmp_path / "captions.vtt"
+    path.write_bytes(CAPTIONS)
+    if request.param == "bytes":
+        yield CAPTIONS
+    elif request.param == "path":
+        yield str(path)
+    else:
+        with open(path, "rb") as file:
+            yield file
+
+
+def test_streams_every_kind_of_source(source):
+    progress = []
+    body = MultipartStream(
+        fields={"lang": "en-US"},
+        files=[FilePart("file", source, filename="captions.vtt")],
+        chunk_size=100,
+        progress=lambda sent, total: progress.append((sent, total)),
+    )
+
+    chunks = list(body)
+
+    assert len(b"".join(chunks)) == len(body)
+    # The file is sent in chunk_size pieces, between the part headers.
+    assert sum(len(chunk) == 100 for chunk in chunks) == len(CAPTIONS) // 100
+    assert progress[-1] == (len(body), len(body))
+    assert parse_multipart(body) == [
+        ("lang", None, b"en-US"),
+        ("file", "captions.vtt", CAPTIONS),
+    ]
+    # A retried request sends the same body again.
+    assert b"".join(body) == b"".join(chunks)
+    if hasattr(source, "tell"):
+        assert source.tell() == 0
+
+
+def test_source_size_counts_from_the_current_position(tmp_path):
+    path = tmp_path / "captions.vtt"
+    path.write_bytes(CAPTIONS)
+    file = io.BytesIO(CAPTIONS)
+    file.seek(10)
+
+    assert source_size(CAPTIONS) == source_size(str(path)) == len(CAPTIONS)
+    assert source_size(file) == len(CAPTIONS) - 10
+    assert source_size(memoryview(CAPTIONS)[:5]) == 5
+
+
+def test_empty_files_are_sent(tmp_path):
+    path = tmp_path / "empty.vtt"
+    path.write_bytes(b"")
+
+    body = MultipartStream(files=[FilePart("file", str(path))])
+
+    assert parse_multipart(body) == [("file", "empty.vtt", b"")]
+    assert body.headers["Content-Length"] == str(len(body))
+
+
+def test_async_iteration_yields_the_same_body():
+    body = MultipartStream(files=[FilePart("file", CAPTIONS)], chunk_size=64)
+
+    async def read():
+        return [chunk async for chunk in body]
+
+    assert b"".join(asyncio.run(read())) == b"".join(body)
+
+
+class UploadTransport(Transport):
+    """Accepts text track uploads, reading each body as a server would."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.requests = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def request(self, method, url, data=None, headers=None, timeout=None, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            self.requests.append((method, url, headers, b"".join(data)))
+        finally:
+            with self._lock:
+                self.active -= 1
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(
+            {"response": {"returncode": "SUCCESS", "messageKey": "upload_success"}}
+        ).encode()
+        return response
+
+
+def test_put_recording_text_track_streams_the_file(source):
+    transport = UploadTransport()
+    bbb_client = BigBlueButtonClient(
+        "https://bbb.example.com/bigbluebutton/api/", "secret", transport=transport
+    )
+
+    response = bbb_client.recordings.put_recording_text_track(
+        "rec-1", source, lang="fr-FR", label="Français"
+    )
+
+    assert response["messageKey"] == "upload_success"
+    ((method, url, headers, body),) = transport.requests
+    assert method == "POST"
+    params = dict(parse_qsl(urlsplit(url).query))
+    assert (params["recordID"], params["lang"], params["label"]) == (
+        "rec-1",
+        "fr-FR",
+        "Français",
+    )
+    assert headers["Content-Length"] == str(len(body))
+    assert CAPTIONS in body
+
+
+def test_limits_concurrent_uploads():
+    transport = UploadTransport(delay=0.05)
+    bbb_client = BigBlueButtonClient(
+        "https://bbb.example.com/bigbluebutton/api/", "secret", transport=transport
+    )
+    threads = [
+        threading.Thread(
+            target=bbb_client.recordings.put_recording_text_track,
+            args=(f"rec-{number}", CAPTIONS),
+        )
+        for number in range(3 * MAX_CONCURRENT_UPLOADS)
+    ]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(transport.requests) == 3 * MAX_CONCURRENT_UPLOADS
+    assert transport.peak == MAX_CONCURRENT_UPLOADS
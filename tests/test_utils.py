@@ -0,0 +1,120 @@
+import hashlib
+import pickle
+from urllib.parse import parse_qsl, quote_plus, urlsplit
+
+import pytest
+
+from sage_bbb.utils import BigBlueButtonUrlBuilder, DefaultChecksumStrategy
+
+BASE_URL = "https://bbb.example.com/bigbluebutton/api/"
+SALT = "secret"
+PARAMS = {
+    "meetingID": "algebra 101",
+    "fullName": "Zoë O'Brien & co",
+    "role": "VIEWER",
+    "redirect": True,
+    "duration": 60,
+}
+
+
+def reference_url(api_call, params, algorithm="sha1"):
+    """Builds the URL the way BigBlueButton documents it, without caching."""
+    converted = {
+        key: ("true" if value else "false") if isinstance(value, bool) else str(value)
+        for key, value in params.items()
+    }
+    query = "&".join(
+        f"{key}={quote_plus(value)}" for key, value in sorted(converted.items())
+    )
+    checksum = hashlib.new(algorithm, (api_call + query + SALT).encode()).hexdigest()
+    return f"{BASE_URL}{api_call}?{query}&checksum={checksum}"
+
+
+@pytest.mark.parametrize("algorithm", ["sha1", "sha256", "sha384", "sha512"])
+def test_build_url_matches_the_reference_signing(algorithm):
+    builder = BigBlueButtonUrlBuilder(
+        BASE_URL, SALT, DefaultChecksumStrategy(algorithm)
+    )
+
+    for api_call in ("join", "create", "join"):
+        assert builder.build_url(api_call, PARAMS) == reference_url(
+            api_call, PARAMS, algorithm
+        )
+    assert builder.build_url("getMeetings") == reference_url(
+        "getMeetings", {}, algorithm
+    )
+
+
+def test_generate_agrees_with_build_url():
+    strategy = DefaultChecksumStrategy()
+    url = BigBlueButtonUrlBuilder(BASE_URL, SALT, strategy).build_url("join", PARAMS)
+
+    assert url.endswith("&checksum=" + strategy.generate("join", PARAMS, SALT))
+
+
+def test_rejects_unsupported_algorithms():
+    with pytest.raises(ValueError, match="md5"):
+        DefaultChecksumStrategy("md5")
+
+
+def test_build_urls_matches_build_url():
+    builder = BigBlueButtonUrlBuilder(BASE_URL, SALT)
+    shared = {"meetingID": "algebra 101", "role": "VIEWER", "redirect": True}
+    rows = [
+        {"fullName": "Jane Doe"},
+        {"fullName": "John Roe", "userID": 7},
+        {"fullName": "Ann", "role": "MODERATOR"},
+    ]
+
+    urls = list(builder.build_urls("join", rows, shared))
+
+    assert urls == [builder.build_url("join", {**shared, **row}) for row in rows]
+    assert dict(parse_qsl(urlsplit(urls[2]).query))["role"] == "MODERATOR"
+
+
+class ParamsChecksumStrategy(DefaultChecksumStrategy):
+    def __init__(self):
+        super().__init__()
+        self.seen = []
+
+    def generate(self, api_call, params, security_salt):
+        self.seen.append(params)
+        return "custom"
+
+
+class UpperCaseChecksumStrategy(DefaultChecksumStrategy):
+    def generate(self, api_call, params, security_salt):
+        return super().generate(api_call, params, security_salt).upper()
+
+
+def test_custom_strategies_keep_their_own_signing():
+    strategy = ParamsChecksumStrategy()
+    builder = BigBlueButtonUrlBuilder(BASE_URL, SALT, strategy)
+
+    url = builder.build_url("join", {"redirect": False, "duration": 60})
+    urls = list(builder.build_urls("join", [{"userID": 1}], {"redirect": True}))
+
+    assert url.endswith("?duration=60&redirect=false&checksum=custom")
+    assert urls[0].endswith("&checksum=custom")
+    # Custom strategies receive the parameters converted to strings.
+    assert strategy.seen == [
+        {"redirect": "false", "duration": "60"},
+        {"redirect": "true", "userID": "1"},
+    ]
+
+
+def test_overridden_generate_is_not_bypassed():
+    builder = BigBlueButtonUrlBuilder(BASE_URL, SALT, UpperCaseChecksumStrategy())
+
+    checksum = builder.build_url("join", PARAMS).rsplit("=", 1)[1]
+
+    assert checksum == reference_url("join", PARAMS).rsplit("=", 1)[1].upper()
+
+
+def test_builders_can_be_pickled_after_signing():
+    builder = BigBlueButtonUrlBuilder(BASE_URL, SALT)
+    url = builder.build_url("join", PARAMS)
+
+    copy = pickle.loads(pickle.dumps(builder))
+
+    assert copy.build_url("join", PARAMS) == url